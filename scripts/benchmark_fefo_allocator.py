@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""FEFO Allocator Scaling Benchmark.
+
+This standalone script measures FEFO post-processing (FEFOBatchAllocator) on a
+synthetic network: daily production at manufacturing sites, daily shipments
+to every destination, then freeze/thaw/disposal flows - the same call sequence
+SlidingWindowModel.apply_fefo_allocation makes after a solve.
+
+Each scale multiplies the number of products (and so batches and flows). The
+allocator is compared with a sort-based reference that re-sorts the
+(node, product, state) batch list for every call, as the allocator did before
+the heap-backed BatchPool.
+
+Usage:
+    python scripts/benchmark_fefo_allocator.py
+    python scripts/benchmark_fefo_allocator.py --weeks 12 --scales 1 2 4 8 16
+    python scripts/benchmark_fefo_allocator.py --weighted --skip-reference
+
+Output:
+- Console: Formatted scaling table
+"""
+
+import argparse
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.analysis.fefo_batch_allocator import FEFOBatchAllocator
+
+
+MANUFACTURING = ['6122', '6110']
+HUBS = ['6104', '6125', 'Lineage']
+DESTINATIONS = ['6103', '6105', '6120', '6123', '6130', '6134']
+
+
+def build_flows(weeks, products, seed=42):
+    """Synthetic production / shipment / freeze / thaw / disposal flows."""
+    rnd = random.Random(seed)
+    start = date(2025, 10, 6)
+    days = [start + timedelta(days=i) for i in range(weeks * 7)]
+    product_ids = [f"P{i:03d}" for i in range(products)]
+
+    production = {}
+    shipments = {}
+    freeze, thaw, disposal = {}, {}, {}
+
+    for day in days:
+        for product in product_ids:
+            for site in MANUFACTURING:
+                production[(site, product, day)] = float(rnd.randint(200, 800))
+            delivery = day + timedelta(days=1)
+            for site in MANUFACTURING:
+                for hub in HUBS:
+                    shipments[(site, hub, product, delivery)] = float(rnd.randint(50, 250))
+            for hub in HUBS:
+                for dest in DESTINATIONS[:2]:
+                    shipments[(hub, dest, product, delivery + timedelta(days=1))] = float(rnd.randint(20, 100))
+            freeze[('Lineage', product, day)] = float(rnd.randint(0, 80))
+            thaw[('6130', product, day)] = float(rnd.randint(0, 40))
+            disposal[('6104', product, 'ambient', day)] = float(rnd.randint(0, 20))
+
+    return start, days[-1], production, shipments, freeze, thaw, disposal
+
+
+def run_allocator(flows, weighted):
+    """Post-process flows with FEFOBatchAllocator; returns (seconds, batches)."""
+    start, end, production, shipments, freeze, thaw, disposal = flows
+    allocator = FEFOBatchAllocator(nodes={}, products={}, start_date=start, end_date=end)
+
+    t0 = time.perf_counter()
+    allocator.create_batches_from_production({'production_by_date_product': production})
+    for (origin, dest, product, delivery), qty in sorted(shipments.items(), key=lambda x: x[0][3]):
+        allocator.allocate_shipment(origin, dest, product, 'ambient', qty, delivery, use_weighted_age=weighted)
+    allocator.apply_pending_moves()
+    for (node, product, day), qty in sorted(freeze.items(), key=lambda x: x[0][2]):
+        allocator.apply_freeze_transition(node, product, qty, day)
+    for (node, product, day), qty in sorted(thaw.items(), key=lambda x: x[0][2]):
+        allocator.apply_thaw_transition(node, product, qty, day)
+    for (node, product, state, day), qty in sorted(disposal.items(), key=lambda x: x[0][3]):
+        allocator.apply_disposal(node, product, state, qty, day)
+    return time.perf_counter() - t0, len(allocator.batches)
+
+
+def run_reference(flows):
+    """Sort-based FEFO over plain lists (calendar age, shipments only)."""
+    start, end, production, shipments, _, _, _ = flows
+    inventory = defaultdict(list)
+    quantities = {}
+
+    t0 = time.perf_counter()
+    for (site, product, day), qty in production.items():
+        batch = (day, f"{site}_{product}_{day}")
+        quantities[batch] = qty
+        inventory[(site, product)].append(batch)
+
+    pending = []
+    for (origin, dest, product, delivery), qty in sorted(shipments.items(), key=lambda x: x[0][3]):
+        remaining = qty
+        for batch in sorted(inventory.get((origin, product), []), key=lambda b: b[0]):
+            if remaining <= 0:
+                break
+            if quantities[batch] <= 0:
+                continue
+            take = min(quantities[batch], remaining)
+            quantities[batch] -= take
+            remaining -= take
+            pending.append((batch, origin, dest, product))
+
+    for batch, origin, dest, product in pending:
+        if batch in inventory[(origin, product)]:
+            inventory[(origin, product)].remove(batch)
+        if quantities[batch] > 0 and batch not in inventory[(dest, product)]:
+            inventory[(dest, product)].append(batch)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FEFO allocator scaling benchmark")
+    parser.add_argument('--weeks', type=int, default=12, help="Horizon length in weeks")
+    parser.add_argument('--products', type=int, default=5, help="Products at scale 1")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 2, 4, 8], help="Product multipliers")
+    parser.add_argument('--weighted', action='store_true', help="Allocate shipments by weighted age")
+    parser.add_argument('--skip-reference', action='store_true', help="Skip the sort-based reference")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"FEFO ALLOCATOR SCALING ({args.weeks} weeks, {'weighted' if args.weighted else 'calendar'} age)")
+    print("=" * 80)
+    print(f"{'Products':>9} {'Batches':>9} {'Shipments':>10} {'Allocator':>11} {'us/ship':>9} {'Reference':>11}")
+    print("-" * 80)
+
+    for scale in args.scales:
+        flows = build_flows(args.weeks, args.products * scale)
+        shipments = len(flows[3])
+        seconds, batches = run_allocator(flows, args.weighted)
+        reference = "-" if args.skip_reference else f"{run_reference(flows):10.3f}s"
+        print(f"{args.products * scale:>9} {batches:>9} {shipments:>10} {seconds:>10.3f}s "
+              f"{1e6 * seconds / shipments:>9.1f} {reference:>11}")
+
+    print("-" * 80)
+    print("us/ship should stay roughly flat as batches grow; the reference grows with pool size.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Fixed Period Benchmark Script.
+
+This standalone script measures what Daily-workflow fixed periods buy on the
+example data. It solves a "yesterday" plan, rolls the horizon forward, and
+solves "today" twice:
+
+1. FREE: the whole horizon re-optimized (what Daily did before fixed periods)
+2. FIXED: weeks after the free window locked to yesterday's plan
+   (production, shipments, truck pallets - see src/optimization/fixed_periods.py)
+
+Purpose:
+- Quantify the solve time saved by locking the fixed period
+- Show the cost of plan stability (objective FIXED vs FREE)
+- Time the LP feasibility pre-check separately
+
+Usage:
+    python scripts/benchmark_fixed_periods.py
+    python scripts/benchmark_fixed_periods.py --weeks 12 --free-weeks 4 --time-limit 600
+    python scripts/benchmark_fixed_periods.py --weeks 4 --free-weeks 1 --roll-days 1
+
+Output:
+- Console: Formatted comparison table
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.optimization.sliding_window_model import SlidingWindowModel
+from src.optimization.fixed_periods import FixedPeriod, check_fixed_period_feasibility
+from src.optimization.warmstart_utils import extract_solution_for_warmstart
+
+from benchmark_model_build import load_data
+
+
+def create_model(data, start, weeks):
+    """SlidingWindowModel for [start, start + weeks)."""
+    return SlidingWindowModel(
+        nodes=data['nodes'],
+        routes=data['routes'],
+        forecast=data['forecast'],
+        products=data['products'],
+        labor_calendar=data['labor_calendar'],
+        cost_structure=data['cost_structure'],
+        start_date=start,
+        end_date=start + timedelta(days=weeks * 7 - 1),
+        truck_schedules=data['truck_schedules'],
+        initial_inventory=data['initial_inventory'],
+        inventory_snapshot_date=data['inventory_snapshot_date'],
+        allow_shortages=True,
+        use_pallet_tracking=True,
+        use_truck_pallet_tracking=True,
+    )
+
+
+def timed_solve(model, time_limit, mip_gap, fixed_period=None):
+    """Solve (model build included) and return metrics."""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = model.solve(
+            solver_name='appsi_highs',
+            time_limit_seconds=time_limit,
+            mip_gap=mip_gap,
+            fixed_period=fixed_period,
+        )
+    return {
+        'total_time': time.perf_counter() - start,
+        'solve_time': result.solve_time_seconds,
+        'objective': result.objective_value,
+        'gap': result.gap,
+        'status': str(result.termination_condition),
+        'result': result,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Daily fixed periods (free vs fixed solve)")
+    parser.add_argument('--weeks', type=int, default=12, help="Planning horizon (weeks)")
+    parser.add_argument('--free-weeks', type=int, default=4, help="Free period (weeks); the rest is fixed")
+    parser.add_argument('--roll-days', type=int, default=1, help="Days between yesterday's and today's solve")
+    parser.add_argument('--time-limit', type=float, default=300, help="Time limit per solve (seconds)")
+    parser.add_argument('--mip-gap', type=float, default=0.01, help="MIP gap")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("FIXED PERIOD BENCHMARK: Daily replanning, free vs fixed")
+    print("=" * 80)
+
+    print("\nLoading data...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_data()
+
+    yesterday_start = data['inventory_snapshot_date']
+    today_start = yesterday_start + timedelta(days=args.roll_days)
+
+    print(f"\nYesterday's solve: {args.weeks} weeks from {yesterday_start}...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        yesterday_model = create_model(data, yesterday_start, args.weeks)
+    yesterday = timed_solve(yesterday_model, args.time_limit, args.mip_gap)
+    print(f"  {yesterday['status']} in {yesterday['solve_time']:.1f}s, objective {yesterday['objective']:,.2f}")
+    values = extract_solution_for_warmstart(yesterday_model)
+
+    fixed_period = FixedPeriod(
+        start_date=today_start + timedelta(weeks=args.free_weeks),
+        end_date=yesterday_model.end_date,
+        values=values,
+        source="benchmark yesterday solve",
+    )
+    print(f"\nToday: {args.weeks} weeks from {today_start}, "
+          f"fixed {fixed_period.start_date} to {fixed_period.end_date}")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        free_model = create_model(data, today_start, args.weeks)
+    free = timed_solve(free_model, args.time_limit, args.mip_gap)
+    print(f"  FREE:  {free['status']} in {free['solve_time']:.1f}s")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        fixed_model = create_model(data, today_start, args.weeks)
+    fixed = timed_solve(fixed_model, args.time_limit, args.mip_gap, fixed_period=fixed_period)
+    print(f"  FIXED: {fixed['status']} in {fixed['solve_time']:.1f}s")
+
+    # Pre-check cost on its own (already included in FIXED total time)
+    check_start = time.perf_counter()
+    _, check_message = check_fixed_period_feasibility(fixed_model.model)
+    check_time = time.perf_counter() - check_start
+
+    print("\n" + "-" * 90)
+    print(f"{'Run':>8} {'Status':>18} {'Solve (s)':>10} {'Total (s)':>10} {'Objective':>16} {'Gap':>8} {'Int vars':>10}")
+    print("-" * 90)
+    for name, r in [('FREE', free), ('FIXED', fixed)]:
+        gap = f"{r['gap'] * 100:.2f}%" if r['gap'] is not None else '-'
+        objective = f"{r['objective']:,.2f}" if r['objective'] is not None else '-'
+        print(f"{name:>8} {r['status']:>18} {r['solve_time']:>10.1f} {r['total_time']:>10.1f} "
+              f"{objective:>16} {gap:>8} {r['result'].num_integer_vars:>10,}")
+    print("-" * 90)
+
+    if free['solve_time'] and fixed['solve_time']:
+        print(f"\nSolve speedup (FREE / FIXED): {free['solve_time'] / fixed['solve_time']:.1f}x")
+    if free['objective'] and fixed['objective']:
+        print(f"Cost of plan stability: {(fixed['objective'] / free['objective'] - 1) * 100:+.2f}% objective")
+    print(f"LP feasibility pre-check: {check_time:.1f}s ({check_message})")
+
+
+if __name__ == "__main__":
+    main()
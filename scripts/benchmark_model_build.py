@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""Model Build Benchmark Script.
+
+This standalone script measures SlidingWindowModel.build_model() time across
+planning horizons (4, 8, 12 and 26 weeks by default), and compares the
+'window' and 'cumulative' shelf life formulations.
+
+Purpose:
+- Verify that model construction scales roughly linearly with horizon length
+- Catch regressions where constraint rules rescan dates/routes per call
+- Report per-day build cost so horizons of different length are comparable
+- Compare nonzeros, build time and solve time between shelf life formulations
+
+Usage:
+    python scripts/benchmark_model_build.py
+    python scripts/benchmark_model_build.py --weeks 4 8 12 26 52
+    python scripts/benchmark_model_build.py --formulation both --nonzeros
+    python scripts/benchmark_model_build.py --formulation both --weeks 4 --solve --time-limit 120
+    python scripts/benchmark_model_build.py --no-prune   # without reachability pruning
+    python scripts/benchmark_model_build.py --highs-direct   # + time to HiGHS: APPSI vs highs_direct
+    python scripts/benchmark_model_build.py --profile-json build_profile.json   # per-family profile
+
+Output:
+- Console: Formatted table (build time, ms/day, variables, constraints,
+  optionally nonzeros and solve time/objective)
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.parsers.multi_file_parser import MultiFileParser
+from src.optimization.sliding_window_model import SlidingWindowModel
+from src.optimization.legacy_to_unified_converter import LegacyToUnifiedConverter
+from src.models.manufacturing import ManufacturingSite
+from src.models.location import LocationType
+from src.models.product import Product
+
+
+def load_data():
+    """Load real data files for benchmarking."""
+    data_dir = project_root / "data" / "examples"
+
+    forecast_file = data_dir / "Gluten Free Forecast - Latest.xlsm"
+    network_file = data_dir / "Network_Config.xlsx"
+    inventory_file = data_dir / "inventory_latest.XLSX"
+
+    if not forecast_file.exists():
+        raise FileNotFoundError(f"Forecast file not found: {forecast_file}")
+    if not network_file.exists():
+        raise FileNotFoundError(f"Network file not found: {network_file}")
+
+    parser = MultiFileParser(
+        forecast_file=str(forecast_file),
+        network_file=str(network_file),
+        inventory_file=str(inventory_file) if inventory_file.exists() else None,
+    )
+    forecast, locations, routes, labor_calendar, truck_schedules_list, cost_structure = parser.parse_all()
+
+    manufacturing_locations = [loc for loc in locations if loc.type == LocationType.MANUFACTURING]
+    if not manufacturing_locations:
+        raise ValueError("No manufacturing site found in locations")
+
+    manuf_loc = manufacturing_locations[0]
+    manufacturing_site = ManufacturingSite(
+        id=manuf_loc.id,
+        name=manuf_loc.name,
+        storage_mode=manuf_loc.storage_mode,
+        production_rate=1400.0,
+        daily_startup_hours=0.5,
+        daily_shutdown_hours=0.25,
+        default_changeover_hours=0.5,
+        production_cost_per_unit=cost_structure.production_cost_per_unit,
+    )
+
+    initial_inventory = None
+    inventory_snapshot_date = min(e.forecast_date for e in forecast.entries)
+    if inventory_file.exists():
+        inventory_snapshot = parser.parse_inventory(snapshot_date=None)
+        initial_inventory = inventory_snapshot.to_optimization_dict()
+        inventory_snapshot_date = inventory_snapshot.snapshot_date
+
+    converter = LegacyToUnifiedConverter()
+    product_ids = sorted(set(e.product_id for e in forecast.entries))
+    products = {
+        pid: Product(id=pid, sku=pid, name=pid, units_per_mix=415)
+        for pid in product_ids
+    }
+
+    return {
+        'nodes': converter.convert_nodes(manufacturing_site, locations, forecast),
+        'routes': converter.convert_routes(routes),
+        'truck_schedules': converter.convert_truck_schedules(truck_schedules_list, manufacturing_site.id),
+        'forecast': forecast,
+        'products': products,
+        'labor_calendar': labor_calendar,
+        'cost_structure': cost_structure,
+        'initial_inventory': initial_inventory,
+        'inventory_snapshot_date': inventory_snapshot_date,
+    }
+
+
+def count_nonzeros(pyomo_model):
+    """Count constraint matrix nonzeros (linear terms over all active constraints)."""
+    from pyomo.environ import Constraint
+    from pyomo.repn import generate_standard_repn
+
+    return sum(
+        len(generate_standard_repn(con.body, compute_values=False, quadratic=False).linear_vars)
+        for con in pyomo_model.component_data_objects(Constraint, active=True)
+    )
+
+
+def benchmark_build(data, weeks, formulation='window', nonzeros=False, solve=False,
+                    time_limit=120, mip_gap=0.01, prune=True, highs_direct=False,
+                    profile=False):
+    """Build (and optionally solve) a model for the given horizon and return metrics."""
+    start = data['inventory_snapshot_date']
+    end = start + timedelta(weeks=weeks)
+
+    # Model construction prints extensive diagnostics - keep the table readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        model = SlidingWindowModel(
+            nodes=data['nodes'],
+            routes=data['routes'],
+            forecast=data['forecast'],
+            products=data['products'],
+            labor_calendar=data['labor_calendar'],
+            cost_structure=data['cost_structure'],
+            start_date=start,
+            end_date=end,
+            truck_schedules=data['truck_schedules'],
+            initial_inventory=data['initial_inventory'],
+            inventory_snapshot_date=data['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+            shelf_life_formulation=formulation,
+            prune_unreachable=prune,
+            profile_build=profile,
+        )
+        build_start = time.perf_counter()
+        pyomo_model = model.build_model()
+        build_time = time.perf_counter() - build_start
+
+    num_days = len(model.dates)
+    result = {
+        'weeks': weeks,
+        'formulation': formulation,
+        'days': num_days,
+        'build_time': build_time,
+        'ms_per_day': build_time / num_days * 1000,
+        'variables': pyomo_model.nvariables(),
+        'constraints': pyomo_model.nconstraints(),
+        'nonzeros': count_nonzeros(pyomo_model) if nonzeros else None,
+        'solve_time': None,
+        'objective': None,
+        'appsi_load_time': None,
+        'direct_build_time': None,
+        'compile_time': None,
+        'direct_rows': None,
+        'profile': model.build_profile.report() if profile else None,
+    }
+
+    if highs_direct:
+        # Time from model data to a loaded HiGHS instance, both backends:
+        #   APPSI: Pyomo build + Highs.set_instance()
+        #   highs_direct: direct build (bulk families as DirectRows, as in
+        #   solve(solver_name='highs_direct')) + CSR compile + passModel
+        from pyomo.contrib.appsi.solvers import Highs
+        from src.optimization.highs_direct import DirectHighs
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            load_start = time.perf_counter()
+            Highs().set_instance(pyomo_model)
+            result['appsi_load_time'] = time.perf_counter() - load_start
+
+            model._direct_build = True
+            try:
+                build_start = time.perf_counter()
+                direct_model = model.build_model()
+                result['direct_build_time'] = time.perf_counter() - build_start
+            finally:
+                model._direct_build = False
+            direct = DirectHighs()
+            direct.set_instance(direct_model)
+        result['compile_time'] = direct.stats['compile_seconds'] + direct.stats['pass_model_seconds']
+        result['direct_rows'] = direct.stats['direct_rows']
+
+    if solve:
+        # solve() rebuilds the model internally; report solver time only
+        with contextlib.redirect_stdout(io.StringIO()):
+            solve_result = model.solve(
+                solver_name='appsi_highs',
+                time_limit_seconds=time_limit,
+                mip_gap=mip_gap,
+            )
+        result['solve_time'] = solve_result.solve_time_seconds
+        result['objective'] = solve_result.objective_value
+
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SlidingWindowModel build time")
+    parser.add_argument('--weeks', type=int, nargs='+', default=[4, 8, 12, 26],
+                        help="Planning horizons (weeks) to benchmark")
+    parser.add_argument('--formulation', choices=['window', 'cumulative', 'both'], default='window',
+                        help="Shelf life formulation(s) to benchmark")
+    parser.add_argument('--nonzeros', action='store_true',
+                        help="Count constraint matrix nonzeros (adds a few seconds per model)")
+    parser.add_argument('--solve', action='store_true',
+                        help="Also solve each model with APPSI HiGHS")
+    parser.add_argument('--time-limit', type=float, default=120,
+                        help="Solve time limit in seconds (with --solve)")
+    parser.add_argument('--mip-gap', type=float, default=0.01,
+                        help="MIP gap (with --solve)")
+    parser.add_argument('--no-prune', action='store_true',
+                        help="Disable reachability pruning of unreachable variables")
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help="Profile each build per step/constraint family and write the reports as JSON")
+    parser.add_argument('--highs-direct', action='store_true',
+                        help="Also compare time to a loaded HiGHS instance: APPSI vs highs_direct (direct build)")
+    args = parser.parse_args()
+
+    formulations = ['window', 'cumulative'] if args.formulation == 'both' else [args.formulation]
+
+    print("=" * 80)
+    print("MODEL BUILD BENCHMARK: SlidingWindowModel")
+    print("=" * 80)
+
+    print("\nLoading data...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_data()
+
+    results = []
+    for weeks in args.weeks:
+        for formulation in formulations:
+            result = benchmark_build(
+                data, weeks, formulation=formulation, nonzeros=args.nonzeros,
+                solve=args.solve, time_limit=args.time_limit, mip_gap=args.mip_gap,
+                prune=not args.no_prune, highs_direct=args.highs_direct,
+                profile=bool(args.profile_json),
+            )
+            results.append(result)
+            print(f"  {weeks:>3} weeks ({formulation}) built in {result['build_time']:.2f}s")
+            if result['compile_time'] is not None:
+                print(f"      direct build {result['direct_build_time']:.2f}s "
+                      f"({result['direct_rows']:,} direct rows), "
+                      f"compiled and passed to HiGHS in {result['compile_time']:.2f}s")
+
+    print("\n" + "-" * 110)
+    print(f"{'Weeks':>6} {'Formulation':>12} {'Days':>6} {'Build (s)':>10} {'ms/day':>8} {'Variables':>11} "
+          f"{'Constraints':>12} {'Nonzeros':>10} {'Solve (s)':>10} {'Objective':>14}")
+    print("-" * 110)
+    for r in results:
+        nonzeros = f"{r['nonzeros']:,}" if r['nonzeros'] is not None else '-'
+        solve_time = f"{r['solve_time']:.1f}" if r['solve_time'] is not None else '-'
+        objective = f"{r['objective']:,.2f}" if r['objective'] is not None else '-'
+        print(f"{r['weeks']:>6} {r['formulation']:>12} {r['days']:>6} {r['build_time']:>10.2f} "
+              f"{r['ms_per_day']:>8.1f} {r['variables']:>11,} {r['constraints']:>12,} "
+              f"{nonzeros:>10} {solve_time:>10} {objective:>14}")
+    print("-" * 110)
+
+    if args.highs_direct:
+        print(f"\nTime to a loaded HiGHS instance (seconds):")
+        print(f"{'Weeks':>6} {'Formulation':>12} {'APPSI build':>12} {'set_instance':>13} {'APPSI total':>12} "
+              f"{'Direct build':>13} {'CSR+pass':>9} {'Direct total':>13} {'Speedup':>8}")
+        for r in results:
+            appsi_total = r['build_time'] + r['appsi_load_time']
+            direct_total = r['direct_build_time'] + r['compile_time']
+            print(f"{r['weeks']:>6} {r['formulation']:>12} {r['build_time']:>12.2f} {r['appsi_load_time']:>13.2f} "
+                  f"{appsi_total:>12.2f} {r['direct_build_time']:>13.2f} {r['compile_time']:>9.2f} "
+                  f"{direct_total:>13.2f} {appsi_total / direct_total:>7.2f}x")
+
+    # Linear scaling: per-day cost should stay roughly flat as the horizon grows
+    for formulation in formulations:
+        series = [r for r in results if r['formulation'] == formulation]
+        if len(series) >= 2:
+            ratio = series[-1]['ms_per_day'] / series[0]['ms_per_day']
+            print(f"\nPer-day build cost ratio, {formulation} ({series[-1]['weeks']}w vs {series[0]['weeks']}w): {ratio:.2f}x")
+            print("  (~1.0x = linear scaling; >2x suggests a quadratic hot spot)")
+
+    if len(formulations) == 2 and args.nonzeros:
+        for weeks in args.weeks:
+            window, cumulative = [r for r in results if r['weeks'] == weeks]
+            reduction = 1 - cumulative['nonzeros'] / window['nonzeros']
+            print(f"  {weeks:>3} weeks: cumulative uses {reduction:.0%} fewer nonzeros than window")
+
+    if args.profile_json:
+        profiles = [
+            {'weeks': r['weeks'], 'formulation': r['formulation'], **r['profile']}
+            for r in results
+        ]
+        with open(args.profile_json, 'w') as f:
+            json.dump(profiles, f, indent=2, default=str)
+        print(f"\nBuild profiles written to {args.profile_json}")
+
+
+if __name__ == "__main__":
+    main()
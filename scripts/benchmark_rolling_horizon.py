@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Rolling-Horizon Benchmark Script.
+
+This standalone script compares the relax-and-fix rolling-horizon solve
+(src/optimization/rolling_horizon.py) with a monolithic solve of the same
+horizon on the example data:
+
+1. MONOLITHIC: one SlidingWindowModel over the whole horizon
+2. ROLLING: committed windows with an LP-relaxed look-ahead, earlier windows fixed
+
+Purpose:
+- Quality vs time: objective of ROLLING relative to MONOLITHIC
+- Per-window build/solve time and integer counts
+
+Usage:
+    python scripts/benchmark_rolling_horizon.py
+    python scripts/benchmark_rolling_horizon.py --weeks 12 --window-weeks 2 --lookahead-weeks 2
+    python scripts/benchmark_rolling_horizon.py --weeks 16 --skip-monolithic
+
+Output:
+- Console: Formatted comparison table
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.optimization.rolling_horizon import RollingHorizonSolver
+from src.optimization.sliding_window_model import SlidingWindowModel
+
+from benchmark_fixed_periods import create_model
+from benchmark_model_build import load_data
+
+
+def create_window_model(data, start, end):
+    """SlidingWindowModel for [start, end] (same settings as create_model)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SlidingWindowModel(
+            nodes=data['nodes'],
+            routes=data['routes'],
+            forecast=data['forecast'],
+            products=data['products'],
+            labor_calendar=data['labor_calendar'],
+            cost_structure=data['cost_structure'],
+            start_date=start,
+            end_date=end,
+            truck_schedules=data['truck_schedules'],
+            initial_inventory=data['initial_inventory'],
+            inventory_snapshot_date=data['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rolling-horizon vs monolithic solve")
+    parser.add_argument('--weeks', type=int, default=12, help="Planning horizon (weeks)")
+    parser.add_argument('--window-weeks', type=int, default=2, help="Committed weeks per window")
+    parser.add_argument('--lookahead-weeks', type=int, default=2, help="LP-relaxed look-ahead weeks")
+    parser.add_argument('--time-limit', type=float, default=600, help="Monolithic time limit (seconds)")
+    parser.add_argument('--window-time-limit', type=float, default=120, help="Time limit per window (seconds)")
+    parser.add_argument('--mip-gap', type=float, default=0.01, help="MIP gap")
+    parser.add_argument('--skip-monolithic', action='store_true', help="Only run the rolling-horizon solve")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"ROLLING HORIZON BENCHMARK: {args.weeks} weeks, "
+          f"{args.window_weeks}-week windows + {args.lookahead_weeks}-week look-ahead")
+    print("=" * 80)
+
+    print("\nLoading data...")
+    with contextlib.redirect_stdout(io.StringIO()):
+        data = load_data()
+    start = data['inventory_snapshot_date']
+    end = start + timedelta(days=args.weeks * 7 - 1)
+
+    rows = []
+
+    if not args.skip_monolithic:
+        print(f"\nMonolithic solve ({args.weeks} weeks)...")
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            model = create_model(data, start, args.weeks)
+            result = model.solve(solver_name='appsi_highs', time_limit_seconds=args.time_limit, mip_gap=args.mip_gap)
+        rows.append(('MONOLITHIC', result, time.perf_counter() - t0))
+        print(f"  {result.termination_condition} in {result.solve_time_seconds:.1f}s")
+
+    print(f"\nRolling-horizon solve...")
+    solver = RollingHorizonSolver(
+        lambda horizon_end: create_window_model(data, start, horizon_end),
+        start, end,
+        window_days=args.window_weeks * 7,
+        lookahead_days=args.lookahead_weeks * 7,
+        time_limit_seconds=args.window_time_limit,
+        mip_gap=args.mip_gap,
+    )
+    t0 = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        result = solver.solve(verbose=True)
+    rows.append(('ROLLING', result, time.perf_counter() - t0))
+    for line in log.getvalue().splitlines():
+        if line.startswith("  Window "):
+            print(line)
+
+    print("\n" + "-" * 90)
+    print(f"{'Run':>11} {'Status':>18} {'Solve (s)':>10} {'Total (s)':>10} {'Objective':>16} {'Gap':>8} {'Int vars':>10}")
+    print("-" * 90)
+    for name, r, total in rows:
+        gap = f"{r.gap * 100:.2f}%" if r.gap is not None else '-'
+        objective = f"{r.objective_value:,.2f}" if r.objective_value is not None else '-'
+        print(f"{name:>11} {str(r.termination_condition):>18} {r.solve_time_seconds or 0:>10.1f} {total:>10.1f} "
+              f"{objective:>16} {gap:>8} {r.num_integer_vars:>10,}")
+    print("-" * 90)
+
+    completed = result.metadata['rolling_horizon']['completed']
+    if not completed:
+        windows = result.metadata['rolling_horizon']['windows']
+        print(f"\nROLLING INCOMPLETE: stopped after window {len(windows)}/{len(solver.windows)} "
+              f"({result.infeasibility_message or result.termination_condition})")
+
+    if len(rows) == 2:
+        (_, mono, mono_total), (_, rolling, rolling_total) = rows
+        if completed and mono.objective_value and rolling.objective_value:
+            print(f"\nQuality: ROLLING objective {(rolling.objective_value / mono.objective_value - 1) * 100:+.2f}% "
+                  f"vs MONOLITHIC")
+        print(f"Time: ROLLING {rolling_total:.1f}s vs MONOLITHIC {mono_total:.1f}s "
+              f"({mono_total / rolling_total:.1f}x)")
+    print("(Gap is the last window's MIP gap; earlier windows are fixed in it.)")
+
+
+if __name__ == "__main__":
+    main()
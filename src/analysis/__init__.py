@@ -6,6 +6,7 @@ results, including:
 - Production activity tracking
 - Demand satisfaction analysis
 - Inventory flow tracking
+- In-transit queries over shipment legs
 - Production labeling requirements (frozen vs ambient)
 """
 
@@ -18,6 +19,7 @@ from .daily_snapshot import (
     DailySnapshot,
     DailySnapshotGenerator,
 )
+from .transit_index import TransitIndex, TransitLeg
 from .production_labeling_report import (
     LabelingRequirement,
     ProductionLabelingReportGenerator,
@@ -31,6 +33,8 @@ __all__ = [
     "DemandRecord",
     "DailySnapshot",
     "DailySnapshotGenerator",
+    "TransitIndex",
+    "TransitLeg",
     "LabelingRequirement",
     "ProductionLabelingReportGenerator",
 ]
@@ -23,6 +23,14 @@ SNAPSHOT SEMANTICS:
 - Demand is consumed from inventory using FIFO (first-in-first-out) strategy
 - This represents the actual inventory available at the end of the day
 
+INDEXING:
+- All inputs (batches, shipment legs, demand, model solution dicts) are bucketed
+  by location and date once, when the generator is created
+- generate_snapshots() / iter_snapshots() build every day in a single
+  chronological pass (batch pools are updated incrementally)
+- In-transit shipments come from a TransitIndex over shipment legs
+- get_snapshot() builds one day on demand and caches it (UI date slider)
+
 USAGE:
     # Preferred (with Pydantic solution):
     generator = DailySnapshotGenerator(
@@ -38,9 +46,11 @@ USAGE:
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
-from datetime import date as Date, timedelta
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from datetime import date as Date, datetime, timedelta
+from itertools import accumulate
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, TYPE_CHECKING
 from collections import defaultdict
 
 from src.models.production_batch import ProductionBatch
@@ -48,6 +58,7 @@ from src.models.shipment import Shipment
 from src.models.location import Location
 from src.models.forecast import Forecast
 from src.models.production_schedule import ProductionSchedule
+from src.analysis.transit_index import TransitIndex
 
 if TYPE_CHECKING:
     from src.optimization.result_schema import OptimizationSolution
@@ -347,17 +358,22 @@ class DailySnapshotGenerator:
         Build efficient lookup structures for fast querying.
 
         Creates indexes for:
-        - Batches by production date
+        - Batches by production date and by ID
         - Shipments by departure date
         - Shipments by arrival date
         - Shipments by delivery date (for demand)
-        - Demand by date, location, and product
-        - Current location of each batch over time
+        - Shipment legs (interval index for in-transit queries)
+        - Batch movements by location (sorted by date, for LEGACY MODE)
+        - Demand by date, location, and product (plus cumulative demand series)
+
+        Model solution dicts are indexed on first use (see _build_model_index).
         """
         # Index batches by production date
         # FILTER OUT initial inventory (INIT-*) - they're not production activity!
         self._batches_by_date: Dict[Date, List[ProductionBatch]] = defaultdict(list)
+        self._batches_by_id: Dict[str, ProductionBatch] = {}
         for batch in self.production_schedule.production_batches:
+            self._batches_by_id.setdefault(batch.id, batch)
             # Only index actual production batches, not initial inventory
             if not batch.id.startswith('INIT-'):
                 self._batches_by_date[batch.production_date].append(batch)
@@ -369,16 +385,28 @@ class DailySnapshotGenerator:
             departure_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
             self._shipments_by_departure[departure_date].append(shipment)
 
-        # Index shipments by arrival date (first leg)
+        # Index shipment legs (in-transit queries) and arrivals by date
+        # (multi-leg routes arrive at each intermediate location)
+        self._transit_index = TransitIndex.from_shipments(self.shipments)
         self._shipments_by_arrival: Dict[Date, Dict[str, List[Shipment]]] = defaultdict(lambda: defaultdict(list))
-        for shipment in self.shipments:
-            # For multi-leg routes, we need to track arrivals at each intermediate location
-            current_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
+        # LEGACY MODE: batch movements per location as (date, kind, batch_id, quantity)
+        # kind: 0 = batch created at its site, 1 = arrival, 2 = departure (same-day order)
+        movements: Dict[str, List[tuple]] = defaultdict(list)
+        for batch in self.production_schedule.production_batches:
+            movements[batch.manufacturing_site_id].append((batch.production_date, 0, batch.id, batch.quantity))
 
-            for leg in shipment.route.route_legs:
-                arrival_date = current_date + timedelta(days=leg.transit_days)
-                self._shipments_by_arrival[arrival_date][leg.to_location_id].append(shipment)
-                current_date = arrival_date
+        for leg in self._transit_index.legs:
+            shipment = leg.item
+            self._shipments_by_arrival[leg.arrival_date][leg.destination_id].append(shipment)
+            movements[leg.origin_id].append((leg.departure_date, 2, shipment.batch_id, shipment.quantity))
+            movements[leg.destination_id].append((leg.arrival_date, 1, shipment.batch_id, shipment.quantity))
+
+        self._movements_by_location: Dict[str, List[tuple]] = {}
+        self._movement_dates: Dict[str, List[Date]] = {}
+        for location_id, location_moves in movements.items():
+            location_moves.sort(key=lambda m: (m[0], m[1]))
+            self._movements_by_location[location_id] = location_moves
+            self._movement_dates[location_id] = [m[0] for m in location_moves]
 
         # Index shipments by delivery date
         self._shipments_by_delivery: Dict[Date, Dict[str, Dict[str, List[Shipment]]]] = defaultdict(
@@ -390,11 +418,114 @@ class DailySnapshotGenerator:
             )
 
         # Index demand by date, location, and product
+        # plus per (location, product) sorted dates with running totals (cumulative demand lookups)
         self.demand_by_date_location_product: Dict[Date, Dict[str, Dict[str, float]]] = defaultdict(
             lambda: defaultdict(lambda: defaultdict(float))
         )
-        for entry in self.forecast.entries:
-            self.demand_by_date_location_product[entry.forecast_date][entry.location_id][entry.product_id] = entry.quantity
+        demand_series: Dict[Tuple[str, str], List[tuple]] = defaultdict(list)
+        for (location_id, product_id, forecast_date), quantity in self.forecast.store.demand_dict().items():
+            self.demand_by_date_location_product[forecast_date][location_id][product_id] = quantity
+            if quantity > 0:
+                demand_series[(location_id, product_id)].append((forecast_date, quantity))
+
+        self._demand_series: Dict[Tuple[str, str], Tuple[List[Date], List[float]]] = {}
+        for key, series in demand_series.items():
+            series.sort()
+            self._demand_series[key] = ([d for d, _ in series], list(accumulate(q for _, q in series)))
+
+        self._model_indexed = False
+        self._snapshot_cache: Dict[Date, DailySnapshot] = {}
+
+    def _build_model_index(self) -> None:
+        """
+        Index the model solution by date (MODEL MODE), once.
+
+        inventory_state, cohort_inventory, production, FEFO batches and
+        allocations, demand consumption and shortages are bucketed by date
+        (and location where applicable); string dates are parsed here.
+        """
+        if self._model_indexed:
+            return
+        self._model_indexed = True
+
+        solution = self.model_solution
+
+        # Aggregate inventory: {date: {location: [(product, state, qty)]}}
+        self._model_inventory_by_date: Dict[Date, Dict[str, List[tuple]]] = defaultdict(lambda: defaultdict(list))
+        # Cohort inventory: {date: {location: {(prod_date, product, state): qty}}}
+        self._cohorts_by_date: Dict[Date, Dict[str, Dict[tuple, float]]] = defaultdict(
+            lambda: defaultdict(lambda: defaultdict(float))
+        )
+        if self.is_aggregate_model:
+            for (node_id, product_id, state, inv_date), qty in (solution.inventory_state or {}).items():
+                if qty > 0.01:
+                    self._model_inventory_by_date[inv_date][node_id].append((product_id, state, qty))
+        else:
+            for (loc, product_id, prod_date, curr_date, state), qty in (solution.cohort_inventory or {}).items():
+                if qty > 0.01:
+                    self._cohorts_by_date[curr_date][loc][(prod_date, product_id, state)] += qty
+
+        # FEFO batches: (production_date, product, state, batch object or None, quantity)
+        # and production inflows by date: (batch_id, product, quantity, manufacturing site)
+        self._fefo_records: List[tuple] = []
+        self._fefo_production_by_date: Dict[Date, List[tuple]] = defaultdict(list)
+        fefo_batches = (solution.fefo_batch_objects or solution.fefo_batches or []) if self.is_aggregate_model else []
+        for batch in fefo_batches:
+            if isinstance(batch, dict):
+                prod_date = _as_date(batch.get('production_date'))
+                self._fefo_records.append((
+                    prod_date, batch['product_id'], batch.get('current_state'),
+                    None, batch.get('current_quantity', batch.get('quantity', 0)),
+                ))
+                batch_id = batch['id']
+                product_id = batch['product_id']
+                quantity = batch.get('initial_quantity', batch.get('quantity', 0))
+                mfg_site = batch.get('manufacturing_site_id', 'UNKNOWN')
+            else:
+                prod_date = batch.production_date
+                self._fefo_records.append((prod_date, batch.product_id, batch.current_state, batch, None))
+                batch_id = batch.id
+                product_id = batch.product_id
+                quantity = batch.initial_quantity
+                mfg_site = batch.manufacturing_site_id
+
+            if not batch_id.startswith('INIT'):
+                self._fefo_production_by_date[prod_date].append((batch_id, product_id, quantity, mfg_site))
+        self._fefo_age_cache: Dict[Date, Dict[tuple, float]] = {}
+
+        # Aggregate production: {date: [(node, product, qty)]}
+        self._model_production_by_date: Dict[Date, List[tuple]] = defaultdict(list)
+        for (node, product, prod_date), qty in (solution.production_by_date_product or {}).items():
+            if qty > 0.01:
+                self._model_production_by_date[prod_date].append((node, product, qty))
+
+        # FEFO shipment allocations, aggregated per shipment (one flow per shipment, not per batch)
+        # arrivals: {delivery_date: {(dest, product, origin): qty}}
+        # departures: {departure_date: {(origin, dest, product): qty}}
+        self._allocation_arrivals_by_date: Dict[Date, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+        self._allocation_departures_by_date: Dict[Date, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+        allocations = (solution.fefo_shipment_allocations or []) if self.is_aggregate_model else []
+        for alloc in allocations:
+            delivery_date = _as_date(alloc.get('delivery_date'))
+            product_id = alloc.get('product_id', 'UNKNOWN')
+            self._allocation_arrivals_by_date[delivery_date][
+                (alloc['destination'], product_id, alloc['origin'])
+            ] += alloc['quantity']
+            # Transit time is not on the allocation (simplified - assume 1 day)
+            departure_date = delivery_date - timedelta(days=1)
+            self._allocation_departures_by_date[departure_date][
+                (alloc['origin'], alloc['destination'], product_id)
+            ] += alloc['quantity']
+
+        # Demand consumption by date: {date: {(loc, prod): qty}} (cohort and aggregate tracking)
+        # and aggregate demand outflows: {date: [(node, product, qty)]}
+        self._consumption_by_date: Dict[Date, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+        self._demand_consumed_by_date: Dict[Date, List[tuple]] = defaultdict(list)
+        for (loc, prod, prod_date, demand_date), qty in (getattr(solution, 'cohort_demand_consumption', None) or {}).items():
+            self._consumption_by_date[demand_date][(loc, prod)] += qty
+        for (loc, prod, demand_date), qty in (getattr(solution, 'demand_consumed', None) or {}).items():
+            self._consumption_by_date[demand_date][(loc, prod)] += qty
+            self._demand_consumed_by_date[demand_date].append((loc, prod, qty))
 
     def generate_snapshots(self, start_date: Date, end_date: Date) -> List[DailySnapshot]:
         """
@@ -407,15 +538,59 @@ class DailySnapshotGenerator:
         Returns:
             List of DailySnapshot objects, one per day
         """
-        snapshots = []
-        current_date = start_date
+        return list(self.iter_snapshots(start_date, end_date))
+
+    def iter_snapshots(self, start_date: Date, end_date: Date) -> Iterator[DailySnapshot]:
+        """
+        Yield daily snapshots for a date range in one chronological pass.
+
+        LEGACY MODE batch pools are carried from one day to the next, so each
+        day only applies that day's movements.
+
+        Args:
+            start_date: First date to snapshot
+            end_date: Last date to snapshot (inclusive)
+
+        Yields:
+            DailySnapshot for each day from start_date to end_date
+        """
+        # LEGACY MODE: batch_id -> quantity at each location (before demand consumption)
+        pools: Optional[Dict[str, Dict[str, float]]] = None
+        cursors: Dict[str, int] = {}
+        if not self.use_model_inventory:
+            pools = {location_id: {} for location_id in self.locations_dict}
+            cursors = {location_id: 0 for location_id in self.locations_dict}
 
+        current_date = start_date
         while current_date <= end_date:
-            snapshot = self._generate_single_snapshot(current_date)
-            snapshots.append(snapshot)
+            if pools is not None:
+                for location_id, pool in pools.items():
+                    end = bisect_right(self._movement_dates.get(location_id, []), current_date)
+                    moves = self._movements_by_location.get(location_id, [])
+                    self._apply_movements(pool, moves[cursors[location_id]:end])
+                    cursors[location_id] = end
+
+            yield self._build_snapshot(current_date, pools=pools)
             current_date += timedelta(days=1)
 
-        return snapshots
+    def get_snapshot(self, snapshot_date: Date) -> DailySnapshot:
+        """
+        Get the snapshot for one date, building it on first request (cached).
+
+        Intended for interactive use (e.g. a date slider) where days are
+        visited one at a time and revisited.
+
+        Args:
+            snapshot_date: Date to snapshot
+
+        Returns:
+            DailySnapshot for the specified date
+        """
+        snapshot = self._snapshot_cache.get(snapshot_date)
+        if snapshot is None:
+            snapshot = self._generate_single_snapshot(snapshot_date)
+            self._snapshot_cache[snapshot_date] = snapshot
+        return snapshot
 
     def _generate_single_snapshot(self, snapshot_date: Date) -> DailySnapshot:
         """
@@ -424,6 +599,24 @@ class DailySnapshotGenerator:
         Args:
             snapshot_date: Date to snapshot
 
+        Returns:
+            DailySnapshot for the specified date
+        """
+        return self._build_snapshot(snapshot_date)
+
+    def _build_snapshot(
+        self,
+        snapshot_date: Date,
+        pools: Optional[Dict[str, Dict[str, float]]] = None
+    ) -> DailySnapshot:
+        """
+        Assemble the snapshot for a date.
+
+        Args:
+            snapshot_date: Date to snapshot
+            pools: LEGACY MODE batch pools per location from iter_snapshots
+                (None = replay each location's movements up to the date)
+
         Returns:
             DailySnapshot for the specified date
         """
@@ -433,7 +626,8 @@ class DailySnapshotGenerator:
         # This ensures complete visibility of the network state
         location_inventory = {}
         for location_id in self.locations_dict.keys():
-            loc_inv = self._calculate_location_inventory(location_id, snapshot_date)
+            pool = pools.get(location_id) if pools is not None else None
+            loc_inv = self._calculate_location_inventory(location_id, snapshot_date, pool=pool)
             # ALWAYS add the location (removed filter that excluded zero-inventory locations)
             location_inventory[location_id] = loc_inv
             snapshot.total_system_inventory += loc_inv.total_quantity
@@ -452,7 +646,7 @@ class DailySnapshotGenerator:
         snapshot.outflows = self._calculate_outflows(snapshot_date)
 
         # Get demand satisfaction (pass location inventory for accurate calculation)
-        snapshot.demand_satisfied = self._get_demand_satisfied(snapshot_date, location_inventory)
+        snapshot.demand_satisfied = self._get_demand_satisfied(snapshot_date, location_inventory, pools=pools)
 
         return snapshot
 
@@ -475,6 +669,8 @@ class DailySnapshotGenerator:
         Returns:
             LocationInventory for the location
         """
+        self._build_model_index()
+
         location = self.locations_dict.get(location_id)
         location_name = location.name if location else location_id
         
@@ -487,58 +683,14 @@ class DailySnapshotGenerator:
             # AGGREGATE MODEL (SlidingWindowModel): Use inventory_state directly
             # CRITICAL: inventory_state is SOURCE OF TRUTH from optimization model
             # FEFO batches may have stale/incorrect location tracking
-            # SIMPLIFIED: Pydantic attributes instead of .get()
-            aggregate_inventory = self.model_solution.inventory_state or {}
-
             # PREFER inventory_state (always correct), use FEFO only for enrichment
-            if aggregate_inventory:
-                # Use aggregate inventory (SOURCE OF TRUTH from model)
-                # Filter for this location and date
-                location_inventory = [
-                    (node_id, product_id, state, qty)
-                    for (node_id, product_id, state, inv_date), qty in aggregate_inventory.items()
-                    if node_id == location_id and inv_date == snapshot_date and qty > 0.01
-                ]
-
-                # Calculate weighted average age from FEFO batches
-                # CRITICAL: Multiple batches of same (product, state) exist with different ages
-                # We need WEIGHTED AVERAGE, not just most recent
-                fefo_batches = self.model_solution.fefo_batch_objects or self.model_solution.fefo_batches or []
-
-                # Group FEFO batches by (product, state) to calculate weighted average age
-                fefo_weighted_ages = {}  # {(product, state): (weighted_avg_age, total_qty)}
-
-                for batch in fefo_batches:
-                    if isinstance(batch, dict):
-                        prod_date = datetime.fromisoformat(batch['production_date']).date() if isinstance(batch['production_date'], str) else batch['production_date']
-                        product = batch['product_id']
-                        state = batch['current_state']
-                        qty = batch.get('current_quantity', batch.get('quantity', 0))
-                    else:
-                        prod_date = batch.production_date
-                        product = batch.product_id
-                        state = batch.current_state
-                        # Get quantity on this date (Batch object has method)
-                        qty = batch.get_quantity_on_date(snapshot_date) if hasattr(batch, 'get_quantity_on_date') else batch.initial_quantity
-
-                    age = (snapshot_date - prod_date).days
-                    key = (product, state)
-
-                    if key not in fefo_weighted_ages:
-                        fefo_weighted_ages[key] = {'total_qty': 0, 'weighted_age_sum': 0}
-
-                    fefo_weighted_ages[key]['total_qty'] += qty
-                    fefo_weighted_ages[key]['weighted_age_sum'] += age * qty
-
-                # Calculate weighted average ages
-                avg_ages = {}
-                for key, data in fefo_weighted_ages.items():
-                    if data['total_qty'] > 0:
-                        avg_age = data['weighted_age_sum'] / data['total_qty']
-                        avg_ages[key] = avg_age
+            if self.model_solution.inventory_state:
+                # Weighted average age per (product, state) from FEFO batches
+                avg_ages = self._fefo_average_ages(snapshot_date)
 
                 # Create BatchInventory objects with weighted average ages
-                for (node_id, product_id, state, qty) in location_inventory:
+                location_inventory = self._model_inventory_by_date.get(snapshot_date, {}).get(location_id, [])
+                for (product_id, state, qty) in location_inventory:
                     # Use weighted average age if available
                     if (product_id, state) in avg_ages:
                         age_days = int(round(avg_ages[(product_id, state)]))
@@ -569,51 +721,14 @@ class DailySnapshotGenerator:
 
         else:
             # COHORT MODEL (UnifiedNodeModel): cohort_inventory with batch detail
-            # SIMPLIFIED: Pydantic attributes
-            cohort_inventory = self.model_solution.cohort_inventory or {}
-            production_batches_data = [
-                {'date': b.date, 'product': b.product, 'quantity': b.quantity, 'node': b.node}
-                for b in self.model_solution.production_batches
-            ]
-
-            # Build batch lookup
-            batch_lookup = {}
-            for batch_data in production_batches_data:
-                batch_date = batch_data['date']
-                batch_product = batch_data['product']
-                batch_qty = batch_data['quantity']
-                batch_id = f"BATCH-{batch_date}-{batch_product}"
-                batch_lookup[(batch_date, batch_product)] = {
-                    'id': batch_id,
-                    'quantity': batch_qty,
-                    'date': batch_date,
-                    'product': batch_product
-                }
-
-            # Filter cohorts for this location and date
-            # cohort_inventory format: {(loc, prod, prod_date, curr_date, state): qty}
-            location_cohorts = [
-                (loc, prod, prod_date, curr_date, state, qty)
-                for (loc, prod, prod_date, curr_date, state), qty in cohort_inventory.items()
-                if loc == location_id and curr_date == snapshot_date and qty > 0.01
-            ]
-
-            # Group by batch (production_date + product + state = unique cohort)
-            batches_at_location = {}
-            for (loc, product_id, prod_date, curr_date, state, qty) in location_cohorts:
-                batch_key = (prod_date, product_id, state)
-                if batch_key not in batches_at_location:
-                    batches_at_location[batch_key] = 0.0
-                batches_at_location[batch_key] += qty
+            # Cohorts grouped by batch (production_date + product + state = unique cohort)
+            batches_at_location = self._cohorts_by_date.get(snapshot_date, {}).get(location_id, {})
 
             # Create BatchInventory objects
             for (prod_date, product_id, state), total_qty in batches_at_location.items():
                 age_days = (snapshot_date - prod_date).days
-                batch_info = batch_lookup.get((prod_date, product_id))
-                batch_id = batch_info['id'] if batch_info else f"BATCH-{prod_date}-{product_id}"
-
                 # Append state indicator to batch_id for clarity
-                batch_id_with_state = f"{batch_id}-{state}"
+                batch_id_with_state = f"BATCH-{prod_date}-{product_id}-{state}"
 
                 batch_inv = BatchInventory(
                     batch_id=batch_id_with_state,
@@ -628,23 +743,58 @@ class DailySnapshotGenerator:
         
         return loc_inv
 
+    def _fefo_average_ages(self, snapshot_date: Date) -> Dict[tuple, float]:
+        """
+        Weighted average age of FEFO batches by (product, state) on a date (cached per date).
+
+        CRITICAL: Multiple batches of same (product, state) exist with different ages.
+        We need WEIGHTED AVERAGE, not just most recent.
+
+        Args:
+            snapshot_date: Date to age batches to
+
+        Returns:
+            {(product, state): weighted average age in days}
+        """
+        avg_ages = self._fefo_age_cache.get(snapshot_date)
+        if avg_ages is not None:
+            return avg_ages
+
+        totals: Dict[tuple, List[float]] = defaultdict(lambda: [0.0, 0.0])  # key -> [total_qty, weighted_age_sum]
+        for prod_date, product, state, batch, qty in self._fefo_records:
+            if batch is not None:
+                # Get quantity on this date (Batch object has method)
+                qty = batch.get_quantity_on_date(snapshot_date) if hasattr(batch, 'get_quantity_on_date') else batch.initial_quantity
+            age = (snapshot_date - prod_date).days
+            data = totals[(product, state)]
+            data[0] += qty
+            data[1] += age * qty
+
+        avg_ages = {key: weighted / total for key, (total, weighted) in totals.items() if total > 0}
+        self._fefo_age_cache[snapshot_date] = avg_ages
+        return avg_ages
+
     def _reconstruct_inventory_legacy(
         self,
         location_id: str,
         snapshot_date: Date,
-        verbose: bool = False
+        verbose: bool = False,
+        pool: Optional[Dict[str, float]] = None
     ) -> LocationInventory:
         """
         Reconstruct inventory from shipments (LEGACY MODE).
         
-        This is the existing ~240 line implementation that manually tracks
-        inventory through the network. Used for backward compatibility when
-        model_solution is not provided.
+        Batches start at their manufacturing site, move with each shipment leg
+        (departures and arrivals up to snapshot_date), and all demand from the
+        schedule start through snapshot_date is consumed FIFO. Used for
+        backward compatibility when model_solution is not provided.
         
         Args:
             location_id: Location to calculate inventory for
             snapshot_date: Date to calculate inventory on
             verbose: Enable debug logging
+            pool: Batch quantities at the location after all movements up to
+                snapshot_date (None = replay the location's movements)
             
         Returns:
             LocationInventory for the location
@@ -663,84 +813,24 @@ class DailySnapshotGenerator:
             location_name=location_name
         )
 
-        # Track which batches are at this location
-        # We need to trace each batch through shipments
-        batch_quantities: Dict[str, float] = {}  # batch_id -> remaining quantity at this location
-
-        # Start with batches at their ACTUAL location (from manufacturing_site_id field)
-        # This handles both regular production (always at manufacturing) and initial inventory (can be anywhere)
-        for batch in self.production_schedule.production_batches:
-            if batch.manufacturing_site_id == location_id and batch.production_date <= snapshot_date:
-                batch_quantities[batch.id] = batch.quantity
-                if debug:
-                    print(f"  [DEBUG] Added batch {batch.id}: {batch.quantity} units (produced {batch.production_date})")
-
-        if debug:
-            print(f"  [DEBUG] Initial batches: {len(batch_quantities)}, total: {sum(batch_quantities.values()):.0f}")
-
-        # Process shipments to track batch movements
-        shipments_processed = 0
-        for shipment in self.shipments:
-            # Calculate key dates for this shipment
-            departure_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
-
-            # Track shipment through each leg
-            current_date = departure_date
-            current_location = shipment.origin_id
-
-            for leg in shipment.route.route_legs:
-                next_location = leg.to_location_id
-                arrival_date = current_date + timedelta(days=leg.transit_days)
-
-                # If shipment departed from this location, remove from inventory
-                if current_location == location_id and current_date <= snapshot_date:
-                    if shipment.batch_id in batch_quantities:
-                        batch_quantities[shipment.batch_id] -= shipment.quantity
-                        if debug:
-                            print(f"  [DEBUG] Departure: batch {shipment.batch_id} -= {shipment.quantity} (departed {current_date})")
-                        if batch_quantities[shipment.batch_id] <= 0.01:  # Account for rounding
-                            del batch_quantities[shipment.batch_id]
-                        shipments_processed += 1
-
-                # If shipment arrived at this location, add to inventory
-                if next_location == location_id and arrival_date <= snapshot_date:
-                    # Only add if not yet departed (check next leg)
-                    if arrival_date <= snapshot_date:
-                        if shipment.batch_id not in batch_quantities:
-                            batch_quantities[shipment.batch_id] = 0.0
-                        batch_quantities[shipment.batch_id] += shipment.quantity
-                        if debug:
-                            print(f"  [DEBUG] Arrival: batch {shipment.batch_id} += {shipment.quantity} (arrived {arrival_date})")
-                        shipments_processed += 1
-
-                # Move to next leg
-                current_date = arrival_date
-                current_location = next_location
+        if pool is None:
+            pool = self._location_pool(location_id, snapshot_date)
 
         if debug:
-            print(f"  [DEBUG] Processed {shipments_processed} shipment movements")
-            print(f"  [DEBUG] Before demand consumption: {len(batch_quantities)} batches, total: {sum(batch_quantities.values()):.0f}")
+            print(f"  [DEBUG] Before demand consumption: {len(pool)} batches, total: {sum(pool.values()):.0f}")
 
         # Deduct demand consumed using FIFO strategy
         # Process all demand from schedule start through snapshot_date
-        schedule_start = self.production_schedule.schedule_start_date
-        demand_consumed = self._consume_demand_fifo(
-            location_id=location_id,
-            batch_quantities=batch_quantities,
-            start_date=schedule_start,
-            end_date=snapshot_date,
-            debug=debug
-        )
+        batch_quantities = self._consume_demand_fifo(location_id, pool, snapshot_date)
 
-        if debug and demand_consumed > 0:
+        if debug:
             print(f"  [DEBUG] After demand consumption: {len(batch_quantities)} batches, total: {sum(batch_quantities.values()):.0f}")
-            print(f"  [DEBUG] Total demand consumed: {demand_consumed:.0f}")
 
         # Build BatchInventory objects for remaining quantities
         for batch_id, quantity in batch_quantities.items():
             if quantity > 0.01:  # Only include non-zero quantities
                 # Find the original batch
-                batch = next((b for b in self.production_schedule.production_batches if b.id == batch_id), None)
+                batch = self._batches_by_id.get(batch_id)
                 if batch:
                     age_days = (snapshot_date - batch.production_date).days
                     batch_inv = BatchInventory(
@@ -761,7 +851,8 @@ class DailySnapshotGenerator:
         self,
         location_id: str,
         snapshot_date: Date,
-        verbose: bool = False
+        verbose: bool = False,
+        pool: Optional[Dict[str, float]] = None
     ) -> LocationInventory:
         """
         Calculate inventory at a location on a specific date.
@@ -776,6 +867,7 @@ class DailySnapshotGenerator:
             location_id: Location to calculate inventory for
             snapshot_date: Date to calculate inventory on
             verbose: Enable debug logging for this calculation (default: False)
+            pool: LEGACY MODE batch pool carried by iter_snapshots (optional)
 
         Returns:
             LocationInventory for the location
@@ -783,88 +875,119 @@ class DailySnapshotGenerator:
         if self.use_model_inventory:
             return self._extract_inventory_from_model(location_id, snapshot_date)
         else:
-            return self._reconstruct_inventory_legacy(location_id, snapshot_date, verbose)
+            return self._reconstruct_inventory_legacy(location_id, snapshot_date, verbose, pool=pool)
+
+    def _location_pool(self, location_id: str, snapshot_date: Date) -> Dict[str, float]:
+        """
+        Batch quantities at a location after all movements up to a date (before demand).
+
+        Args:
+            location_id: Location to replay
+            snapshot_date: Last date of movements to apply (inclusive)
+
+        Returns:
+            Dict mapping batch_id to quantity
+        """
+        pool: Dict[str, float] = {}
+        end = bisect_right(self._movement_dates.get(location_id, []), snapshot_date)
+        self._apply_movements(pool, self._movements_by_location.get(location_id, [])[:end])
+        return pool
+
+    @staticmethod
+    def _apply_movements(pool: Dict[str, float], movements: List[tuple]) -> None:
+        """
+        Apply batch movements (from _movements_by_location) to a pool in place.
+
+        Departures only reduce batches present at the location; batches at or
+        below 0.01 units are removed (rounding).
+        """
+        for _, kind, batch_id, quantity in movements:
+            if kind == 2:
+                if batch_id in pool:
+                    pool[batch_id] -= quantity
+                    if pool[batch_id] <= 0.01:
+                        del pool[batch_id]
+            elif kind == 0:
+                pool[batch_id] = quantity
+            else:
+                pool[batch_id] = pool.get(batch_id, 0.0) + quantity
+
+    def _cumulative_demand(self, location_id: str, product_id: str, end_date: Date) -> float:
+        """
+        Total demand at a location for a product from schedule start through end_date.
+
+        Args:
+            location_id: Demand location
+            product_id: Product
+            end_date: Last date to include (inclusive)
+
+        Returns:
+            Cumulative demand quantity
+        """
+        series = self._demand_series.get((location_id, product_id))
+        if not series:
+            return 0.0
+        dates, totals = series
+
+        def total_through(d: Date) -> float:
+            i = bisect_right(dates, d)
+            return totals[i - 1] if i else 0.0
+
+        start_date = self.production_schedule.schedule_start_date
+        if end_date < start_date:
+            return 0.0
+        return total_through(end_date) - total_through(start_date - timedelta(days=1))
 
     def _consume_demand_fifo(
         self,
         location_id: str,
         batch_quantities: Dict[str, float],
-        start_date: Date,
-        end_date: Date,
-        debug: bool = False
-    ) -> float:
+        end_date: Date
+    ) -> Dict[str, float]:
         """
         Consume demand from inventory using FIFO (first-in-first-out) strategy.
 
-        This modifies batch_quantities in-place, deducting demand consumed from
-        the oldest batches first.
+        All demand from the schedule start through end_date is deducted from the
+        oldest batches first. Consuming each day in turn from the same pool takes
+        min(total demand, available) oldest-first, so the cumulative demand per
+        product is consumed in one step.
 
         Args:
             location_id: Location where demand is consumed
-            batch_quantities: Dict mapping batch_id to current quantity (modified in-place)
-            start_date: First date to process demand from
+            batch_quantities: Dict mapping batch_id to current quantity (not modified)
             end_date: Last date to process demand through (inclusive)
-            debug: Enable debug logging
 
         Returns:
-            Total quantity of demand consumed
+            Remaining batch quantities (same order as batch_quantities)
         """
-        total_consumed = 0.0
-        current_date = start_date
+        # Batches of each product at this location (only non-empty, known batches)
+        product_batches: Dict[str, List[tuple]] = defaultdict(list)
+        for batch_id, quantity in batch_quantities.items():
+            if quantity > 0.01:
+                batch = self._batches_by_id.get(batch_id)
+                if batch:
+                    product_batches[batch.product_id].append((batch.production_date, batch_id))
 
-        # Iterate through each date in the range
-        while current_date <= end_date:
-            # Get demand for this location on this date
-            demand_by_product = self.demand_by_date_location_product.get(current_date, {}).get(location_id, {})
+        remaining = dict(batch_quantities)
+        for product_id, batches in product_batches.items():
+            remaining_demand = self._cumulative_demand(location_id, product_id, end_date)
+            if remaining_demand <= 0.01:
+                continue
 
-            for product_id, demand_qty in demand_by_product.items():
-                if demand_qty <= 0:
-                    continue
-
-                if debug:
-                    print(f"  [DEBUG] Consuming demand: {demand_qty:.0f} units of {product_id} on {current_date}")
-
-                # Find all batches of this product at this location
-                # Sort by production_date (oldest first) for FIFO
-                product_batches = []
-                for batch_id, quantity in batch_quantities.items():
-                    if quantity > 0.01:  # Only consider non-empty batches
-                        batch = self._get_batch_by_id(batch_id)
-                        if batch and batch.product_id == product_id:
-                            product_batches.append((batch_id, quantity, batch.production_date))
-
-                # Sort by production date (oldest first)
-                product_batches.sort(key=lambda x: x[2])
-
-                # Consume demand from batches in FIFO order
-                remaining_demand = demand_qty
-                for batch_id, available_qty, production_date in product_batches:
-                    if remaining_demand <= 0.01:
-                        break
-
-                    # Consume from this batch
-                    consumed_from_batch = min(remaining_demand, available_qty)
-                    batch_quantities[batch_id] -= consumed_from_batch
-                    remaining_demand -= consumed_from_batch
-                    total_consumed += consumed_from_batch
-
-                    if debug:
-                        print(f"    [DEBUG] Consumed {consumed_from_batch:.0f} from batch {batch_id} (produced {production_date})")
-
-                    # Remove batch if fully consumed
-                    if batch_quantities[batch_id] <= 0.01:
-                        del batch_quantities[batch_id]
-                        if debug:
-                            print(f"    [DEBUG] Batch {batch_id} fully consumed, removed from inventory")
-
-                # Check for shortage (demand exceeds available inventory)
-                if remaining_demand > 0.01:
-                    if debug:
-                        print(f"    [DEBUG] WARNING: Shortage of {remaining_demand:.0f} units of {product_id}")
+            # Sort by production date (oldest first)
+            batches.sort(key=lambda x: x[0])
+            for _, batch_id in batches:
+                consumed_from_batch = min(remaining_demand, remaining[batch_id])
+                remaining[batch_id] -= consumed_from_batch
+                remaining_demand -= consumed_from_batch
 
-            current_date += timedelta(days=1)
+                # Remove batch if fully consumed
+                if remaining[batch_id] <= 0.01:
+                    del remaining[batch_id]
+                if remaining_demand <= 0.01:
+                    break
 
-        return total_consumed
+        return remaining
 
     def _get_batch_by_id(self, batch_id: str) -> Optional[ProductionBatch]:
         """
@@ -876,10 +999,7 @@ class DailySnapshotGenerator:
         Returns:
             ProductionBatch object if found, None otherwise
         """
-        for batch in self.production_schedule.production_batches:
-            if batch.id == batch_id:
-                return batch
-        return None
+        return self._batches_by_id.get(batch_id)
 
     def _find_in_transit_shipments(self, snapshot_date: Date) -> List[TransitInventory]:
         """
@@ -894,33 +1014,21 @@ class DailySnapshotGenerator:
         Returns:
             List of TransitInventory objects
         """
+        # Legs of one shipment are consecutive, so a shipment is on at most one leg
         in_transit = []
-
-        for shipment in self.shipments:
-            # Calculate departure and arrival dates for each leg
-            current_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
-
-            for leg in shipment.route.route_legs:
-                departure_date = current_date
-                arrival_date = current_date + timedelta(days=leg.transit_days)
-
-                # Check if in transit on this leg
-                if departure_date <= snapshot_date < arrival_date:
-                    days_in_transit = (snapshot_date - departure_date).days
-                    transit_inv = TransitInventory(
-                        shipment_id=shipment.id,
-                        origin_id=leg.from_location_id,
-                        destination_id=leg.to_location_id,
-                        product_id=shipment.product_id,
-                        quantity=shipment.quantity,
-                        departure_date=departure_date,
-                        expected_arrival_date=arrival_date,
-                        days_in_transit=days_in_transit
-                    )
-                    in_transit.append(transit_inv)
-                    break  # Shipment can only be in transit on one leg at a time
-
-                current_date = arrival_date
+        for leg in self._transit_index.on_date(snapshot_date):
+            shipment = leg.item
+            transit_inv = TransitInventory(
+                shipment_id=shipment.id,
+                origin_id=leg.origin_id,
+                destination_id=leg.destination_id,
+                product_id=shipment.product_id,
+                quantity=shipment.quantity,
+                departure_date=leg.departure_date,
+                expected_arrival_date=leg.arrival_date,
+                days_in_transit=(snapshot_date - leg.departure_date).days
+            )
+            in_transit.append(transit_inv)
 
         return in_transit
 
@@ -941,20 +1049,19 @@ class DailySnapshotGenerator:
             # CRITICAL: Use production_by_date_product (source of truth) instead of FEFO batches
             # FEFO creates multiple batches per production run for allocation tracking
             # But we need to show AGGREGATE production, not individual batch splits
-            production_dict = self.model_solution.production_by_date_product or {}
+            self._build_model_index()
 
-            for (node, product, date), qty in production_dict.items():
-                if date == snapshot_date and qty > 0.01:
-                    # Create aggregate production record
-                    batch_inv = BatchInventory(
-                        batch_id=f"PROD-{node}-{product}-{date}",
-                        product_id=product,
-                        quantity=qty,
-                        production_date=date,
-                        age_days=0,  # Just produced
-                        state='ambient'  # Default state for fresh production
-                    )
-                    production_activity.append(batch_inv)
+            for node, product, qty in self._model_production_by_date.get(snapshot_date, []):
+                # Create aggregate production record
+                batch_inv = BatchInventory(
+                    batch_id=f"PROD-{node}-{product}-{snapshot_date}",
+                    product_id=product,
+                    quantity=qty,
+                    production_date=snapshot_date,
+                    age_days=0,  # Just produced
+                    state='ambient'  # Default state for fresh production
+                )
+                production_activity.append(batch_inv)
         else:
             # Use production_schedule batches
             batches = self._batches_by_date.get(snapshot_date, [])
@@ -986,77 +1093,25 @@ class DailySnapshotGenerator:
         """
         inflows = []
 
-        # Production inflows - use FEFO batches for aggregate models
         if self.is_aggregate_model and self.model_solution:
-            fefo_batches = self.model_solution.fefo_batch_objects or []
-            if not fefo_batches:
-                fefo_batches = self.model_solution.fefo_batches or []
-
-            for batch in fefo_batches:
-                # Handle both objects and dicts
-                if isinstance(batch, dict):
-                    prod_date = batch.get('production_date')
-                    if isinstance(prod_date, str):
-                        from datetime import datetime
-                        prod_date = datetime.fromisoformat(prod_date).date()
-                    batch_id = batch['id']
-                    product_id = batch['product_id']
-                    quantity = batch.get('initial_quantity', batch.get('quantity', 0))
-                    mfg_site = batch.get('manufacturing_site_id', 'UNKNOWN')
-                else:
-                    prod_date = batch.production_date
-                    batch_id = batch.id
-                    product_id = batch.product_id
-                    quantity = batch.initial_quantity
-                    mfg_site = batch.manufacturing_site_id
-
-                if prod_date == snapshot_date and not batch_id.startswith('INIT'):
-                    flow = InventoryFlow(
-                        flow_type="production",
-                        location_id=mfg_site,
-                        product_id=product_id,
-                        quantity=quantity,
-                        counterparty=None,
-                        batch_id=batch_id
-                    )
-                    inflows.append(flow)
-        else:
-            # Production inflows from production_schedule
-            batches = self._batches_by_date.get(snapshot_date, [])
-            for batch in batches:
+            self._build_model_index()
+
+            # Production inflows from FEFO batches
+            for batch_id, product_id, quantity, mfg_site in self._fefo_production_by_date.get(snapshot_date, []):
                 flow = InventoryFlow(
                     flow_type="production",
-                    location_id=batch.manufacturing_site_id,
-                    product_id=batch.product_id,
-                    quantity=batch.quantity,
+                    location_id=mfg_site,
+                    product_id=product_id,
+                    quantity=quantity,
                     counterparty=None,
-                    batch_id=batch.id
+                    batch_id=batch_id
                 )
                 inflows.append(flow)
 
-        # Arrival inflows from FEFO shipment allocations for aggregate models
-        if self.is_aggregate_model and self.model_solution:
-            fefo_allocations = self.model_solution.fefo_shipment_allocations or []
-
-            # CRITICAL: Aggregate allocations by shipment to avoid duplicate counting
-            # FEFO creates multiple allocations per shipment (one per batch)
-            # But we need ONE inflow per shipment arrival, not one per allocation
-            arrival_totals = defaultdict(float)  # {(dest, product, delivery_date, origin): total_qty}
-
-            for alloc in fefo_allocations:
-                delivery_date = alloc.get('delivery_date')
-                if isinstance(delivery_date, str):
-                    from datetime import datetime
-                    delivery_date = datetime.fromisoformat(delivery_date).date()
-
-                if delivery_date == snapshot_date:
-                    # Aggregate by shipment arrival
-                    arrival_key = (alloc['destination'], alloc.get('product_id', 'UNKNOWN'),
-                                 delivery_date, alloc['origin'])
-                    arrival_totals[arrival_key] += alloc['quantity']
-
-            # Create ONE inflow per shipment arrival
-            for (dest, product_id, delivery_date, origin), total_qty in arrival_totals.items():
+            # Arrival inflows from FEFO shipment allocations
+            # CRITICAL: ONE inflow per shipment arrival, not one per allocation (batch)
+            arrival_totals = self._allocation_arrivals_by_date.get(snapshot_date, {})
+            for (dest, product_id, origin), total_qty in arrival_totals.items():
                 flow = InventoryFlow(
                     flow_type="arrival",
                     location_id=dest,
@@ -1067,6 +1122,19 @@ class DailySnapshotGenerator:
                 )
                 inflows.append(flow)
         else:
+            # Production inflows from production_schedule
+            batches = self._batches_by_date.get(snapshot_date, [])
+            for batch in batches:
+                flow = InventoryFlow(
+                    flow_type="production",
+                    location_id=batch.manufacturing_site_id,
+                    product_id=batch.product_id,
+                    quantity=batch.quantity,
+                    counterparty=None,
+                    batch_id=batch.id
+                )
+                inflows.append(flow)
+
             # Arrival inflows from shipments list
             arrivals_by_location = self._shipments_by_arrival.get(snapshot_date, {})
             for location_id, shipments in arrivals_by_location.items():
@@ -1099,37 +1167,13 @@ class DailySnapshotGenerator:
         """
         outflows = []
 
-        # Departures from FEFO shipment allocations for aggregate models
         if self.is_aggregate_model and self.model_solution:
-            fefo_allocations = self.model_solution.fefo_shipment_allocations or []
-
-            # CRITICAL: Aggregate allocations by shipment to avoid duplicate counting
-            # FEFO creates multiple allocations per shipment (one per batch)
-            # But we need ONE outflow per shipment, not one per allocation
-            shipment_totals = defaultdict(float)  # {(origin, dest, product, departure_date): total_qty}
-
-            for alloc in fefo_allocations:
-                delivery_date = alloc.get('delivery_date')
-                if isinstance(delivery_date, str):
-                    from datetime import datetime
-                    delivery_date = datetime.fromisoformat(delivery_date).date()
+            self._build_model_index()
 
-                origin = alloc['origin']
-                dest = alloc['destination']
-                product_id = alloc.get('product_id', 'UNKNOWN')
-
-                # Find route to get transit time (simplified - assume 1 day if not found)
-                transit_days = 1  # Default
-
-                departure_date = delivery_date - timedelta(days=transit_days)
-
-                if departure_date == snapshot_date:
-                    # Aggregate by shipment (not by allocation/batch)
-                    shipment_key = (origin, dest, product_id, departure_date)
-                    shipment_totals[shipment_key] += alloc['quantity']
-
-            # Create ONE outflow per shipment
-            for (origin, dest, product_id, departure_date), total_qty in shipment_totals.items():
+            # Departures from FEFO shipment allocations
+            # CRITICAL: ONE outflow per shipment, not one per allocation (batch)
+            shipment_totals = self._allocation_departures_by_date.get(snapshot_date, {})
+            for (origin, dest, product_id), total_qty in shipment_totals.items():
                 flow = InventoryFlow(
                     flow_type="departure",
                     location_id=origin,
@@ -1139,6 +1183,20 @@ class DailySnapshotGenerator:
                     batch_id=None  # Aggregated across batches
                 )
                 outflows.append(flow)
+
+            # Demand consumption from model solution (already aggregated)
+            for node, product, qty in self._demand_consumed_by_date.get(snapshot_date, []):
+                # Check if destination is a demand node (not a hub)
+                if node not in ['6104', '6125', 'Lineage', '6122']:
+                    flow = InventoryFlow(
+                        flow_type="demand",
+                        location_id=node,
+                        product_id=product,
+                        quantity=qty,
+                        counterparty=None,
+                        batch_id=None  # Aggregated
+                    )
+                    outflows.append(flow)
         else:
             # Departure outflows from shipments list
             shipments = self._shipments_by_departure.get(snapshot_date, [])
@@ -1153,26 +1211,6 @@ class DailySnapshotGenerator:
                 )
                 outflows.append(flow)
 
-        # Demand consumption - use model solution for aggregate models
-        if self.is_aggregate_model and self.model_solution:
-            demand_consumed = getattr(self.model_solution, 'demand_consumed', {})
-
-            # Use demand_consumed directly (already aggregated)
-            # Format: {(node, product, date): qty}
-            for (node, product, date), qty in demand_consumed.items():
-                if date == snapshot_date:
-                    # Check if destination is a demand node (not a hub)
-                    if node not in ['6104', '6125', 'Lineage', '6122']:
-                        flow = InventoryFlow(
-                            flow_type="demand",
-                            location_id=node,
-                            product_id=product,
-                            quantity=qty,
-                            counterparty=None,
-                            batch_id=None  # Aggregated
-                        )
-                        outflows.append(flow)
-        else:
             # Demand outflows from shipments list
             deliveries_by_dest = self._shipments_by_delivery.get(snapshot_date, {})
             for dest_id, products in deliveries_by_dest.items():
@@ -1193,7 +1231,8 @@ class DailySnapshotGenerator:
     def _get_demand_satisfied(
         self,
         snapshot_date: Date,
-        location_inventory: Dict[str, LocationInventory]
+        location_inventory: Dict[str, LocationInventory],
+        pools: Optional[Dict[str, Dict[str, float]]] = None
     ) -> List[DemandRecord]:
         """
         Get demand satisfaction records for the snapshot date.
@@ -1206,6 +1245,7 @@ class DailySnapshotGenerator:
         Args:
             snapshot_date: Date to check demand satisfaction
             location_inventory: Inventory at each location on this date (after demand consumption)
+            pools: LEGACY MODE batch pools carried by iter_snapshots (optional)
 
         Returns:
             List of DemandRecord objects
@@ -1215,7 +1255,7 @@ class DailySnapshotGenerator:
             return self._get_demand_satisfied_from_model(snapshot_date)
         else:
             # Fallback to LEGACY MODE
-            return self._get_demand_satisfied_legacy(snapshot_date, location_inventory)
+            return self._get_demand_satisfied_legacy(snapshot_date, location_inventory, pools=pools)
 
     def _get_demand_satisfied_from_model(
         self,
@@ -1233,131 +1273,80 @@ class DailySnapshotGenerator:
         Returns:
             List of DemandRecord objects
         """
+        self._build_model_index()
+
         demand_records = []
 
-        # Get demand from forecast for this date
-        forecast_demand: Dict[Tuple[str, str], float] = {}  # (loc, prod) → qty
-        for entry in self.forecast.entries:
-            if entry.forecast_date == snapshot_date:
-                key = (entry.location_id, entry.product_id)
-                forecast_demand[key] = entry.quantity
-
-        # Get demand consumption from model
-        # For batch tracking models: cohort_demand_consumption {(loc, prod, prod_date, demand_date): qty}
-        # For aggregate models: demand_consumed {(loc, prod, date): qty}
-        cohort_consumption = getattr(self.model_solution, 'cohort_demand_consumption', {})
-        aggregate_consumption = getattr(self.model_solution, 'demand_consumed', {})
-
-        # Aggregate consumption by location and product for this date
-        supplied_qty: Dict[Tuple[str, str], float] = {}  # (loc, prod) → total supplied
-
-        # Extract from cohort tracking (if available)
-        for (loc, prod, prod_date, demand_date), qty in cohort_consumption.items():
-            if demand_date == snapshot_date:
-                key = (loc, prod)
-                supplied_qty[key] = supplied_qty.get(key, 0.0) + qty
-
-        # Extract from aggregate tracking (if available)
-        for (loc, prod, date), qty in aggregate_consumption.items():
-            if date == snapshot_date:
-                key = (loc, prod)
-                supplied_qty[key] = supplied_qty.get(key, 0.0) + qty
+        # Demand consumption from model (cohort_demand_consumption and demand_consumed)
+        supplied_qty = self._consumption_by_date.get(snapshot_date, {})  # (loc, prod) → total supplied
 
         # Get shortages from model
         # Format: {(dest, prod, date): qty}
         shortages_dict = self.model_solution.shortages or {}
 
         # Create demand records for all locations with demand
-        for (loc, prod), demand in forecast_demand.items():
-            supplied = supplied_qty.get((loc, prod), 0.0)
-            shortage = shortages_dict.get((loc, prod, snapshot_date), 0.0)
-
-            # Validation: supplied + shortage should approximately equal demand
-            # Allow small tolerance for numerical precision
-            total_accounted = supplied + shortage
-            if abs(total_accounted - demand) > 0.01:
-                # If there's a mismatch, use supplied + shortage as ground truth
-                # This could happen if there's rounding or if shortage variable wasn't needed
-                if shortage == 0.0:
-                    # No explicit shortage variable - calculate from supplied
-                    shortage = max(0.0, demand - supplied)
-
-            # Round shortage to exactly 0.0 if within epsilon tolerance to prevent false shortage display
-            if shortage < 0.01:
-                shortage = 0.0
-
-            record = DemandRecord(
-                destination_id=loc,
-                product_id=prod,
-                demand_quantity=demand,
-                supplied_quantity=supplied,
-                shortage_quantity=shortage
-            )
-            demand_records.append(record)
+        for loc, demand_by_product in self.demand_by_date_location_product.get(snapshot_date, {}).items():
+            for prod, demand in demand_by_product.items():
+                supplied = supplied_qty.get((loc, prod), 0.0)
+                shortage = shortages_dict.get((loc, prod, snapshot_date), 0.0)
+
+                # Validation: supplied + shortage should approximately equal demand
+                # Allow small tolerance for numerical precision
+                total_accounted = supplied + shortage
+                if abs(total_accounted - demand) > 0.01:
+                    # If there's a mismatch, use supplied + shortage as ground truth
+                    # This could happen if there's rounding or if shortage variable wasn't needed
+                    if shortage == 0.0:
+                        # No explicit shortage variable - calculate from supplied
+                        shortage = max(0.0, demand - supplied)
+
+                # Round shortage to exactly 0.0 if within epsilon tolerance to prevent false shortage display
+                if shortage < 0.01:
+                    shortage = 0.0
+
+                record = DemandRecord(
+                    destination_id=loc,
+                    product_id=prod,
+                    demand_quantity=demand,
+                    supplied_quantity=supplied,
+                    shortage_quantity=shortage
+                )
+                demand_records.append(record)
 
         return demand_records
 
     def _get_demand_satisfied_legacy(
         self,
         snapshot_date: Date,
-        location_inventory: Dict[str, LocationInventory]
+        location_inventory: Dict[str, LocationInventory],
+        pools: Optional[Dict[str, Dict[str, float]]] = None
     ) -> List[DemandRecord]:
         """
         Calculate demand satisfaction by reconstructing inventory (LEGACY MODE).
 
-        This method calculates how much demand was satisfied from available inventory.
-        Since inventory is calculated AFTER demand consumption, the supplied_quantity
-        represents what was actually consumed (limited by available inventory).
+        The supplied quantity is limited by the inventory available before the
+        day's demand was consumed: supplied = min(demand, available before).
 
         Args:
             snapshot_date: Date to check demand satisfaction
             location_inventory: Inventory at each location on this date (after demand consumption)
+            pools: Batch pools per location after this date's movements (optional)
 
         Returns:
             List of DemandRecord objects
         """
         demand_records = []
 
-        # Get all demand for this date from forecast
-        demand_by_location_product: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-
-        for entry in self.forecast.entries:
-            if entry.forecast_date == snapshot_date:
-                demand_by_location_product[entry.location_id][entry.product_id] = entry.quantity
-
-        # Get ending inventory at each location (after demand consumption)
-        ending_inventory_by_location_product: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
-        for location_id, loc_inv in location_inventory.items():
-            for product_id, quantity in loc_inv.by_product.items():
-                ending_inventory_by_location_product[location_id][product_id] = quantity
-
-        # Create demand records
         # ONLY create records for locations that actually have demand
-        all_locations_with_demand = set(demand_by_location_product.keys())
-
-        for location_id in all_locations_with_demand:
-            # For this location with demand, check all products that have demand
-            all_products_with_demand = set(demand_by_location_product[location_id].keys())
-
-            for product_id in all_products_with_demand:
-                demand_qty = demand_by_location_product[location_id][product_id]
-
-                # Calculate what was supplied by comparing with a hypothetical "before consumption" inventory
-                # We need to recalculate inventory before consumption for this specific date
-                # For now, we use a simplified approach: supplied = min(demand, available inventory before consumption)
+        for location_id, demand_by_product in self.demand_by_date_location_product.get(snapshot_date, {}).items():
+            pool = pools.get(location_id) if pools is not None else None
+            if pool is None:
+                pool = self._location_pool(location_id, snapshot_date)
 
+            for product_id, demand_qty in demand_by_product.items():
                 # Get the available inventory before demand consumption
-                # This requires a separate calculation or tracking
-                # For simplicity, we'll calculate supplied_qty based on whether there's a shortage
-
-                # Since we consumed demand in FIFO order, the supplied quantity is:
-                # supplied = demand - shortage
-                # We can infer shortage from the ending inventory
-
-                # Actually, we need to track what was available before consumption
-                # Let's use a different approach: calculate inventory before demand for this location
                 available_before = self._calculate_inventory_before_demand_on_date(
-                    location_id, product_id, snapshot_date
+                    location_id, product_id, snapshot_date, pool=pool
                 )
 
                 supplied_qty = min(demand_qty, available_before)
@@ -1382,7 +1371,8 @@ class DailySnapshotGenerator:
         self,
         location_id: str,
         product_id: str,
-        target_date: Date
+        target_date: Date,
+        pool: Optional[Dict[str, float]] = None
     ) -> float:
         """
         Calculate inventory available before demand consumption on a specific date.
@@ -1394,63 +1384,37 @@ class DailySnapshotGenerator:
             location_id: Location to check
             product_id: Product to check
             target_date: Date to check inventory on (before demand)
+            pool: Batch quantities after all movements up to target_date
+                (None = replay the location's movements)
 
         Returns:
             Quantity available before demand consumption
         """
-        # Calculate inventory state just before demand consumption on target_date
-        # This means: all activities up to and including target_date, EXCEPT demand on target_date
-
-        batch_quantities: Dict[str, float] = {}
-
-        # Add all production up to target_date
-        for batch in self.production_schedule.production_batches:
-            if batch.manufacturing_site_id == location_id and batch.production_date <= target_date:
-                batch_quantities[batch.id] = batch.quantity
-
-        # Process all shipments up to target_date
-        for shipment in self.shipments:
-            departure_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
-            current_date = departure_date
-            current_location = shipment.origin_id
-
-            for leg in shipment.route.route_legs:
-                next_location = leg.to_location_id
-                arrival_date = current_date + timedelta(days=leg.transit_days)
-
-                # Departure
-                if current_location == location_id and current_date <= target_date:
-                    if shipment.batch_id in batch_quantities:
-                        batch_quantities[shipment.batch_id] -= shipment.quantity
-                        if batch_quantities[shipment.batch_id] <= 0.01:
-                            del batch_quantities[shipment.batch_id]
-
-                # Arrival
-                if next_location == location_id and arrival_date <= target_date:
-                    if shipment.batch_id not in batch_quantities:
-                        batch_quantities[shipment.batch_id] = 0.0
-                    batch_quantities[shipment.batch_id] += shipment.quantity
-
-                current_date = arrival_date
-                current_location = next_location
+        # Inventory state just before demand consumption on target_date:
+        # all movements up to and including target_date, EXCEPT demand on target_date
+        if pool is None:
+            pool = self._location_pool(location_id, target_date)
 
         # Consume demand from schedule_start to (target_date - 1)
-        # This gives us inventory right before target_date's demand
+        batch_quantities = pool
         if target_date > self.production_schedule.schedule_start_date:
-            self._consume_demand_fifo(
-                location_id=location_id,
-                batch_quantities=batch_quantities,
-                start_date=self.production_schedule.schedule_start_date,
-                end_date=target_date - timedelta(days=1),
-                debug=False
-            )
+            batch_quantities = self._consume_demand_fifo(location_id, pool, target_date - timedelta(days=1))
 
         # Sum up inventory for this product
         total_qty = 0.0
         for batch_id, quantity in batch_quantities.items():
             if quantity > 0.01:
-                batch = self._get_batch_by_id(batch_id)
+                batch = self._batches_by_id.get(batch_id)
                 if batch and batch.product_id == product_id:
                     total_qty += quantity
 
         return total_qty
+
+
+def _as_date(value: Any) -> Optional[Date]:
+    """Date from a date, datetime or ISO string (solution dicts store either)."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
@@ -3,17 +3,21 @@
 Converts aggregate flows from sliding window model into batch-level detail
 with full traceability and state_entry_date tracking.
 
-Following TDD: Minimal implementation to pass tests.
+Batches at each (node, product, state) are held in a BatchPool: an
+insertion-ordered membership map plus lazily maintained heaps, so the oldest
+batch is found in O(log n) instead of re-sorting the list for every shipment,
+freeze, thaw or disposal, and membership checks / removals are O(1).
 """
 
+from bisect import bisect_right, insort
 from dataclasses import dataclass, field
 from datetime import date as Date
-from typing import Dict, List, Tuple, Optional, Set
-from collections import defaultdict
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional
+import heapq
 import uuid
 
 
-@dataclass
+@dataclass(slots=True)
 class Batch:
     """Represents a production batch with full traceability.
 
@@ -40,6 +44,11 @@ class Batch:
     initial_state: str = field(default='ambient')
     location_history: Dict[Date, str] = field(default_factory=dict)
     quantity_history: Dict[Date, float] = field(default_factory=dict)
+    # Sorted snapshot dates (keys of the histories) for bisect lookups
+    _history_dates: List[Date] = field(default_factory=list, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._history_dates = sorted(set(self.location_history) | set(self.quantity_history))
 
     def age_in_state(self, current_date: Date) -> int:
         """Calculate age in current state."""
@@ -51,33 +60,245 @@ class Batch:
 
     def get_location_on_date(self, check_date: Date) -> Optional[str]:
         """Get batch location on a specific date."""
-        if check_date in self.location_history:
-            return self.location_history[check_date]
-
-        # Find most recent date before or on check_date
-        valid_dates = [d for d in self.location_history.keys() if d <= check_date]
-        if valid_dates:
-            return self.location_history[max(valid_dates)]
-
-        return self.location_id  # Fallback to current
+        return self._history_value(self.location_history, check_date, self.location_id)
 
     def get_quantity_on_date(self, check_date: Date) -> float:
         """Get batch quantity on a specific date."""
-        if check_date in self.quantity_history:
-            return self.quantity_history[check_date]
-
-        # Find most recent date before or on check_date
-        valid_dates = [d for d in self.quantity_history.keys() if d <= check_date]
-        if valid_dates:
-            return self.quantity_history[max(valid_dates)]
-
-        return self.quantity  # Fallback to current
+        return self._history_value(self.quantity_history, check_date, self.quantity)
 
     def record_snapshot(self, snapshot_date: Date):
         """Record current location and quantity for a date."""
+        if snapshot_date not in self.location_history and snapshot_date not in self.quantity_history:
+            insort(self._history_dates, snapshot_date)
         self.location_history[snapshot_date] = self.location_id
         self.quantity_history[snapshot_date] = self.quantity
 
+    def _history_value(self, history: Dict[Date, Any], check_date: Date, fallback: Any) -> Any:
+        """Value recorded on the most recent date on or before check_date."""
+        if check_date in history:
+            return history[check_date]
+
+        # Most recent snapshot date before check_date
+        i = bisect_right(self._history_dates, check_date) - 1
+        while i >= 0:
+            snapshot_date = self._history_dates[i]
+            if snapshot_date in history:
+                return history[snapshot_date]
+            i -= 1
+
+        return fallback  # Fallback to current
+
+
+def _shelf_life_rate(state: str) -> float:
+    """Fraction of shelf life consumed per day in a state (weighted age slope)."""
+    from src.analysis.lp_fefo_allocator import (
+        AMBIENT_SHELF_LIFE, FROZEN_SHELF_LIFE, THAWED_SHELF_LIFE
+    )
+
+    shelf_life = {
+        'ambient': AMBIENT_SHELF_LIFE,
+        'frozen': FROZEN_SHELF_LIFE,
+        'thawed': THAWED_SHELF_LIFE,
+    }.get(state)
+    return 1.0 / shelf_life if shelf_life else 0.0
+
+
+class BatchPool:
+    """Batches at one (node, product, state), with FEFO priority queues.
+
+    Behaves like the list it replaces for the operations callers use:
+    append, remove, ``in``, len, iteration (insertion order) and indexing.
+    Membership is by identity and appending a batch that is already in the
+    pool is a no-op.
+
+    oldest() returns the next batch to consume. Heap entries are validated
+    when they reach the top and discarded if the batch has left the pool, was
+    re-appended since, or has no quantity left; an entry whose key changed
+    (e.g. state_entry_date reset) is re-pushed with the current key. A batch
+    keeps its insertion sequence number, so ties are broken in insertion order
+    as with the stable sorts this replaces.
+
+    Weighted age at a delivery date is
+        initial_term(batch) + (delivery - state_entry_date) * rate(current_state)
+    once delivery is after state_entry_date, so per current_state the order
+    does not depend on the delivery date: one heap per current_state keyed on
+    initial_term - state_entry_date * rate, and the heap tops are compared
+    with the full calculate_weighted_age_from_batch. Deliveries on or before
+    the newest state_entry_date in the pool fall back to a linear scan.
+    """
+
+    __slots__ = ('_members', '_seq', '_calendar', '_weighted', '_max_state_entry')
+
+    def __init__(self, batches: Iterable[Batch] = ()):
+        self._members: Dict[int, Tuple[int, Batch]] = {}   # id(batch) -> (seq, batch)
+        self._seq = 0
+        self._calendar: List[Tuple[Date, int, Batch]] = []
+        self._weighted: Optional[Dict[str, List[Tuple[float, int, Batch]]]] = None
+        self._max_state_entry: Optional[Date] = None
+        for batch in batches:
+            self.append(batch)
+
+    def append(self, batch: Batch):
+        """Add a batch (no-op if already in the pool)."""
+        if id(batch) in self._members:
+            return
+        seq = self._seq
+        self._seq += 1
+        self._members[id(batch)] = (seq, batch)
+        self._push(batch, seq)
+
+        if len(self._calendar) > 2 * len(self._members) + 32:
+            self._rebuild_heaps()
+
+    def remove(self, batch: Batch):
+        """Remove a batch; raises ValueError if it is not in the pool."""
+        if self._members.pop(id(batch), None) is None:
+            raise ValueError("batch not in pool")
+
+    def oldest(self, weighted_at: Optional[Date] = None) -> Optional[Batch]:
+        """
+        Next batch to consume with quantity > 0, without removing it.
+
+        Args:
+            weighted_at: Delivery date for weighted-age FEFO (highest weighted
+                age first); None for calendar FEFO (oldest state_entry_date)
+
+        Returns:
+            Batch, or None if no batch has quantity left
+        """
+        if weighted_at is None:
+            return self._peek(self._calendar, self._calendar_key)
+
+        if self._max_state_entry is not None and weighted_at <= self._max_state_entry:
+            return self._oldest_weighted_scan(weighted_at)
+
+        from src.analysis.lp_fefo_allocator import calculate_weighted_age_from_batch
+
+        if self._weighted is None:
+            self._build_weighted()
+
+        best, best_rank = None, None
+        for state in list(self._weighted):
+            top = self._peek(self._weighted[state], self._weighted_key, state)
+            if top is None:
+                continue
+            rank = (calculate_weighted_age_from_batch(top, weighted_at), -self._members[id(top)][0])
+            if best_rank is None or rank > best_rank:
+                best, best_rank = top, rank
+        return best
+
+    def __contains__(self, batch: object) -> bool:
+        return id(batch) in self._members
+
+    def __iter__(self) -> Iterator[Batch]:
+        return iter([batch for _, batch in self._members.values()])
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BatchPool, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"BatchPool({list(self)!r})"
+
+    @staticmethod
+    def _calendar_key(batch: Batch) -> Date:
+        return batch.state_entry_date
+
+    @staticmethod
+    def _weighted_key(batch: Batch) -> float:
+        """Negated delivery-independent part of the weighted age (min-heap)."""
+        from src.analysis.lp_fefo_allocator import calculate_weighted_age_from_batch
+
+        initial_term = calculate_weighted_age_from_batch(batch, batch.state_entry_date)
+        return batch.state_entry_date.toordinal() * _shelf_life_rate(batch.current_state) - initial_term
+
+    def _push(self, batch: Batch, seq: int):
+        heapq.heappush(self._calendar, (batch.state_entry_date, seq, batch))
+        if self._weighted is not None:
+            heap = self._weighted.setdefault(batch.current_state, [])
+            heapq.heappush(heap, (self._weighted_key(batch), seq, batch))
+        if self._max_state_entry is None or batch.state_entry_date > self._max_state_entry:
+            self._max_state_entry = batch.state_entry_date
+
+    def _peek(self, heap: list, key_fn, state: Optional[str] = None) -> Optional[Batch]:
+        """Top valid batch of a heap, discarding stale entries on the way."""
+        while heap:
+            key, seq, batch = heap[0]
+            member = self._members.get(id(batch))
+            if member is None or member[0] != seq or batch.quantity <= 0:
+                heapq.heappop(heap)
+                continue
+
+            if state is not None and batch.current_state != state:
+                # State changed while pooled: move to the right weighted heap
+                heapq.heappop(heap)
+                target = self._weighted.setdefault(batch.current_state, [])
+                heapq.heappush(target, (key_fn(batch), seq, batch))
+                continue
+
+            current_key = key_fn(batch)
+            if current_key != key:
+                heapq.heapreplace(heap, (current_key, seq, batch))
+                if self._max_state_entry is None or batch.state_entry_date > self._max_state_entry:
+                    self._max_state_entry = batch.state_entry_date
+                continue
+
+            return batch
+        return None
+
+    def _oldest_weighted_scan(self, delivery_date: Date) -> Optional[Batch]:
+        from src.analysis.lp_fefo_allocator import calculate_weighted_age_from_batch
+
+        best, best_age = None, None
+        for _, batch in self._members.values():
+            if batch.quantity <= 0:
+                continue
+            age = calculate_weighted_age_from_batch(batch, delivery_date)
+            if best_age is None or age > best_age:
+                best, best_age = batch, age
+        return best
+
+    def _build_weighted(self):
+        self._weighted = {}
+        for seq, batch in self._members.values():
+            self._weighted.setdefault(batch.current_state, []).append(
+                (self._weighted_key(batch), seq, batch)
+            )
+        for heap in self._weighted.values():
+            heapq.heapify(heap)
+
+    def _rebuild_heaps(self):
+        """Drop stale heap entries (bounds heap size by live membership)."""
+        self._calendar = [(batch.state_entry_date, seq, batch) for seq, batch in self._members.values()]
+        heapq.heapify(self._calendar)
+        if self._weighted is not None:
+            self._build_weighted()
+
+
+class BatchStore(dict):
+    """batch_inventory mapping: (node, product, state) -> BatchPool.
+
+    Missing keys create an empty pool on item access (like defaultdict(list));
+    assigning a list wraps it in a BatchPool.
+    """
+
+    def __missing__(self, key):
+        pool = BatchPool()
+        dict.__setitem__(self, key, pool)
+        return pool
+
+    def __setitem__(self, key, batches):
+        if not isinstance(batches, BatchPool):
+            batches = BatchPool(batches)
+        dict.__setitem__(self, key, batches)
+
 
 class FEFOBatchAllocator:
     """Allocates aggregate flows to specific batches using FEFO policy.
@@ -108,7 +329,7 @@ class FEFOBatchAllocator:
 
         # Batch tracking
         self.batches: List[Batch] = []
-        self.batch_inventory: Dict[Tuple[str, str, str], List[Batch]] = defaultdict(list)
+        self.batch_inventory: Dict[Tuple[str, str, str], BatchPool] = BatchStore()
 
         # Shipment allocations (for genealogy)
         self.shipment_allocations: List[Dict] = []
@@ -197,36 +418,22 @@ class FEFOBatchAllocator:
         Returns:
             List of allocations [{'batch_id': str, 'quantity': float}, ...]
         """
-        # Get available batches at origin, sorted by age (oldest first = FEFO)
+        # Available batches at origin, taken oldest first (FEFO) from the pool's
+        # priority queue - weighted age at delivery if requested, calendar age
+        # (state_entry_date) otherwise
         inv_key = (origin_node, product_id, state)
-        available_batches = self.batch_inventory.get(inv_key, [])
-
-        # Sort by age - weighted if requested, calendar age otherwise
-        if use_weighted_age:
-            # Import weighted age calculation
-            from src.analysis.lp_fefo_allocator import calculate_weighted_age_from_batch
-
-            # Sort by weighted age at delivery (oldest weighted age first)
-            sorted_batches = sorted(
-                available_batches,
-                key=lambda b: calculate_weighted_age_from_batch(b, delivery_date),
-                reverse=True  # Highest weighted age first (oldest)
-            )
-        else:
-            # Sort by state_entry_date (oldest first for traditional FEFO)
-            sorted_batches = sorted(available_batches, key=lambda b: b.state_entry_date)
+        available_batches = self.batch_inventory.get(inv_key)
+        weighted_at = delivery_date if use_weighted_age else None
 
         # Allocate from oldest batches
         allocations = []
         remaining_to_allocate = quantity
 
-        for batch in sorted_batches:
-            if remaining_to_allocate <= 0:
+        while remaining_to_allocate > 0 and available_batches:
+            batch = available_batches.oldest(weighted_at)
+            if batch is None:
                 break
 
-            if batch.quantity <= 0:
-                continue
-
             # Allocate from this batch
             allocated_qty = min(batch.quantity, remaining_to_allocate)
 
@@ -328,19 +535,16 @@ class FEFOBatchAllocator:
         """
         # Get available ambient batches at node (oldest first)
         inv_key = (node_id, product_id, 'ambient')
-        available_batches = self.batch_inventory.get(inv_key, [])
-        sorted_batches = sorted(available_batches, key=lambda b: b.state_entry_date)
+        available_batches = self.batch_inventory.get(inv_key)
 
         frozen_batches = []
         remaining_to_freeze = quantity
 
-        for batch in sorted_batches:
-            if remaining_to_freeze <= 0:
+        while remaining_to_freeze > 0 and available_batches:
+            batch = available_batches.oldest()
+            if batch is None:
                 break
 
-            if batch.quantity <= 0:
-                continue
-
             # Determine how much to freeze from this batch
             freeze_qty = min(batch.quantity, remaining_to_freeze)
 
@@ -409,19 +613,16 @@ class FEFOBatchAllocator:
         """
         # Get available frozen batches at node (oldest first)
         inv_key = (node_id, product_id, 'frozen')
-        available_batches = self.batch_inventory.get(inv_key, [])
-        sorted_batches = sorted(available_batches, key=lambda b: b.state_entry_date)
+        available_batches = self.batch_inventory.get(inv_key)
 
         thawed_batches = []
         remaining_to_thaw = quantity
 
-        for batch in sorted_batches:
-            if remaining_to_thaw <= 0:
+        while remaining_to_thaw > 0 and available_batches:
+            batch = available_batches.oldest()
+            if batch is None:
                 break
 
-            if batch.quantity <= 0:
-                continue
-
             # Determine how much to thaw from this batch
             thaw_qty = min(batch.quantity, remaining_to_thaw)
 
@@ -495,21 +696,17 @@ class FEFOBatchAllocator:
             List of batches that were disposed (fully or partially)
         """
         inv_key = (node_id, product_id, state)
-        available_batches = self.batch_inventory.get(inv_key, [])
-
-        # Sort by age (oldest first - dispose oldest first, matching FEFO)
-        sorted_batches = sorted(available_batches, key=lambda b: b.state_entry_date)
+        available_batches = self.batch_inventory.get(inv_key)
 
         disposed_batches = []
         remaining_to_dispose = quantity
 
-        for batch in sorted_batches:
-            if remaining_to_dispose <= 0:
+        # Dispose oldest first (matching FEFO)
+        while remaining_to_dispose > 0 and available_batches:
+            batch = available_batches.oldest()
+            if batch is None:
                 break
 
-            if batch.quantity <= 0:
-                continue
-
             dispose_qty = min(batch.quantity, remaining_to_dispose)
             batch.quantity -= dispose_qty
             remaining_to_dispose -= dispose_qty
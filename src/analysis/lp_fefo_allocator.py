@@ -137,18 +137,15 @@ class LPFEFOAllocator:
 
         model = ConcreteModel()
 
-        # Pre-compute compatible (batch, shipment) pairs
-        compatible_pairs = []
-        for b_idx, batch in enumerate(self.batches):
-            for s_idx, shipment in enumerate(self.shipments):
-                (origin, dest, product, state, qty, delivery_date) = shipment
-
-                # Check compatibility
-                if (batch.location_id == origin and
-                    batch.product_id == product and
-                    batch.current_state == state and
-                    batch.quantity > 0.01):
-                    compatible_pairs.append((b_idx, s_idx))
+        # Pre-compute compatible (batch, shipment) pairs: same (location,
+        # product, state) and stock left. Sorted batch-major, as allocations
+        # are reported.
+        compatible_pairs = sorted(
+            (b_idx, s_idx)
+            for batch_indices, shipment_indices in self._compatible_groups().values()
+            for b_idx in batch_indices
+            for s_idx in shipment_indices
+        )
 
         logger.info(f"LP FEFO: {len(self.batches)} batches × {len(self.shipments)} shipments = {len(compatible_pairs)} compatible pairs")
 
@@ -206,7 +203,7 @@ class LPFEFOAllocator:
             if not compatible_b:
                 return Constraint.Skip
 
-            return sum(model.x[b_idx, s_idx] for b_idx in compatible_b if (b_idx, s_idx) in compatible_pairs) == self.shipments[s_idx][4]
+            return sum(model.x[b_idx, s_idx] for b_idx in compatible_b) == self.shipments[s_idx][4]
 
         model.shipment_satisfaction = Constraint(
             range(len(self.shipments)),
@@ -223,11 +220,7 @@ class LPFEFOAllocator:
 
             batch = self.batches[b_idx]
 
-            return sum(
-                model.x[b_idx, s_idx]
-                for s_idx in compatible_s
-                if (b_idx, s_idx) in compatible_pairs
-            ) <= batch.quantity
+            return sum(model.x[b_idx, s_idx] for s_idx in compatible_s) <= batch.quantity
 
         model.batch_capacity = Constraint(
             range(len(self.batches)),
@@ -281,6 +274,28 @@ class LPFEFOAllocator:
             logger.error(traceback.format_exc())
             return None
 
+    def _compatible_groups(self) -> Dict[Tuple[str, str, str], Tuple[List[int], List[int]]]:
+        """Batch and shipment indices per (location, product, state).
+
+        Batches are compatible with every shipment of their group (and no
+        other), so grouping replaces testing every batch against every
+        shipment. Batches with 0.01 or less left are left out.
+
+        Returns:
+            {(origin, product, state): ([batch_idx, ...], [shipment_idx, ...])}
+            for every group with at least one shipment
+        """
+        groups: Dict[Tuple[str, str, str], Tuple[List[int], List[int]]] = {}
+        for s_idx, (origin, dest, product, state, qty, delivery_date) in enumerate(self.shipments):
+            groups.setdefault((origin, product, state), ([], []))[1].append(s_idx)
+
+        for b_idx, batch in enumerate(self.batches):
+            key = (batch.location_id, batch.product_id, batch.current_state)
+            if key in groups and batch.quantity > 0.01:
+                groups[key][0].append(b_idx)
+
+        return groups
+
     def apply_lp_allocation(self, lp_result: Dict, fefo_allocator) -> None:
         """Apply LP allocation results to FEFO batch allocator.
 
@@ -348,6 +363,226 @@ class LPFEFOAllocator:
                 })
 
 
+class SparseLPFEFOAllocator(LPFEFOAllocator):
+    """LP FEFO allocator assembled as a sparse matrix and solved with highspy.
+
+    Same LP and result contract as LPFEFOAllocator.optimize_allocation, built
+    without Pyomo: batches and shipments are grouped by (location, product,
+    state), the weighted-age costs of each group are computed with NumPy and
+    the constraint matrix is assembled with scipy.sparse, then passed to
+    HiGHS directly.
+
+    Groups share no variables or constraints, so with decompose=True each
+    group is solved as its own LP, in parallel threads. Otherwise the groups
+    are stacked block-diagonally into one LP.
+
+    Requires numpy, scipy and highspy (see sparse_lp_available()).
+    """
+
+    def __init__(
+        self,
+        batches: List,
+        shipments: List[Tuple],
+        ambient_shelf_life: int = 17,
+        frozen_shelf_life: int = 120,
+        thawed_shelf_life: int = 14,
+        decompose: bool = True,
+        max_workers: Optional[int] = None
+    ):
+        """Initialize sparse LP FEFO allocator.
+
+        Args:
+            batches: List of Batch objects available for allocation
+            shipments: List of (origin, dest, product, state, quantity, delivery_date) tuples
+            ambient_shelf_life: Days in ambient shelf life
+            frozen_shelf_life: Days in frozen shelf life
+            thawed_shelf_life: Days in thawed shelf life
+            decompose: Solve each (origin, product, state) group separately
+            max_workers: Threads for decomposed solves (None = executor default)
+        """
+        super().__init__(batches, shipments, ambient_shelf_life, frozen_shelf_life, thawed_shelf_life)
+        self.decompose = decompose
+        self.max_workers = max_workers
+
+    def optimize_allocation(self) -> Optional[Dict]:
+        """Solve the weighted-age LP; see LPFEFOAllocator.optimize_allocation.
+
+        Returns:
+            Allocation result dict (plus 'num_subproblems'), or None if any
+            group is infeasible (e.g. insufficient supply) or HiGHS fails
+        """
+        import time
+        import numpy as np
+
+        start_time = time.time()
+
+        groups = [group for group in self._compatible_groups().values() if group[0]]
+        self._log_supply_gaps(groups)
+
+        # Per-batch / per-shipment vectors for the weighted-age costs
+        rates = {
+            'ambient': 1.0 / self.ambient_shelf_life,
+            'frozen': 1.0 / self.frozen_shelf_life,
+            'thawed': 1.0 / self.thawed_shelf_life,
+        }
+        entry = np.array([b.state_entry_date.toordinal() for b in self.batches], dtype=float)
+        produced = np.array([b.production_date.toordinal() for b in self.batches], dtype=float)
+        self._entry = entry
+        self._initial_age = np.maximum(entry - produced, 0.0) * np.array(
+            [rates.get(b.initial_state, 0.0) for b in self.batches]
+        )
+        self._current_rate = np.array([rates.get(b.current_state, 0.0) for b in self.batches])
+        self._delivery = np.array([s[5].toordinal() for s in self.shipments], dtype=float)
+
+        num_variables = sum(len(b) * len(s) for b, s in groups)
+        logger.info(
+            f"Sparse LP FEFO: {len(self.batches)} batches × {len(self.shipments)} shipments = "
+            f"{num_variables} compatible pairs in {len(groups)} groups"
+        )
+
+        try:
+            if self.decompose and len(groups) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    solutions = list(executor.map(lambda group: self._solve_groups([group]), groups))
+            else:
+                solutions = [self._solve_groups(groups)] if groups else []
+        except Exception as e:
+            logger.error(f"Sparse LP FEFO failed: {e}")
+            return None
+
+        if any(solution is None for solution in solutions):
+            logger.error("Sparse LP FEFO: HiGHS did not find an optimal allocation")
+            return None
+
+        solve_time = time.time() - start_time
+        allocations = sorted(
+            (alloc for solution_allocations, _ in solutions for alloc in solution_allocations),
+            key=lambda alloc: (alloc['batch_idx'], alloc['shipment_idx'])
+        )
+        objective_value = sum(objective for _, objective in solutions)
+
+        logger.info(
+            f"Sparse LP FEFO: {len(allocations)} non-zero allocations, "
+            f"objective={objective_value:.4f}, {solve_time:.2f}s"
+        )
+
+        return {
+            'allocations': allocations,
+            'objective_value': objective_value,
+            'solve_time': solve_time,
+            'method': 'LP',
+            'num_variables': num_variables,
+            'num_nonzero': len(allocations),
+            'num_subproblems': len(solutions),
+        }
+
+    def _log_supply_gaps(self, groups: List[Tuple[List[int], List[int]]]):
+        """Warn about shipments the LP cannot satisfy (as the Pyomo build does)."""
+        supplied = set()
+        for batch_indices, shipment_indices in groups:
+            available = sum(self.batches[b].quantity for b in batch_indices)
+            demand = sum(self.shipments[s][4] for s in shipment_indices)
+            supplied.update(shipment_indices)
+            if available < demand - 0.01:
+                origin, _, product, state = self.shipments[shipment_indices[0]][:4]
+                logger.warning(
+                    f"Group ({origin}, {product}, {state}) insufficient supply: "
+                    f"need {demand:.0f}, have {available:.0f}"
+                )
+
+        for s_idx, shipment in enumerate(self.shipments):
+            if s_idx not in supplied:
+                logger.warning(f"Shipment {s_idx} has NO compatible batches: {shipment}")
+
+    def _solve_groups(self, groups: List[Tuple[List[int], List[int]]]) -> Optional[Tuple[List[Dict], float]]:
+        """Build and solve one LP over the given groups (block-diagonal).
+
+        Variable k of a group with nb batches and ns shipments is
+        x[batch k // ns, shipment k % ns]. Rows are the shipment equalities
+        followed by the batch capacities.
+
+        Returns:
+            (allocations, objective_value), or None if not solved to optimality
+        """
+        import highspy
+        import numpy as np
+        from scipy import sparse
+
+        costs, blocks, row_lower, row_upper = [], [], [], []
+        for batch_indices, shipment_indices in groups:
+            b = np.asarray(batch_indices)
+            s = np.asarray(shipment_indices)
+            nb, ns = len(b), len(s)
+
+            days_in_current = np.maximum(self._delivery[s][None, :] - self._entry[b][:, None], 0.0)
+            costs.append((self._initial_age[b][:, None] + days_in_current * self._current_rate[b][:, None]).ravel())
+
+            blocks.append(sparse.vstack([
+                sparse.kron(np.ones((1, nb)), sparse.identity(ns)),    # shipment satisfaction
+                sparse.kron(sparse.identity(nb), np.ones((1, ns))),    # batch capacity
+            ]))
+
+            shipment_qty = np.array([self.shipments[i][4] for i in shipment_indices], dtype=float)
+            batch_qty = np.array([self.batches[i].quantity for i in batch_indices], dtype=float)
+            row_lower.extend([shipment_qty, np.full(nb, -highspy.kHighsInf)])
+            row_upper.extend([shipment_qty, batch_qty])
+
+        cost = np.concatenate(costs)
+        matrix = sparse.block_diag(blocks, format='csc')
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = matrix.shape[1]
+        lp.num_row_ = matrix.shape[0]
+        lp.col_cost_ = cost
+        lp.col_lower_ = np.zeros(len(cost))
+        lp.col_upper_ = np.full(len(cost), highspy.kHighsInf)
+        lp.row_lower_ = np.concatenate(row_lower)
+        lp.row_upper_ = np.concatenate(row_upper)
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kColwise
+        lp.a_matrix_.start_ = matrix.indptr
+        lp.a_matrix_.index_ = matrix.indices
+        lp.a_matrix_.value_ = matrix.data
+
+        solver = highspy.Highs()
+        solver.setOptionValue('output_flag', False)
+        solver.passModel(lp)
+        solver.run()
+        if solver.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            return None
+
+        x = np.asarray(solver.getSolution().col_value)
+
+        allocations = []
+        offset = 0
+        for batch_indices, shipment_indices in groups:
+            ns = len(shipment_indices)
+            block = x[offset:offset + len(batch_indices) * ns]
+            for k in np.flatnonzero(block > 0.01):
+                b_idx = batch_indices[k // ns]
+                allocations.append({
+                    'batch_id': self.batches[b_idx].id,
+                    'shipment_idx': shipment_indices[k % ns],
+                    'quantity': float(block[k]),
+                    'batch_idx': b_idx
+                })
+            offset += len(block)
+
+        return allocations, float(cost @ x)
+
+
+def sparse_lp_available() -> bool:
+    """True if numpy, scipy and highspy are importable (SparseLPFEFOAllocator)."""
+    try:
+        import highspy  # noqa: F401
+        import numpy  # noqa: F401
+        import scipy.sparse  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
 def allocate_batches_lp(
     batches: List,
     shipments: List[Tuple],
@@ -365,7 +600,10 @@ def allocate_batches_lp(
         Allocation result dict or None if failed
     """
     if allocation_method == 'lp':
-        allocator = LPFEFOAllocator(batches, shipments)
+        if sparse_lp_available():
+            allocator = SparseLPFEFOAllocator(batches, shipments)
+        else:
+            allocator = LPFEFOAllocator(batches, shipments)
         return allocator.optimize_allocation()
     else:
         # Greedy method handled by FEFOBatchAllocator
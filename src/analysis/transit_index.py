@@ -0,0 +1,225 @@
+"""Interval index over shipment legs for in-transit queries.
+
+A leg is on the road on date d if departure_date <= d < arrival_date. Scanning
+every shipment leg for each query is O(legs); the snapshot date slider and the
+retro visualization ask this on every interaction.
+
+TransitIndex is built once per solution. Legs are sorted by departure date and
+a max-arrival segment tree over that order answers:
+- on_date(d): legs on the road on d
+- between(d1, d2): legs on the road at any time in [d1, d2]
+- departing(d) / arriving(d): legs leaving / reaching on d
+in O(log n + k) for k results. Each query can be restricted to a lane
+(origin -> destination), an origin or a destination; those sub-indexes are
+built on first use.
+
+Results are returned in insertion order (for from_shipments: shipment order,
+then leg order).
+
+Example:
+    index = TransitIndex.from_shipments(shipments)
+    on_road = index.on_date(date(2025, 10, 15))
+    lane = index.between(date(2025, 10, 13), date(2025, 10, 19), origin_id="6122", destination_id="6125")
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date as Date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class TransitLeg:
+    """One leg of a movement between two locations.
+
+    Attributes:
+        origin_id: Location the leg departs from
+        destination_id: Location the leg arrives at
+        departure_date: Departure date
+        arrival_date: Arrival date (the leg is off the road from this date)
+        item: Object the leg belongs to (e.g. Shipment, TruckMovement)
+    """
+    origin_id: str
+    destination_id: str
+    departure_date: Date
+    arrival_date: Date
+    item: Any = None
+
+    @property
+    def transit_days(self) -> int:
+        """Days on the road."""
+        return (self.arrival_date - self.departure_date).days
+
+
+class TransitIndex:
+    """Static interval index over TransitLeg objects."""
+
+    def __init__(self, legs: Iterable[TransitLeg]):
+        """
+        Build the index.
+
+        Args:
+            legs: Legs to index (insertion order is the result order)
+        """
+        self.legs: List[TransitLeg] = list(legs)
+
+        # Positions sorted by departure (stable, so ties keep insertion order)
+        self._order = sorted(range(len(self.legs)), key=lambda i: self.legs[i].departure_date)
+        self._departures = [self.legs[i].departure_date.toordinal() for i in self._order]
+
+        # Arrival order for arriving() lookups
+        self._arrival_order = sorted(range(len(self.legs)), key=lambda i: self.legs[i].arrival_date)
+        self._arrivals = [self.legs[i].arrival_date.toordinal() for i in self._arrival_order]
+
+        # Max-arrival segment tree over departure order (leaves at _size + i)
+        self._size = 1
+        while self._size < max(len(self.legs), 1):
+            self._size *= 2
+        self._max_arrival = [-1] * (2 * self._size)
+        for pos, i in enumerate(self._order):
+            self._max_arrival[self._size + pos] = self.legs[i].arrival_date.toordinal()
+        for node in range(self._size - 1, 0, -1):
+            self._max_arrival[node] = max(self._max_arrival[2 * node], self._max_arrival[2 * node + 1])
+
+        self._subindexes: Dict[Tuple[Optional[str], Optional[str]], TransitIndex] = {}
+
+    @classmethod
+    def from_shipments(cls, shipments: Iterable[Any]) -> "TransitIndex":
+        """
+        Index every route leg of every shipment.
+
+        Leg dates are derived as in the rest of the analysis code: the shipment
+        departs delivery_date - total_transit_days and each leg takes its
+        transit_days.
+
+        Args:
+            shipments: Shipments with delivery_date, total_transit_days and
+                route.route_legs
+
+        Returns:
+            TransitIndex whose legs carry the shipment as item
+        """
+        legs = []
+        for shipment in shipments:
+            current_date = shipment.delivery_date - timedelta(days=shipment.total_transit_days)
+            for route_leg in shipment.route.route_legs:
+                arrival_date = current_date + timedelta(days=route_leg.transit_days)
+                legs.append(TransitLeg(
+                    origin_id=route_leg.from_location_id,
+                    destination_id=route_leg.to_location_id,
+                    departure_date=current_date,
+                    arrival_date=arrival_date,
+                    item=shipment,
+                ))
+                current_date = arrival_date
+        return cls(legs)
+
+    def __len__(self) -> int:
+        return len(self.legs)
+
+    @property
+    def lanes(self) -> List[Tuple[str, str]]:
+        """Distinct (origin, destination) lanes, sorted."""
+        return sorted({(leg.origin_id, leg.destination_id) for leg in self.legs})
+
+    def on_date(
+        self,
+        on_date: Date,
+        origin_id: Optional[str] = None,
+        destination_id: Optional[str] = None
+    ) -> List[TransitLeg]:
+        """
+        Legs on the road on a date (departure_date <= on_date < arrival_date).
+
+        Args:
+            on_date: Date to query
+            origin_id: Only legs departing from this location (optional)
+            destination_id: Only legs arriving at this location (optional)
+
+        Returns:
+            Matching legs in insertion order
+        """
+        return self.between(on_date, on_date, origin_id, destination_id)
+
+    def between(
+        self,
+        start_date: Date,
+        end_date: Date,
+        origin_id: Optional[str] = None,
+        destination_id: Optional[str] = None
+    ) -> List[TransitLeg]:
+        """
+        Legs on the road at any time from start_date to end_date (inclusive).
+
+        A leg overlaps the range if departure_date <= end_date and
+        arrival_date > start_date.
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range (inclusive)
+            origin_id: Only legs departing from this location (optional)
+            destination_id: Only legs arriving at this location (optional)
+
+        Returns:
+            Matching legs in insertion order
+        """
+        index = self._subindex(origin_id, destination_id)
+        if end_date < start_date or not index.legs:
+            return []
+
+        prefix = bisect_right(index._departures, end_date.toordinal())
+        threshold = start_date.toordinal()
+
+        positions = []
+        stack = [(1, 0, index._size)]
+        while stack:
+            node, lo, hi = stack.pop()
+            if lo >= prefix or index._max_arrival[node] <= threshold:
+                continue
+            if hi - lo == 1:
+                positions.append(index._order[lo])
+                continue
+            mid = (lo + hi) // 2
+            stack.append((2 * node + 1, mid, hi))
+            stack.append((2 * node, lo, mid))
+
+        return [index.legs[i] for i in sorted(positions)]
+
+    def departing(
+        self,
+        on_date: Date,
+        origin_id: Optional[str] = None,
+        destination_id: Optional[str] = None
+    ) -> List[TransitLeg]:
+        """Legs departing on a date (optionally on a lane / origin / destination)."""
+        index = self._subindex(origin_id, destination_id)
+        day = on_date.toordinal()
+        lo, hi = bisect_left(index._departures, day), bisect_right(index._departures, day)
+        return [index.legs[i] for i in sorted(index._order[lo:hi])]
+
+    def arriving(
+        self,
+        on_date: Date,
+        origin_id: Optional[str] = None,
+        destination_id: Optional[str] = None
+    ) -> List[TransitLeg]:
+        """Legs arriving on a date (optionally on a lane / origin / destination)."""
+        index = self._subindex(origin_id, destination_id)
+        day = on_date.toordinal()
+        lo, hi = bisect_left(index._arrivals, day), bisect_right(index._arrivals, day)
+        return [index.legs[i] for i in sorted(index._arrival_order[lo:hi])]
+
+    def _subindex(self, origin_id: Optional[str], destination_id: Optional[str]) -> "TransitIndex":
+        """Index restricted to an origin and/or destination (built on first use)."""
+        if origin_id is None and destination_id is None:
+            return self
+        key = (origin_id, destination_id)
+        if key not in self._subindexes:
+            self._subindexes[key] = TransitIndex(
+                leg for leg in self.legs
+                if (origin_id is None or leg.origin_id == origin_id)
+                and (destination_id is None or leg.destination_id == destination_id)
+            )
+        return self._subindexes[key]
@@ -4,6 +4,7 @@ from .location import Location, LocationType, StorageMode
 from .route import Route
 from .product import Product, ProductState
 from .forecast import Forecast, ForecastEntry
+from .forecast_store import ForecastStore
 from .manufacturing import ManufacturingSite
 from .truck_schedule import TruckSchedule, DepartureType, DayOfWeek
 from .labor_calendar import LaborCalendar, LaborDay
@@ -23,6 +24,7 @@ __all__ = [
     "ProductState",
     "Forecast",
     "ForecastEntry",
+    "ForecastStore",
     # Manufacturing and production
     "ManufacturingSite",
     "TruckSchedule",
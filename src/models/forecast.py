@@ -1,8 +1,11 @@
 """Forecast data model for demand planning."""
 
+from collections.abc import Sequence
 from datetime import date as Date
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import Any, Iterator, Optional
+from pydantic import BaseModel, Field, PrivateAttr
+
+from .forecast_store import ForecastStore
 
 
 class ForecastEntry(BaseModel):
@@ -36,10 +39,59 @@ class ForecastEntry(BaseModel):
         )
 
 
+class ForecastEntryView(Sequence):
+    """Read-only list of ForecastEntry objects backed by a ForecastStore.
+
+    Used as Forecast.entries for forecasts built with Forecast.from_store(), so
+    existing callers that iterate, index or len() the entries keep working
+    without a ForecastEntry object per row being held in memory. Entries are
+    created on access (without re-validation - the store is validated).
+    """
+
+    def __init__(self, store: ForecastStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self._entry(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("forecast entry index out of range")
+        return self._entry(index)
+
+    def __iter__(self) -> Iterator[ForecastEntry]:
+        for i in range(len(self)):
+            yield self._entry(i)
+
+    def _entry(self, i: int) -> ForecastEntry:
+        location_id, product_id, forecast_date, quantity, confidence = self.store.row(i)
+        return ForecastEntry.model_construct(
+            location_id=location_id,
+            product_id=product_id,
+            forecast_date=forecast_date,
+            quantity=quantity,
+            confidence=confidence,
+        )
+
+    def __repr__(self) -> str:
+        return f"ForecastEntryView({len(self)} entries)"
+
+
 class Forecast(BaseModel):
     """
     Container for multiple forecast entries.
 
+    Lookups go through a columnar ForecastStore (see forecast_store.py), built
+    from the entries on first use. Forecasts created with from_store() keep
+    only the store; their entries are a read-only ForecastEntryView.
+
+    The store built from list entries is a cache and is not pickled, so equal
+    forecasts pickle to the same bytes whether or not .store was used.
+
     Attributes:
         name: Name of the forecast (e.g., "Q4 2025 Forecast")
         entries: List of forecast entries
@@ -55,6 +107,64 @@ class Forecast(BaseModel):
         description="Forecast creation date"
     )
 
+    _store: Optional[ForecastStore] = PrivateAttr(default=None)
+    _store_key: Optional[tuple] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_store(
+        cls,
+        name: str,
+        store: ForecastStore,
+        creation_date: Optional[Date] = None,
+    ) -> "Forecast":
+        """
+        Create a forecast backed by a ForecastStore.
+
+        Skips per-entry Pydantic validation (the store validates its columns
+        in one vectorized pass). entries becomes a read-only ForecastEntryView.
+
+        Args:
+            name: Forecast name
+            store: Columnar forecast data
+            creation_date: Forecast creation date (default: today)
+
+        Returns:
+            Forecast
+        """
+        return cls.model_construct(
+            name=name,
+            entries=ForecastEntryView(store),
+            creation_date=creation_date or Date.today(),
+        )
+
+    @property
+    def store(self) -> ForecastStore:
+        """
+        Columnar view of the entries (built on first use).
+
+        Rebuilt if entries is replaced or changes length. Call refresh_store()
+        after editing entries in place. Forecasts from from_store() return
+        the store behind their ForecastEntryView.
+        """
+        if isinstance(self.entries, ForecastEntryView):
+            return self.entries.store
+        key = (id(self.entries), len(self.entries))
+        if self._store is None or self._store_key != key:
+            self._store = ForecastStore.from_entries(self.entries)
+            self._store_key = key
+        return self._store
+
+    def refresh_store(self) -> None:
+        """Discard the cached store after entries were edited in place."""
+        self._store = None
+        self._store_key = None
+
+    def __getstate__(self) -> dict:
+        """Pickle without the cached store (its key holds an object id)."""
+        state = super().__getstate__()
+        state['__pydantic_private__'] = {'_store': None, '_store_key': None}
+        return state
+
     def get_demand(self, location_id: str, product_id: str, forecast_date: Date) -> float:
         """
         Get forecasted demand for a specific location, product, and date.
@@ -65,14 +175,9 @@ class Forecast(BaseModel):
             forecast_date: Date to query
 
         Returns:
-            Forecasted quantity (0 if not found)
+            Forecasted quantity, summed over duplicate entries (0 if not found)
         """
-        for entry in self.entries:
-            if (entry.location_id == location_id and
-                entry.product_id == product_id and
-                entry.forecast_date == forecast_date):
-                return entry.quantity
-        return 0.0
+        return self.store.get_demand(location_id, product_id, forecast_date)
 
     def __str__(self) -> str:
         """String representation."""
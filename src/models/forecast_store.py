@@ -0,0 +1,396 @@
+"""Columnar forecast storage backed by NumPy arrays.
+
+A Forecast with tens of thousands of ForecastEntry objects is slow to validate
+and to scan: every consumer (SlidingWindowModel, DailySnapshotGenerator,
+get_demand) iterates the full list. ForecastStore keeps the same data as
+integer-coded columns:
+
+- location and product IDs are coded against sorted ID tables
+- dates are stored as day numbers (numpy datetime64[D])
+- quantities and confidences are float arrays (NaN = no confidence)
+
+Duplicate (location, product, date) rows are kept as rows and summed by the
+lookups and aggregations, matching how SlidingWindowModel treats them.
+
+Example:
+    store = ForecastStore.from_columns(
+        location_ids=["6103", "6103"],
+        product_ids=["P1", "P1"],
+        dates=[date(2025, 6, 1), date(2025, 6, 2)],
+        quantities=[100.0, 150.0],
+    )
+    store.get_demand("6103", "P1", date(2025, 6, 2))   # 150.0
+    store.demand_dict(date(2025, 6, 2), date(2025, 6, 30))
+    store.aggregate(by=("location_id",))               # {"6103": 250.0}
+"""
+
+from datetime import date as Date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+# Column names accepted by ForecastStore.aggregate(by=...)
+GROUP_COLUMNS = ("location_id", "product_id", "forecast_date")
+
+
+def _to_days(dates: Any) -> np.ndarray:
+    """Convert dates (date objects, pandas timestamps or datetime64) to day numbers."""
+    return np.asarray(dates, dtype="datetime64[D]").astype(np.int64)
+
+
+def _to_date(day: int) -> Date:
+    """Convert a day number back to a datetime.date."""
+    return np.datetime64(int(day), "D").astype(Date)
+
+
+class ForecastStore:
+    """Forecast demand held as integer-coded NumPy columns.
+
+    Build with from_columns(), from_entries() or from_dataframe(); the
+    constructor takes already coded arrays and is used internally.
+
+    Attributes:
+        location_table: Sorted location IDs (location code -> ID)
+        product_table: Sorted product IDs (product code -> ID)
+        location_codes: Location code per row (int32)
+        product_codes: Product code per row (int32)
+        days: Day number per row (int64, days since 1970-01-01)
+        quantities: Quantity per row (float64)
+        confidences: Confidence per row (float64, NaN if not given)
+    """
+
+    def __init__(
+        self,
+        location_table: Sequence[str],
+        product_table: Sequence[str],
+        location_codes: np.ndarray,
+        product_codes: np.ndarray,
+        days: np.ndarray,
+        quantities: np.ndarray,
+        confidences: Optional[np.ndarray] = None,
+    ):
+        self.location_table: Tuple[str, ...] = tuple(location_table)
+        self.product_table: Tuple[str, ...] = tuple(product_table)
+        self.location_codes = np.asarray(location_codes, dtype=np.int32)
+        self.product_codes = np.asarray(product_codes, dtype=np.int32)
+        self.days = np.asarray(days, dtype=np.int64)
+        self.quantities = np.asarray(quantities, dtype=np.float64)
+        if confidences is None:
+            confidences = np.full(len(self.quantities), np.nan)
+        self.confidences = np.asarray(confidences, dtype=np.float64)
+
+        self._location_index = {loc: i for i, loc in enumerate(self.location_table)}
+        self._product_index = {prod: i for i, prod in enumerate(self.product_table)}
+        self._demand_index: Optional[Dict[Tuple[int, int, int], float]] = None
+
+    def __getstate__(self) -> dict:
+        """Pickle the columns only; the lookup indexes are rebuilt on load."""
+        state = self.__dict__.copy()
+        for name in ('_location_index', '_product_index', '_demand_index'):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._location_index = {loc: i for i, loc in enumerate(self.location_table)}
+        self._product_index = {prod: i for i, prod in enumerate(self.product_table)}
+        self._demand_index = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_columns(
+        cls,
+        location_ids: Sequence[Any],
+        product_ids: Sequence[Any],
+        dates: Sequence[Any],
+        quantities: Sequence[float],
+        confidences: Optional[Sequence[Optional[float]]] = None,
+        validate: bool = True,
+    ) -> "ForecastStore":
+        """Build a store from parallel columns (lists, arrays or pandas Series).
+
+        Args:
+            location_ids: Destination location ID per row
+            product_ids: Product ID per row
+            dates: Forecast date per row
+            quantities: Forecast quantity per row
+            confidences: Optional confidence per row (None/NaN = not given)
+            validate: Check quantities and confidences (vectorized)
+
+        Returns:
+            ForecastStore
+
+        Raises:
+            ValueError: If column lengths differ or validation fails
+        """
+        locations = np.asarray(location_ids, dtype=object).astype(str)
+        products = np.asarray(product_ids, dtype=object).astype(str)
+        days = _to_days(dates)
+        qty = np.asarray(quantities, dtype=np.float64)
+        if confidences is None:
+            conf = np.full(len(qty), np.nan)
+        else:
+            conf = np.array(confidences, dtype=np.float64)  # None -> NaN
+
+        lengths = {len(locations), len(products), len(days), len(qty), len(conf)}
+        if len(lengths) != 1:
+            raise ValueError(f"Forecast columns have different lengths: {sorted(lengths)}")
+
+        location_table, location_codes = np.unique(locations, return_inverse=True)
+        product_table, product_codes = np.unique(products, return_inverse=True)
+
+        store = cls(
+            location_table=location_table.tolist(),
+            product_table=product_table.tolist(),
+            location_codes=location_codes,
+            product_codes=product_codes,
+            days=days,
+            quantities=qty,
+            confidences=conf,
+        )
+        if validate:
+            store.validate()
+        return store
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[Any], validate: bool = False) -> "ForecastStore":
+        """Build a store from ForecastEntry objects (or anything with the same attributes).
+
+        Entries are already validated by Pydantic, so validation is off by default.
+        """
+        entries = list(entries)
+        return cls.from_columns(
+            location_ids=[e.location_id for e in entries],
+            product_ids=[e.product_id for e in entries],
+            dates=[e.forecast_date for e in entries],
+            quantities=[e.quantity for e in entries],
+            confidences=[e.confidence for e in entries],
+            validate=validate,
+        )
+
+    @classmethod
+    def from_dataframe(
+        cls,
+        df: Any,
+        location_col: str = "location_id",
+        product_col: str = "product_id",
+        date_col: str = "forecast_date",
+        quantity_col: str = "quantity",
+        confidence_col: Optional[str] = None,
+        validate: bool = True,
+    ) -> "ForecastStore":
+        """Build a store from a long-format pandas DataFrame (one row per entry)."""
+        return cls.from_columns(
+            location_ids=df[location_col].to_numpy(),
+            product_ids=df[product_col].to_numpy(),
+            dates=df[date_col].to_numpy(),
+            quantities=df[quantity_col].to_numpy(),
+            confidences=df[confidence_col].tolist() if confidence_col else None,
+            validate=validate,
+        )
+
+    def validate(self) -> None:
+        """Check quantities and confidences with the ForecastEntry rules.
+
+        Raises:
+            ValueError: If any quantity is negative or missing, or any
+                confidence is outside [0, 1]
+        """
+        bad_qty = np.flatnonzero(~(self.quantities >= 0))
+        if len(bad_qty):
+            row = int(bad_qty[0])
+            raise ValueError(
+                f"{len(bad_qty)} forecast rows have a negative or missing quantity "
+                f"(first: row {row}, {self.row(row)})"
+            )
+        conf = self.confidences
+        bad_conf = np.flatnonzero(~np.isnan(conf) & ((conf < 0) | (conf > 1)))
+        if len(bad_conf):
+            row = int(bad_conf[0])
+            raise ValueError(
+                f"{len(bad_conf)} forecast rows have a confidence outside [0, 1] "
+                f"(first: row {row}, {self.row(row)})"
+            )
+
+    # ------------------------------------------------------------------
+    # Row access (used by the Forecast.entries adapter)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self.quantities)
+
+    def row(self, i: int) -> Tuple[str, str, Date, float, Optional[float]]:
+        """Row i as (location_id, product_id, forecast_date, quantity, confidence)."""
+        confidence = self.confidences[i]
+        return (
+            self.location_table[self.location_codes[i]],
+            self.product_table[self.product_codes[i]],
+            _to_date(self.days[i]),
+            float(self.quantities[i]),
+            None if np.isnan(confidence) else float(confidence),
+        )
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @property
+    def location_ids(self) -> List[str]:
+        """Location IDs that have at least one row."""
+        return [self.location_table[c] for c in np.unique(self.location_codes)]
+
+    @property
+    def product_ids(self) -> List[str]:
+        """Product IDs that have at least one row."""
+        return [self.product_table[c] for c in np.unique(self.product_codes)]
+
+    @property
+    def dates(self) -> List[Date]:
+        """Sorted distinct forecast dates."""
+        return [_to_date(d) for d in np.unique(self.days)]
+
+    @property
+    def start_date(self) -> Optional[Date]:
+        return _to_date(self.days.min()) if len(self) else None
+
+    @property
+    def end_date(self) -> Optional[Date]:
+        return _to_date(self.days.max()) if len(self) else None
+
+    @property
+    def total_quantity(self) -> float:
+        return float(self.quantities.sum())
+
+    def get_demand(self, location_id: str, product_id: str, forecast_date: Date) -> float:
+        """Demand for a location, product and date (0 if none). O(1) after the first call."""
+        if self._demand_index is None:
+            self._demand_index = self._build_demand_index()
+        loc = self._location_index.get(location_id)
+        prod = self._product_index.get(product_id)
+        if loc is None or prod is None:
+            return 0.0
+        return self._demand_index.get((loc, prod, int(_to_days(forecast_date))), 0.0)
+
+    def _build_demand_index(self) -> Dict[Tuple[int, int, int], float]:
+        """Summed quantity per coded (location, product, day)."""
+        keys, totals = self._group(("location_id", "product_id", "forecast_date"), slice(None))
+        return dict(zip(map(tuple, keys.tolist()), totals.tolist()))
+
+    def date_mask(self, start_date: Optional[Date] = None, end_date: Optional[Date] = None) -> np.ndarray:
+        """Boolean row mask for start_date <= date <= end_date (either bound optional)."""
+        mask = np.ones(len(self), dtype=bool)
+        if start_date is not None:
+            mask &= self.days >= int(_to_days(start_date))
+        if end_date is not None:
+            mask &= self.days <= int(_to_days(end_date))
+        return mask
+
+    def filter_dates(self, start_date: Optional[Date] = None, end_date: Optional[Date] = None) -> "ForecastStore":
+        """Rows within [start_date, end_date] as a new store (code tables are shared)."""
+        return self.take(self.date_mask(start_date, end_date))
+
+    def take(self, rows: Any) -> "ForecastStore":
+        """Subset of rows (boolean mask or index array) as a new store."""
+        return ForecastStore(
+            location_table=self.location_table,
+            product_table=self.product_table,
+            location_codes=self.location_codes[rows],
+            product_codes=self.product_codes[rows],
+            days=self.days[rows],
+            quantities=self.quantities[rows],
+            confidences=self.confidences[rows],
+        )
+
+    def demand_dict(
+        self,
+        start_date: Optional[Date] = None,
+        end_date: Optional[Date] = None,
+    ) -> Dict[Tuple[str, str, Date], float]:
+        """Summed demand keyed by (location_id, product_id, forecast_date) within the dates."""
+        return self.aggregate(
+            by=("location_id", "product_id", "forecast_date"),
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    def aggregate(
+        self,
+        by: Sequence[str] = ("location_id", "product_id"),
+        start_date: Optional[Date] = None,
+        end_date: Optional[Date] = None,
+    ) -> Dict[Any, float]:
+        """Total quantity grouped by one or more columns.
+
+        Args:
+            by: Columns from GROUP_COLUMNS to group by, in key order
+            start_date: Optional first date to include
+            end_date: Optional last date to include
+
+        Returns:
+            Dict of group key -> total quantity. Keys are tuples in `by` order,
+            or plain values when grouping by a single column.
+
+        Raises:
+            ValueError: If `by` names an unknown column
+        """
+        by = tuple(by)
+        unknown = [c for c in by if c not in GROUP_COLUMNS]
+        if unknown or not by:
+            raise ValueError(f"Cannot group forecast by {list(by)}. Expected columns from {list(GROUP_COLUMNS)}")
+
+        keys, totals = self._group(by, self.date_mask(start_date, end_date))
+        decoders = [self._decoder(c) for c in by]
+        result = {}
+        for key, total in zip(keys.tolist(), totals.tolist()):
+            decoded = tuple(decode(k) for decode, k in zip(decoders, key))
+            result[decoded if len(decoded) > 1 else decoded[0]] = total
+        return result
+
+    def _column(self, name: str) -> np.ndarray:
+        return {
+            "location_id": self.location_codes,
+            "product_id": self.product_codes,
+            "forecast_date": self.days,
+        }[name]
+
+    def _decoder(self, name: str):
+        if name == "location_id":
+            return self.location_table.__getitem__
+        if name == "product_id":
+            return self.product_table.__getitem__
+        return _to_date
+
+    def _group(self, by: Tuple[str, ...], rows: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Distinct coded keys (n_groups x len(by)) and their summed quantities."""
+        columns = np.column_stack([self._column(c)[rows] for c in by])
+        if len(columns) == 0:
+            return columns, np.empty(0)
+        keys, inverse = np.unique(columns, axis=0, return_inverse=True)
+        totals = np.bincount(inverse.ravel(), weights=self.quantities[rows], minlength=len(keys))
+        return keys, totals
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def to_dataframe(self) -> Any:
+        """Long-format pandas DataFrame with the ForecastEntry column names."""
+        import pandas as pd
+
+        return pd.DataFrame({
+            "location_id": np.asarray(self.location_table, dtype=object)[self.location_codes] if len(self) else [],
+            "product_id": np.asarray(self.product_table, dtype=object)[self.product_codes] if len(self) else [],
+            "forecast_date": [_to_date(d) for d in self.days],
+            "quantity": self.quantities,
+            "confidence": self.confidences,
+        })
+
+    def __repr__(self) -> str:
+        return (
+            f"ForecastStore({len(self)} rows, {len(self.location_table)} locations, "
+            f"{len(self.product_table)} products, {self.start_date} to {self.end_date})"
+        )
@@ -23,6 +23,23 @@ from .base_model import (
 from .sliding_window_model import (
     SlidingWindowModel,
 )
+from .solve_session import (
+    PersistentSolveSession,
+)
+from .fixed_periods import (
+    FixedPeriod,
+)
+from .rolling_horizon import (
+    RollingHorizonSolver,
+)
+from .temporal_aggregation import (
+    PlanningPeriods,
+    PeriodLabor,
+)
+from .solve_telemetry import (
+    SolveProgress,
+    SolveTelemetry,
+)
 
 __all__ = [
     # Solver configuration
@@ -36,4 +53,16 @@ __all__ = [
     "OptimizationResult",
     # Sliding window model (production model)
     "SlidingWindowModel",
+    # Persistent what-if re-solves
+    "PersistentSolveSession",
+    # Rolling-horizon fixed periods
+    "FixedPeriod",
+    # Relax-and-fix solve for long horizons
+    "RollingHorizonSolver",
+    # Variable-granularity planning periods
+    "PlanningPeriods",
+    "PeriodLabor",
+    # Live MIP progress and early stop
+    "SolveProgress",
+    "SolveTelemetry",
 ]
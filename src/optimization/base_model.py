@@ -8,11 +8,12 @@ This ensures strict interface compliance and fail-fast validation at the model-U
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, Callable, List, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 import time
 import math
+import warnings
 
 from pyomo.environ import ConcreteModel, Objective, Constraint, Var, value
 from pyomo.opt import SolverStatus, TerminationCondition
@@ -22,6 +23,10 @@ from .solver_config import SolverConfig
 # Import OptimizationSolution for type hints
 if TYPE_CHECKING:
     from .result_schema import OptimizationSolution
+    from .solve_session import PersistentSolveSession
+    from .fixed_periods import FixedPeriod
+    from .solve_telemetry import SolveProgress, SolveTelemetry
+    from .build_profiler import BuildProfiler
 
 # Import ValidationError for fail-fast handling
 from pydantic import ValidationError
@@ -172,6 +177,11 @@ class BaseOptimizationModel(ABC):
         self.result: Optional[OptimizationResult] = None
         self.solution: Optional['OptimizationSolution'] = None  # Now Pydantic validated
         self._build_time: Optional[float] = None
+        # True while solve() builds for highs_direct/portfolio: models may emit
+        # bulk constraint families as highs_direct.DirectRows instead of Pyomo
+        self._direct_build = False
+        self.primal_solver = None  # APPSI solver holding the solution during extract_solution()
+        self.build_profile: Optional['BuildProfiler'] = None  # Set by models that profile their build
 
     @abstractmethod
     def build_model(self) -> ConcreteModel:
@@ -239,6 +249,12 @@ class BaseOptimizationModel(ABC):
         use_warmstart: bool = False,
         use_aggressive_heuristics: bool = False,
         tee: bool = False,
+        partial_start: Optional[List[Any]] = None,
+        highs_options: Optional[Dict[str, Any]] = None,
+        telemetry: Optional['SolveTelemetry'] = None,
+        direct: bool = False,
+        portfolio: bool = False,
+        extract: bool = True,
     ) -> OptimizationResult:
         """
         Solve model using APPSI HiGHS solver (modern Pyomo interface).
@@ -252,15 +268,221 @@ class BaseOptimizationModel(ABC):
             use_warmstart: Enable warmstart from variable initial values
             use_aggressive_heuristics: Enable aggressive MIP heuristics
             tee: Show solver output
+            partial_start: Variables whose current values are passed to HiGHS as
+                a partial MIP start (replaces the dense use_warmstart start)
+            highs_options: HiGHS options applied over the project defaults
+                (e.g. {'threads': 2})
+            telemetry: Records MIP progress during the solve (see solve_telemetry)
+            direct: Load the model into HiGHS as CSR arrays instead of through
+                APPSI (see highs_direct.DirectHighs)
+            portfolio: Race several HiGHS/CBC configurations in separate
+                processes (see solver_portfolio.SolverPortfolio); a partial
+                start becomes a dense warmstart and telemetry is not recorded
+            extract: Build the OptimizationSolution (see _run_appsi_solve)
 
         Returns:
             OptimizationResult
         """
+        if portfolio:
+            # Members take a dense start (hint values are already loaded)
+            use_warmstart = use_warmstart or bool(partial_start)
+            partial_start = None
+            if telemetry is not None:
+                warnings.warn(
+                    "Solve telemetry / progress_callback is not supported by the solver portfolio "
+                    "(members run in separate processes); progress not recorded",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+                telemetry = None
+        solver = self._create_appsi_highs_solver(
+            time_limit_seconds=time_limit_seconds,
+            mip_gap=mip_gap,
+            use_warmstart=use_warmstart and not partial_start,
+            use_aggressive_heuristics=use_aggressive_heuristics,
+            tee=tee,
+            highs_options=highs_options,
+            direct=direct,
+            portfolio=portfolio,
+        )
+        if partial_start:
+            self._set_appsi_partial_start(solver, partial_start)
+        return self._run_appsi_solve(solver, telemetry=telemetry, extract=extract)
+
+    def _solve_lp_first(
+        self,
+        mode: str,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        use_aggressive_heuristics: bool = False,
+        tee: bool = False,
+        highs_options: Optional[Dict[str, Any]] = None,
+        telemetry: Optional['SolveTelemetry'] = None,
+        partial_start: Optional[List[Any]] = None,
+    ) -> OptimizationResult:
+        """
+        Solve with the LP-relaxation-first pipeline (see lp_first.py).
+
+        The LP relaxation and every repair LP run on the same persistent APPSI
+        HiGHS solver as the final solve, all within one time limit: each solve
+        gets the time remaining (the final one at least
+        lp_first.MIN_SOLVE_SECONDS). If the repair fails, the MIP is solved
+        from the partial start if given, else without a warmstart (also in
+        'fast' mode).
+
+        Args:
+            mode: 'warmstart' (repaired incumbent warmstarts the MIP) or
+                'fast' (repaired incumbent is the result)
+            time_limit_seconds: Time limit for the whole pipeline (LP, repair LPs, MIP)
+            mip_gap: MIP gap tolerance
+            use_aggressive_heuristics: Enable aggressive MIP heuristics
+            tee: Show solver output
+            highs_options: HiGHS options applied over the project defaults
+            telemetry: Records MIP progress of the final MIP solve
+            partial_start: Variables whose current (warmstart hint) values start
+                the MIP if the repair fails (see _set_appsi_partial_start)
+
+        Returns:
+            OptimizationResult with metadata['lp_first'] (bound, repair stats)
+        """
+        from .lp_first import MIN_SOLVE_SECONDS, remaining_time, repair_lp_relaxation, unfix_repaired
+
+        deadline = time.time() + time_limit_seconds if time_limit_seconds else None
+        solver = self._create_appsi_highs_solver(
+            time_limit_seconds=time_limit_seconds,
+            mip_gap=mip_gap,
+            use_aggressive_heuristics=use_aggressive_heuristics,
+            tee=tee,
+            highs_options=highs_options,
+        )
+
+        # The LP solves overwrite the hint values; keep them for the fallback start
+        hint_values = [(v, v.value) for v in partial_start or ()]
+
+        print(f"\nLP-first ({mode}): solving LP relaxation and repairing integers...")
+        repair = repair_lp_relaxation(self.model, solver, verbose=True, deadline=deadline)
+
+        remaining = remaining_time(deadline)
+        if remaining is not None:
+            solver.config.time_limit = max(remaining, MIN_SOLVE_SECONDS)
+
+        if repair.success and mode == 'fast':
+            # Integers still fixed: this solve is the LP over the continuous variables
+            result = self._run_appsi_solve(solver)
+            unfix_repaired(repair)
+            if result.success:
+                result.termination_condition = TerminationCondition.feasible
+                result.gap = repair.gap
+            result.solve_time_seconds = repair.lp_time + repair.repair_time + (result.solve_time_seconds or 0)
+        else:
+            if repair.success:
+                # Values of the repaired solution stay loaded as the MIP start
+                unfix_repaired(repair)
+                solver.config.warmstart = True
+                gap_text = f"{repair.gap:.2%}" if repair.gap is not None else "n/a"
+                print(f"  Repaired incumbent {repair.objective:,.2f} (gap {gap_text} to LP bound) -> MIP warmstart")
+            elif hint_values:
+                for var_data, value in hint_values:
+                    var_data.set_value(value, skip_validation=True)
+                self._set_appsi_partial_start(solver, partial_start)
+                print(f"  Integer repair failed ({repair.message}); solving the MIP from the warmstart hints")
+            else:
+                print(f"  Integer repair failed ({repair.message}); solving the MIP without warmstart")
+            result = self._run_appsi_solve(solver, telemetry=telemetry)
+
+        result.metadata['lp_first'] = dict(repair.summary(), mode=mode)
+        return result
+
+    def _set_appsi_partial_start(self, solver, variables: List[Any]) -> None:
+        """
+        Hand HiGHS a partial MIP start built from the given variables' values.
+
+        APPSI's own warmstart sends every column (unset values as 0). After a
+        rolling-horizon shift that dense start is usually infeasible and HiGHS
+        discards it. A sparse start fixes only the given discrete variables and
+        lets HiGHS complete the rest with a small sub-MIP.
+
+        Falls back to APPSI's dense warmstart if the HiGHS interface does not
+        expose sparse solutions.
+
+        Args:
+            solver: APPSI Highs from _create_appsi_highs_solver()
+            variables: Pyomo variable data with values set
+        """
+        import numpy as np
+
+        solver.set_instance(self.model)
+        try:
+            var_map = solver._pyomo_var_to_solver_var_map
+            columns = [(var_map[id(v)], v.value) for v in variables if id(v) in var_map]
+            index = np.array([c for c, _ in columns], dtype=np.int32)
+            values = np.array([val for _, val in columns], dtype=np.float64)
+            solver._solver_model.setSolution(len(columns), index, values)
+        except (AttributeError, TypeError) as e:
+            print(f"  Partial MIP start unavailable ({e}); using full warmstart")
+            solver.config.warmstart = True
+            return
+
+        # The instance was just loaded - nothing for solve() to re-scan
+        update_config = solver.update_config
+        update_config.check_for_new_or_removed_constraints = False
+        update_config.check_for_new_or_removed_vars = False
+        update_config.check_for_new_or_removed_params = False
+        update_config.check_for_new_objective = False
+        update_config.update_constraints = False
+        update_config.update_vars = False
+        update_config.update_params = False
+        update_config.update_named_expressions = False
+        update_config.update_objective = False
+        print(f"  Partial MIP start: {len(columns):,} discrete values passed to HiGHS")
+
+    def _create_appsi_highs_solver(
+        self,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        use_warmstart: bool = False,
+        use_aggressive_heuristics: bool = False,
+        tee: bool = False,
+        highs_options: Optional[Dict[str, Any]] = None,
+        direct: bool = False,
+        portfolio: bool = False,
+    ):
+        """
+        Create an APPSI HiGHS solver configured with the project's HiGHS options.
+
+        Split out of _solve_with_appsi_highs() so a persistent solve session
+        (see solve_session.PersistentSolveSession) can keep one configured
+        solver alive across re-solves.
+
+        Args:
+            time_limit_seconds: Maximum solve time
+            mip_gap: MIP gap tolerance
+            use_warmstart: Enable warmstart from variable initial values
+            use_aggressive_heuristics: Enable aggressive MIP heuristics
+            tee: Show solver output
+            highs_options: HiGHS options applied over the defaults below
+            direct: Create a highs_direct.DirectHighs (same interface and
+                options, model passed to HiGHS as CSR arrays)
+            portfolio: Create a solver_portfolio.SolverPortfolio (options below
+                are the base of every HiGHS member; members set their own
+                threads, seeds and heuristic settings)
+
+        Returns:
+            Configured pyomo.contrib.appsi.solvers.Highs (or DirectHighs,
+            SolverPortfolio) instance
+        """
         from pyomo.contrib.appsi.solvers import Highs
         import os
 
         # Create APPSI solver
-        solver = Highs()
+        if direct:
+            from .highs_direct import DirectHighs
+            solver = DirectHighs()
+        elif portfolio:
+            from .solver_portfolio import SolverPortfolio
+            solver = SolverPortfolio()
+        else:
+            solver = Highs()
 
         # Configure solver
         if time_limit_seconds:
@@ -298,11 +520,43 @@ class BaseOptimizationModel(ABC):
             solver.highs_options['mip_heuristic_effort'] = 1.0
             solver.highs_options['mip_lp_age_limit'] = 10
 
+        # Caller overrides (e.g. per-worker thread limits for parallel solves)
+        if highs_options:
+            solver.highs_options.update(highs_options)
+
         # Solve (with safe solution loading for APPSI)
         # APPSI throws RuntimeError if solution loading fails
         # We need to check termination condition FIRST, then load if optimal/feasible
         solver.config.load_solution = False  # Don't load automatically
 
+        return solver
+
+    def _run_appsi_solve(
+        self,
+        solver,
+        telemetry: Optional['SolveTelemetry'] = None,
+        extract: bool = True,
+    ) -> OptimizationResult:
+        """
+        Solve self.model with a configured APPSI solver and extract the result.
+
+        The solver may be fresh or persistent (already holding self.model from a
+        previous solve, in which case APPSI only pushes the changes).
+
+        Args:
+            solver: APPSI solver from _create_appsi_highs_solver()
+            telemetry: Records MIP progress (HiGHS callbacks) during the solve;
+                summary stored in metadata['solve_progress']
+            extract: Build and validate the OptimizationSolution. False leaves
+                only the values loaded into the model (e.g. a rolling-horizon
+                window whose relaxed look-ahead is not a valid plan)
+
+        Returns:
+            OptimizationResult
+        """
+        if telemetry is not None:
+            telemetry.attach(solver, self.model)
+
         solve_start = time.time()
         try:
             results = solver.solve(self.model)
@@ -347,6 +601,9 @@ class BaseOptimizationModel(ABC):
             solve_time = time.time() - solve_start
             # Re-raise with context
             raise RuntimeError(f"APPSI solve failed: {e}") from e
+        finally:
+            if telemetry is not None:
+                telemetry.detach()
 
         # Convert APPSI Results to our OptimizationResult
         # Check termination condition by name (APPSI has: optimal, infeasible, unbounded, etc.)
@@ -374,6 +631,11 @@ class BaseOptimizationModel(ABC):
             legacy_tc = TerminationCondition.maxTimeLimit
             success = (hasattr(results, 'best_feasible_objective') and
                       results.best_feasible_objective is not None)
+        elif appsi_tc == AppsiTC.interrupted and has_feasible:
+            # Stopped early (e.g. SolveTelemetry stop_gap) - keep the incumbent
+            legacy_tc = TerminationCondition.feasible
+            success = True
+            print(f"  -> Interrupted with incumbent, mapped to: feasible, success=True")
         else:
             # Unknown or error condition
             legacy_tc = TerminationCondition.unknown
@@ -403,7 +665,7 @@ class BaseOptimizationModel(ABC):
             solver_status=None,  # APPSI doesn't have solver_status
             termination_condition=legacy_tc,  # Use converted legacy enum for compatibility
             solve_time_seconds=solve_time,
-            solver_name='appsi_highs',
+            solver_name=getattr(solver, 'backend', 'appsi_highs'),
             gap=gap,
             num_variables=num_vars,
             num_constraints=num_cons,
@@ -413,10 +675,15 @@ class BaseOptimizationModel(ABC):
         self.result = result
 
         # Extract solution if successful
-        if success:
+        if success and extract:
             try:
-                # APPSI automatically loads solution into model
-                self.solution = self.extract_solution(self.model)  # Returns OptimizationSolution (Pydantic)
+                # APPSI automatically loads solution into model; extract_solution
+                # may read all primal values from the solver at once (primal_solver)
+                self.primal_solver = solver
+                try:
+                    self.solution = self.extract_solution(self.model)  # Returns OptimizationSolution (Pydantic)
+                finally:
+                    self.primal_solver = None
 
                 # Store solution data in result metadata (convert to dict)
                 result.metadata.update(self.solution.model_dump(mode='json'))
@@ -501,6 +768,13 @@ class BaseOptimizationModel(ABC):
                 result.infeasibility_message = f"Unexpected error during solution extraction: {e}"
                 result.metadata['solution_extraction_failed'] = True
 
+        if telemetry is not None:
+            result.metadata['solve_progress'] = telemetry.summary()
+            if telemetry.stopped_early:
+                print(f"  Stopped early: {telemetry.stop_reason}")
+        if getattr(solver, 'backend', None) in ('highs_direct', 'portfolio'):
+            result.metadata[solver.backend] = dict(solver.stats)
+
         return result
 
     def solve(
@@ -512,13 +786,25 @@ class BaseOptimizationModel(ABC):
         mip_gap: Optional[float] = None,
         use_aggressive_heuristics: bool = False,
         use_warmstart: bool = False,
+        warmstart_hints: Optional[Dict[tuple, float]] = None,
+        fixed_period: Optional['FixedPeriod'] = None,
+        lp_first: Optional[str] = None,
+        progress_callback: Optional[Callable[['SolveProgress'], Optional[bool]]] = None,
+        telemetry: Optional['SolveTelemetry'] = None,
     ) -> OptimizationResult:
         """
         Build and solve the optimization model.
 
         Args:
-            solver_name: Name of solver to use (None = best available)
-            solver_options: Additional solver options
+            solver_name: Name of solver to use (None = best available).
+                'highs_direct' solves with HiGHS like 'appsi_highs' but passes
+                the model as CSR arrays (see highs_direct.py); models that
+                support it build their bulk constraint rows straight into
+                those arrays. 'portfolio' races several HiGHS configurations
+                (and CBC if installed) in separate processes and returns the
+                best (see solver_portfolio.py)
+            solver_options: Additional solver options (for appsi_highs: HiGHS
+                options applied over the project defaults, e.g. {'threads': 2})
             tee: If True, print solver output
             time_limit_seconds: Maximum solve time in seconds
             mip_gap: MIP gap tolerance (e.g., 0.01 for 1% gap)
@@ -527,10 +813,36 @@ class BaseOptimizationModel(ABC):
                 Recommended for large problems (21+ day windows)
             use_warmstart: If True, pass warmstart flag to solver (requires variables
                 to have initial values set via .set_value()). Used for MIP warmstarting.
+            warmstart_hints: Variable values from a previous solve, keyed by
+                (variable_name, *index) (see warmstart_utils). Loaded into the
+                freshly built model (with bound/integrality repair) and implies
+                use_warmstart=True.
+            fixed_period: Decisions to lock for part of the horizon (see
+                fixed_periods.FixedPeriod). Fixed after the warmstart is applied.
+            lp_first: LP-relaxation-first pipeline (appsi_highs only, the
+                default solver_name if it resolves to it; see lp_first.py).
+                'warmstart': solve the LP relaxation, repair it into an
+                integer incumbent and warmstart the MIP with it. 'fast':
+                return the repaired incumbent without the MIP (gap reported
+                against the LP bound). time_limit_seconds covers the whole
+                pipeline; warmstart_hints start the MIP if the repair fails.
+                None (default): MIP only.
+            progress_callback: Called with each SolveProgress sample (incumbent,
+                bound, gap, nodes, elapsed) while HiGHS runs; return True to
+                stop early with the incumbent (appsi_highs only)
+            telemetry: SolveTelemetry to record progress into (see
+                solve_telemetry.py; e.g. with stop_gap). Created from
+                progress_callback if not given. The time series is stored in
+                result.metadata['solve_progress'].
 
         Returns:
             OptimizationResult with solve status and objective value
 
+        Raises:
+            ValueError: If fixed_period values conflict with the built model or
+                the fixed plan is infeasible (LP pre-check), or if lp_first is
+                not a supported mode or used with a solver other than appsi_highs
+
         Example:
             result = model.solve(
                 solver_name='cbc',
@@ -541,12 +853,52 @@ class BaseOptimizationModel(ABC):
                 tee=True
             )
         """
+        if lp_first is not None:
+            from .lp_first import LP_FIRST_MODES
+            if lp_first not in LP_FIRST_MODES:
+                raise ValueError(f"lp_first must be one of {LP_FIRST_MODES}, got {lp_first!r}")
+            if solver_name is None:
+                solver_name = self.solver_config.get_best_available_solver()
+            if solver_name != 'appsi_highs':
+                raise ValueError(f"lp_first requires solver_name='appsi_highs', got {solver_name!r}")
+
+        if progress_callback is not None:
+            if telemetry is None:
+                from .solve_telemetry import SolveTelemetry
+                telemetry = SolveTelemetry(callback=progress_callback)
+            else:
+                telemetry.callback = progress_callback
+        if telemetry is not None and solver_name not in ('appsi_highs', 'highs_direct', 'portfolio'):
+            print(f"  Solve telemetry requires appsi_highs (solver: {solver_name}); progress not recorded")
+
         # Build model (always - this creates the Pyomo ConcreteModel)
         build_start = time.time()
         print("Building Pyomo model in solve()...")
-        self.model = self.build_model()
+        # CSR backends take rows without Pyomo components; the fixed-period LP
+        # pre-check solves the Pyomo model through APPSI, so it needs them all
+        self._direct_build = solver_name in ('highs_direct', 'portfolio') and fixed_period is None
+        try:
+            self.model = self.build_model()
+        finally:
+            self._direct_build = False
         self._build_time = time.time() - build_start
 
+        # Rolling-horizon warmstart: initialize the fresh model from a previous solve
+        if warmstart_hints:
+            from .warmstart_utils import apply_warmstart_hints
+            apply_warmstart_hints(self.model, warmstart_hints, verbose=True)
+            use_warmstart = True
+
+        # Lock committed decisions (e.g. Daily weeks 5-12); presolve removes them
+        if fixed_period is not None:
+            from .fixed_periods import apply_fixed_period
+            apply_fixed_period(self.model, fixed_period, verbose=True)
+
+        partial_start = None
+        if warmstart_hints:
+            from .warmstart_utils import get_partial_start_variables
+            partial_start = get_partial_start_variables(self.model)
+
         # NOTE: LP file writing removed (2025-11-17)
         # Previously caused thousands of "No value for uninitialized VarData" warnings
         # because Pyomo iterates all variables when writing LP format.
@@ -562,13 +914,29 @@ class BaseOptimizationModel(ABC):
         options = solver_options or {}
 
         # Handle APPSI solvers (different interface than legacy SolverFactory)
-        if solver_name == 'appsi_highs':
+        if lp_first is not None:
+            return self._solve_lp_first(
+                mode=lp_first,
+                time_limit_seconds=time_limit_seconds,
+                mip_gap=mip_gap,
+                use_aggressive_heuristics=use_aggressive_heuristics,
+                tee=tee,
+                highs_options=solver_options,
+                telemetry=telemetry,
+                partial_start=partial_start,
+            )
+        if solver_name in ('appsi_highs', 'highs_direct', 'portfolio'):
             return self._solve_with_appsi_highs(
                 time_limit_seconds=time_limit_seconds,
                 mip_gap=mip_gap,
                 use_warmstart=use_warmstart,
                 use_aggressive_heuristics=use_aggressive_heuristics,
-                tee=tee
+                tee=tee,
+                partial_start=partial_start,
+                highs_options=solver_options,
+                telemetry=telemetry,
+                direct=solver_name == 'highs_direct',
+                portfolio=solver_name == 'portfolio',
             )
 
         # Configure solver-specific options (legacy interface)
@@ -846,6 +1214,44 @@ class BaseOptimizationModel(ABC):
             infeasibility_message=infeasibility_message,
         )
 
+    def create_solve_session(
+        self,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        use_warmstart: bool = False,
+        use_aggressive_heuristics: bool = False,
+        tee: bool = False,
+    ) -> 'PersistentSolveSession':
+        """
+        Build the model once and return a session for in-place what-if re-solves.
+
+        Args:
+            time_limit_seconds: Default time limit for each solve
+            mip_gap: Default MIP gap for each solve
+            use_warmstart: Use the previous solution as a MIP start
+            use_aggressive_heuristics: Enable aggressive MIP heuristics
+            tee: Show solver output
+
+        Returns:
+            PersistentSolveSession wrapping this model
+
+        Example:
+            session = model.create_solve_session(time_limit_seconds=120, mip_gap=0.01)
+            base = session.solve()
+            session.set_cost('shortage_penalty_per_unit', 20.0)
+            what_if = session.solve()  # no rebuild
+        """
+        from .solve_session import PersistentSolveSession
+
+        return PersistentSolveSession(
+            self,
+            time_limit_seconds=time_limit_seconds,
+            mip_gap=mip_gap,
+            use_warmstart=use_warmstart,
+            use_aggressive_heuristics=use_aggressive_heuristics,
+            tee=tee,
+        )
+
     def get_solution(self) -> Optional['OptimizationSolution']:
         """
         Get extracted solution from last solve.
@@ -867,7 +1273,8 @@ class BaseOptimizationModel(ABC):
         Get statistics about the model.
 
         Returns:
-            Dictionary with model statistics
+            Dictionary with model statistics (plus 'build_profile', the
+            BuildProfiler report, when the build was profiled)
 
         Example:
             stats = model.get_model_statistics()
@@ -888,13 +1295,16 @@ class BaseOptimizationModel(ABC):
             if var.is_integer() or var.is_binary()
         )
 
-        return {
+        stats = {
             'built': True,
             'build_time_seconds': self._build_time,
             'num_variables': self.model.nvariables(),
             'num_constraints': self.model.nconstraints(),
             'num_integer_vars': num_integer,
         }
+        if self.build_profile is not None:
+            stats['build_profile'] = self.build_profile.report()
+        return stats
 
     def get_build_time(self) -> Optional[float]:
         """
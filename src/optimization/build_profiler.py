@@ -0,0 +1,238 @@
+"""Model build profiling: time, memory and size per build step and constraint family.
+
+BuildProfiler wraps each step of a model build (sets, variables, each
+_add_* constraint method, objective) and records:
+
+- wall time and peak traced memory of the step (tracemalloc, optional)
+- the Var and Constraint components the step added
+
+After the build, finish() sizes every family: rows and nonzeros per
+Constraint component, the smallest and largest absolute coefficient (a wide
+range hurts LP numerics), columns and integer columns per Var component.
+
+Profiling is opt-in (SlidingWindowModel(profile_build=True)); without it the
+build runs each step under a no-op context and nothing is measured.
+
+Example:
+    model = SlidingWindowModel(..., profile_build=True)
+    model.build_model()
+    model.build_profile.report()            # dict
+    model.build_profile.to_dataframe()      # one row per constraint family
+    model.build_profile.to_json('build_profile.json')
+"""
+
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+import json
+import math
+import time
+import tracemalloc
+
+from pyomo.environ import Constraint, Objective, Var
+from pyomo.repn import generate_standard_repn
+
+
+@dataclass
+class StepProfile:
+    """One build step.
+
+    Attributes:
+        name: Step name (e.g. 'state_balance')
+        seconds: Wall time
+        peak_memory_mb: Peak traced memory during the step (None if not tracked)
+        memory_delta_mb: Traced memory retained by the step (None if not tracked)
+        constraints: Constraint components added by the step
+        variables: Var components added by the step
+    """
+    name: str
+    seconds: float
+    peak_memory_mb: Optional[float] = None
+    memory_delta_mb: Optional[float] = None
+    constraints: List[str] = field(default_factory=list)
+    variables: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FamilyProfile:
+    """Size of one Constraint component (rows) or Var component (columns).
+
+    Attributes:
+        name: Component name
+        kind: 'constraint', 'objective' or 'variable'
+        step: Build step that added it
+        size: Active rows (constraints) or columns (variables)
+        nonzeros: Linear terms over all rows (constraints only)
+        min_abs_coef, max_abs_coef: Coefficient range (constraints only)
+        integer: Integer/binary columns (variables only)
+    """
+    name: str
+    kind: str
+    step: Optional[str]
+    size: int
+    nonzeros: Optional[int] = None
+    min_abs_coef: Optional[float] = None
+    max_abs_coef: Optional[float] = None
+    integer: Optional[int] = None
+
+
+def _components(model: Any, ctype: Any) -> List[str]:
+    return [c.name for c in model.component_objects(ctype, descend_into=True)]
+
+
+class BuildProfiler:
+    """Collects StepProfile per build step and FamilyProfile per component.
+
+    Attributes:
+        steps: Step profiles in build order
+        families: Family profiles (after finish())
+    """
+
+    def __init__(self, track_memory: bool = True, coefficients: bool = True):
+        """Configure the profiler.
+
+        Args:
+            track_memory: Measure peak memory with tracemalloc (slows the build)
+            coefficients: Compute nonzeros and coefficient ranges in finish()
+                (one linear-representation pass over every constraint)
+        """
+        self.track_memory = track_memory
+        self.coefficients = coefficients
+        self.steps: List[StepProfile] = []
+        self.families: List[FamilyProfile] = []
+        self._started_tracing = False
+
+    @contextmanager
+    def step(self, name: str, model: Any) -> Iterator[None]:
+        """Profile one build step (components added during it are attributed to it)."""
+        constraints_before = set(_components(model, Constraint))
+        variables_before = set(_components(model, Var))
+
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            tracemalloc.reset_peak()
+            memory_before = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            profile = StepProfile(name=name, seconds=seconds)
+            if self.track_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                profile.peak_memory_mb = (peak - memory_before) / 2**20
+                profile.memory_delta_mb = (current - memory_before) / 2**20
+            profile.constraints = [c for c in _components(model, Constraint) if c not in constraints_before]
+            profile.variables = [v for v in _components(model, Var) if v not in variables_before]
+            self.steps.append(profile)
+
+    def finish(self, model: Any) -> None:
+        """Size every Constraint/Var component of the built model and stop tracing."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+        step_of = {}
+        for step in self.steps:
+            for name in step.constraints + step.variables:
+                step_of[name] = step.name
+
+        self.families = []
+        for component in model.component_objects(Constraint, active=True, descend_into=True):
+            rows = [con for con in component.values() if con.active]
+            family = FamilyProfile(
+                name=component.name, kind='constraint', step=step_of.get(component.name), size=len(rows),
+            )
+            if self.coefficients:
+                self._size_rows(family, (con.body for con in rows))
+            self.families.append(family)
+
+        for component in model.component_objects(Objective, active=True, descend_into=True):
+            family = FamilyProfile(
+                name=component.name, kind='objective', step=step_of.get(component.name), size=len(component),
+            )
+            if self.coefficients:
+                self._size_rows(family, (obj.expr for obj in component.values()))
+            self.families.append(family)
+
+        for component in model.component_objects(Var, descend_into=True):
+            variables = list(component.values())
+            self.families.append(FamilyProfile(
+                name=component.name,
+                kind='variable',
+                step=step_of.get(component.name),
+                size=len(variables),
+                integer=sum(1 for v in variables if v.is_integer() or v.is_binary()),
+            ))
+
+    @staticmethod
+    def _size_rows(family: FamilyProfile, expressions: Iterator[Any]) -> None:
+        nonzeros = 0
+        smallest, largest = math.inf, 0.0
+        for expr in expressions:
+            repn = generate_standard_repn(expr, compute_values=True, quadratic=False)
+            nonzeros += len(repn.linear_vars)
+            for coef in repn.linear_coefs:
+                magnitude = abs(coef)
+                if magnitude:
+                    smallest = min(smallest, magnitude)
+                    largest = max(largest, magnitude)
+        family.nonzeros = nonzeros
+        if largest:
+            family.min_abs_coef = smallest
+            family.max_abs_coef = largest
+
+    def report(self) -> Dict[str, Any]:
+        """Steps, families and totals as a JSON-friendly dict."""
+        constraints = [f for f in self.families if f.kind == 'constraint']
+        variables = [f for f in self.families if f.kind == 'variable']
+        coefs = [f for f in self.families if f.max_abs_coef is not None]
+        totals = {
+            'seconds': sum(s.seconds for s in self.steps),
+            'peak_memory_mb': max((s.peak_memory_mb for s in self.steps if s.peak_memory_mb is not None),
+                                  default=None),
+            'rows': sum(f.size for f in constraints),
+            'columns': sum(f.size for f in variables),
+            'integer_columns': sum(f.integer or 0 for f in variables),
+            'nonzeros': sum(f.nonzeros or 0 for f in constraints) if self.coefficients else None,
+            'min_abs_coef': min((f.min_abs_coef for f in coefs), default=None),
+            'max_abs_coef': max((f.max_abs_coef for f in coefs), default=None),
+        }
+        return {
+            'steps': [asdict(s) for s in self.steps],
+            'families': [asdict(f) for f in self.families],
+            'totals': totals,
+        }
+
+    def to_dataframe(self, kind: str = 'constraint'):
+        """pandas DataFrame of the families of one kind ('constraint', 'variable',
+        'objective') or of the steps (kind='step'), largest first."""
+        import pandas as pd
+
+        if kind == 'step':
+            return pd.DataFrame([asdict(s) for s in self.steps]).sort_values('seconds', ascending=False)
+        rows = [asdict(f) for f in self.families if f.kind == kind]
+        return pd.DataFrame(rows).sort_values('size', ascending=False) if rows else pd.DataFrame(rows)
+
+    def to_json(self, path: Optional[str] = None, **metadata: Any) -> str:
+        """Report as JSON (written to path if given); metadata is added at the top level."""
+        text = json.dumps(dict(metadata, **self.report()), indent=2, default=str)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+    def summary(self) -> str:
+        """Step table plus the five largest constraint families."""
+        lines = [f"  {'Step':<32} {'Time (s)':>9} {'Peak MB':>9}  Components"]
+        for s in self.steps:
+            peak = f"{s.peak_memory_mb:.1f}" if s.peak_memory_mb is not None else '-'
+            lines.append(f"  {s.name:<32} {s.seconds:>9.3f} {peak:>9}  {', '.join(s.constraints + s.variables)}")
+        largest = sorted((f for f in self.families if f.kind == 'constraint'), key=lambda f: -(f.nonzeros or f.size))
+        for f in largest[:5]:
+            nz = f"{f.nonzeros:,} nonzeros" if f.nonzeros is not None else ''
+            lines.append(f"  {f.name}: {f.size:,} rows {nz}")
+        return "\n".join(lines)
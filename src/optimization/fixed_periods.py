@@ -0,0 +1,222 @@
+"""Fixed-period variable locking for rolling-horizon replanning.
+
+The Daily workflow re-optimizes only the first weeks of the horizon (weeks 1-4)
+and keeps the rest of the plan (weeks 5-12) as decided by the previous solve.
+This module fixes the committed decisions of that period on a freshly built
+SlidingWindowModel so HiGHS presolve removes them and only the free window is
+searched:
+
+- production, mix_count, product_produced: what is produced when
+- in_transit: what is shipped on which route and departure date
+- truck_pallet_load: truck pallets carrying those shipments
+
+Inventory, storage pallets, shortages and labor stay free so the fixed plan
+can absorb differences in starting stock (yesterday's actuals).
+
+Every variable of these families whose dates fall inside the fixed period is
+fixed: to the previous value if there is one, otherwise to zero (hints only
+store nonzero values).
+
+Example:
+    hints = extract_solution_for_warmstart(previous_model)
+    fixed = FixedPeriod(start_date=date(2025, 12, 1), end_date=date(2026, 1, 25), values=hints)
+    result = model.solve(solver_name='appsi_highs', fixed_period=fixed)
+"""
+
+from dataclasses import dataclass
+from datetime import date as Date
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyomo.environ import Reals, Var
+
+
+# Variable families locked in the fixed period (committed decisions only).
+# Storage pallet_count is left out on purpose: it is ceil(inventory / 320),
+# and fixing it would cap inventory at yesterday's plan so higher actual
+# stock could not be carried (see docs/features/daily_rolling_horizon.md)
+FIXED_PERIOD_VARIABLES = (
+    'production',
+    'mix_count',
+    'product_produced',
+    'in_transit',
+    'truck_pallet_load',
+)
+
+# Fixed values may sit this far outside the new variable bounds (solver noise)
+BOUND_TOLERANCE = 1e-6
+
+
+@dataclass
+class FixedPeriod:
+    """Decisions to lock for part of the planning horizon.
+
+    Attributes:
+        start_date: First date of the fixed period
+        end_date: Last date of the fixed period (inclusive)
+        values: Previous solve values keyed by (variable_name, *index)
+            (see warmstart_utils.extract_solution_for_warmstart). Missing
+            keys are fixed to zero.
+        check_feasibility: Run the LP feasibility pre-check before the MIP
+        source: Description of where the values came from (for messages)
+    """
+    start_date: Date
+    end_date: Date
+    values: Dict[Tuple, float]
+    check_feasibility: bool = True
+    source: Optional[str] = None
+
+    def contains(self, index: Tuple) -> bool:
+        """True if the index has a date and all its dates lie in the fixed period."""
+        dates = [c for c in index if isinstance(c, Date)]
+        return bool(dates) and all(self.start_date <= d <= self.end_date for d in dates)
+
+
+def apply_fixed_period(
+    pyomo_model: Any,
+    fixed_period: FixedPeriod,
+    verbose: bool = False
+) -> Dict[str, int]:
+    """Fix the committed decisions of the fixed period on a built model.
+
+    Args:
+        pyomo_model: Built Pyomo ConcreteModel (SlidingWindowModel.build_model())
+        fixed_period: Period and values to lock
+        verbose: Print diagnostic information
+
+    Returns:
+        Statistics: fixed, fixed_nonzero, fixed_zero
+
+    Raises:
+        ValueError: If a fixed value cannot be applied to the new model (outside
+            the variable bounds, e.g. a truck that is now smaller, or a nonzero
+            decision whose route/truck/date no longer exists), or if the LP
+            pre-check finds the fixed plan infeasible with the current data
+    """
+    stats = {'fixed': 0, 'fixed_nonzero': 0, 'fixed_zero': 0}
+    conflicts: List[str] = []
+
+    for var_name in FIXED_PERIOD_VARIABLES:
+        if not hasattr(pyomo_model, var_name):
+            continue
+        var = getattr(pyomo_model, var_name)
+
+        for index, var_data in var.items():
+            key_index = index if isinstance(index, tuple) else (index,)
+            if not fixed_period.contains(key_index):
+                continue
+
+            val = fixed_period.values.get((var_name,) + key_index, 0.0)
+            lb, ub = var_data.lb, var_data.ub
+            if (lb is not None and val < lb - BOUND_TOLERANCE) or (ub is not None and val > ub + BOUND_TOLERANCE):
+                conflicts.append(f"{var_name}{list(key_index)} = {val:g} outside bounds [{lb}, {ub}]")
+                continue
+            if lb is not None and val < lb:
+                val = lb
+            elif ub is not None and val > ub:
+                val = ub
+            if var_data.is_integer():
+                val = round(val)
+
+            var_data.fix(val)
+            stats['fixed'] += 1
+            if val:
+                stats['fixed_nonzero'] += 1
+            else:
+                stats['fixed_zero'] += 1
+
+    # Committed decisions that have no variable in the new model
+    for key, val in fixed_period.values.items():
+        var_name, index = key[0], key[1:]
+        if var_name not in FIXED_PERIOD_VARIABLES or not val or not fixed_period.contains(index):
+            continue
+        var = getattr(pyomo_model, var_name, None)
+        lookup = index if len(index) != 1 else index[0]
+        if var is None or lookup not in var:
+            conflicts.append(f"{var_name}{list(index)} = {val:g} has no variable in the new model")
+
+    if verbose:
+        print(f"\n✓ Fixed period {fixed_period.start_date} to {fixed_period.end_date}:")
+        print(f"  Variables fixed: {stats['fixed']:,} "
+              f"({stats['fixed_nonzero']:,} nonzero, {stats['fixed_zero']:,} zero)")
+
+    if conflicts:
+        shown = "\n  ".join(conflicts[:10])
+        more = f"\n  ... and {len(conflicts) - 10} more" if len(conflicts) > 10 else ""
+        raise ValueError(
+            f"{len(conflicts)} fixed-period values conflict with the new model "
+            f"(source: {fixed_period.source or 'previous solve'}):\n  {shown}{more}"
+        )
+
+    if fixed_period.check_feasibility:
+        is_feasible, message = check_fixed_period_feasibility(pyomo_model)
+        if verbose:
+            print(f"  Feasibility pre-check: {message}")
+        if not is_feasible:
+            raise ValueError(
+                f"Fixed period {fixed_period.start_date} to {fixed_period.end_date} is infeasible "
+                f"with the current inventory/actuals: {message}. The locked shipments need stock "
+                f"the free period can no longer supply - re-run with fewer fixed weeks or a Weekly solve."
+            )
+
+    return stats
+
+
+def check_fixed_period_feasibility(
+    pyomo_model: Any,
+    time_limit_seconds: float = 60.0
+) -> Tuple[bool, str]:
+    """Check that the model with fixed variables still has a feasible LP relaxation.
+
+    An infeasible LP relaxation proves the MIP is infeasible, so a plan that
+    contradicts the current data (e.g. actual production fell short of what
+    the fixed shipments need) is reported in seconds instead of after a full
+    MIP solve. A feasible relaxation does not prove MIP feasibility.
+
+    Integer variables are relaxed for the check and restored afterwards.
+
+    Args:
+        pyomo_model: Built Pyomo model with the fixed-period variables fixed
+        time_limit_seconds: Time limit for the LP solve
+
+    Returns:
+        Tuple of (is_feasible, message). If the check cannot run (no HiGHS or
+        time limit reached) is_feasible is True and the message says so.
+    """
+    try:
+        from pyomo.contrib.appsi.solvers import Highs
+        from pyomo.contrib.appsi.base import TerminationCondition
+    except ImportError:
+        return True, "skipped (APPSI HiGHS not available)"
+
+    solver = Highs()
+    if not solver.available():
+        return True, "skipped (HiGHS not available)"
+    solver.config.time_limit = time_limit_seconds
+    solver.config.load_solution = False
+    solver.config.stream_solver = False
+
+    # Relax integrality in place (same approach as core.relax_integer_vars)
+    relaxed = []
+    for var_data in pyomo_model.component_data_objects(Var, descend_into=True):
+        if var_data.is_integer() and not var_data.fixed:
+            lb, ub = var_data.bounds
+            relaxed.append((var_data, var_data.domain))
+            var_data.domain = Reals
+            var_data.setlb(lb)
+            var_data.setub(ub)
+
+    try:
+        results = solver.solve(pyomo_model)
+    finally:
+        for var_data, domain in relaxed:
+            lb, ub = var_data.bounds
+            var_data.domain = domain
+            var_data.setlb(lb)
+            var_data.setub(ub)
+
+    termination = results.termination_condition
+    if termination in (TerminationCondition.infeasible, TerminationCondition.infeasibleOrUnbounded):
+        return False, "LP relaxation is infeasible"
+    if termination == TerminationCondition.optimal:
+        return True, f"LP relaxation feasible (bound {results.best_objective_bound:,.2f})"
+    return True, f"inconclusive ({termination.name})"
@@ -0,0 +1,422 @@
+"""Direct-to-HiGHS backend: the Pyomo model as CSR arrays in one passModel call.
+
+APPSI's Highs interface keeps a persistent, incrementally updatable copy of
+the model: it registers every variable, constraint and expression with its
+own bookkeeping before HiGHS sees a single row. A solve that builds its
+model once does not need any of that. DirectHighs compiles the active
+constraints and objective of the built model into HiGHS's row-wise sparse
+format (NumPy arrays: column cost/bounds/integrality, row bounds, CSR
+start/index/value) and hands them over with Highs.passModel().
+
+It mirrors the parts of the APPSI solver the solve pipeline uses (config,
+highs_options, update_config, set_instance, solve, load_vars, and the
+_solver_model / _pyomo_var_to_solver_var_map attributes), so
+_run_appsi_solve, SolveTelemetry, partial MIP starts and bulk primal reads
+(PrimalValues) work unchanged. Select it per solve with
+solver_name='highs_direct'.
+
+Fixed variables are folded into row bounds (as in the LP writer), so they
+are not columns and keep their values. Only linear models are supported.
+
+Models can skip Pyomo for their bulk constraint families: a build that
+stores a DirectRows on the Pyomo model (as model._direct_rows) emits those
+rows as (variable, coefficient) lists instead of Constraint components, and
+MatrixModel.from_pyomo appends them after the Pyomo rows. solve() requests
+such a build for 'highs_direct' and 'portfolio' (see SlidingWindowModel).
+
+Example:
+    result = model.solve(solver_name='highs_direct', time_limit_seconds=300)
+    result.metadata['highs_direct']   # columns, rows, nonzeros, compile time
+"""
+
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import time
+
+import numpy as np
+from pyomo.environ import Constraint, Objective, maximize
+from pyomo.repn import generate_standard_repn
+
+
+# Attribute of a Pyomo model holding the DirectRows of a direct build
+DIRECT_ROWS_ATTR = '_direct_rows'
+
+
+class DirectRows:
+    """Constraint rows assembled without Pyomo Constraint components.
+
+    Rows are stored in CSR order over Pyomo VarData; MatrixModel.from_pyomo
+    maps them to columns (and folds fixed variables into the bounds) when
+    the model is compiled, so variables fixed after the build are handled
+    like in Pyomo rows.
+
+    Attributes:
+        families: Rows added per constraint family name
+        variables, coefficients: Nonzeros of all rows (row after row)
+        starts: Row starts into variables/coefficients (num_row + 1 entries)
+        lower, upper: Row bounds (-inf/inf if unbounded)
+    """
+
+    def __init__(self):
+        self.families: Dict[str, int] = {}
+        self.variables: List[Any] = []
+        self.coefficients: List[float] = []
+        self.starts: List[int] = [0]
+        self.lower: List[float] = []
+        self.upper: List[float] = []
+
+    @property
+    def num_row(self) -> int:
+        return len(self.lower)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.variables)
+
+    def add(self, family: str, terms: Iterable[Tuple[Any, float]],
+            lower: float = -np.inf, upper: float = np.inf) -> None:
+        """Add lower <= sum(coef * var) <= upper (repeated variables are merged)."""
+        merged: Dict[int, List[Any]] = {}
+        for var, coef in terms:
+            entry = merged.get(id(var))
+            if entry is None:
+                merged[id(var)] = [var, coef]
+            else:
+                entry[1] += coef
+        for var, coef in merged.values():
+            if coef:
+                self.variables.append(var)
+                self.coefficients.append(coef)
+        self.starts.append(len(self.variables))
+        self.lower.append(lower)
+        self.upper.append(upper)
+        self.families[family] = self.families.get(family, 0) + 1
+
+
+class MatrixModel:
+    """Linear (MI)P of a Pyomo model in HiGHS's row-wise layout.
+
+    Attributes:
+        columns: Pyomo VarData per column (first-appearance order)
+        col_cost, col_lower, col_upper: float64 arrays per column
+        integrality: int8 array per column (1 = integer)
+        row_lower, row_upper: float64 arrays per row
+        start, index, value: CSR arrays (start has num_row + 1 entries)
+        offset: Objective constant
+        maximize: Objective sense
+        trivial_rows: Constraints without free variables (empty rows)
+    """
+
+    def __init__(self):
+        self.columns: List[Any] = []
+        self.column_of: Dict[int, int] = {}
+        self.col_cost = np.zeros(0)
+        self.col_lower = np.zeros(0)
+        self.col_upper = np.zeros(0)
+        self.integrality = np.zeros(0, dtype=np.int8)
+        self.row_lower = np.zeros(0)
+        self.row_upper = np.zeros(0)
+        self.start = np.zeros(1, dtype=np.int32)
+        self.index = np.zeros(0, dtype=np.int32)
+        self.value = np.zeros(0)
+        self.offset = 0.0
+        self.maximize = False
+        self.trivial_rows = 0
+
+    @property
+    def num_col(self) -> int:
+        return len(self.col_cost)
+
+    @property
+    def num_row(self) -> int:
+        return len(self.row_lower)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.index)
+
+    def _column(self, var: Any) -> int:
+        col = self.column_of.get(id(var))
+        if col is None:
+            col = len(self.columns)
+            self.column_of[id(var)] = col
+            self.columns.append(var)
+        return col
+
+    @classmethod
+    def from_pyomo(cls, model: Any) -> 'MatrixModel':
+        """Compile the active constraints (then any DirectRows) and objective of a Pyomo model.
+
+        Raises:
+            ValueError: If the model has no single active objective or a
+                constraint/objective is not linear
+        """
+        matrix = cls()
+        row_lower: List[float] = []
+        row_upper: List[float] = []
+        starts: List[int] = [0]
+        index: List[int] = []
+        values: List[float] = []
+
+        for con in model.component_data_objects(Constraint, active=True, descend_into=True):
+            repn = generate_standard_repn(con.body, compute_values=True, quadratic=False)
+            if not repn.is_linear():
+                raise ValueError(f"highs_direct supports linear models only (constraint {con.name})")
+            constant = repn.constant or 0.0
+            lower = -np.inf if con.lb is None else con.lb - constant
+            upper = np.inf if con.ub is None else con.ub - constant
+            if not repn.linear_vars:
+                # Kept as an empty row: HiGHS presolve reports it if violated
+                matrix.trivial_rows += 1
+            index.extend(matrix._column(v) for v in repn.linear_vars)
+            values.extend(repn.linear_coefs)
+            starts.append(len(index))
+            row_lower.append(lower)
+            row_upper.append(upper)
+
+        direct_rows = getattr(model, DIRECT_ROWS_ATTR, None)
+        if direct_rows is not None:
+            variables = direct_rows.variables
+            coefficients = direct_rows.coefficients
+            row_starts = direct_rows.starts
+            for row in range(direct_rows.num_row):
+                lower = direct_rows.lower[row]
+                upper = direct_rows.upper[row]
+                for k in range(row_starts[row], row_starts[row + 1]):
+                    var = variables[k]
+                    if var.fixed:
+                        shift = coefficients[k] * var.value
+                        lower -= shift
+                        upper -= shift
+                    else:
+                        index.append(matrix._column(var))
+                        values.append(coefficients[k])
+                if len(index) == starts[-1]:
+                    matrix.trivial_rows += 1
+                starts.append(len(index))
+                row_lower.append(lower)
+                row_upper.append(upper)
+
+        objectives = list(model.component_data_objects(Objective, active=True, descend_into=True))
+        if len(objectives) != 1:
+            raise ValueError(f"highs_direct needs exactly one active objective, found {len(objectives)}")
+        obj = objectives[0]
+        repn = generate_standard_repn(obj.expr, compute_values=True, quadratic=False)
+        if not repn.is_linear():
+            raise ValueError("highs_direct supports linear objectives only")
+        cost_columns = [matrix._column(v) for v in repn.linear_vars]
+
+        num_col = len(matrix.columns)
+        matrix.col_cost = np.zeros(num_col)
+        np.add.at(matrix.col_cost, np.asarray(cost_columns, dtype=np.int64),
+                  np.asarray(repn.linear_coefs, dtype=np.float64))
+        matrix.offset = float(repn.constant or 0.0)
+        matrix.maximize = obj.sense == maximize
+
+        lower = np.empty(num_col)
+        upper = np.empty(num_col)
+        integrality = np.zeros(num_col, dtype=np.int8)
+        for col, var in enumerate(matrix.columns):
+            lb, ub = var.bounds
+            lower[col] = -np.inf if lb is None else lb
+            upper[col] = np.inf if ub is None else ub
+            if var.is_integer() or var.is_binary():
+                integrality[col] = 1
+        matrix.col_lower = lower
+        matrix.col_upper = upper
+        matrix.integrality = integrality
+
+        matrix.row_lower = np.asarray(row_lower, dtype=np.float64)
+        matrix.row_upper = np.asarray(row_upper, dtype=np.float64)
+        matrix.start = np.asarray(starts, dtype=np.int32)
+        matrix.index = np.asarray(index, dtype=np.int32)
+        matrix.value = np.asarray(values, dtype=np.float64)
+        return matrix
+
+    _ARRAYS = ('col_cost', 'col_lower', 'col_upper', 'integrality', 'row_lower', 'row_upper',
+               'start', 'index', 'value')
+
+    def arrays(self) -> Dict[str, Any]:
+        """Picklable copy of the LP (arrays, offset, sense) without the Pyomo columns."""
+        data: Dict[str, Any] = {name: getattr(self, name) for name in self._ARRAYS}
+        data.update(offset=self.offset, maximize=self.maximize)
+        return data
+
+    @classmethod
+    def from_arrays(cls, data: Dict[str, Any]) -> 'MatrixModel':
+        """Rebuild from arrays() (e.g. in a worker process); columns stay empty."""
+        matrix = cls()
+        for name in cls._ARRAYS:
+            setattr(matrix, name, data[name])
+        matrix.offset = data['offset']
+        matrix.maximize = data['maximize']
+        return matrix
+
+    def to_highs_lp(self, names: bool = False) -> Any:
+        """highspy.HighsLp with these arrays (names: columns c0.., rows r0.., e.g. for MPS export)."""
+        import highspy
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = self.num_col
+        lp.num_row_ = self.num_row
+        lp.col_cost_ = self.col_cost
+        lp.col_lower_ = self.col_lower
+        lp.col_upper_ = self.col_upper
+        lp.row_lower_ = self.row_lower
+        lp.row_upper_ = self.row_upper
+        lp.offset_ = self.offset
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = self.start
+        lp.a_matrix_.index_ = self.index
+        lp.a_matrix_.value_ = self.value
+        if self.maximize:
+            lp.sense_ = highspy.ObjSense.kMaximize
+        if names:
+            lp.col_names_ = [f"c{i}" for i in range(self.num_col)]
+            lp.row_names_ = [f"r{i}" for i in range(self.num_row)]
+        if self.integrality.any():
+            lp.integrality_ = [
+                highspy.HighsVarType.kInteger if flag else highspy.HighsVarType.kContinuous
+                for flag in self.integrality
+            ]
+        return lp
+
+
+# HighsModelStatus name -> APPSI TerminationCondition name
+_TERMINATION = {
+    'kOptimal': 'optimal',
+    'kInfeasible': 'infeasible',
+    'kUnbounded': 'unbounded',
+    'kUnboundedOrInfeasible': 'infeasibleOrUnbounded',
+    'kTimeLimit': 'maxTimeLimit',
+    'kIterationLimit': 'maxIterations',
+    'kSolutionLimit': 'maxIterations',
+    'kInterrupt': 'interrupted',
+    'kObjectiveBound': 'objectiveLimit',
+    'kObjectiveTarget': 'objectiveLimit',
+}
+
+
+class DirectHighs:
+    """APPSI-compatible HiGHS solver that loads the model via passModel.
+
+    Attributes:
+        backend: Solver name reported in OptimizationResult ('highs_direct')
+        config: time_limit, mip_gap, warmstart, stream_solver, load_solution
+        highs_options: HiGHS options set before each solve
+        stats: Size (incl. rows built as DirectRows) and compile time of the
+            last loaded model
+    """
+
+    backend = 'highs_direct'
+
+    def __init__(self):
+        self.config = SimpleNamespace(
+            time_limit=None, mip_gap=None, warmstart=False, stream_solver=False, load_solution=False,
+        )
+        # APPSI update flags (the matrix is rebuilt by set_instance, never updated)
+        self.update_config = SimpleNamespace()
+        self.highs_options: Dict[str, Any] = {}
+        self.stats: Dict[str, Any] = {}
+        self._solver_model = None
+        self._pyomo_var_to_solver_var_map: Dict[int, int] = {}
+        self._model = None
+        self._matrix: Optional[MatrixModel] = None
+
+    def available(self) -> bool:
+        try:
+            import highspy  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def set_instance(self, model: Any) -> None:
+        """Compile model and pass it to a fresh HiGHS instance."""
+        import highspy
+
+        compile_start = time.perf_counter()
+        matrix = MatrixModel.from_pyomo(model)
+        compile_time = time.perf_counter() - compile_start
+
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        pass_start = time.perf_counter()
+        highs.passModel(matrix.to_highs_lp())
+        pass_time = time.perf_counter() - pass_start
+
+        self._solver_model = highs
+        self._pyomo_var_to_solver_var_map = matrix.column_of
+        self._model = model
+        self._matrix = matrix
+        direct_rows = getattr(model, DIRECT_ROWS_ATTR, None)
+        self.stats = {
+            'columns': matrix.num_col,
+            'rows': matrix.num_row,
+            'direct_rows': direct_rows.num_row if direct_rows is not None else 0,
+            'nonzeros': matrix.nnz,
+            'integer_columns': int(matrix.integrality.sum()),
+            'empty_rows': matrix.trivial_rows,
+            'compile_seconds': compile_time,
+            'pass_model_seconds': pass_time,
+        }
+        print(f"  highs_direct: {matrix.num_col:,} columns, {matrix.num_row:,} rows, "
+              f"{matrix.nnz:,} nonzeros compiled in {compile_time:.2f}s (passModel {pass_time:.2f}s)")
+
+    def _apply_options(self) -> None:
+        highs = self._solver_model
+        highs.setOptionValue('output_flag', bool(self.config.stream_solver))
+        if self.config.time_limit:
+            highs.setOptionValue('time_limit', float(self.config.time_limit))
+        if self.config.mip_gap:
+            highs.setOptionValue('mip_rel_gap', float(self.config.mip_gap))
+        for name, option in self.highs_options.items():
+            highs.setOptionValue(name, option)
+
+    def _set_warmstart(self) -> None:
+        import highspy
+
+        solution = highspy.HighsSolution()
+        solution.col_value = [0.0 if v.value is None else v.value for v in self._matrix.columns]
+        self._solver_model.setSolution(solution)
+
+    def solve(self, model: Any) -> Any:
+        """Solve model (compiled on first use) and return APPSI-style Results."""
+        from pyomo.contrib.appsi.base import Results, TerminationCondition
+
+        if self._model is not model:
+            self.set_instance(model)
+        self._apply_options()
+        if self.config.warmstart:
+            self._set_warmstart()
+
+        highs = self._solver_model
+        highs.run()
+
+        status = highs.getModelStatus()
+        name = getattr(status, 'name', str(status).split('.')[-1])
+        info = highs.getInfo()
+
+        results = Results()
+        results.termination_condition = getattr(
+            TerminationCondition, _TERMINATION.get(name, 'unknown'), TerminationCondition.unknown
+        )
+        if info.primal_solution_status == 2:  # kSolutionStatusFeasible
+            results.best_feasible_objective = info.objective_function_value
+        if self._matrix.integrality.any():
+            bound = info.mip_dual_bound
+            results.best_objective_bound = bound if abs(bound) < 1e30 else None
+        elif name == 'kOptimal':
+            results.best_objective_bound = info.objective_function_value
+        return results
+
+    def load_vars(self, vars_to_load: Optional[List[Any]] = None) -> None:
+        """Load the HiGHS column values into the Pyomo variables."""
+        col_value = self._solver_model.getSolution().col_value
+        if vars_to_load is None:
+            for var, val in zip(self._matrix.columns, col_value):
+                var.set_value(val, skip_validation=True)
+            return
+        for var in vars_to_load:
+            col = self._pyomo_var_to_solver_var_map.get(id(var))
+            if col is not None:
+                var.set_value(col_value[col], skip_validation=True)
@@ -0,0 +1,272 @@
+"""LP-relaxation-first solve: LP bound, integer repair, then the MIP.
+
+The sliding-window MIP spends most of its time on pallet counts
+(pallet_count, truck_pallet_load), mix counts and changeover binaries. Their
+LP relaxation solves in seconds with APPSI HiGHS and is usually close to the
+MIP optimum, so BaseOptimizationModel.solve(lp_first=...) runs two phases:
+
+1. LP: relax every integer variable and solve (objective = lower bound)
+2. Repair (fix-and-propagate): round and fix one variable family at a time
+   in ROUNDING_ORDER and re-solve the LP over the rest, so later families
+   adapt to the ones already fixed. A family is rounded up first (more
+   pallets/mixes/production days are always coverable), then to nearest,
+   then down; the first rounding whose LP stays feasible is kept.
+
+With every integer variable fixed, the final LP gives a feasible integer
+incumbent (objective = upper bound). Then either:
+
+- 'warmstart': the incumbent is handed to the MIP solve as a warmstart
+- 'fast': the incumbent is returned as the plan, with gap = (incumbent - LP
+  bound) / incumbent, in a fraction of the MIP time
+
+Example:
+    result = model.solve(solver_name='appsi_highs', lp_first='fast')
+    print(result.gap, result.metadata['lp_first'])
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import math
+import time
+
+from pyomo.environ import Reals, Var
+
+
+LP_FIRST_MODES = ('warmstart', 'fast')
+
+# Families fixed first drive the rest (binaries -> starts -> mixes -> pallets);
+# integer families not listed are rounded last, in model order
+ROUNDING_ORDER = (
+    'product_produced',
+    'any_production',
+    'product_start',
+    'total_starts',
+    'mix_count',
+    'truck_pallet_load',
+    'pallet_count',
+    'pallet_entry',
+)
+
+ROUNDING_DIRECTIONS = ('up', 'nearest', 'down')
+
+# LP values this close to an integer count as integral
+INTEGRALITY_TOLERANCE = 1e-6
+
+# Less time than this left before the deadline ends the repair; the final
+# solve always gets at least this long to return its incumbent
+MIN_SOLVE_SECONDS = 1.0
+
+
+def remaining_time(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until deadline (a time.time() value), None without one."""
+    if deadline is None:
+        return None
+    return max(deadline - time.time(), 0.0)
+
+
+@dataclass
+class RepairResult:
+    """Outcome of the LP relaxation and integer repair.
+
+    Attributes:
+        success: True if every integer variable was fixed with a feasible LP
+        lp_bound: LP relaxation objective (lower bound on the MIP)
+        objective: Objective of the repaired integer solution
+        lp_time: LP relaxation solve time (seconds)
+        repair_time: Rounding + LP re-solve time (seconds)
+        lp_solves: LP solves during the repair
+        rounding: {variable family: rounding direction kept}
+        message: Why the repair failed (empty on success)
+        fixed_vars: Variables fixed by the repair (release with unfix_repaired)
+    """
+    success: bool
+    lp_bound: Optional[float] = None
+    objective: Optional[float] = None
+    lp_time: float = 0.0
+    repair_time: float = 0.0
+    lp_solves: int = 0
+    rounding: Dict[str, str] = field(default_factory=dict)
+    message: str = ''
+    fixed_vars: List[Any] = field(default_factory=list, repr=False)
+
+    @property
+    def gap(self) -> Optional[float]:
+        """Relative gap between the repaired objective and the LP bound."""
+        if self.objective is None or self.lp_bound is None or abs(self.objective) <= 1e-10:
+            return None
+        return abs((self.objective - self.lp_bound) / self.objective)
+
+    def summary(self) -> Dict[str, Any]:
+        """Stats for OptimizationResult.metadata['lp_first']."""
+        return {
+            'success': self.success,
+            'lp_bound': self.lp_bound,
+            'objective': self.objective,
+            'gap': self.gap,
+            'lp_time': self.lp_time,
+            'repair_time': self.repair_time,
+            'lp_solves': self.lp_solves,
+            'rounding': dict(self.rounding),
+            'fixed': len(self.fixed_vars),
+            'message': self.message,
+        }
+
+
+def relax_integrality(
+    pyomo_model: Any,
+    predicate: Optional[Callable[[Any], bool]] = None,
+) -> List[Tuple[Any, Any]]:
+    """Relax every unfixed integer variable in place, keeping its bounds.
+
+    Args:
+        pyomo_model: Built Pyomo model
+        predicate: Optional filter on the variable data; only unfixed integer
+            variables it accepts are relaxed
+
+    Returns:
+        [(variable, original domain)] for restore_integrality()
+    """
+    relaxed = []
+    for var_data in pyomo_model.component_data_objects(Var, descend_into=True):
+        if var_data.is_integer() and not var_data.fixed and (predicate is None or predicate(var_data)):
+            lb, ub = var_data.bounds
+            relaxed.append((var_data, var_data.domain))
+            var_data.domain = Reals
+            var_data.setlb(lb)
+            var_data.setub(ub)
+    return relaxed
+
+
+def restore_integrality(relaxed: List[Tuple[Any, Any]]) -> None:
+    """Undo relax_integrality()."""
+    for var_data, domain in relaxed:
+        lb, ub = var_data.bounds
+        var_data.domain = domain
+        var_data.setlb(lb)
+        var_data.setub(ub)
+
+
+def unfix_repaired(repair: RepairResult) -> None:
+    """Unfix the variables fixed by the repair (their values stay as a warmstart)."""
+    for var_data in repair.fixed_vars:
+        var_data.unfix()
+    repair.fixed_vars = []
+
+
+def _round(value: Optional[float], direction: str, lb: Optional[float], ub: Optional[float]) -> float:
+    """Round an LP value in the given direction and clamp it into [lb, ub]."""
+    if value is None:
+        value = lb if lb is not None else 0.0
+    if direction == 'up':
+        rounded = math.ceil(value - INTEGRALITY_TOLERANCE)
+    elif direction == 'down':
+        rounded = math.floor(value + INTEGRALITY_TOLERANCE)
+    else:
+        rounded = round(value)
+    if lb is not None and rounded < lb:
+        rounded = math.ceil(lb - INTEGRALITY_TOLERANCE)
+    if ub is not None and rounded > ub:
+        rounded = math.floor(ub + INTEGRALITY_TOLERANCE)
+    return float(rounded)
+
+
+def _integer_families(relaxed: List[Tuple[Any, Any]]) -> List[Tuple[str, List[Any]]]:
+    """Group the relaxed variables by component name, in ROUNDING_ORDER."""
+    families: Dict[str, List[Any]] = {}
+    for var_data, _ in relaxed:
+        families.setdefault(var_data.parent_component().local_name, []).append(var_data)
+    ordered = [name for name in ROUNDING_ORDER if name in families]
+    ordered += [name for name in families if name not in ROUNDING_ORDER]
+    return [(name, families[name]) for name in ordered]
+
+
+def _failure(message: str, deadline: Optional[float]) -> str:
+    remaining = remaining_time(deadline)
+    if remaining is not None and remaining < MIN_SOLVE_SECONDS:
+        return "time limit reached"
+    return message
+
+
+def repair_lp_relaxation(
+    pyomo_model: Any,
+    solver: Any,
+    verbose: bool = False,
+    deadline: Optional[float] = None,
+) -> RepairResult:
+    """Solve the LP relaxation and repair it into a feasible integer solution.
+
+    On success every integer variable is fixed to its repaired value and the
+    continuous variables hold the matching LP solution (call unfix_repaired()
+    to release them). On failure nothing stays fixed. Integrality is
+    restored in both cases.
+
+    Args:
+        pyomo_model: Built Pyomo model
+        solver: APPSI solver (e.g. BaseOptimizationModel._create_appsi_highs_solver());
+            reused as a persistent solver for every LP
+        verbose: Print progress
+        deadline: time.time() by which the repair must finish; each LP gets
+            the time remaining (solver.config.time_limit) and the repair
+            fails once less than MIN_SOLVE_SECONDS is left
+
+    Returns:
+        RepairResult
+    """
+    from pyomo.contrib.appsi.base import TerminationCondition as AppsiTC
+
+    repair = RepairResult(success=False)
+
+    def solve_lp():
+        remaining = remaining_time(deadline)
+        if remaining is not None:
+            if remaining < MIN_SOLVE_SECONDS:
+                return None
+            solver.config.time_limit = remaining
+        repair.lp_solves += 1
+        results = solver.solve(pyomo_model)
+        if results.termination_condition != AppsiTC.optimal:
+            return None
+        solver.load_vars()
+        return results.best_feasible_objective
+
+    relaxed = relax_integrality(pyomo_model)
+    try:
+        start = time.time()
+        repair.lp_bound = solve_lp()
+        repair.lp_time = time.time() - start
+        if repair.lp_bound is None:
+            repair.message = _failure("LP relaxation not solved to optimality", deadline)
+            return repair
+        if verbose:
+            print(f"  LP relaxation: bound {repair.lp_bound:,.2f} in {repair.lp_time:.1f}s "
+                  f"({len(relaxed):,} integer variables relaxed)")
+
+        start = time.time()
+        objective = repair.lp_bound
+        for name, variables in _integer_families(relaxed):
+            lp_values = [v.value for v in variables]
+            for direction in ROUNDING_DIRECTIONS:
+                for var_data, lp_value in zip(variables, lp_values):
+                    var_data.fix(_round(lp_value, direction, var_data.lb, var_data.ub))
+                objective = solve_lp()
+                if objective is not None:
+                    repair.rounding[name] = direction
+                    repair.fixed_vars.extend(variables)
+                    break
+                for var_data, lp_value in zip(variables, lp_values):
+                    var_data.unfix()
+                    var_data.set_value(lp_value, skip_validation=True)
+            else:
+                repair.message = _failure(f"no feasible rounding for {name}", deadline)
+                unfix_repaired(repair)
+                return repair
+
+            if verbose:
+                print(f"    {name}: {len(variables):,} fixed ({repair.rounding[name]}), objective {objective:,.2f}")
+
+        repair.objective = objective
+        repair.repair_time = time.time() - start
+        repair.success = True
+        return repair
+    finally:
+        restore_integrality(relaxed)
@@ -0,0 +1,189 @@
+"""Reachability analysis: which inventory series can ever hold useful stock.
+
+SlidingWindowModel indexes inventory, in_transit, pallet and state-transition
+variables over nodes × products × dates × states, filtered only by node
+capabilities. Many of those series are structurally zero or useless:
+
+- unreachable: no production, initial inventory or inbound route can put
+  the product into that state at that node (e.g. ambient stock at a node
+  only served by frozen routes)
+- too early: the shortest path from a source takes longer than the days
+  since planning start (a breadroom 3 days from the plant holds no new stock
+  on days 1-3 without initial inventory)
+- useless: no demand for the product at the node or anywhere downstream
+
+VariableSupport computes, per (node, product, state):
+
+1. Forward: the earliest day stock can be there (sources at day 0, route
+   legs add their transit days, freeze/thaw transitions are same-day)
+2. Backward: whether it can feed demand (demand states at the node, or a
+   route leg / transition into a series that can)
+
+A series is kept if it is reachable within the horizon and is useful or a
+source (initial inventory, production state at a manufacturing node). The
+model only instantiates variables on kept series from their earliest date
+on, so every flow it drops would have been forced to zero (or was useless
+stock) and the optimum is unchanged.
+
+Shelf life (17 days ambient, 120 frozen, 14 thawed) is deliberately not a
+forward criterion. The model's shelf-life windows are per node and count
+every arrival as fresh inflow, so age accumulated upstream never forces an
+arrival to zero; rejecting arrivals by cumulative time in a state would
+drop flows the model allows and change the optimum. (On the example
+network the longest same-state path is a few days anyway.)
+
+Example:
+    support = VariableSupport(dates, products, legs, transitions, sources, sinks, end_date)
+    support.has_inventory('6104', 'P1', 'ambient', t)
+"""
+
+from dataclasses import dataclass
+from datetime import date as Date, timedelta
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+@dataclass(frozen=True)
+class FlowLeg:
+    """Route leg between inventory series.
+
+    Attributes:
+        origin: Origin node (stock leaves its ship_state inventory)
+        dest: Destination node (stock enters its arrival_state inventory)
+        ship_state: State in transit ('ambient' or 'frozen')
+        arrival_state: State on arrival ('ambient', 'frozen' or 'thawed')
+        offset_days: Days between departure and arrival
+    """
+    origin: str
+    dest: str
+    ship_state: str
+    arrival_state: str
+    offset_days: int
+
+
+class VariableSupport:
+    """Feasible support of the inventory series of a SlidingWindowModel.
+
+    Attributes:
+        earliest: {(node, product, state): earliest date with stock} for kept series
+        prune_dates: Whether variables before a series' earliest date are dropped
+            (off with aggregated periods, whose arrivals map between periods)
+        removed: {family: (total, kept, rows removed)} recorded while building
+    """
+
+    def __init__(
+        self,
+        dates: List[Date],
+        products: Iterable[str],
+        legs: List[FlowLeg],
+        transitions: Dict[str, List[Tuple[str, str]]],
+        sources: Set[Tuple[str, str, str]],
+        sinks: Set[Tuple[str, str, str]],
+        end_date: Date,
+        prune_dates: bool = True,
+    ):
+        """Run the forward and backward passes.
+
+        Args:
+            dates: Planning dates (period starts)
+            products: Product IDs
+            legs: Route legs (see FlowLeg)
+            transitions: {node: [(from_state, to_state)]} same-day state changes
+                (freeze: ambient -> frozen, thaw: frozen -> thawed/ambient)
+            sources: (node, product, state) holding stock on day 0 (initial
+                inventory, production state at manufacturing nodes)
+            sinks: (node, product, state) that can serve demand
+            end_date: Last day of the horizon
+            prune_dates: Drop variables before a series' earliest date
+        """
+        self.start_date = dates[0]
+        self.prune_dates = prune_dates
+        self.removed: Dict[str, Tuple[int, int, int]] = {}
+
+        horizon_days = (end_date - self.start_date).days
+        self.earliest: Dict[Tuple[str, str, str], Date] = {}
+        for prod in products:
+            reach = self._forward(prod, legs, transitions, sources)
+            useful = self._backward(prod, legs, transitions, sinks)
+            for (node_id, state), offset in reach.items():
+                key = (node_id, prod, state)
+                if offset <= horizon_days and ((node_id, state) in useful or key in sources):
+                    self.earliest[key] = self.start_date + timedelta(days=offset)
+
+    @staticmethod
+    def _forward(prod, legs, transitions, sources) -> Dict[Tuple[str, str], int]:
+        """Earliest day offset with stock per (node, state) (Bellman-Ford, offsets >= 0).
+
+        No shelf-life cut-off: arrivals restart the model's shelf-life windows
+        (see the module docstring).
+        """
+        reach = {(n, s): 0 for (n, p, s) in sources if p == prod}
+        changed = True
+        while changed:
+            changed = False
+            for leg in legs:
+                start = reach.get((leg.origin, leg.ship_state))
+                if start is None:
+                    continue
+                arrival = start + leg.offset_days
+                if arrival < reach.get((leg.dest, leg.arrival_state), arrival + 1):
+                    reach[(leg.dest, leg.arrival_state)] = arrival
+                    changed = True
+            for node_id, moves in transitions.items():
+                for from_state, to_state in moves:
+                    start = reach.get((node_id, from_state))
+                    if start is not None and start < reach.get((node_id, to_state), start + 1):
+                        reach[(node_id, to_state)] = start
+                        changed = True
+        return reach
+
+    @staticmethod
+    def _backward(prod, legs, transitions, sinks) -> Set[Tuple[str, str]]:
+        """(node, state) series that can feed demand for prod."""
+        useful = {(n, s) for (n, p, s) in sinks if p == prod}
+        changed = True
+        while changed:
+            changed = False
+            for leg in legs:
+                if (leg.dest, leg.arrival_state) in useful and (leg.origin, leg.ship_state) not in useful:
+                    useful.add((leg.origin, leg.ship_state))
+                    changed = True
+            for node_id, moves in transitions.items():
+                for from_state, to_state in moves:
+                    if (node_id, to_state) in useful and (node_id, from_state) not in useful:
+                        useful.add((node_id, from_state))
+                        changed = True
+        return useful
+
+    def has_series(self, node_id: str, prod: str, state: str) -> bool:
+        """True if the (node, product, state) series is kept at all."""
+        return (node_id, prod, state) in self.earliest
+
+    def has_inventory(self, node_id: str, prod: str, state: str, t: Date) -> bool:
+        """True if the series is kept and can hold stock on date t."""
+        earliest = self.earliest.get((node_id, prod, state))
+        if earliest is None:
+            return False
+        return not self.prune_dates or t >= earliest
+
+    def record(self, family: str, total: int, kept: int, rows_removed: int = 0) -> None:
+        """Record how many columns of a variable family (and rows keyed on them) were dropped."""
+        self.removed[family] = (total, kept, rows_removed)
+
+    def summary(self) -> str:
+        """One line per variable family plus totals."""
+        lines = []
+        columns = rows = 0
+        for family, (total, kept, removed_rows) in self.removed.items():
+            pct = (total - kept) / total * 100 if total else 0.0
+            lines.append(f"    {family}: {kept:,} of {total:,} kept ({pct:.0f}% removed)")
+            columns += total - kept
+            rows += removed_rows
+        lines.append(f"    Removed: {columns:,} columns, {rows:,} rows keyed on them")
+        return "\n".join(lines)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """{family: {'total', 'kept', 'rows_removed'}} (for benchmarks/metadata)."""
+        return {
+            family: {'total': total, 'kept': kept, 'rows_removed': removed_rows}
+            for family, (total, kept, removed_rows) in self.removed.items()
+        }
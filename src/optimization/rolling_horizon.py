@@ -0,0 +1,355 @@
+"""Rolling-horizon (relax-and-fix) solve for long planning horizons.
+
+A monolithic SlidingWindowModel over 12+ weeks carries thousands of integer
+pallet and changeover variables; HiGHS often hits the time limit (or the
+mip_max_leaves memory cap) long before closing the gap. Relax-and-fix solves
+the horizon as a sequence of overlapping windows instead:
+
+    window k:  [ fixed (windows < k) | committed (integer) | look-ahead (LP) ]
+
+- committed window: integer variables keep their integrality
+- look-ahead: integer variables dated after the committed window are relaxed
+  to continuous, so the window sees future demand and capacity cheaply
+- beyond the look-ahead: not modeled (the model for window k ends there)
+- earlier windows: their committed decisions (production, mixes, shipments,
+  truck pallets - see fixed_periods.FIXED_PERIOD_VARIABLES) and every other
+  integer dated in them (storage pallets, changeover starts) are fixed to
+  the values chosen when they were solved. Shipments are committed by
+  departure date, so the truck pallets of a shipment delivered after the
+  window stay integer in that window's look-ahead
+
+Each window model starts at the planning start and has the earlier windows
+fixed, so presolve removes them and the inventory, in-transit pipeline and
+product ages at the end of the previous window carry into the next window
+exactly - no re-aging of "initial inventory" at window boundaries.
+
+The last window ends at the planning end with nothing relaxed, so its solve
+is the full-horizon plan: model.get_solution() returns one OptimizationSolution
+and the returned OptimizationResult is that solve's result (solve_time_seconds
+summed over all windows, per-window stats in metadata['rolling_horizon']).
+
+Example:
+    def build(end_date):
+        return SlidingWindowModel(..., start_date=start, end_date=end_date)
+
+    solver = RollingHorizonSolver(build, start, start + timedelta(weeks=12) - timedelta(days=1),
+                                  window_days=14, lookahead_days=14, time_limit_seconds=120)
+    result = solver.solve()
+    solution = solver.model.get_solution()
+"""
+
+from dataclasses import asdict, dataclass
+from datetime import date as Date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import time
+
+from pyomo.environ import Var
+
+from .base_model import BaseOptimizationModel, OptimizationResult
+from .fixed_periods import FixedPeriod, apply_fixed_period
+from .lp_first import relax_integrality
+from .warmstart_utils import (
+    apply_warmstart_hints,
+    extract_solution_for_warmstart,
+    get_partial_start_variables,
+)
+
+
+@dataclass
+class RollingWindow:
+    """One relax-and-fix window and its solve statistics.
+
+    Attributes:
+        index: Window number (0 = first)
+        start_date: First committed date
+        end_date: Last committed date (inclusive)
+        horizon_end: Last date of the look-ahead (end of the window model)
+        build_time: Model build time (seconds)
+        solve_time: Solve time (seconds)
+        objective: Objective of the window model (look-ahead relaxed)
+        termination: Solver termination condition
+        fixed: Variables fixed from earlier windows
+        relaxed: Integer variables relaxed in the look-ahead
+        integer: Integer variables left in the committed window
+    """
+    index: int
+    start_date: Date
+    end_date: Date
+    horizon_end: Date
+    build_time: Optional[float] = None
+    solve_time: Optional[float] = None
+    objective: Optional[float] = None
+    termination: Optional[str] = None
+    fixed: int = 0
+    relaxed: int = 0
+    integer: int = 0
+
+
+def build_windows(
+    start_date: Date,
+    end_date: Date,
+    window_days: int,
+    lookahead_days: int,
+) -> List[RollingWindow]:
+    """Split start_date..end_date into committed windows with look-ahead.
+
+    Args:
+        start_date: Planning start
+        end_date: Planning end (inclusive)
+        window_days: Committed days per window
+        lookahead_days: Relaxed days after each committed window
+
+    Returns:
+        Windows in order; the last one ends at end_date
+
+    Raises:
+        ValueError: If window_days < 1, lookahead_days < 0 or end_date < start_date
+    """
+    if window_days < 1:
+        raise ValueError(f"window_days must be >= 1, got {window_days}")
+    if lookahead_days < 0:
+        raise ValueError(f"lookahead_days must be >= 0, got {lookahead_days}")
+    if end_date < start_date:
+        raise ValueError(f"end_date ({end_date}) must be >= start_date ({start_date})")
+
+    windows = []
+    window_start = start_date
+    while window_start <= end_date:
+        window_end = min(window_start + timedelta(days=window_days - 1), end_date)
+        windows.append(RollingWindow(
+            index=len(windows),
+            start_date=window_start,
+            end_date=window_end,
+            horizon_end=min(window_end + timedelta(days=lookahead_days), end_date),
+        ))
+        window_start = window_end + timedelta(days=1)
+    return windows
+
+
+def _dates(var_data) -> List[Date]:
+    index = var_data.index()
+    key_index = index if isinstance(index, tuple) else (index,)
+    return [c for c in key_index if isinstance(c, Date)]
+
+
+def relax_integer_variables(
+    pyomo_model: Any,
+    after: Date,
+    keep_integer: Optional[Callable[[Any], bool]] = None,
+) -> Tuple[int, int]:
+    """Relax integrality of unfixed variables dated after `after` (the look-ahead).
+
+    A variable is in the look-ahead if any date in its index is later than
+    `after`. Bounds (including the [0, 1] of binaries) are kept, as in
+    lp_first.relax_integrality which does the relaxing.
+
+    Args:
+        pyomo_model: Built Pyomo model
+        after: Last committed date
+        keep_integer: Optional predicate on a variable; look-ahead variables
+            it accepts stay integer (see departs_in_window)
+
+    Returns:
+        Tuple of (relaxed, integer): integer variables relaxed and left integer
+    """
+    def in_lookahead(var_data) -> bool:
+        dates = _dates(var_data)
+        if not dates or max(dates) <= after:
+            return False
+        return keep_integer is None or not keep_integer(var_data)
+
+    relaxed = len(relax_integrality(pyomo_model, in_lookahead))
+    integer = sum(
+        1 for var_data in pyomo_model.component_data_objects(Var, descend_into=True)
+        if var_data.is_integer() and not var_data.fixed
+    )
+    return relaxed, integer
+
+
+def departs_in_window(model: BaseOptimizationModel, end_date: Date) -> Callable[[Any], bool]:
+    """keep_integer predicate for truck pallets loaded inside the committed window.
+
+    in_transit is keyed by departure date, its truck pallets by delivery date:
+    a shipment departing on or before end_date but delivered after it is
+    committed with the window, so its truck pallets must stay integer or the
+    next window could not fix them (or the shipment) consistently.
+
+    Args:
+        model: Built SlidingWindowModel of the window being solved
+        end_date: Last committed date
+    """
+    def keep(var_data) -> bool:
+        if var_data.parent_component().name != 'truck_pallet_load':
+            return False
+        _, dest, _, delivery_date = var_data.index()
+        return any(
+            departure_date <= end_date
+            for route in model.routes_to_node.get(dest, ())
+            for departure_date in model._departure_dates(delivery_date, model._offset_days(route))
+        )
+    return keep
+
+
+def fix_committed_integers(pyomo_model: Any, end_date: Date, values: Dict[Tuple, float]) -> int:
+    """Fix every unfixed integer variable dated on or before end_date.
+
+    apply_fixed_period fixes the decisions (FIXED_PERIOD_VARIABLES); the
+    integers that follow from them (storage pallets, pallet entries,
+    changeover starts) would otherwise stay free and be re-solved by every
+    later window. Variables missing from `values` were zero.
+
+    Args:
+        pyomo_model: Built Pyomo model
+        end_date: Last committed date
+        values: Solution of the previous window, keyed (var_name, *index)
+
+    Returns:
+        Number of variables fixed
+    """
+    fixed = 0
+    for var in pyomo_model.component_objects(Var, active=True, descend_into=True):
+        for index, var_data in var.items():
+            if var_data.fixed or not var_data.is_integer():
+                continue
+            dates = _dates(var_data)
+            if not dates or max(dates) > end_date:
+                continue
+            key_index = index if isinstance(index, tuple) else (index,)
+            var_data.fix(round(values.get((var.name, *key_index), 0)))
+            fixed += 1
+    return fixed
+
+
+class RollingHorizonSolver:
+    """Relax-and-fix solve of a long horizon with APPSI HiGHS.
+
+    Attributes:
+        model_factory: Builds an (unsolved) model from start_date to a given end date
+        windows: Relax-and-fix windows (filled in with stats by solve())
+        model: Model of the last solved window (full horizon after a successful solve)
+        result: OptimizationResult of the last solved window
+    """
+
+    def __init__(
+        self,
+        model_factory: Callable[[Date], BaseOptimizationModel],
+        start_date: Date,
+        end_date: Date,
+        window_days: int = 14,
+        lookahead_days: int = 14,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        use_aggressive_heuristics: bool = False,
+        highs_options: Optional[Dict[str, Any]] = None,
+        tee: bool = False,
+    ):
+        """Set up the windows.
+
+        Args:
+            model_factory: Callable returning a new model (e.g. SlidingWindowModel)
+                for start_date..end_date, called once per window with the
+                window's horizon end
+            start_date: Planning start (must match the factory's models)
+            end_date: Planning end (inclusive)
+            window_days: Committed days per window
+            lookahead_days: Days after the committed window solved as an LP relaxation
+            time_limit_seconds: Time limit per window solve
+            mip_gap: MIP gap per window solve
+            use_aggressive_heuristics: Enable aggressive MIP heuristics
+            highs_options: HiGHS options applied over the project defaults
+            tee: Show solver output
+
+        Raises:
+            ValueError: If the window parameters are invalid
+        """
+        self.model_factory = model_factory
+        self.start_date = start_date
+        self.end_date = end_date
+        self.windows = build_windows(start_date, end_date, window_days, lookahead_days)
+        self.time_limit_seconds = time_limit_seconds
+        self.mip_gap = mip_gap
+        self.use_aggressive_heuristics = use_aggressive_heuristics
+        self.highs_options = highs_options
+        self.tee = tee
+
+        self.model: Optional[BaseOptimizationModel] = None
+        self.result: Optional[OptimizationResult] = None
+
+    def solve(self, verbose: bool = True) -> OptimizationResult:
+        """Solve the windows in order and return the full-horizon result.
+
+        If a window finds no feasible solution, its result is returned (with
+        the stats of the windows solved so far) and later windows are skipped.
+
+        Args:
+            verbose: Print one progress line per window
+
+        Returns:
+            OptimizationResult of the last window solved
+        """
+        values: Dict[Tuple, float] = {}
+        total_start = time.time()
+
+        for window in self.windows:
+            model = self.model_factory(window.horizon_end)
+
+            build_start = time.time()
+            model.model = model.build_model()
+            model._build_time = time.time() - build_start
+            window.build_time = model._build_time
+
+            partial_start = None
+            if values:
+                apply_warmstart_hints(model.model, values)
+                committed_end = window.start_date - timedelta(days=1)
+                window.fixed = apply_fixed_period(model.model, FixedPeriod(
+                    start_date=self.start_date,
+                    end_date=committed_end,
+                    values=values,
+                    check_feasibility=False,
+                    source=f"rolling-horizon window {window.index}",
+                ))['fixed']
+                window.fixed += fix_committed_integers(model.model, committed_end, values)
+                partial_start = get_partial_start_variables(model.model)
+
+            window.relaxed, window.integer = relax_integer_variables(
+                model.model, window.end_date, departs_in_window(model, window.end_date))
+
+            result = model._solve_with_appsi_highs(
+                time_limit_seconds=self.time_limit_seconds,
+                mip_gap=self.mip_gap,
+                use_aggressive_heuristics=self.use_aggressive_heuristics,
+                tee=self.tee,
+                partial_start=partial_start,
+                highs_options=self.highs_options,
+                # Earlier windows only hand their values on; their look-ahead is relaxed
+                extract=window is self.windows[-1],
+            )
+            window.solve_time = result.solve_time_seconds
+            window.objective = result.objective_value
+            window.termination = str(result.termination_condition)
+            self.model, self.result = model, result
+
+            if verbose:
+                objective = f"{window.objective:,.2f}" if window.objective is not None else '-'
+                print(f"  Window {window.index + 1}/{len(self.windows)}: committed {window.start_date} to "
+                      f"{window.end_date}, look-ahead to {window.horizon_end} - {window.termination} "
+                      f"in {window.solve_time or 0:.1f}s, objective {objective} "
+                      f"({window.integer:,} integer, {window.relaxed:,} relaxed, {window.fixed:,} fixed)")
+
+            if not result.is_feasible():
+                break
+            values = extract_solution_for_warmstart(model)
+
+        solved = [w for w in self.windows if w.termination is not None]
+        result = self.result
+        result.metadata['rolling_horizon'] = {
+            'windows': [asdict(w) for w in solved],
+            'completed': len(solved) == len(self.windows) and result.is_feasible(),
+            'total_build_time': sum(w.build_time or 0 for w in solved),
+            'total_solve_time': sum(w.solve_time or 0 for w in solved),
+            'total_time': time.time() - total_start,
+            'last_window_solve_time': result.solve_time_seconds,
+        }
+        result.solve_time_seconds = result.metadata['rolling_horizon']['total_solve_time']
+        return result
@@ -7,6 +7,7 @@ cohort-based approach while maintaining exact shelf life enforcement.
 Key Features:
 - State-based inventory tracking (ambient, frozen, thawed)
 - Sliding window constraints for shelf life (17d, 120d, 14d)
+- Optional cumulative (prefix-sum) shelf life formulation for long horizons
 - Pipeline inventory tracking (in-transit indexed by departure date)
 - Integer pallet tracking for storage and truck loading
 - O(H) variables instead of O(H³) cohorts
@@ -31,13 +32,15 @@ Architecture based on:
 - Production-proven approach from SAP/Oracle planning systems
 """
 
+from contextlib import nullcontext
 from datetime import date as Date, timedelta
 from typing import Dict, List, Set, Tuple, Optional, Any
 import warnings
 import logging
+import math
 
 from pyomo.environ import (
-    ConcreteModel, Var, Constraint, Objective, Set as PyomoSet,
+    ConcreteModel, Var, Constraint, Objective, Param, Set as PyomoSet,
     NonNegativeReals, NonNegativeIntegers, Binary, Integers,
     minimize, quicksum, value
 )
@@ -50,7 +53,12 @@ from ..models.unified_route import UnifiedRoute, TransportMode
 from ..models.unified_truck_schedule import UnifiedTruckSchedule
 from ..models.labor_calendar import LaborCalendar
 from ..models.forecast import Forecast
+from ..models.time_period import VariableGranularityConfig
 from .base_model import BaseOptimizationModel, OptimizationResult
+from .temporal_aggregation import PlanningPeriods, PeriodLabor, WEEKDAY_NAMES
+from .reachability import FlowLeg, VariableSupport
+from .primal_values import PrimalTable, PrimalValues
+from .build_profiler import BuildProfiler
 from . import constants
 
 
@@ -84,6 +92,12 @@ class SlidingWindowModel(BaseOptimizationModel):
         - Integer pallet ceiling (storage and trucks)
         - Demand satisfaction
 
+    Direct build:
+        When solve() targets highs_direct or portfolio, the state balance,
+        shelf life window, pallet and truck families skip their Pyomo rules.
+        Row functions write them as (variable, coefficient) rows into a
+        highs_direct.DirectRows, appended to the CSR arrays (see _add_rows).
+
     Objective:
         Minimize: labor + transport + holding + shortage + changeover + waste
         (NO explicit staleness - implicit via holding costs)
@@ -114,6 +128,18 @@ class SlidingWindowModel(BaseOptimizationModel):
     THAWED_SHELF_LIFE = constants.THAWED_SHELF_LIFE_DAYS
     MINIMUM_ACCEPTABLE_SHELF_LIFE_DAYS = constants.MINIMUM_ACCEPTABLE_SHELF_LIFE_DAYS
 
+    # Supported shelf life constraint formulations (see _add_sliding_window_shelf_life)
+    SHELF_LIFE_FORMULATIONS = ('window', 'cumulative')
+
+    # CostStructure fields held in model.cost_rate when mutable_parameters=True
+    MUTABLE_COST_RATES = (
+        'production_cost_per_unit',
+        'shortage_penalty_per_unit',
+        'storage_cost_per_pallet_day_frozen',
+        'storage_cost_per_pallet_day_ambient',
+        'changeover_cost_per_start',
+    )
+
     # Packaging constants - imported from constants module
     UNITS_PER_CASE = constants.UNITS_PER_CASE
     CASES_PER_PALLET = constants.CASES_PER_PALLET
@@ -136,6 +162,13 @@ class SlidingWindowModel(BaseOptimizationModel):
         allow_shortages: bool = True,
         use_pallet_tracking: bool = True,
         use_truck_pallet_tracking: bool = True,
+        shelf_life_formulation: str = 'window',
+        shelf_life: Optional[Dict[str, int]] = None,
+        mutable_parameters: bool = False,
+        granularity: Optional[VariableGranularityConfig] = None,
+        prune_unreachable: bool = True,
+        profile_build: bool = False,
+        build_diagnostics: bool = False,
     ):
         """Initialize sliding window model.
 
@@ -156,8 +189,57 @@ class SlidingWindowModel(BaseOptimizationModel):
             allow_shortages: Allow unmet demand (with penalty)
             use_pallet_tracking: Use integer pallets for storage costs
             use_truck_pallet_tracking: Use integer pallets for truck capacity
+            shelf_life_formulation: How shelf life windows are written:
+                'window' (default) sums every flow in each L-day window;
+                'cumulative' adds prefix-sum variables so each window is a
+                difference of two cumulative terms (far fewer nonzeros for
+                the 120-day frozen window on long horizons)
+            shelf_life: Shelf life overrides in days by state ('ambient',
+                'frozen', 'thawed'), e.g. {'ambient': 21} for what-if runs.
+                States not given keep AMBIENT/FROZEN/THAWED_SHELF_LIFE
+            mutable_parameters: Put demand, cost rates, route costs and truck
+                capacities into mutable Pyomo Params (model.demand_qty,
+                model.cost_rate, model.route_cost_per_unit,
+                model.truck_capacity_pallets) so a persistent solver can
+                re-solve what-if changes without rebuilding the model
+            granularity: Variable time granularity (e.g. daily for the first
+                4 weeks, then weekly). model.dates then holds period start
+                dates and demand, shelf life, transit, labor and truck
+                capacity are aggregated per period (see
+                temporal_aggregation.py). None (default) = daily periods
+            prune_unreachable: Only create inventory, in-transit, pallet and
+                freeze/thaw variables where stock can exist: reachable from
+                production or initial inventory by that date and feeding
+                demand downstream (see reachability.py). False = full
+                capability-filtered cross products
+            profile_build: Profile build_model() per step and constraint
+                family (time, peak memory, rows, nonzeros, coefficient
+                range) into self.build_profile (see build_profiler.py)
+            build_diagnostics: Print the debugging traces of specific nodes
+                and days (DAY 18/DAY2 shelf life, 6104/6125 arrivals,
+                Lineage/6130 balances, model structure, waste cost)
         """
         super().__init__()
+        self.profile_build = profile_build
+        self.build_diagnostics = build_diagnostics
+        self.direct_rows = None  # highs_direct.DirectRows of a direct build (see _add_rows)
+
+        if shelf_life_formulation not in self.SHELF_LIFE_FORMULATIONS:
+            raise ValueError(
+                f"Unknown shelf_life_formulation '{shelf_life_formulation}'. "
+                f"Expected one of: {', '.join(self.SHELF_LIFE_FORMULATIONS)}"
+            )
+
+        if shelf_life:
+            unknown = set(shelf_life) - {'ambient', 'frozen', 'thawed'}
+            if unknown:
+                raise ValueError(
+                    f"Unknown shelf_life state(s): {', '.join(sorted(unknown))}. "
+                    f"Expected 'ambient', 'frozen' or 'thawed'"
+                )
+            self.AMBIENT_SHELF_LIFE = int(shelf_life.get('ambient', self.AMBIENT_SHELF_LIFE))
+            self.FROZEN_SHELF_LIFE = int(shelf_life.get('frozen', self.FROZEN_SHELF_LIFE))
+            self.THAWED_SHELF_LIFE = int(shelf_life.get('thawed', self.THAWED_SHELF_LIFE))
 
         # Store inputs (compatible with UnifiedNodeModel)
         self.nodes = {node.id: node for node in nodes}
@@ -167,22 +249,21 @@ class SlidingWindowModel(BaseOptimizationModel):
         self.products_dict = products
         self.truck_schedules = truck_schedules or []
 
+        # Planning periods: one per day, or variable granularity buckets
+        self.periods = PlanningPeriods(start_date, end_date, granularity)
+        self.period_days = self.periods.period_days
+        self._truck_departure_counts: Dict[Tuple[int, Date], int] = {}
+        self.granularity = granularity
+
         # Convert forecast to demand dict (FILTER to planning horizon only!)
-        self.demand = {}
-        for entry in forecast.entries:
-            # Only include demand within planning horizon
-            if start_date <= entry.forecast_date <= end_date:
-                key = (entry.location_id, entry.product_id, entry.forecast_date)
-                self.demand[key] = self.demand.get(key, 0) + entry.quantity
+        # Vectorized horizon filter + group-by on the columnar forecast store,
+        # summed per period when periods span several days
+        self.demand = self.periods.aggregate_demand(forecast.store.demand_dict(start_date, end_date))
 
         self.forecast = forecast
 
-        # Build date list BEFORE using for filtering
-        self.dates = []
-        current = start_date
-        while current <= end_date:
-            self.dates.append(current)
-            current += timedelta(days=1)
+        # Build date list BEFORE using for filtering (period start dates)
+        self.dates = list(self.periods.dates)
         self.truck_schedules = truck_schedules or []
         self.labor_calendar = labor_calendar
         self.cost_structure = cost_structure
@@ -191,6 +272,8 @@ class SlidingWindowModel(BaseOptimizationModel):
         self.allow_shortages = allow_shortages
         self.use_pallet_tracking = use_pallet_tracking
         self.use_truck_pallet_tracking = use_truck_pallet_tracking
+        self.shelf_life_formulation = shelf_life_formulation
+        self.mutable_parameters = mutable_parameters
 
         # Preprocess initial inventory to standard format
         self.initial_inventory = self._preprocess_initial_inventory(
@@ -240,13 +323,24 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Build network indices
         self._build_network_indices()
 
+        # Precompute date positions, shelf life windows and per-node route legs
+        self._build_constraint_indices()
+
+        # Feasible support of the inventory series (None = no pruning)
+        self.support = self._build_variable_support() if prune_unreachable else None
+
         print(f"\nSliding Window Model Initialized:")
         print(f"  Nodes: {len(self.nodes)}")
         print(f"  Routes: {len(self.routes)}")
         print(f"  Products: {len(self.products)}")
         print(f"  Planning horizon: {len(self.dates)} days")
+        if self.periods.is_aggregated:
+            print(f"  Time granularity: {self.periods.summary()}")
         print(f"  Demand entries: {len(self.demand)}")
         print(f"  Pallet tracking: {use_pallet_tracking}")
+        print(f"  Shelf life formulation: {shelf_life_formulation}")
+        if self.support is not None:
+            print(f"  Reachable inventory series: {len(self.support.earliest)}")
 
     def _preprocess_initial_inventory(
         self,
@@ -420,6 +514,232 @@ class SlidingWindowModel(BaseOptimizationModel):
             for route in lineage_routes_to:
                 print(f"    - {route.origin_node_id} → Lineage (mode={route.transport_mode}, days={route.transit_days})")
 
+    def _build_constraint_indices(self):
+        """Precompute date and route lookup tables used by constraint rules.
+
+        Constraint rules are called once per (node, product, date). Without these
+        tables every call rescans the date list (list.index + slicing) and the
+        route list, which makes model build quadratic in the horizon length.
+
+        Tables:
+            date_index: {date: position in self.dates}
+            date_to_prev: {date: previous planning date} (first date has no entry)
+            shelf_life_windows: {shelf_life: {t: (t-L+1 .. t) clipped to horizon}}
+                (aggregated periods: periods starting within L days of t's end)
+            arrival_legs: {(dest, arrival_state): [(origin, ship_state, offset_days)]}
+            departure_legs: {(origin, ship_state): [dest, ...]}
+            route_by_pair: {(origin, dest): first matching route}
+            nodes_with_frozen_inbound: nodes reached by at least one frozen route
+
+        offset_days is the number of planning days between departure and arrival,
+        i.e. departure = dates[date_index[arrival] - offset_days]. It matches the
+        ``t - timedelta(days=route.transit_days)`` arithmetic used in the rules.
+        With aggregated periods, _departure_dates maps it to departure periods.
+        """
+        from collections import defaultdict
+
+        self.date_index = {d: i for i, d in enumerate(self.dates)}
+        self.date_to_prev = {d: self.dates[i - 1] for i, d in enumerate(self.dates) if i > 0}
+
+        # Sliding windows [t-L+1, t] clipped at planning start, one table per shelf life
+        self.shelf_life_windows = {}
+        for shelf_life in (self.AMBIENT_SHELF_LIFE, self.FROZEN_SHELF_LIFE, self.THAWED_SHELF_LIFE):
+            self.shelf_life_windows[shelf_life] = self.periods.shelf_life_windows(shelf_life)
+
+        # Arrival/departure legs grouped by state (route order preserved)
+        self.arrival_legs = defaultdict(list)
+        self.departure_legs = defaultdict(list)
+        self.route_by_pair = {}
+        self.nodes_with_frozen_inbound = set()
+
+        for route in self.routes:
+            origin = route.origin_node_id
+            dest = route.destination_node_id
+            self.route_by_pair.setdefault((origin, dest), route)
+
+            ship_state = 'frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient'
+            self.departure_legs[(origin, ship_state)].append(dest)
+
+            if route.transport_mode == TransportMode.FROZEN:
+                self.nodes_with_frozen_inbound.add(dest)
+
+            dest_node = self.nodes.get(dest)
+            if dest_node is None:
+                continue
+            arrival_state = self._determine_arrival_state(route, dest_node)
+            offset_days = self._offset_days(route)
+            self.arrival_legs[(dest, arrival_state)].append((origin, ship_state, offset_days))
+
+    def _build_variable_support(self) -> VariableSupport:
+        """Reachability of every (node, product, state) inventory series.
+
+        Sources are initial inventory and the production state of the
+        manufacturing nodes, route legs move stock between series after their
+        transit days, freeze/thaw move it between states at a node, and
+        demand marks the ambient/thawed series it is consumed from. Variables
+        before a series' earliest date are only dropped with daily periods.
+        """
+        legs = []
+        for route in self.routes:
+            dest_node = self.nodes.get(route.destination_node_id)
+            if dest_node is None:
+                continue
+            legs.append(FlowLeg(
+                origin=route.origin_node_id,
+                dest=route.destination_node_id,
+                ship_state='frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient',
+                arrival_state=self._determine_arrival_state(route, dest_node),
+                offset_days=self._offset_days(route),
+            ))
+
+        # Same conditions as the thaw/freeze variables in _add_variables
+        transitions = {}
+        for node_id, node in self.nodes.items():
+            moves = []
+            if node.supports_frozen_storage() and node.supports_ambient_storage():
+                moves.append(('ambient', 'frozen'))
+            if node.supports_frozen_storage() and (node.supports_ambient_storage() or node.has_demand_capability()):
+                moves.extend([('frozen', 'thawed'), ('frozen', 'ambient')])
+            if moves:
+                transitions[node_id] = moves
+
+        sources = {key for key, qty in self.initial_inventory.items() if qty > 0}
+        for node in self.manufacturing_nodes:
+            sources.update((node.id, prod, node.get_production_state()) for prod in self.products)
+
+        sinks = set()
+        for (node_id, prod, _) in self.demand:
+            sinks.add((node_id, prod, 'ambient'))
+            sinks.add((node_id, prod, 'thawed'))
+
+        return VariableSupport(
+            dates=self.dates,
+            products=list(self.products.keys()),
+            legs=legs,
+            transitions=transitions,
+            sources=sources,
+            sinks=sinks,
+            end_date=self.end_date,
+            prune_dates=not self.periods.is_aggregated,
+        )
+
+    def _has_inventory(self, node_id: str, prod: str, state: str, t: Date) -> bool:
+        """True if inventory[node, prod, state, t] is in the model's support."""
+        return self.support is None or self.support.has_inventory(node_id, prod, state, t)
+
+    def _has_transit(self, route: UnifiedRoute, prod: str, departure_date: Date, state: str) -> bool:
+        """True if in_transit[route, prod, departure_date, state] is in the model's support.
+
+        Goods travel in the route's transport mode, leave the origin's stock
+        in that state and must land in a kept series at the destination.
+        """
+        ship_state = 'frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient'
+        if state != ship_state:
+            return False
+        dest_node = self.nodes.get(route.destination_node_id)
+        if dest_node is None:
+            return False
+        arrival_state = self._determine_arrival_state(route, dest_node)
+        return (self._has_inventory(route.origin_node_id, prod, ship_state, departure_date)
+                and self.support.has_series(route.destination_node_id, prod, arrival_state))
+
+    @staticmethod
+    def _offset_days(route: UnifiedRoute) -> int:
+        """Whole planning days between departure and arrival on a route.
+
+        UnifiedRoute.transit_days is a float; this is the offset used by the
+        date-index tables (see _build_constraint_indices).
+        """
+        return timedelta(days=route.transit_days).days
+
+    def _departure_date(self, t: Date, offset_days: int) -> Optional[Date]:
+        """Departure date for goods arriving on t after offset_days, or None if pre-horizon.
+
+        With aggregated periods this is the latest of _departure_dates().
+        """
+        departures = self._departure_dates(t, offset_days)
+        return departures[-1] if departures else None
+
+    def _departure_dates(self, t: Date, offset_days: int) -> Tuple[Date, ...]:
+        """Departure dates (periods) of goods arriving on t after offset_days.
+
+        Daily periods: (t - offset_days,) if within the horizon, else ().
+        Aggregated periods: every period whose departures arrive in t.
+        """
+        if not self.periods.is_aggregated:
+            idx = self.date_index[t] - offset_days
+            if 0 <= idx < len(self.dates):
+                return (self.dates[idx],)
+            return ()
+        return self.periods.departure_periods(t, offset_days)
+
+    def _arrival_date(self, departure_date: Date, offset_days: int) -> Optional[Date]:
+        """Delivery date (period) of goods departing on departure_date, or None beyond horizon."""
+        if not self.periods.is_aggregated:
+            delivery_date = departure_date + timedelta(days=offset_days)
+            return delivery_date if delivery_date in self.date_index else None
+        return self.periods.arrival_period(departure_date, offset_days)
+
+    def _period_labor(self, t: Date):
+        """LaborDay for date t, or PeriodLabor summed over a multi-day period (None if no labor)."""
+        if not self.periods.is_aggregated:
+            return self.labor_calendar.get_labor_day(t)
+        return self.periods.labor(self.labor_calendar, t)
+
+    @staticmethod
+    def _is_mixed_period(labor) -> bool:
+        """True for an aggregated period with both fixed (weekday) and non-fixed days."""
+        return isinstance(labor, PeriodLabor) and labor.fixed_hours > 0 and labor.non_fixed_hours > 0
+
+    def _overtime_bounds(self):
+        """Overtime bounds: 2h per weekday, or the period's summed overtime capacity."""
+        if not self.periods.is_aggregated:
+            return (0, 2)
+
+        def bounds(m, node_id, t):
+            if self.period_days[t] == 1:
+                return (0, 2)
+            labor = self._period_labor(t)
+            return (0, labor.overtime_hours if isinstance(labor, PeriodLabor) else 0)
+        return bounds
+
+    def _period_bounds(self, upper: float, date_position: int = -1):
+        """Variable bounds for a per-day upper limit, scaled by period length.
+
+        Daily periods keep the plain (0, upper) tuple.
+        """
+        if not self.periods.is_aggregated:
+            return (0, upper)
+        period_days = self.period_days
+        return lambda m, *index: (0, upper * period_days[index[date_position]])
+
+    def _truck_departures(self, truck_idx: int, t: Date) -> int:
+        """Departures of a truck whose loads are delivered in period t (aggregated periods).
+
+        truck_pallet_load is keyed by delivery period, and a weekly period
+        receives the departures of the daily periods just before it as well
+        as its own, so its load is limited per departure, not per period.
+        """
+        counts = self._truck_departure_counts
+        key = (truck_idx, t)
+        if key not in counts:
+            truck = self.truck_schedules[truck_idx]
+            departure_periods = set()
+            for route in self.routes_to_node.get(truck.destination_node_id, []):
+                departure_periods.update(self._departure_dates(t, self._offset_days(route)))
+            counts[key] = sum(self.periods.count_weekday(d, truck.day_of_week) for d in departure_periods)
+        return counts[key]
+
+    def _truck_load_scale(self, truck_idx: int, t: Date) -> int:
+        """Truck capacities in the upper bound of truck_pallet_load[truck_idx, ..., t].
+
+        1 with daily periods; with aggregated periods one per departure
+        delivering into t (at least 1, like a daily non-operating day).
+        """
+        if not self.periods.is_aggregated:
+            return 1
+        return max(1, self._truck_departures(truck_idx, t))
+
     def _expand_intermediate_stop_routes(self) -> List[UnifiedRoute]:
         """Expand truck routes to include intermediate stop destinations.
 
@@ -645,12 +965,22 @@ class SlidingWindowModel(BaseOptimizationModel):
         print("="*80)
 
         model = ConcreteModel()
+        self.build_profile = BuildProfiler() if self.profile_build else None
+
+        # Direct build (solve() with highs_direct/portfolio): bulk families as CSR rows.
+        # Rows over mutable Params stay in Pyomo so a persistent solver can update them.
+        self.direct_rows = None
+        if self._direct_build and not self.mutable_parameters:
+            from .highs_direct import DIRECT_ROWS_ATTR, DirectRows
+            self.direct_rows = DirectRows()
+            setattr(model, DIRECT_ROWS_ATTR, self.direct_rows)
 
         # Define sets
-        model.nodes = PyomoSet(initialize=list(self.nodes.keys()))
-        model.products = PyomoSet(initialize=list(self.products.keys()))
-        model.dates = PyomoSet(initialize=self.dates, ordered=True)
-        model.states = PyomoSet(initialize=['ambient', 'frozen', 'thawed'])
+        with self._profile('sets', model):
+            model.nodes = PyomoSet(initialize=list(self.nodes.keys()))
+            model.products = PyomoSet(initialize=list(self.products.keys()))
+            model.dates = PyomoSet(initialize=self.dates, ordered=True)
+            model.states = PyomoSet(initialize=['ambient', 'frozen', 'thawed'])
 
         print(f"\nSets defined:")
         print(f"  Nodes: {len(list(model.nodes))}")
@@ -658,18 +988,108 @@ class SlidingWindowModel(BaseOptimizationModel):
         print(f"  Dates: {len(list(model.dates))}")
         print(f"  States: {len(list(model.states))}")
 
+        # Mutable parameters (what-if re-solves through a persistent solver)
+        if self.mutable_parameters:
+            with self._profile('parameters', model):
+                self._add_parameters(model)
+
         # Add variables
-        self._add_variables(model)
+        with self._profile('variables', model):
+            self._add_variables(model)
 
         # Add constraints
         self._add_constraints(model)
 
         # Build objective
-        self._build_objective(model)
+        with self._profile('objective', model):
+            self._build_objective(model)
+
+        if self.build_profile is not None:
+            self.build_profile.finish(model)
+            print(f"\nBuild profile:")
+            print(self.build_profile.summary())
 
         print(f"\nModel built successfully")
         return model
 
+    def _profile(self, step: str, model: ConcreteModel):
+        """Context for one build step: profiled with profile_build, else a no-op."""
+        if self.build_profile is None:
+            return nullcontext()
+        return self.build_profile.step(step, model)
+
+    def _add_rows(self, model: ConcreteModel, name: str, index, rule, row, doc: str):
+        """Add a bulk constraint family as a Constraint, or as direct rows in a direct build.
+
+        Args:
+            model: Model being built
+            name: Constraint component name (family name of the direct rows)
+            index: Keys of the family
+            rule: Pyomo rule
+            row: Same constraint without Pyomo expressions: row(*key) returns
+                (terms, lower, upper) with terms [(var, coef), ...], or None
+                where rule skips the key
+            doc: Constraint doc
+        """
+        if self.direct_rows is None:
+            model.add_component(name, Constraint(index, rule=rule, doc=doc))
+            return
+        add = self.direct_rows.add
+        for key in index:
+            entry = row(*key)
+            if entry is not None:
+                add(name, *entry)
+
+    def _add_parameters(self, model: ConcreteModel):
+        """Add mutable Params for the data a what-if re-solve may change.
+
+        Constraints and the objective reference these Params instead of float
+        constants, so APPSI can push new values to HiGHS in place (see
+        PersistentSolveSession). Values match the constants used otherwise,
+        so the model is numerically identical to mutable_parameters=False.
+        """
+        print(f"\nAdding mutable parameters...")
+
+        model.demand_qty = Param(
+            list(self.demand.keys()),
+            initialize=self.demand,
+            mutable=True,
+            doc="Demand quantity (units) per (node, product, date)"
+        )
+
+        cost_rates = {
+            'production_cost_per_unit': self.cost_structure.production_cost_per_unit or 1.30,
+            'shortage_penalty_per_unit': self.cost_structure.shortage_penalty_per_unit or 0,
+            'storage_cost_per_pallet_day_frozen': self.cost_structure.storage_cost_per_pallet_day_frozen or 0,
+            'storage_cost_per_pallet_day_ambient': self.cost_structure.storage_cost_per_pallet_day_ambient or 0,
+            'changeover_cost_per_start': getattr(self.cost_structure, 'changeover_cost_per_start', 0) or 0,
+        }
+        model.cost_rate = Param(
+            list(self.MUTABLE_COST_RATES),
+            initialize=cost_rates,
+            mutable=True,
+            doc="Objective cost rates (CostStructure field name -> value)"
+        )
+
+        model.route_cost_per_unit = Param(
+            list(self.route_by_pair.keys()),
+            initialize={pair: route.cost_per_unit or 0 for pair, route in self.route_by_pair.items()},
+            mutable=True,
+            doc="Transport cost per unit per (origin, destination)"
+        )
+
+        model.truck_capacity_pallets = Param(
+            list(range(len(self.truck_schedules))),
+            initialize=self.PALLETS_PER_TRUCK,
+            mutable=True,
+            doc="Truck capacity (pallets) per truck schedule index"
+        )
+
+        print(f"  Demand parameters: {len(model.demand_qty)}")
+        print(f"  Cost rate parameters: {len(model.cost_rate)}")
+        print(f"  Route cost parameters: {len(model.route_cost_per_unit)}")
+        print(f"  Truck capacity parameters: {len(model.truck_capacity_pallets)}")
+
     def _add_variables(self, model: ConcreteModel):
         """Add decision variables to model."""
         print(f"\nAdding variables...")
@@ -684,10 +1104,11 @@ class SlidingWindowModel(BaseOptimizationModel):
         ]
         # MIP Performance: Add explicit upper bound (validated via A/B test)
         # Production bounded by max daily capacity: 1400 units/hr × 14 hrs = 19600
+        # (per day of the period when periods are aggregated)
         model.production = Var(
             production_index,
             within=NonNegativeReals,
-            bounds=(0, 19600),
+            bounds=self._period_bounds(19600),
             doc="Production quantity by node, product, date"
         )
         print(f"  Production variables: {len(production_index)}")
@@ -697,6 +1118,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         # CRITICAL: Create inventory vars for ALL nodes (including demand nodes!)
         # Demand nodes need inventory to satisfy demand from
         inventory_index = []
+        first_product = next(iter(model.products), None)
         for node_id, node in self.nodes.items():
             # Skip only if node has no storage AND no demand capability
             if not node.capabilities.can_store and not node.has_demand_capability():
@@ -715,10 +1137,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                         # Typically: nodes that receive from frozen routes (like 6130 from Lineage)
                         # Don't create for pure ambient nodes like manufacturing
                         # Don't create for frozen-only nodes like Lineage (they can't thaw!)
-                        has_frozen_inbound = any(
-                            r.destination_node_id == node_id and r.transport_mode == TransportMode.FROZEN
-                            for r in self.routes
-                        )
+                        has_frozen_inbound = node_id in self.nodes_with_frozen_inbound
                         # FIX (2025-11-08): Match thaw flow logic (line 753)
                         # Frozen-only nodes (Lineage) should NOT have thawed inventory
                         # Must be able to hold frozen AND use ambient/thawed
@@ -730,9 +1149,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                             inventory_index.append((node_id, prod, 'thawed', t))
 
                             # DIAGNOSTIC (2025-11-05): Verify 6130 gets thawed vars
-                            if node_id == '6130' and prod == list(model.products)[0] and t == list(model.dates)[0]:
+                            if self.build_diagnostics and node_id == '6130' and prod == first_product and t == self.dates[0]:
                                 print(f"  DEBUG: Creating thawed inventory var for 6130 (has_frozen_inbound={has_frozen_inbound})")
 
+        # Reachability pruning: drop series that can never hold useful stock
+        if self.support is not None:
+            num_inventory = len(inventory_index)
+            inventory_index = [key for key in inventory_index if self._has_inventory(*key)]
+            # Each dropped inventory column also drops its balance and shelf life rows
+            self.support.record('inventory', num_inventory, len(inventory_index),
+                                rows_removed=2 * (num_inventory - len(inventory_index)))
+
         # MIP Performance: Add explicit upper bound (validated via A/B test)
         # Inventory bounded by storage capacity: 62 pallets × 320 units = 19840
         model.inventory = Var(
@@ -749,7 +1176,7 @@ class SlidingWindowModel(BaseOptimizationModel):
             for (node_id, prod, state), qty in list(self.initial_inventory.items())[:5]:
                 first_date = min(model.dates)
                 key = (node_id, prod, state, first_date)
-                exists = key in inventory_index
+                exists = key in model.inventory
                 print(f"    {key}: exists={exists}, qty={qty:.0f}")
 
         # STATE TRANSITION VARIABLES (NEW - enables freeze/thaw flows)
@@ -776,6 +1203,20 @@ class SlidingWindowModel(BaseOptimizationModel):
             for t in model.dates
         ]
 
+        if self.support is not None:
+            # Thaw draws from frozen stock, freeze from ambient stock into frozen
+            num_transitions = len(thaw_index) + len(freeze_index)
+            thaw_index = [
+                (n, p, t) for (n, p, t) in thaw_index
+                if self._has_inventory(n, p, 'frozen', t)
+                and (self._has_inventory(n, p, 'thawed', t) or self._has_inventory(n, p, 'ambient', t))
+            ]
+            freeze_index = [
+                (n, p, t) for (n, p, t) in freeze_index
+                if self._has_inventory(n, p, 'ambient', t) and self._has_inventory(n, p, 'frozen', t)
+            ]
+            self.support.record('thaw/freeze', num_transitions, len(thaw_index) + len(freeze_index))
+
         model.thaw = Var(
             thaw_index,
             within=NonNegativeReals,
@@ -814,6 +1255,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Only create variables for route-day combinations where a truck actually runs
         in_transit_index = []
         skipped_no_truck_days = 0
+        skipped_unreachable = 0
 
         day_of_week_map = {
             0: 'monday', 1: 'tuesday', 2: 'wednesday', 3: 'thursday',
@@ -831,15 +1273,22 @@ class SlidingWindowModel(BaseOptimizationModel):
                 # Create in-transit variables for planning horizon departures
                 for departure_date in model.dates:
                     # CRITICAL: Check if truck runs on this day of week
+                    # (on any day of the period when periods are aggregated)
                     if has_truck_schedule:
-                        day_name = day_of_week_map[departure_date.weekday()]
-                        if day_name not in valid_days:
+                        if self.periods.is_aggregated:
+                            no_truck = valid_days.isdisjoint(self.periods.weekday_names(departure_date))
+                        else:
+                            no_truck = day_of_week_map[departure_date.weekday()] not in valid_days
+                        if no_truck:
                             # No truck on this day for this route - skip variable
                             skipped_no_truck_days += 2  # 2 states
                             continue
 
                     # In-transit can be in frozen or ambient state
                     for state in ['frozen', 'ambient']:
+                        if self.support is not None and not self._has_transit(route, prod, departure_date, state):
+                            skipped_unreachable += 1
+                            continue
                         in_transit_index.append((
                             route.origin_node_id,
                             route.destination_node_id,
@@ -864,16 +1313,22 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Total in_transit (for material balance compatibility)
         # MIP Performance: Add explicit upper bound (validated via A/B test)
         # In-transit bounded by truck capacity: 44 pallets × 320 units = 14080
+        # (per day of the period; index is (origin, dest, prod, departure, state))
         model.in_transit = Var(
             in_transit_index,
             within=NonNegativeReals,
-            bounds=(0, 14080),
+            bounds=self._period_bounds(14080, date_position=-2),
             doc="Total in-transit (init + new)"
         )
 
         print(f"  In-transit variables (decomposed): {len(in_transit_index)} × 3 (total, from_init, from_new) = {len(in_transit_index) * 3}")
         if skipped_no_truck_days > 0:
             print(f"    Skipped {skipped_no_truck_days} invalid route-day combinations (day-of-week enforcement)")
+        if self.support is not None:
+            # 3 columns (total, from_init, from_new) and 1 decomposition row each
+            num_in_transit = len(in_transit_index) + skipped_unreachable
+            self.support.record('in_transit (total, from_init, from_new)', 3 * num_in_transit,
+                                3 * len(in_transit_index), rows_removed=skipped_unreachable)
 
         # PALLET VARIABLES (optional - for storage costs)
         if self.use_pallet_tracking:
@@ -890,6 +1345,15 @@ class SlidingWindowModel(BaseOptimizationModel):
                             # Ambient + thawed share same physical space
                             pallet_index.append((node_id, prod, 'ambient', t))
 
+            if self.support is not None:
+                num_pallets = len(pallet_index)
+                pallet_index = [
+                    (n, p, s, t) for (n, p, s, t) in pallet_index
+                    if self._has_inventory(n, p, s, t) or (s == 'ambient' and self._has_inventory(n, p, 'thawed', t))
+                ]
+                self.support.record('pallet_count', num_pallets, len(pallet_index),
+                                    rows_removed=num_pallets - len(pallet_index))
+
             model.pallet_count = Var(
                 pallet_index,
                 within=NonNegativeIntegers,
@@ -904,6 +1368,10 @@ class SlidingWindowModel(BaseOptimizationModel):
             ambient_fixed = self.cost_structure.storage_cost_fixed_per_pallet_ambient or 0
 
             if frozen_fixed > 0 or ambient_fixed > 0:
+                if self.support is not None:
+                    num_entries = self.support.removed['pallet_count'][0]
+                    self.support.record('pallet_entry', num_entries, len(pallet_index),
+                                        rows_removed=num_entries - len(pallet_index))
                 model.pallet_entry = Var(
                     pallet_index,
                     within=NonNegativeIntegers,
@@ -924,10 +1392,24 @@ class SlidingWindowModel(BaseOptimizationModel):
                     for prod in model.products:
                         truck_pallet_index.append((truck_idx, truck_dest, prod, t))
 
+            if self.support is not None:
+                # Loads for products nothing is ever shipped to the destination in
+                transit_dest_products = {(d, p) for (_, d, p, _, _) in in_transit_index}
+                num_truck_pallets = len(truck_pallet_index)
+                truck_pallet_index = [
+                    key for key in truck_pallet_index if (key[1], key[2]) in transit_dest_products
+                ]
+                self.support.record('truck_pallet_load', num_truck_pallets, len(truck_pallet_index))
+
+            if self.periods.is_aggregated:
+                truck_load_bounds = lambda m, truck_idx, dest, prod, t: (
+                    0, self.PALLETS_PER_TRUCK * self._truck_load_scale(truck_idx, t))
+            else:
+                truck_load_bounds = (0, self.PALLETS_PER_TRUCK)
             model.truck_pallet_load = Var(
                 truck_pallet_index,
                 within=NonNegativeIntegers,
-                bounds=(0, self.PALLETS_PER_TRUCK),
+                bounds=truck_load_bounds,
                 doc="Integer pallet count for truck loading"
             )
             print(f"  Truck pallet variables: {len(truck_pallet_index)} integers")
@@ -1114,7 +1596,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         model.overtime_hours = Var(
             labor_index,
             within=NonNegativeReals,
-            bounds=(0, 2),  # Max 2h overtime per weekday
+            bounds=self._overtime_bounds(),  # Max 2h overtime per weekday
             doc="Overtime hours (hours beyond fixed hours on weekdays)"
         )
 
@@ -1149,7 +1631,7 @@ class SlidingWindowModel(BaseOptimizationModel):
             for (node_id, prod_id, t) in mix_index:
                 product = self.products.get(prod_id)
                 if product and hasattr(product, 'units_per_mix') and product.units_per_mix > 0:
-                    max_mixes = int(max_daily_units / product.units_per_mix) + 1
+                    max_mixes = int(max_daily_units * self.period_days[t] / product.units_per_mix) + 1
                 else:
                     max_mixes = 100  # Fallback for products without units_per_mix
                 mix_bounds[(node_id, prod_id, t)] = (0, max_mixes)
@@ -1173,24 +1655,41 @@ class SlidingWindowModel(BaseOptimizationModel):
         print(f"  TOTAL: {total_vars + total_integers + total_binaries:,}")
         print(f"  (vs cohort model: ~500,000 total)")
 
+        if self.support is not None:
+            print(f"\nReachability pruning:")
+            print(self.support.summary())
+
 
     def _add_constraints(self, model: ConcreteModel):
         """Add constraints to model."""
         print(f"\nAdding constraints...")
 
         # Core constraints
-        self._add_consumption_decomposition(model)
-        self._add_sliding_window_shelf_life(model)
-        self._add_init_inv_outflow_bounds(model)
-        self._add_state_balance(model)
-        self._add_demand_satisfaction(model)
-        self._add_pallet_constraints(model)
-        self._add_production_constraints(model)
-        self._add_changeover_detection(model)
-        self._add_truck_constraints(model)
+        steps = [
+            ('consumption_decomposition', self._add_consumption_decomposition),
+            ('shelf_life', self._add_sliding_window_shelf_life),
+            ('init_inv_outflow_bounds', self._add_init_inv_outflow_bounds),
+            ('state_balance', self._add_state_balance),
+            ('demand_satisfaction', self._add_demand_satisfaction),
+            ('pallet_constraints', self._add_pallet_constraints),
+            ('production_constraints', self._add_production_constraints),
+            ('changeover_detection', self._add_changeover_detection),
+            ('truck_constraints', self._add_truck_constraints),
+        ]
+        for step, add_constraints in steps:
+            with self._profile(step, model):
+                add_constraints(model)
 
         print(f"\nConstraints added")
+        if self.direct_rows is not None:
+            print(f"  Direct rows: {self.direct_rows.num_row:,} rows, {self.direct_rows.nnz:,} nonzeros "
+                  f"({', '.join(self.direct_rows.families)})")
+
+        if self.build_diagnostics:
+            self._print_structure_diagnostic(model)
 
+    def _print_structure_diagnostic(self, model: ConcreteModel):
+        """Print production/balance/transit structure at the plant (build_diagnostics)."""
         # ====================================================================
         # DIAGNOSTIC: Check model structure to debug zero production
         # ====================================================================
@@ -1215,6 +1714,8 @@ class SlidingWindowModel(BaseOptimizationModel):
                 print(f"Ambient balance constraints at {mfg_id}: {len(mfg_balance)}")
                 if not mfg_balance:
                     print(f"  ❌ NO MATERIAL BALANCE AT {mfg_id}!")
+            elif self.direct_rows is not None:
+                print(f"Ambient balance rows (direct): {self.direct_rows.families.get('ambient_balance_con', 0)}")
             else:
                 print(f"  ❌ ambient_balance_con DOES NOT EXIST!")
 
@@ -1262,6 +1763,130 @@ class SlidingWindowModel(BaseOptimizationModel):
         """
         print(f"\n  Adding sliding window shelf life constraints...")
 
+        date_list = self.dates
+        ambient_windows = self.shelf_life_windows[self.AMBIENT_SHELF_LIFE]
+        frozen_windows = self.shelf_life_windows[self.FROZEN_SHELF_LIFE]
+        thawed_windows = self.shelf_life_windows[self.THAWED_SHELF_LIFE]
+
+        # Each day's flow terms appear in up to L overlapping windows. Collect the
+        # terms for a (node, product, day) once and reuse them for every window.
+        def daily_terms(collect):
+            cache = {}
+
+            def lookup(node_id, prod, tau):
+                key = (node_id, prod, tau)
+                terms = cache.get(key)
+                if terms is None:
+                    terms = cache[key] = collect(node_id, prod, tau)
+                return terms
+            return lookup
+
+        @daily_terms
+        def ambient_inflows(node_id, prod, tau):
+            """Production (ambient) + thaw + ambient arrivals on day tau."""
+            node = self.nodes[node_id]
+            terms = []
+            # Production that goes to ambient
+            if node.can_produce() and (node_id, prod, tau) in model.production:
+                if node.get_production_state() == 'ambient':
+                    terms.append(model.production[node_id, prod, tau])
+
+            # Thaw flow
+            if (node_id, prod, tau) in model.thaw:
+                terms.append(model.thaw[node_id, prod, tau])
+
+            # Arrivals in ambient state (goods that departed earlier and arrive on tau)
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'ambient'), ()):
+                # Calculate departure date: goods must have left (tau - transit_days) to arrive on tau
+                # Only include if departure is within planning horizon
+                for departure_date in self._departure_dates(tau, offset_days):
+                    if (origin, node_id, prod, departure_date, 'ambient') in model.in_transit:
+                        terms.append(model.in_transit[origin, node_id, prod, departure_date, 'ambient'])
+            return terms
+
+        @daily_terms
+        def ambient_outflows(node_id, prod, tau):
+            """Ambient shipments FROM NEW + freeze + consumption FROM NEW on day tau."""
+            node = self.nodes[node_id]
+            terms = []
+            # Departures in ambient state - use shipment_from_new only
+            for dest in self.departure_legs.get((node_id, 'ambient'), ()):
+                # Goods departing on tau - decomposed to exclude init_inv shipments
+                if (node_id, dest, prod, tau, 'ambient') in model.shipment_from_new:
+                    terms.append(model.shipment_from_new[node_id, dest, prod, tau, 'ambient'])
+
+            # Freeze flow
+            if (node_id, prod, tau) in model.freeze:
+                terms.append(model.freeze[node_id, prod, tau])
+
+            # FLOW DECOMPOSITION: Use consumption_from_new (not total)
+            # This ensures sliding window only constrains "new" flows
+            # Init_inv consumption handled by separate bounds (no phantom inventory)
+            if node.has_demand_capability() and (node_id, prod, tau) in model.consumption_from_new_ambient:
+                terms.append(model.consumption_from_new_ambient[node_id, prod, tau])
+            return terms
+
+        @daily_terms
+        def frozen_inflows(node_id, prod, tau):
+            """Production (frozen) + freeze + frozen arrivals on day tau."""
+            node = self.nodes[node_id]
+            terms = []
+            # Production that goes to frozen
+            if node.can_produce() and (node_id, prod, tau) in model.production:
+                if node.get_production_state() == 'frozen':
+                    terms.append(model.production[node_id, prod, tau])
+
+            # Freeze flow (ambient → frozen)
+            if (node_id, prod, tau) in model.freeze:
+                terms.append(model.freeze[node_id, prod, tau])
+
+            # Arrivals in frozen state (shipped in the route's mode, as in frozen_balance_rule:
+            # ambient goods arriving at a frozen-only node freeze on arrival)
+            for origin, ship_state, offset_days in self.arrival_legs.get((node_id, 'frozen'), ()):
+                for departure_date in self._departure_dates(tau, offset_days):
+                    if (origin, node_id, prod, departure_date, ship_state) in model.in_transit:
+                        terms.append(model.in_transit[origin, node_id, prod, departure_date, ship_state])
+            return terms
+
+        @daily_terms
+        def frozen_outflows(node_id, prod, tau):
+            """Frozen shipments FROM NEW + thaw on day tau."""
+            terms = []
+            # Departures in frozen state - use shipment_from_new only
+            for dest in self.departure_legs.get((node_id, 'frozen'), ()):
+                if (node_id, dest, prod, tau, 'frozen') in model.shipment_from_new:
+                    terms.append(model.shipment_from_new[node_id, dest, prod, tau, 'frozen'])
+
+            # Thaw flow (frozen → ambient/thawed)
+            if (node_id, prod, tau) in model.thaw:
+                terms.append(model.thaw[node_id, prod, tau])
+            return terms
+
+        @daily_terms
+        def thawed_inflows(node_id, prod, tau):
+            """Thaw + arrivals that thaw on arrival on day tau."""
+            terms = []
+            # Thaw flow (frozen → thawed at this node)
+            if (node_id, prod, tau) in model.thaw:
+                terms.append(model.thaw[node_id, prod, tau])
+
+            # CRITICAL FIX: Arrivals from frozen routes (frozen goods arriving at ambient-only nodes)
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'thawed'), ()):
+                # Frozen goods shipped to this ambient-only node arrive as thawed
+                for departure_date in self._departure_dates(tau, offset_days):
+                    if (origin, node_id, prod, departure_date, 'frozen') in model.in_transit:
+                        terms.append(model.in_transit[origin, node_id, prod, departure_date, 'frozen'])
+            return terms
+
+        @daily_terms
+        def thawed_outflows(node_id, prod, tau):
+            """Thawed consumption FROM NEW on day tau."""
+            node = self.nodes[node_id]
+            terms = []
+            if node.has_demand_capability() and (node_id, prod, tau) in model.consumption_from_new_thawed:
+                terms.append(model.consumption_from_new_thawed[node_id, prod, tau])
+            return terms
+
         # AMBIENT shelf life: 17 days
         def ambient_shelf_life_rule(model, node_id, prod, t):
             """Outflows in 17-day window <= inflows in same window."""
@@ -1270,15 +1895,13 @@ class SlidingWindowModel(BaseOptimizationModel):
                 return Constraint.Skip
 
             # Window: last 17 days (t-16 to t, inclusive)
-            window_start = max(0, list(model.dates).index(t) - 16)
-            window_dates = list(model.dates)[window_start:list(model.dates).index(t)+1]
+            window_dates = ambient_windows[t]
 
             # DIAGNOSTIC: Log window on day 18
-            date_list = list(model.dates)
-            if len(date_list) > 17 and t == date_list[17]:  # Day 18 (index 17)
+            if self.build_diagnostics and len(date_list) > 17 and t == date_list[17]:  # Day 18 (index 17)
                 init_inv_check = self.initial_inventory.get((node_id, prod, 'ambient'), 0)
                 if init_inv_check > 1000:
-                    first_date = min(model.dates)
+                    first_date = date_list[0]
                     days_from_start = (t - first_date).days
                     print(f"  DAY 18 ambient_shelf_life[{node_id}, {prod[:30]}]:")
                     print(f"    Window: {window_dates[0]} to {window_dates[-1]} ({len(window_dates)} days)")
@@ -1312,46 +1935,16 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Mathematical proof: See optimization-solver agent analysis (2025-11-10)
 
             for tau in window_dates:
-                # Production that goes to ambient
-                if node.can_produce() and (node_id, prod, tau) in model.production:
-                    if node.get_production_state() == 'ambient':
-                        Q_ambient += model.production[node_id, prod, tau]
-
-                # Thaw flow
-                if (node_id, prod, tau) in model.thaw:
-                    Q_ambient += model.thaw[node_id, prod, tau]
-
-                # Arrivals in ambient state (goods that departed earlier and arrive on tau)
-                for route in self.routes_to_node[node_id]:
-                    arrival_state = self._determine_arrival_state(route, node)
-                    if arrival_state == 'ambient':
-                        # Calculate departure date: goods must have left (tau - transit_days) to arrive on tau
-                        # Only include if departure is within planning horizon
-                        departure_date = tau - timedelta(days=route.transit_days)
-                        if departure_date in model.dates and (route.origin_node_id, node_id, prod, departure_date, 'ambient') in model.in_transit:
-                            Q_ambient += model.in_transit[route.origin_node_id, node_id, prod, departure_date, 'ambient']
+                for term in ambient_inflows(node_id, prod, tau):
+                    Q_ambient += term
 
             # Outflows from ambient: shipments FROM NEW + freeze + consumption FROM NEW
             # FLOW DECOMPOSITION (2025-11-14): Use from_new variables only
             # Init_inv flows are NOT subject to sliding window (separate bounds)
             O_ambient = 0
             for tau in window_dates:
-                # Departures in ambient state - use shipment_from_new only
-                for route in self.routes_from_node[node_id]:
-                    if route.transport_mode != TransportMode.FROZEN:  # Ambient route
-                        # Goods departing on tau - decomposed to exclude init_inv shipments
-                        if (node_id, route.destination_node_id, prod, tau, 'ambient') in model.shipment_from_new:
-                            O_ambient += model.shipment_from_new[node_id, route.destination_node_id, prod, tau, 'ambient']
-
-                # Freeze flow
-                if (node_id, prod, tau) in model.freeze:
-                    O_ambient += model.freeze[node_id, prod, tau]
-
-                # FLOW DECOMPOSITION: Use consumption_from_new (not total)
-                # This ensures sliding window only constrains "new" flows
-                # Init_inv consumption handled by separate bounds (no phantom inventory)
-                if node.has_demand_capability() and (node_id, prod, tau) in model.consumption_from_new_ambient:
-                    O_ambient += model.consumption_from_new_ambient[node_id, prod, tau]
+                for term in ambient_outflows(node_id, prod, tau):
+                    O_ambient += term
 
             # Skip if no activity to avoid trivial True constraint
             # Check if both are constants (not Pyomo expressions)
@@ -1367,8 +1960,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 pass  # Pyomo expressions - let them through
 
             # DIAGNOSTIC: Log day 2 constraint for nodes with initial inventory
-            if self.initial_inventory.get((node_id, prod, 'ambient'), 0) > 0:
-                date_list = list(model.dates)
+            if self.build_diagnostics and self.initial_inventory.get((node_id, prod, 'ambient'), 0) > 0:
                 if len(date_list) >= 2 and t == date_list[1]:  # Day 2
                     print(f"  DAY2 ambient_shelf_life[{node_id}, {prod[:30]}]:")
                     print(f"    Window: {len(window_dates)} days")
@@ -1388,14 +1980,6 @@ class SlidingWindowModel(BaseOptimizationModel):
             #   - Structurally prevents old inventory use (can't ship what didn't arrive in window)
             return O_ambient <= Q_ambient
 
-        model.ambient_shelf_life_con = Constraint(
-            [(n, p, t) for n, node in self.nodes.items()
-             if node.supports_ambient_storage()
-             for p in model.products for t in model.dates],
-            rule=ambient_shelf_life_rule,
-            doc="Ambient shelf life: 17-day sliding window"
-        )
-
         # FROZEN shelf life: 120 days (similar structure)
         def frozen_shelf_life_rule(model, node_id, prod, t):
             """Outflows in 120-day window <= inflows in same window."""
@@ -1404,8 +1988,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 return Constraint.Skip
 
             # Window: last 120 days
-            window_start = max(0, list(model.dates).index(t) - 119)
-            window_dates = list(model.dates)[window_start:list(model.dates).index(t)+1]
+            window_dates = frozen_windows[t]
 
             # Inflows to frozen: initial_inv (if start date in window) + production_frozen + freeze + arrivals_frozen
             Q_frozen = 0
@@ -1416,39 +1999,18 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Same fix as ambient rule - prevents 120× phantom inventory for frozen state
 
             for tau in window_dates:
-                # Production that goes to frozen
-                if node.can_produce() and (node_id, prod, tau) in model.production:
-                    if node.get_production_state() == 'frozen':
-                        Q_frozen += model.production[node_id, prod, tau]
-
-                # Freeze flow (ambient → frozen)
-                if (node_id, prod, tau) in model.freeze:
-                    Q_frozen += model.freeze[node_id, prod, tau]
-
-                # Arrivals in frozen state
-                for route in self.routes_to_node[node_id]:
-                    arrival_state = self._determine_arrival_state(route, node)
-                    if arrival_state == 'frozen':
-                        departure_date = tau - timedelta(days=route.transit_days)
-                        if departure_date in model.dates and (route.origin_node_id, node_id, prod, departure_date, 'frozen') in model.in_transit:
-                            Q_frozen += model.in_transit[route.origin_node_id, node_id, prod, departure_date, 'frozen']
+                for term in frozen_inflows(node_id, prod, tau):
+                    Q_frozen += term
 
             # Outflows from frozen: departures FROM NEW + thaw
             # FLOW DECOMPOSITION (2025-11-14): Use shipment_from_new only
             O_frozen = 0
             for tau in window_dates:
-                # Departures in frozen state - use shipment_from_new only
-                for route in self.routes_from_node[node_id]:
-                    if route.transport_mode == TransportMode.FROZEN:
-                        if (node_id, route.destination_node_id, prod, tau, 'frozen') in model.shipment_from_new:
-                            O_frozen += model.shipment_from_new[node_id, route.destination_node_id, prod, tau, 'frozen']
-
-                # Thaw flow (frozen → ambient/thawed)
-                if (node_id, prod, tau) in model.thaw:
-                    O_frozen += model.thaw[node_id, prod, tau]
+                for term in frozen_outflows(node_id, prod, tau):
+                    O_frozen += term
 
             # DIAGNOSTIC: Log Lineage constraint on day 1
-            if node_id == "Lineage" and t == min(model.dates):
+            if node_id == "Lineage" and t == date_list[0]:
                 try:
                     q_val = value(Q_frozen, exception=False)
                     o_val = value(O_frozen, exception=False)
@@ -1474,14 +2036,6 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Changed to: O <= Q (standard perishables formulation)
             return O_frozen <= Q_frozen
 
-        model.frozen_shelf_life_con = Constraint(
-            [(n, p, t) for n, node in self.nodes.items()
-             if node.supports_frozen_storage()
-             for p in model.products for t in model.dates],
-            rule=frozen_shelf_life_rule,
-            doc="Frozen shelf life: 120-day sliding window"
-        )
-
         # THAWED shelf life: 14 days
         def thawed_shelf_life_rule(model, node_id, prod, t):
             """Outflows in 14-day window <= inflows in same window."""
@@ -1494,8 +2048,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 return Constraint.Skip
 
             # Window: last 14 days
-            window_start = max(0, list(model.dates).index(t) - 13)
-            window_dates = list(model.dates)[window_start:list(model.dates).index(t)+1]
+            window_dates = thawed_windows[t]
 
             # Inflows to thawed: initial_inv (if start date in window) + thaw + arrivals_from_frozen_routes
             Q_thawed = 0
@@ -1506,26 +2059,16 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Same fix as ambient/frozen rules - prevents 14× phantom inventory for thawed state
 
             for tau in window_dates:
-                # Thaw flow (frozen → thawed at this node)
-                if (node_id, prod, tau) in model.thaw:
-                    Q_thawed += model.thaw[node_id, prod, tau]
-
-                # CRITICAL FIX: Arrivals from frozen routes (frozen goods arriving at ambient-only nodes)
-                for route in self.routes_to_node[node_id]:
-                    arrival_state = self._determine_arrival_state(route, node)
-                    if arrival_state == 'thawed':
-                        # Frozen goods shipped to this ambient-only node arrive as thawed
-                        departure_date = tau - timedelta(days=route.transit_days)
-                        if departure_date in model.dates and (route.origin_node_id, node_id, prod, departure_date, 'frozen') in model.in_transit:
-                            Q_thawed += model.in_transit[route.origin_node_id, node_id, prod, departure_date, 'frozen']
+                for term in thawed_inflows(node_id, prod, tau):
+                    Q_thawed += term
 
             # Outflows from thawed: demand consumption FROM NEW
             # FLOW DECOMPOSITION (2025-11-14): Use consumption_from_new only
             # Init_inv consumption is NOT subject to sliding window (separate bounds)
             O_thawed = 0
             for tau in window_dates:
-                if node.has_demand_capability() and (node_id, prod, tau) in model.consumption_from_new_thawed:
-                    O_thawed += model.consumption_from_new_thawed[node_id, prod, tau]
+                for term in thawed_outflows(node_id, prod, tau):
+                    O_thawed += term
 
             # Skip if no activity (avoids trivial True constraint)
             try:
@@ -1542,13 +2085,58 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Changed to: O <= Q (standard perishables formulation)
             return O_thawed <= Q_thawed
 
-        model.thawed_shelf_life_con = Constraint(
-            [(n, p, t) for n, node in self.nodes.items()
-             if node.supports_ambient_storage()
-             for p in model.products for t in model.dates],
-            rule=thawed_shelf_life_rule,
-            doc="Thawed shelf life: 14-day sliding window (resets on thaw!)"
-        )
+        ambient_index = [(n, p, t) for n, node in self.nodes.items()
+                         if node.supports_ambient_storage()
+                         for p in model.products for t in model.dates]
+        frozen_index = [(n, p, t) for n, node in self.nodes.items()
+                        if node.supports_frozen_storage()
+                        for p in model.products for t in model.dates]
+        # Thawed windows only where a thawed inventory variable exists
+        thawed_index = [(n, p, t) for (n, p, t) in ambient_index
+                        if (n, p, 'thawed', t) in model.inventory]
+        if self.support is not None:
+            # Same for ambient/frozen windows once unreachable inventory is pruned
+            ambient_index = [(n, p, t) for (n, p, t) in ambient_index
+                             if (n, p, 'ambient', t) in model.inventory]
+            frozen_index = [(n, p, t) for (n, p, t) in frozen_index
+                            if (n, p, 'frozen', t) in model.inventory]
+
+        def window_row(windows, inflows, outflows):
+            """Direct row of a window rule: O - Q <= 0 over the same daily terms."""
+            def row(node_id, prod, t):
+                terms = []
+                for tau in windows[t]:
+                    terms.extend((var, 1.0) for var in outflows(node_id, prod, tau))
+                    terms.extend((var, -1.0) for var in inflows(node_id, prod, tau))
+                return (terms, -math.inf, 0.0) if terms else None
+            return row
+
+        if self.shelf_life_formulation == 'cumulative':
+            # Same windows written as differences of prefix sums (see _add_cumulative_shelf_life)
+            self._add_cumulative_shelf_life(
+                model, 'ambient', self.AMBIENT_SHELF_LIFE, ambient_index, ambient_inflows, ambient_outflows)
+            self._add_cumulative_shelf_life(
+                model, 'frozen', self.FROZEN_SHELF_LIFE, frozen_index, frozen_inflows, frozen_outflows)
+            self._add_cumulative_shelf_life(
+                model, 'thawed', self.THAWED_SHELF_LIFE, thawed_index, thawed_inflows, thawed_outflows)
+        else:
+            self._add_rows(
+                model, 'ambient_shelf_life_con', ambient_index, ambient_shelf_life_rule,
+                window_row(ambient_windows, ambient_inflows, ambient_outflows),
+                doc="Ambient shelf life: 17-day sliding window"
+            )
+
+            self._add_rows(
+                model, 'frozen_shelf_life_con', frozen_index, frozen_shelf_life_rule,
+                window_row(frozen_windows, frozen_inflows, frozen_outflows),
+                doc="Frozen shelf life: 120-day sliding window"
+            )
+
+            self._add_rows(
+                model, 'thawed_shelf_life_con', thawed_index, thawed_shelf_life_rule,
+                window_row(thawed_windows, thawed_inflows, thawed_outflows),
+                doc="Thawed shelf life: 14-day sliding window (resets on thaw!)"
+            )
 
 
         # INITIAL INVENTORY EXPIRATION CONSTRAINT
@@ -1624,6 +2212,104 @@ class SlidingWindowModel(BaseOptimizationModel):
         print(f"    Frozen (120d): ~{len([n for n in self.nodes if self.nodes[n].supports_frozen_storage()]) * len(list(model.products)) * len(list(model.dates)):,}")
         print(f"    Thawed (14d): ~{len([n for n in self.nodes if self.nodes[n].supports_ambient_storage()]) * len(list(model.products)) * len(list(model.dates)):,}")
 
+    def _add_cumulative_shelf_life(
+        self,
+        model: ConcreteModel,
+        state: str,
+        shelf_life: int,
+        window_index: List[Tuple[str, str, Date]],
+        inflows,
+        outflows,
+    ):
+        """Add shelf life windows in prefix-sum (cumulative) form.
+
+        Equivalent to the window formulation O(t-L+1..t) <= Q(t-L+1..t), but each
+        window is written as a difference of two cumulative terms:
+
+            cum_Q[t] = cum_Q[t-1] + Q[t]        (cum_Q before day 1 = 0)
+            cum_O[t] = cum_O[t-1] + O[t]
+            cum_O[t] - cum_O[t-L] <= cum_Q[t] - cum_Q[t-L]
+
+        Every daily flow appears once (in its cumulative definition) instead of
+        in L overlapping windows, so nonzeros grow O(H) per node-product rather
+        than O(H·L). Creates {state}_cum_inflow / {state}_cum_outflow variables,
+        their definition constraints, and {state}_shelf_life_con.
+
+        Args:
+            model: Model being built
+            state: 'ambient', 'frozen' or 'thawed'
+            shelf_life: Window length L in days
+            window_index: (node, product, date) keys that get a window constraint
+            inflows: callable (node, prod, date) -> list of inflow terms for that day
+            outflows: callable (node, prod, date) -> list of outflow terms for that day
+        """
+        num_dates = len(self.dates)
+
+        # Number of flow terms up to each date, per node-product series. A window
+        # with no terms at all is skipped (same as the window formulation).
+        series = {}
+        for (node_id, prod, _) in window_index:
+            if (node_id, prod) in series:
+                continue
+            counts = [0]
+            for tau in self.dates:
+                counts.append(counts[-1] + len(inflows(node_id, prod, tau)) + len(outflows(node_id, prod, tau)))
+            if counts[-1] > 0:
+                series[(node_id, prod)] = counts
+
+        cum_index = [(n, p, t) for (n, p) in series for t in self.dates]
+        cum_inflow = Var(cum_index, within=NonNegativeReals,
+                         doc=f"Cumulative {state} inflows from planning start through date")
+        cum_outflow = Var(cum_index, within=NonNegativeReals,
+                          doc=f"Cumulative {state} outflows from planning start through date")
+        model.add_component(f'{state}_cum_inflow', cum_inflow)
+        model.add_component(f'{state}_cum_outflow', cum_outflow)
+
+        def cum_inflow_rule(model, node_id, prod, t):
+            prev_date = self.date_to_prev.get(t)
+            prev = cum_inflow[node_id, prod, prev_date] if prev_date else 0
+            return cum_inflow[node_id, prod, t] == prev + quicksum(inflows(node_id, prod, t))
+
+        def cum_outflow_rule(model, node_id, prod, t):
+            prev_date = self.date_to_prev.get(t)
+            prev = cum_outflow[node_id, prod, prev_date] if prev_date else 0
+            return cum_outflow[node_id, prod, t] == prev + quicksum(outflows(node_id, prod, t))
+
+        def window_rule(model, node_id, prod, t):
+            counts = series.get((node_id, prod))
+            if counts is None:
+                return Constraint.Skip
+
+            idx = self.date_index[t]
+            # Last period BEFORE the window (negative = window starts at planning start)
+            lag = self.date_index[self.shelf_life_windows[shelf_life][t][0]] - 1
+            if counts[idx + 1] - counts[max(0, lag + 1)] == 0:
+                return Constraint.Skip  # No flows in this window
+
+            O_window = cum_outflow[node_id, prod, t]
+            Q_window = cum_inflow[node_id, prod, t]
+            if lag >= 0:
+                lag_date = self.dates[lag]
+                O_window = O_window - cum_outflow[node_id, prod, lag_date]
+                Q_window = Q_window - cum_inflow[node_id, prod, lag_date]
+            return O_window <= Q_window
+
+        model.add_component(f'{state}_cum_inflow_con', Constraint(
+            cum_index, rule=cum_inflow_rule,
+            doc=f"Cumulative {state} inflow definition (prefix sum)"
+        ))
+        model.add_component(f'{state}_cum_outflow_con', Constraint(
+            cum_index, rule=cum_outflow_rule,
+            doc=f"Cumulative {state} outflow definition (prefix sum)"
+        ))
+        model.add_component(f'{state}_shelf_life_con', Constraint(
+            window_index, rule=window_rule,
+            doc=f"{state.capitalize()} shelf life: {shelf_life}-day window as cumulative difference"
+        ))
+
+        print(f"    {state.capitalize()} ({shelf_life}d, cumulative): {len(series)} series × {num_dates} days "
+              f"→ {len(cum_index) * 2:,} cumulative vars")
+
     def _add_consumption_decomposition(self, model: ConcreteModel):
         """Decompose total flows (consumption + shipments) into init_inv and new components.
 
@@ -1660,15 +2346,27 @@ class SlidingWindowModel(BaseOptimizationModel):
 
         demand_keys = list(self.demand.keys())
 
-        model.ambient_consumption_decomp = Constraint(
-            demand_keys,
-            rule=ambient_consumption_decomp_rule,
+        def decomp_row(total, from_init, from_new):
+            """total == from_init + from_new over the same key (None if total has no such key)."""
+            def row(*key):
+                if key not in total:
+                    return None
+                return [(total[key], 1.0), (from_init[key], -1.0), (from_new[key], -1.0)], 0.0, 0.0
+            return row
+
+        self._add_rows(
+            model, 'ambient_consumption_decomp', demand_keys,
+            ambient_consumption_decomp_rule,
+            decomp_row(model.demand_consumed_from_ambient, model.consumption_from_init_ambient,
+                       model.consumption_from_new_ambient),
             doc="Decompose ambient consumption into init_inv and new flows"
         )
 
-        model.thawed_consumption_decomp = Constraint(
-            demand_keys,
-            rule=thawed_consumption_decomp_rule,
+        self._add_rows(
+            model, 'thawed_consumption_decomp', demand_keys,
+            thawed_consumption_decomp_rule,
+            decomp_row(model.demand_consumed_from_thawed, model.consumption_from_init_thawed,
+                       model.consumption_from_new_thawed),
             doc="Decompose thawed consumption into init_inv and new flows"
         )
 
@@ -1687,9 +2385,10 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Get all in_transit keys
         transit_keys = [(o, d, p, t, s) for (o, d, p, t, s) in model.in_transit]
 
-        model.shipment_decomp = Constraint(
-            transit_keys,
-            rule=shipment_decomp_rule,
+        self._add_rows(
+            model, 'shipment_decomp', transit_keys,
+            shipment_decomp_rule,
+            decomp_row(model.in_transit, model.shipment_from_init, model.shipment_from_new),
             doc="Decompose shipments into init_inv and new flows"
         )
 
@@ -1712,7 +2411,7 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             # Sum ALL outflows from init over shelf life (17 days)
             shelf_life_days = 17
-            shelf_life_dates = list(model.dates)[:min(shelf_life_days, len(model.dates))]
+            shelf_life_dates = self.periods.periods_within(shelf_life_days)
 
             # Consumption from init (for demand nodes)
             total_consumed_from_init = sum(
@@ -1723,11 +2422,10 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             # Shipments from init (for all nodes with outbound routes)
             total_shipped_from_init = sum(
-                model.shipment_from_init[node_id, route.destination_node_id, prod, t, 'ambient']
+                model.shipment_from_init[node_id, dest, prod, t, 'ambient']
                 for t in shelf_life_dates
-                for route in self.routes_from_node[node_id]
-                if route.transport_mode != TransportMode.FROZEN
-                and (node_id, route.destination_node_id, prod, t, 'ambient') in model.shipment_from_init
+                for dest in self.departure_legs.get((node_id, 'ambient'), ())
+                if (node_id, dest, prod, t, 'ambient') in model.shipment_from_init
             )
 
             total_from_init = total_consumed_from_init + total_shipped_from_init
@@ -1751,7 +2449,7 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             # Sum consumption from init over shelf life (14 days)
             shelf_life_days = 14
-            shelf_life_dates = list(model.dates)[:min(shelf_life_days, len(model.dates))]
+            shelf_life_dates = self.periods.periods_within(shelf_life_days)
 
             total_from_init = sum(
                 model.consumption_from_init_thawed[node_id, prod, t]
@@ -1771,15 +2469,40 @@ class SlidingWindowModel(BaseOptimizationModel):
         thawed_init_entries = [(n, p) for (n, p, s), qty in self.initial_inventory.items()
                                if s == 'thawed' and qty > 0]
 
-        model.ambient_init_bound = Constraint(
-            ambient_init_entries,
-            rule=ambient_init_bound_rule,
+        def ambient_init_bound_row(node_id, prod):
+            shelf_life_dates = self.periods.periods_within(17)
+            terms = [(model.consumption_from_init_ambient[node_id, prod, t], 1.0)
+                     for t in shelf_life_dates
+                     if (node_id, prod, t) in model.consumption_from_init_ambient]
+            terms.extend(
+                (model.shipment_from_init[node_id, dest, prod, t, 'ambient'], 1.0)
+                for t in shelf_life_dates
+                for dest in self.departure_legs.get((node_id, 'ambient'), ())
+                if (node_id, dest, prod, t, 'ambient') in model.shipment_from_init
+            )
+            if not terms:
+                return None
+            return terms, -math.inf, float(self.initial_inventory[(node_id, prod, 'ambient')])
+
+        def thawed_init_bound_row(node_id, prod):
+            if not self.nodes[node_id].has_demand_capability():
+                return None
+            terms = [(model.consumption_from_init_thawed[node_id, prod, t], 1.0)
+                     for t in self.periods.periods_within(14)
+                     if (node_id, prod, t) in model.consumption_from_init_thawed]
+            if not terms:
+                return None
+            return terms, -math.inf, float(self.initial_inventory[(node_id, prod, 'thawed')])
+
+        self._add_rows(
+            model, 'ambient_init_bound', ambient_init_entries,
+            ambient_init_bound_rule, ambient_init_bound_row,
             doc="Bound ambient consumption from init_inv to available quantity"
         )
 
-        model.thawed_init_bound = Constraint(
-            thawed_init_entries,
-            rule=thawed_init_bound_rule,
+        self._add_rows(
+            model, 'thawed_init_bound', thawed_init_entries,
+            thawed_init_bound_rule, thawed_init_bound_row,
             doc="Bound thawed consumption from init_inv to available quantity"
         )
 
@@ -1833,12 +2556,40 @@ class SlidingWindowModel(BaseOptimizationModel):
         """
         print(f"\n  Adding state balance constraints...")
 
-        # Build date lookup for previous day
-        date_list = list(model.dates)
-        date_to_prev = {}
-        for i, d in enumerate(date_list):
-            if i > 0:
-                date_to_prev[d] = date_list[i-1]
+        # Date lookups precomputed in _build_constraint_indices
+        date_list = self.dates
+        date_to_prev = self.date_to_prev
+
+        def balance_row(node_id, prod, state, t, inflows, outflows):
+            """Direct row of a balance rule: I[t] - I[t-1] - inflows + outflows (+ disposal) = initial stock."""
+            terms = [(model.inventory[node_id, prod, state, t], 1.0)]
+            prev_date = date_to_prev.get(t)
+            if prev_date and (node_id, prod, state, prev_date) in model.inventory:
+                terms.append((model.inventory[node_id, prod, state, prev_date], -1.0))
+                rhs = 0.0
+            else:
+                rhs = float(self.initial_inventory.get((node_id, prod, state), 0))
+            terms.extend((var, -1.0) for var in inflows)
+            terms.extend((var, 1.0) for var in outflows)
+            if hasattr(model, 'disposal') and (node_id, prod, state, t) in model.disposal:
+                terms.append((model.disposal[node_id, prod, state, t], 1.0))
+            return terms, rhs, rhs
+
+        def arrival_vars(node_id, prod, t, arrival_state, transit_state=None):
+            """in_transit arriving on t in arrival_state (keyed by ship state unless transit_state is given)."""
+            found = []
+            for origin, ship_state, offset_days in self.arrival_legs.get((node_id, arrival_state), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    key = (origin, node_id, prod, departure_date, transit_state or ship_state)
+                    if key in model.in_transit:
+                        found.append(model.in_transit[key])
+            return found
+
+        def departure_vars(node_id, prod, t, state):
+            """in_transit leaving node_id on t in state."""
+            return [model.in_transit[node_id, dest, prod, t, state]
+                    for dest in self.departure_legs.get((node_id, state), ())
+                    if (node_id, dest, prod, t, state) in model.in_transit]
 
         # AMBIENT STATE BALANCE
         def ambient_balance_rule(model, node_id, prod, t):
@@ -1872,47 +2623,35 @@ class SlidingWindowModel(BaseOptimizationModel):
             # CRITICAL FIX: Match on route transport mode, not arrival state!
             # in_transit state = route transport mode (how shipped)
             # arrival state = after transformation at destination
+            # Arrival legs are pre-grouped by arrival state (determined per route/destination)
             arrivals = 0
-            for route in self.routes_to_node[node_id]:
-                departure_date = t - timedelta(days=route.transit_days)
-
-                if departure_date not in model.dates:
-                    continue
-
-                # Determine how goods arrive (may transform from transport mode)
-                arrival_state = self._determine_arrival_state(route, node)
-
-                if arrival_state != 'ambient':
-                    continue  # Not arriving as ambient inventory
-
-                # Look for in_transit variable using route's TRANSPORT mode
-                ship_state = 'frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient'
+            for origin, ship_state, offset_days in self.arrival_legs.get((node_id, 'ambient'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    # Look for in_transit variable using route's TRANSPORT mode (ship_state)
+                    key = (origin, node_id, prod, departure_date, ship_state)
+
+                    # DIAGNOSTIC: Log for debugging arrivals issues
+                    if self.build_diagnostics and node_id in ['6104', '6125'] and len(date_list) > 1 and t == date_list[1]:
+                        print(f"  DEBUG arrivals for {node_id}, {prod[:30]}, {t}:")
+                        print(f"    Route from {origin}, transit={(t - departure_date).days}")
+                        print(f"    Departure date: {departure_date}")
+                        print(f"    departure_date in model.dates: {departure_date in model.dates}")
+                        print(f"    Key in model.in_transit: {key in model.in_transit}")
+                        print(f"    Arrival state: ambient")
 
-                key = (route.origin_node_id, node_id, prod, departure_date, ship_state)
-
-                # DIAGNOSTIC: Log for debugging arrivals issues
-                if node_id in ['6104', '6125'] and t == list(model.dates)[1] if len(list(model.dates)) > 1 else False:
-                    print(f"  DEBUG arrivals for {node_id}, {prod[:30]}, {t}:")
-                    print(f"    Route from {route.origin_node_id}, transit={route.transit_days}")
-                    print(f"    Departure date: {departure_date}")
-                    print(f"    departure_date in model.dates: {departure_date in model.dates}")
-                    print(f"    Key in model.in_transit: {key in model.in_transit}")
-                    print(f"    Arrival state: {arrival_state}")
-
-                if key in model.in_transit:
-                    arrivals += model.in_transit[key]
+                    if key in model.in_transit:
+                        arrivals += model.in_transit[key]
 
             # Outflows
             freeze_outflow = 0
             if (node_id, prod, t) in model.freeze:
                 freeze_outflow = model.freeze[node_id, prod, t]
 
-            # Departures: goods leaving TODAY (t) via in-transit
+            # Departures: goods leaving TODAY (t) via in-transit (ambient routes only)
             departures = sum(
-                model.in_transit[node_id, route.destination_node_id, prod, t, 'ambient']
-                for route in self.routes_from_node[node_id]
-                if route.transport_mode != TransportMode.FROZEN  # Ambient routes only
-                and (node_id, route.destination_node_id, prod, t, 'ambient') in model.in_transit
+                model.in_transit[node_id, dest, prod, t, 'ambient']
+                for dest in self.departure_legs.get((node_id, 'ambient'), ())
+                if (node_id, dest, prod, t, 'ambient') in model.in_transit
             )
 
             # Demand consumption from ambient inventory
@@ -1934,11 +2673,29 @@ class SlidingWindowModel(BaseOptimizationModel):
                 departures - freeze_outflow - demand_consumption - disposal_outflow
             )
 
-        model.ambient_balance_con = Constraint(
+        def ambient_balance_row(node_id, prod, t):
+            if (node_id, prod, 'ambient', t) not in model.inventory:
+                return None
+            node = self.nodes[node_id]
+            inflows = arrival_vars(node_id, prod, t, 'ambient')
+            if node.can_produce() and node.get_production_state() == 'ambient' \
+                    and (node_id, prod, t) in model.production:
+                inflows.append(model.production[node_id, prod, t])
+            if (node_id, prod, t) in model.thaw:
+                inflows.append(model.thaw[node_id, prod, t])
+            outflows = departure_vars(node_id, prod, t, 'ambient')
+            if (node_id, prod, t) in model.freeze:
+                outflows.append(model.freeze[node_id, prod, t])
+            if node.has_demand_capability() and (node_id, prod, t) in model.demand_consumed_from_ambient:
+                outflows.append(model.demand_consumed_from_ambient[node_id, prod, t])
+            return balance_row(node_id, prod, 'ambient', t, inflows, outflows)
+
+        self._add_rows(
+            model, 'ambient_balance_con',
             [(n, p, t) for n, node in self.nodes.items()
              if node.supports_ambient_storage()
              for p in model.products for t in model.dates],
-            rule=ambient_balance_rule,
+            ambient_balance_rule, ambient_balance_row,
             doc="Ambient state material balance"
         )
 
@@ -1975,26 +2732,14 @@ class SlidingWindowModel(BaseOptimizationModel):
             #   - in_transit variable state = 'ambient' (route mode)
             #   - arrival state = 'frozen' (transformation at destination)
             arrivals = 0
-            for route in self.routes_to_node[node_id]:
-                departure_date = t - timedelta(days=route.transit_days)
-
-                if departure_date not in model.dates:
-                    continue
-
-                # Determine how goods arrive (may transform from transport mode)
-                arrival_state = self._determine_arrival_state(route, node)
-
-                if arrival_state != 'frozen':
-                    continue  # Not arriving as frozen inventory
+            for origin, ship_state, offset_days in self.arrival_legs.get((node_id, 'frozen'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    # Look for in_transit variable using route's TRANSPORT mode
+                    # (Not arrival state! in_transit state = how goods are shipped)
+                    key = (origin, node_id, prod, departure_date, ship_state)
 
-                # Look for in_transit variable using route's TRANSPORT mode
-                # (Not arrival state! in_transit state = how goods are shipped)
-                ship_state = 'frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient'
-
-                key = (route.origin_node_id, node_id, prod, departure_date, ship_state)
-
-                if key in model.in_transit:
-                    arrivals += model.in_transit[key]
+                    if key in model.in_transit:
+                        arrivals += model.in_transit[key]
 
             # Outflows
             thaw_outflow = 0
@@ -2003,14 +2748,13 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             # Departures: goods leaving TODAY (t) via in-transit
             departures = sum(
-                model.in_transit[node_id, route.destination_node_id, prod, t, 'frozen']
-                for route in self.routes_from_node[node_id]
-                if route.transport_mode == TransportMode.FROZEN  # Frozen routes only
-                and (node_id, route.destination_node_id, prod, t, 'frozen') in model.in_transit
+                model.in_transit[node_id, dest, prod, t, 'frozen']
+                for dest in self.departure_legs.get((node_id, 'frozen'), ())  # Frozen routes only
+                if (node_id, dest, prod, t, 'frozen') in model.in_transit
             )
 
             # DIAGNOSTIC: Log Lineage frozen balance on day 1
-            if node_id == "Lineage" and t == min(model.dates):
+            if self.build_diagnostics and node_id == "Lineage" and t == date_list[0]:
                 print(f"  DEBUG frozen_balance[{node_id}, {prod[:30]}, {t}]:")
                 print(f"    prev_inv: {prev_inv}")
                 print(f"    production_inflow: {production_inflow}")
@@ -2054,11 +2798,27 @@ class SlidingWindowModel(BaseOptimizationModel):
                 departures - thaw_outflow - disposal_outflow
             )
 
-        model.frozen_balance_con = Constraint(
+        def frozen_balance_row(node_id, prod, t):
+            if (node_id, prod, 'frozen', t) not in model.inventory:
+                return None
+            node = self.nodes[node_id]
+            inflows = arrival_vars(node_id, prod, t, 'frozen')
+            if node.can_produce() and node.get_production_state() == 'frozen' \
+                    and (node_id, prod, t) in model.production:
+                inflows.append(model.production[node_id, prod, t])
+            if (node_id, prod, t) in model.freeze:
+                inflows.append(model.freeze[node_id, prod, t])
+            outflows = departure_vars(node_id, prod, t, 'frozen')
+            if (node_id, prod, t) in model.thaw:
+                outflows.append(model.thaw[node_id, prod, t])
+            return balance_row(node_id, prod, 'frozen', t, inflows, outflows)
+
+        self._add_rows(
+            model, 'frozen_balance_con',
             [(n, p, t) for n, node in self.nodes.items()
              if node.supports_frozen_storage()
              for p in model.products for t in model.dates],
-            rule=frozen_balance_rule,
+            frozen_balance_rule, frozen_balance_row,
             doc="Frozen state material balance"
         )
 
@@ -2088,12 +2848,11 @@ class SlidingWindowModel(BaseOptimizationModel):
             # CRITICAL: Frozen goods arriving at ambient-only nodes become thawed
             # Must look for in_transit in FROZEN state (departure state), not ambient!
             arrivals = sum(
-                model.in_transit[route.origin_node_id, node_id, prod, departure_date, 'frozen']
-                for route in self.routes_to_node[node_id]
+                model.in_transit[origin, node_id, prod, departure_date, 'frozen']
+                for origin, _, offset_days in self.arrival_legs.get((node_id, 'thawed'), ())
                 # Calculate when goods must have departed to arrive today
-                if (departure_date := t - timedelta(days=route.transit_days)) in model.dates
-                and (route.origin_node_id, node_id, prod, departure_date, 'frozen') in model.in_transit
-                and self._determine_arrival_state(route, node) == 'thawed'
+                for departure_date in self._departure_dates(t, offset_days)
+                if (origin, node_id, prod, departure_date, 'frozen') in model.in_transit
             )
 
             # Outflows: shipments + demand
@@ -2114,8 +2873,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                     demand_consumption = model.demand_consumed_from_thawed[node_id, prod, t]
 
             # DIAGNOSTIC: Log 6130 thawed balance when receiving from Lineage
-            if node_id == "6130" and prod == "HELGAS GFREE MIXED GRAIN 500G":
-                date_list = list(model.dates)
+            if self.build_diagnostics and node_id == "6130" and prod == "HELGAS GFREE MIXED GRAIN 500G":
                 if t == date_list[0] or (len(date_list) > 7 and t == date_list[7]):  # Day 1 or Day 8
                     print(f"  DEBUG thawed_balance[{node_id}, {prod[:30]}, {t}]:")
                     print(f"    prev_inv: {prev_inv}")
@@ -2135,11 +2893,25 @@ class SlidingWindowModel(BaseOptimizationModel):
                 departures - demand_consumption - disposal_outflow
             )
 
-        model.thawed_balance_con = Constraint(
+        def thawed_balance_row(node_id, prod, t):
+            if (node_id, prod, 'thawed', t) not in model.inventory:
+                return None
+            node = self.nodes[node_id]
+            # Frozen goods arriving at ambient-only nodes: in_transit keyed 'frozen'
+            inflows = arrival_vars(node_id, prod, t, 'thawed', transit_state='frozen')
+            if (node_id, prod, t) in model.thaw:
+                inflows.append(model.thaw[node_id, prod, t])
+            outflows = []
+            if node.has_demand_capability() and (node_id, prod, t) in model.demand_consumed_from_thawed:
+                outflows.append(model.demand_consumed_from_thawed[node_id, prod, t])
+            return balance_row(node_id, prod, 'thawed', t, inflows, outflows)
+
+        self._add_rows(
+            model, 'thawed_balance_con',
             [(n, p, t) for n, node in self.nodes.items()
              if node.supports_ambient_storage()
              for p in model.products for t in model.dates],
-            rule=thawed_balance_rule,
+            thawed_balance_rule, thawed_balance_row,
             doc="Thawed state material balance (14-day shelf life from thaw)"
         )
 
@@ -2159,12 +2931,8 @@ class SlidingWindowModel(BaseOptimizationModel):
         """
         print(f"\n  Adding demand satisfaction...")
 
-        # Build date lookup for previous day (needed for consumption limit fix)
-        date_list = list(model.dates)
-        date_to_prev = {}
-        for i, d in enumerate(date_list):
-            if i > 0:
-                date_to_prev[d] = date_list[i-1]
+        # Previous-day lookup (needed for consumption limit fix)
+        date_to_prev = self.date_to_prev
 
         demand_keys = list(self.demand.keys())
 
@@ -2175,7 +2943,10 @@ class SlidingWindowModel(BaseOptimizationModel):
             if (node_id, prod, t) not in self.demand:
                 return Constraint.Skip
 
-            demand_qty = self.demand[(node_id, prod, t)]
+            if self.mutable_parameters:
+                demand_qty = model.demand_qty[node_id, prod, t]
+            else:
+                demand_qty = self.demand[(node_id, prod, t)]
 
             # Total consumption = sum of consumption from both states
             consumed_from_ambient = model.demand_consumed_from_ambient[node_id, prod, t]
@@ -2188,9 +2959,17 @@ class SlidingWindowModel(BaseOptimizationModel):
             else:
                 return total_consumed == demand_qty
 
-        model.demand_balance_con = Constraint(
-            demand_keys,
-            rule=demand_balance_rule,
+        def demand_balance_row(node_id, prod, t):
+            terms = [(model.demand_consumed_from_ambient[node_id, prod, t], 1.0),
+                     (model.demand_consumed_from_thawed[node_id, prod, t], 1.0)]
+            if self.allow_shortages:
+                terms.append((model.shortage[node_id, prod, t], 1.0))
+            demand_qty = float(self.demand[(node_id, prod, t)])
+            return terms, demand_qty, demand_qty
+
+        self._add_rows(
+            model, 'demand_balance_con', demand_keys,
+            demand_balance_rule, demand_balance_row,
             doc="Demand = consumed + shortage"
         )
 
@@ -2270,21 +3049,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                 available += model.thaw[node_id, prod, t]
 
             # Add arrivals
-            for route in self.routes_to_node[node_id]:
-                arrival_state = self._determine_arrival_state(route, node)
-                if arrival_state == 'ambient':
-                    departure_date = t - timedelta(days=route.transit_days)
-                    if departure_date in model.dates:
-                        key = (route.origin_node_id, node_id, prod, departure_date, 'ambient')
-                        if key in model.in_transit:
-                            available += model.in_transit[key]
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'ambient'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    key = (origin, node_id, prod, departure_date, 'ambient')
+                    if key in model.in_transit:
+                        available += model.in_transit[key]
 
             # Subtract departures (shipments)
-            for route in self.routes_from_node[node_id]:
-                if route.transport_mode != TransportMode.FROZEN:
-                    key = (node_id, route.destination_node_id, prod, t, 'ambient')
-                    if key in model.in_transit:
-                        available -= model.in_transit[key]
+            for dest in self.departure_legs.get((node_id, 'ambient'), ()):
+                key = (node_id, dest, prod, t, 'ambient')
+                if key in model.in_transit:
+                    available -= model.in_transit[key]
 
             # Subtract freeze outflow
             if (node_id, prod, t) in model.freeze:
@@ -2329,16 +3104,13 @@ class SlidingWindowModel(BaseOptimizationModel):
                 available += model.thaw[node_id, prod, t]
 
             # Add arrivals (frozen goods arriving at ambient-only nodes become thawed)
-            for route in self.routes_to_node[node_id]:
-                arrival_state = self._determine_arrival_state(route, node)
-                if arrival_state == 'thawed':
-                    departure_date = t - timedelta(days=route.transit_days)
-                    if departure_date in model.dates:
-                        # Check both frozen and thawed in-transit
-                        for state in ['frozen', 'thawed']:
-                            key = (route.origin_node_id, node_id, prod, departure_date, state)
-                            if key in model.in_transit:
-                                available += model.in_transit[key]
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'thawed'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    # Check both frozen and thawed in-transit
+                    for state in ['frozen', 'thawed']:
+                        key = (origin, node_id, prod, departure_date, state)
+                        if key in model.in_transit:
+                            available += model.in_transit[key]
 
             # DON'T subtract disposal! (creates circular dependency - same as ambient)
             # State balance handles disposal separately
@@ -2346,15 +3118,67 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Bound consumption by available supply
             return model.demand_consumed_from_thawed[node_id, prod, t] <= available
 
-        model.demand_consumed_ambient_limit_con = Constraint(
-            demand_keys,
-            rule=demand_consumption_ambient_limit_rule,
+        def consumption_limit_row(consumed, state, inflows, outflows, node_id, prod, t):
+            """consumed <= prev_inv (or initial inventory on day 1) + inflows - outflows."""
+            if (node_id, prod, t) not in self.demand or not self.nodes[node_id].has_demand_capability():
+                return None
+            terms = [(consumed[node_id, prod, t], 1.0)]
+            if (node_id, prod, state, t) not in model.inventory:
+                return terms, 0.0, 0.0
+            prev_date = date_to_prev.get(t)
+            upper = 0.0
+            if prev_date and (node_id, prod, state, prev_date) in model.inventory:
+                terms.append((model.inventory[node_id, prod, state, prev_date], -1.0))
+            else:
+                upper = float(self.initial_inventory.get((node_id, prod, state), 0))
+            terms.extend((var, -1.0) for var in inflows)
+            terms.extend((var, 1.0) for var in outflows)
+            return terms, -math.inf, upper
+
+        def demand_consumption_ambient_limit_row(node_id, prod, t):
+            node = self.nodes[node_id]
+            inflows, outflows = [], []
+            if node.can_produce() and node.get_production_state() == 'ambient' \
+                    and (node_id, prod, t) in model.production:
+                inflows.append(model.production[node_id, prod, t])
+            if (node_id, prod, t) in model.thaw:
+                inflows.append(model.thaw[node_id, prod, t])
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'ambient'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    key = (origin, node_id, prod, departure_date, 'ambient')
+                    if key in model.in_transit:
+                        inflows.append(model.in_transit[key])
+            for dest in self.departure_legs.get((node_id, 'ambient'), ()):
+                key = (node_id, dest, prod, t, 'ambient')
+                if key in model.in_transit:
+                    outflows.append(model.in_transit[key])
+            if (node_id, prod, t) in model.freeze:
+                outflows.append(model.freeze[node_id, prod, t])
+            return consumption_limit_row(model.demand_consumed_from_ambient, 'ambient',
+                                         inflows, outflows, node_id, prod, t)
+
+        def demand_consumption_thawed_limit_row(node_id, prod, t):
+            inflows = []
+            if (node_id, prod, t) in model.thaw:
+                inflows.append(model.thaw[node_id, prod, t])
+            for origin, _, offset_days in self.arrival_legs.get((node_id, 'thawed'), ()):
+                for departure_date in self._departure_dates(t, offset_days):
+                    for state in ['frozen', 'thawed']:
+                        key = (origin, node_id, prod, departure_date, state)
+                        if key in model.in_transit:
+                            inflows.append(model.in_transit[key])
+            return consumption_limit_row(model.demand_consumed_from_thawed, 'thawed',
+                                         inflows, [], node_id, prod, t)
+
+        self._add_rows(
+            model, 'demand_consumed_ambient_limit_con', demand_keys,
+            demand_consumption_ambient_limit_rule, demand_consumption_ambient_limit_row,
             doc="Consumption from ambient <= ambient inventory"
         )
 
-        model.demand_consumed_thawed_limit_con = Constraint(
-            demand_keys,
-            rule=demand_consumption_thawed_limit_rule,
+        self._add_rows(
+            model, 'demand_consumed_thawed_limit_con', demand_keys,
+            demand_consumption_thawed_limit_rule, demand_consumption_thawed_limit_row,
             doc="Consumption from thawed <= thawed inventory"
         )
 
@@ -2385,21 +3209,25 @@ class SlidingWindowModel(BaseOptimizationModel):
                 else:
                     return Constraint.Skip
 
-        model.storage_pallet_ceiling_con = Constraint(
-            model.pallet_count.index_set(),
-            rule=storage_pallet_ceiling_rule,
+        def storage_pallet_ceiling_row(node_id, prod, state, t):
+            states = ('ambient', 'thawed') if state == 'ambient' else (state,)
+            terms = [(model.inventory[node_id, prod, inv_state, t], -1.0)
+                     for inv_state in states if (node_id, prod, inv_state, t) in model.inventory]
+            if state != 'ambient' and not terms:
+                return None
+            terms.append((model.pallet_count[node_id, prod, state, t], float(self.UNITS_PER_PALLET)))
+            return terms, 0.0, math.inf
+
+        self._add_rows(
+            model, 'storage_pallet_ceiling_con', model.pallet_count.index_set(),
+            storage_pallet_ceiling_rule, storage_pallet_ceiling_row,
             doc="Storage pallet ceiling: pallet_count * 320 >= inventory"
         )
         print(f"    Storage pallet ceiling constraints added")
 
         # Pallet entry detection (for fixed costs)
         if hasattr(model, 'pallet_entry'):
-            # Build date lookup for previous day
-            date_list = list(model.dates)
-            date_to_prev = {}
-            for i, d in enumerate(date_list):
-                if i > 0:
-                    date_to_prev[d] = date_list[i-1]
+            date_to_prev = self.date_to_prev
 
             def pallet_entry_detection_rule(model, node_id, prod, state, t):
                 """Detect new pallets entering storage: entry >= count[t] - count[t-1]."""
@@ -2417,9 +3245,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                     return model.pallet_entry[node_id, prod, state, t] >= \
                            model.pallet_count[node_id, prod, state, t]
 
-            model.pallet_entry_detection_con = Constraint(
-                model.pallet_entry.index_set(),
-                rule=pallet_entry_detection_rule,
+            def pallet_entry_detection_row(node_id, prod, state, t):
+                terms = [(model.pallet_entry[node_id, prod, state, t], 1.0),
+                         (model.pallet_count[node_id, prod, state, t], -1.0)]
+                prev_date = date_to_prev.get(t)
+                if prev_date and (node_id, prod, state, prev_date) in model.pallet_count:
+                    terms.append((model.pallet_count[node_id, prod, state, prev_date], 1.0))
+                return terms, 0.0, math.inf
+
+            self._add_rows(
+                model, 'pallet_entry_detection_con', model.pallet_entry.index_set(),
+                pallet_entry_detection_rule, pallet_entry_detection_row,
                 doc="Detect new pallets entering storage for fixed costs"
             )
             print(f"    Pallet entry detection constraints added")
@@ -2433,7 +3269,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 We need to check each route individually.
                 """
                 # Find all routes to this destination
-                routes_to_dest = [r for r in self.routes if r.destination_node_id == dest]
+                routes_to_dest = self.routes_to_node.get(dest)
                 if not routes_to_dest:
                     return Constraint.Skip
 
@@ -2442,11 +3278,8 @@ class SlidingWindowModel(BaseOptimizationModel):
                 total_in_transit = 0
 
                 for route in routes_to_dest:
-                    # Calculate when goods must depart from THIS origin to arrive on delivery_date
-                    departure_date = delivery_date - timedelta(days=route.transit_days)
-
-                    # Only include if departure is within planning horizon
-                    if departure_date in model.dates:
+                    # Departures from THIS origin (within planning horizon) arriving on delivery_date
+                    for departure_date in self._departure_dates(delivery_date, self._offset_days(route)):
                         # Add in-transit from this specific origin, departing on this date
                         for state in ['frozen', 'ambient']:
                             if (route.origin_node_id, dest, prod, departure_date, state) in model.in_transit:
@@ -2455,23 +3288,39 @@ class SlidingWindowModel(BaseOptimizationModel):
                 # CRITICAL FIX: Skip if no in-transit shipments
                 # Otherwise creates constraint: truck_pallet_load * 320 >= 0, which wastes variables
                 # More importantly: prevents infeasibility from truck constraints on dates with no shipments
-                try:
-                    if total_in_transit == 0:
-                        return Constraint.Skip
-                except:
-                    pass  # Pyomo expression, can't compare to 0
+                # (Only a numeric 0 can be skipped; comparing a Pyomo expression to 0 would
+                # stringify it inside the relational __bool__, which dominated build time.)
+                if isinstance(total_in_transit, (int, float)) and total_in_transit == 0:
+                    return Constraint.Skip
 
                 # Truck pallets must be sufficient to carry all in-transit shipments
                 return model.truck_pallet_load[truck_idx, dest, prod, delivery_date] * self.UNITS_PER_PALLET >= total_in_transit
 
-            model.truck_pallet_ceiling_con = Constraint(
-                model.truck_pallet_load.index_set(),
-                rule=truck_pallet_ceiling_rule,
+            def truck_pallet_ceiling_row(truck_idx, dest, prod, delivery_date):
+                terms = []
+                for route in self.routes_to_node.get(dest, ()):
+                    for departure_date in self._departure_dates(delivery_date, self._offset_days(route)):
+                        for state in ('frozen', 'ambient'):
+                            key = (route.origin_node_id, dest, prod, departure_date, state)
+                            if key in model.in_transit:
+                                terms.append((model.in_transit[key], -1.0))
+                if not terms:
+                    return None
+                terms.append((model.truck_pallet_load[truck_idx, dest, prod, delivery_date],
+                              float(self.UNITS_PER_PALLET)))
+                return terms, 0.0, math.inf
+
+            self._add_rows(
+                model, 'truck_pallet_ceiling_con', model.truck_pallet_load.index_set(),
+                truck_pallet_ceiling_rule, truck_pallet_ceiling_row,
                 doc="Truck pallet ceiling: pallet_load * 320 >= shipments"
             )
 
             # DIAGNOSTIC: Count constraints
-            ceiling_count = sum(1 for _ in model.truck_pallet_ceiling_con)
+            if self.direct_rows is not None:
+                ceiling_count = self.direct_rows.families.get('truck_pallet_ceiling_con', 0)
+            else:
+                ceiling_count = sum(1 for _ in model.truck_pallet_ceiling_con)
             print(f"    Truck pallet ceiling constraints added: {ceiling_count}")
 
             # Check if any constraints reference dates beyond horizon
@@ -2506,9 +3355,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                 else:
                     return Constraint.Skip
 
-            model.mix_production_con = Constraint(
-                model.mix_count.index_set(),
-                rule=mix_production_rule,
+            def mix_production_row(node_id, prod, t):
+                if (node_id, prod, t) not in model.production:
+                    return None
+                product = self.products[prod]
+                units_per_mix = product.units_per_mix if hasattr(product, 'units_per_mix') else 1
+                return ([(model.production[node_id, prod, t], 1.0),
+                         (model.mix_count[node_id, prod, t], -float(units_per_mix))], 0.0, 0.0)
+
+            self._add_rows(
+                model, 'mix_production_con', model.mix_count.index_set(),
+                mix_production_rule, mix_production_row,
                 doc="Production = mix_count × units_per_mix"
             )
             print(f"    Mix-based production constraints added")
@@ -2522,22 +3379,28 @@ class SlidingWindowModel(BaseOptimizationModel):
                 default_production_rate = 1400  # units/hour
                 max_daily_units = default_production_rate * max_daily_hours  # 19,600 units
 
+                def max_mixes(prod, t):
+                    product = self.products.get(prod)
+                    if product and hasattr(product, 'units_per_mix') and product.units_per_mix > 0:
+                        return int(max_daily_units * self.period_days[t] / product.units_per_mix) + 1
+                    return 100  # Fallback
+
                 def mix_count_product_linking_rule(model, node_id, prod, t):
                     """Force mix_count=0 when product not produced (product_produced=0)."""
                     if (node_id, prod, t) not in model.product_produced:
                         return Constraint.Skip
+                    return model.mix_count[node_id, prod, t] <= max_mixes(prod, t) * model.product_produced[node_id, prod, t]
 
-                    product = self.products.get(prod)
-                    if product and hasattr(product, 'units_per_mix') and product.units_per_mix > 0:
-                        max_mixes = int(max_daily_units / product.units_per_mix) + 1
-                    else:
-                        max_mixes = 100  # Fallback
-
-                    return model.mix_count[node_id, prod, t] <= max_mixes * model.product_produced[node_id, prod, t]
-
-                model.mix_count_product_link = Constraint(
-                    model.mix_count.index_set(),
-                    rule=mix_count_product_linking_rule,
+                def mix_count_product_linking_row(node_id, prod, t):
+                    if (node_id, prod, t) not in model.product_produced:
+                        return None
+                    return ([(model.mix_count[node_id, prod, t], 1.0),
+                             (model.product_produced[node_id, prod, t], -float(max_mixes(prod, t)))],
+                            -math.inf, 0.0)
+
+                self._add_rows(
+                    model, 'mix_count_product_link', model.mix_count.index_set(),
+                    mix_count_product_linking_rule, mix_count_product_linking_row,
                     doc="mix_count <= max_mixes × product_produced (forces mix_count=0 when not producing)"
                 )
                 print(f"    Mix-count to product_produced linking constraints added (MIP optimization)")
@@ -2552,9 +3415,15 @@ class SlidingWindowModel(BaseOptimizationModel):
                         return Constraint.Skip
                     return model.mix_count[node_id, prod, t] >= model.product_produced[node_id, prod, t]
 
-                model.mix_count_lower_bound = Constraint(
-                    model.mix_count.index_set(),
-                    rule=mix_count_lower_bound_rule,
+                def mix_count_lower_bound_row(node_id, prod, t):
+                    if (node_id, prod, t) not in model.product_produced:
+                        return None
+                    return ([(model.mix_count[node_id, prod, t], 1.0),
+                             (model.product_produced[node_id, prod, t], -1.0)], 0.0, math.inf)
+
+                self._add_rows(
+                    model, 'mix_count_lower_bound', model.mix_count.index_set(),
+                    mix_count_lower_bound_rule, mix_count_lower_bound_row,
                     doc="mix_count >= product_produced (tight LP: if producing, at least 1 mix)"
                 )
                 print(f"    Mix-count lower bound constraints added (Phase 4: tight LP relaxation)")
@@ -2564,6 +3433,20 @@ class SlidingWindowModel(BaseOptimizationModel):
         # 1. Link labor_hours_used to production_time (equality)
         # 2. Enforce labor_hours_used <= max_hours (capacity limit)
 
+        def overhead_hours(node):
+            """(startup, shutdown, changeover) hours of a manufacturing node."""
+            return (node.capabilities.daily_startup_hours or 0.5,
+                    node.capabilities.daily_shutdown_hours or 0.25,
+                    node.capabilities.default_changeover_hours or 0.5)
+
+        def max_labor_hours(labor_day):
+            """Labor capacity of a period (fixed + overtime, or the 14h non-fixed day)."""
+            if isinstance(labor_day, PeriodLabor):
+                return labor_day.max_hours  # Summed over the days of the period
+            if labor_day.is_fixed_day:
+                return labor_day.fixed_hours + (labor_day.overtime_hours if hasattr(labor_day, 'overtime_hours') else 0)
+            return 14.0  # Weekend/holiday max
+
         def production_time_link_rule(model, node_id, t):
             """Link labor_hours_used to production time + overhead time.
 
@@ -2602,9 +3485,7 @@ class SlidingWindowModel(BaseOptimizationModel):
             scaled_overhead = 0
             if hasattr(model, 'total_starts') and (node_id, t) in model.total_starts:
                 # Get overhead parameters from node capabilities
-                startup_hours = node.capabilities.daily_startup_hours or 0.5
-                shutdown_hours = node.capabilities.daily_shutdown_hours or 0.25
-                changeover_hours = node.capabilities.default_changeover_hours or 0.5
+                startup_hours, shutdown_hours, changeover_hours = overhead_hours(node)
 
                 # Overhead calculation (scaled by production_rate):
                 # - Startup/shutdown: applied once if producing (any products)
@@ -2618,7 +3499,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 )
 
             # Get available hours
-            labor_day = self.labor_calendar.get_labor_day(t)
+            labor_day = self._period_labor(t)
             if not labor_day:
                 return total_production == 0  # No labor → no production
 
@@ -2646,15 +3527,12 @@ class SlidingWindowModel(BaseOptimizationModel):
                 return Constraint.Skip
 
             # Get available hours
-            labor_day = self.labor_calendar.get_labor_day(t)
+            labor_day = self._period_labor(t)
             if not labor_day:
                 return Constraint.Skip  # No labor day means production=0 (handled by link constraint)
 
             # Calculate max hours
-            if labor_day.is_fixed_day:
-                max_hours = labor_day.fixed_hours + (labor_day.overtime_hours if hasattr(labor_day, 'overtime_hours') else 0)
-            else:
-                max_hours = 14.0  # Weekend/holiday max
+            max_hours = max_labor_hours(labor_day)
 
             # Enforce capacity limit
             if (node_id, t) in model.labor_hours_used:
@@ -2663,18 +3541,49 @@ class SlidingWindowModel(BaseOptimizationModel):
                 # No labor variable - constraint handled elsewhere
                 return Constraint.Skip
 
+        def production_time_link_row(node_id, t):
+            node = self.nodes[node_id]
+            production_rate = node.capabilities.production_rate_per_hour
+            if not node.can_produce() or not production_rate or production_rate <= 0:
+                return None
+            production = [(model.production[node_id, prod, t], 1.0)
+                          for prod in model.products if (node_id, prod, t) in model.production]
+            if not self._period_labor(t):
+                return (production, 0.0, 0.0) if production else None
+            if (node_id, t) not in model.labor_hours_used:
+                return None
+            # labor_hours_used * rate - production - scaled_overhead == 0
+            terms = [(model.labor_hours_used[node_id, t], float(production_rate))]
+            terms.extend((var, -1.0) for var, _ in production)
+            if hasattr(model, 'total_starts') and (node_id, t) in model.total_starts:
+                startup_hours, shutdown_hours, changeover_hours = overhead_hours(node)
+                terms.append((model.any_production[node_id, t],
+                              -production_rate * (startup_hours + shutdown_hours - changeover_hours)))
+                terms.append((model.total_starts[node_id, t], -production_rate * changeover_hours))
+            return terms, 0.0, 0.0
+
+        def production_capacity_limit_row(node_id, t):
+            node = self.nodes[node_id]
+            production_rate = node.capabilities.production_rate_per_hour
+            if not node.can_produce() or not production_rate or production_rate <= 0:
+                return None
+            labor_day = self._period_labor(t)
+            if not labor_day or (node_id, t) not in model.labor_hours_used:
+                return None
+            return [(model.labor_hours_used[node_id, t], 1.0)], -math.inf, float(max_labor_hours(labor_day))
+
         # Add both constraints
         manufacturing_date_pairs = [(node.id, t) for node in self.manufacturing_nodes for t in model.dates]
 
-        model.production_time_link_con = Constraint(
-            manufacturing_date_pairs,
-            rule=production_time_link_rule,
+        self._add_rows(
+            model, 'production_time_link_con', manufacturing_date_pairs,
+            production_time_link_rule, production_time_link_row,
             doc="Link labor_hours_used to production time"
         )
 
-        model.production_capacity_limit_con = Constraint(
-            manufacturing_date_pairs,
-            rule=production_capacity_limit_rule,
+        self._add_rows(
+            model, 'production_capacity_limit_con', manufacturing_date_pairs,
+            production_capacity_limit_rule, production_capacity_limit_row,
             doc="Enforce labor capacity: labor_hours_used <= max_hours"
         )
 
@@ -2685,13 +3594,16 @@ class SlidingWindowModel(BaseOptimizationModel):
         if hasattr(model, 'overtime_hours'):
             def overtime_detection_rule(model, node_id, t):
                 """Detect overtime hours on weekdays: overtime >= hours - fixed."""
-                labor_day = self.labor_calendar.get_labor_day(t)
+                labor_day = self._period_labor(t)
                 if not labor_day:
                     return Constraint.Skip
 
                 fixed_hours = labor_day.fixed_hours if hasattr(labor_day, 'fixed_hours') else 0
 
-                if fixed_hours > 0:
+                if self._is_mixed_period(labor_day):
+                    # Weekdays + weekend: hours beyond fixed go to overtime or labor_hours_paid
+                    return Constraint.Skip
+                elif fixed_hours > 0:
                     # Weekday: overtime >= hours_used - fixed_hours
                     # Minimization sets overtime = max(0, hours_used - fixed_hours)
                     return model.overtime_hours[node_id, t] >= model.labor_hours_used[node_id, t] - fixed_hours
@@ -2699,9 +3611,19 @@ class SlidingWindowModel(BaseOptimizationModel):
                     # Weekend: no overtime concept (all hours are non_fixed)
                     return model.overtime_hours[node_id, t] == 0
 
-            model.overtime_detection_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=overtime_detection_rule,
+            def overtime_detection_row(node_id, t):
+                labor_day = self._period_labor(t)
+                if not labor_day or self._is_mixed_period(labor_day):
+                    return None
+                fixed_hours = labor_day.fixed_hours if hasattr(labor_day, 'fixed_hours') else 0
+                if fixed_hours > 0:
+                    return ([(model.overtime_hours[node_id, t], 1.0),
+                             (model.labor_hours_used[node_id, t], -1.0)], -float(fixed_hours), math.inf)
+                return [(model.overtime_hours[node_id, t], 1.0)], 0.0, 0.0
+
+            self._add_rows(
+                model, 'overtime_detection_con', manufacturing_date_pairs,
+                overtime_detection_rule, overtime_detection_row,
                 doc="Overtime detection: overtime >= hours - fixed (weekdays only)"
             )
             print(f"    Overtime detection constraints added")
@@ -2710,11 +3632,23 @@ class SlidingWindowModel(BaseOptimizationModel):
         if hasattr(model, 'labor_hours_paid'):
             def labor_hours_paid_lower_rule(model, node_id, t):
                 """Paid hours must at least equal used hours."""
+                if self.periods.is_aggregated and self._is_mixed_period(self._period_labor(t)):
+                    # Weekdays + weekend: paid = non-fixed hours beyond fixed + overtime
+                    labor = self._period_labor(t)
+                    return (model.labor_hours_paid[node_id, t] >=
+                            model.labor_hours_used[node_id, t] - labor.fixed_hours - model.overtime_hours[node_id, t])
                 return model.labor_hours_paid[node_id, t] >= model.labor_hours_used[node_id, t]
 
-            model.labor_hours_paid_lower_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=labor_hours_paid_lower_rule,
+            def labor_hours_paid_lower_row(node_id, t):
+                terms = [(model.labor_hours_paid[node_id, t], 1.0), (model.labor_hours_used[node_id, t], -1.0)]
+                if self.periods.is_aggregated and self._is_mixed_period(self._period_labor(t)):
+                    terms.append((model.overtime_hours[node_id, t], 1.0))
+                    return terms, -float(self._period_labor(t).fixed_hours), math.inf
+                return terms, 0.0, math.inf
+
+            self._add_rows(
+                model, 'labor_hours_paid_lower_con', manufacturing_date_pairs,
+                labor_hours_paid_lower_rule, labor_hours_paid_lower_row,
                 doc="Paid hours >= used hours (always pay for time worked)"
             )
 
@@ -2730,7 +3664,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 If any_production = 0: paid_hours >= 0 (can be 0)
                 If any_production = 1: paid_hours >= 4 (minimum payment)
                 """
-                labor_day = self.labor_calendar.get_labor_day(t)
+                labor_day = self._period_labor(t)
 
                 if not labor_day or labor_day.is_fixed_day:
                     return Constraint.Skip  # Only applies to weekends/holidays
@@ -2746,9 +3680,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                     # No any_production variable - skip minimum enforcement
                     return Constraint.Skip
 
-            model.minimum_payment_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=minimum_payment_enforcement_rule,
+            def minimum_payment_enforcement_row(node_id, t):
+                labor_day = self._period_labor(t)
+                if not labor_day or labor_day.is_fixed_day or (node_id, t) not in model.any_production:
+                    return None
+                minimum_hours = getattr(labor_day, 'minimum_hours', 4.0) or 4.0
+                return ([(model.labor_hours_paid[node_id, t], 1.0),
+                         (model.any_production[node_id, t], -float(minimum_hours))], 0.0, math.inf)
+
+            self._add_rows(
+                model, 'minimum_payment_con', manufacturing_date_pairs,
+                minimum_payment_enforcement_rule, minimum_payment_enforcement_row,
                 doc="Enforce 4-hour minimum payment on weekends/holidays when producing"
             )
 
@@ -2779,9 +3721,17 @@ class SlidingWindowModel(BaseOptimizationModel):
                 # First day: start if producing
                 return model.product_start[node_id, prod, t] >= model.product_produced[node_id, prod, t]
 
-        model.start_detection_con = Constraint(
-            model.product_start.index_set(),
-            rule=start_detection_rule,
+        def start_detection_row(node_id, prod, t):
+            terms = [(model.product_start[node_id, prod, t], 1.0),
+                     (model.product_produced[node_id, prod, t], -1.0)]
+            prev_date = date_to_prev.get(t)
+            if prev_date and (node_id, prod, prev_date) in model.product_produced:
+                terms.append((model.product_produced[node_id, prod, prev_date], 1.0))
+            return terms, 0.0, math.inf
+
+        self._add_rows(
+            model, 'start_detection_con', model.product_start.index_set(),
+            start_detection_rule, start_detection_row,
             doc="Detect product starts (0→1 transitions)"
         )
 
@@ -2800,10 +3750,18 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             return model.production[node_id, prod, t] <= max_daily_production * model.product_produced[node_id, prod, t]
 
-        model.product_binary_linking_con = Constraint(
+        def product_binary_linking_row(node_id, prod, t):
+            if (node_id, prod, t) not in model.production:
+                return None
+            production_rate = self.nodes[node_id].capabilities.production_rate_per_hour or 1400
+            return ([(model.production[node_id, prod, t], 1.0),
+                     (model.product_produced[node_id, prod, t], -float(production_rate * 14))], -math.inf, 0.0)
+
+        self._add_rows(
+            model, 'product_binary_linking_con',
             [(node.id, prod, t) for node in self.manufacturing_nodes
              for prod in model.products for t in model.dates],
-            rule=product_binary_linking_rule,
+            product_binary_linking_rule, product_binary_linking_row,
             doc="Link production quantity to product_produced binary (upper bound)"
         )
 
@@ -2833,9 +3791,18 @@ class SlidingWindowModel(BaseOptimizationModel):
                     if (node_id, prod, t) in model.product_start
                 )
 
-            model.total_starts_link_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=total_starts_link_rule,
+            manufacturing_date_pairs = [(node.id, t) for node in self.manufacturing_nodes for t in model.dates]
+
+            def product_vars(var, node_id, t, coef):
+                return [(var[node_id, prod, t], coef) for prod in model.products if (node_id, prod, t) in var]
+
+            def total_starts_link_row(node_id, t):
+                terms = [(model.total_starts[node_id, t], 1.0)] + product_vars(model.product_start, node_id, t, -1.0)
+                return terms, 0.0, 0.0
+
+            self._add_rows(
+                model, 'total_starts_link_con', manufacturing_date_pairs,
+                total_starts_link_rule, total_starts_link_row,
                 doc="Link total_starts to sum of product_start (overhead optimization)"
             )
 
@@ -2868,15 +3835,25 @@ class SlidingWindowModel(BaseOptimizationModel):
                     if (node_id, prod, t) in model.product_produced
                 )
 
-            model.any_production_upper_link_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=any_production_upper_link_rule,
+            def any_production_upper_link_row(node_id, t):
+                terms = product_vars(model.product_produced, node_id, t, 1.0)
+                terms.append((model.any_production[node_id, t], -float(len(model.products))))
+                return terms, -math.inf, 0.0
+
+            def any_production_lower_link_row(node_id, t):
+                terms = product_vars(model.product_produced, node_id, t, -1.0)
+                terms.append((model.any_production[node_id, t], 1.0))
+                return terms, -math.inf, 0.0
+
+            self._add_rows(
+                model, 'any_production_upper_link_con', manufacturing_date_pairs,
+                any_production_upper_link_rule, any_production_upper_link_row,
                 doc="Link any_production upper: forces 1 if producing (overhead optimization)"
             )
 
-            model.any_production_lower_link_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=any_production_lower_link_rule,
+            self._add_rows(
+                model, 'any_production_lower_link_con', manufacturing_date_pairs,
+                any_production_lower_link_rule, any_production_lower_link_row,
                 doc="Link any_production lower: forces 0 if not producing (overhead optimization)"
             )
 
@@ -2888,9 +3865,13 @@ class SlidingWindowModel(BaseOptimizationModel):
                 num_products = len(model.products)
                 return model.total_starts[node_id, t] <= num_products * model.any_production[node_id, t]
 
-            model.total_starts_zero_link_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=total_starts_zero_when_not_producing_rule,
+            def total_starts_zero_when_not_producing_row(node_id, t):
+                return ([(model.total_starts[node_id, t], 1.0),
+                         (model.any_production[node_id, t], -float(len(model.products)))], -math.inf, 0.0)
+
+            self._add_rows(
+                model, 'total_starts_zero_link_con', manufacturing_date_pairs,
+                total_starts_zero_when_not_producing_rule, total_starts_zero_when_not_producing_row,
                 doc="Force total_starts = 0 when any_production = 0 (overhead optimization)"
             )
 
@@ -2926,9 +3907,16 @@ class SlidingWindowModel(BaseOptimizationModel):
                 epsilon = 1.0
                 return total_prod >= epsilon * model.any_production[node_id, t]
 
-            model.any_production_enforcement_con = Constraint(
-                [(node.id, t) for node in self.manufacturing_nodes for t in model.dates],
-                rule=any_production_enforcement_rule,
+            def any_production_enforcement_row(node_id, t):
+                if not self.nodes[node_id].can_produce():
+                    return None
+                terms = product_vars(model.production, node_id, t, 1.0)
+                terms.append((model.any_production[node_id, t], -1.0))
+                return terms, 0.0, math.inf
+
+            self._add_rows(
+                model, 'any_production_enforcement_con', manufacturing_date_pairs,
+                any_production_enforcement_rule, any_production_enforcement_row,
                 doc="Enforce production > 0 if any_production = 1 (prevents phantom overhead)"
             )
 
@@ -2945,28 +3933,19 @@ class SlidingWindowModel(BaseOptimizationModel):
             return
 
         # TRUCK CAPACITY: Sum of pallet loads <= 44 pallets
-        def truck_capacity_rule(model, truck_idx, departure_date):
+        def truck_capacity_rule(model, truck_idx, t):
             """Total pallets on this specific truck departure <= 44 pallets.
 
-            Only applies on days when this truck actually operates.
+            Daily periods: one row per departure day the truck operates,
+            over the loads delivered by that departure. Aggregated periods:
+            one row per delivery period (truck_pallet_load is keyed by
+            delivery period), 44 pallets per departure delivering into it.
             """
             truck = self.truck_schedules[truck_idx]
-
-            # Check if truck operates on this day of week
-            day_of_week_map = {
-                0: 'monday', 1: 'tuesday', 2: 'wednesday', 3: 'thursday',
-                4: 'friday', 5: 'saturday', 6: 'sunday'
-            }
-            actual_day_of_week = day_of_week_map[departure_date.weekday()]
-
-            # Skip if truck doesn't operate on this day
-            if truck.day_of_week.lower() != actual_day_of_week:
-                return Constraint.Skip
-
             truck_dest = truck.destination_node_id
 
             # Find routes TO this truck's destination
-            routes_to_dest = [r for r in self.routes if r.destination_node_id == truck_dest]
+            routes_to_dest = self.routes_to_node.get(truck_dest, [])
 
             if not routes_to_dest:
                 return Constraint.Skip
@@ -2974,14 +3953,36 @@ class SlidingWindowModel(BaseOptimizationModel):
             # Build list of pallet variables to sum
             pallet_vars = []
 
-            for route in routes_to_dest:
-                # Calculate delivery date for shipment departing on this date
-                delivery_date = departure_date + timedelta(days=route.transit_days)
-
-                # Collect pallet variables for this delivery
+            if self.periods.is_aggregated:
+                departures = self._truck_departures(truck_idx, t)
+                if departures == 0:
+                    return Constraint.Skip
                 for prod in model.products:
-                    if (truck_idx, truck_dest, prod, delivery_date) in model.truck_pallet_load:
-                        pallet_vars.append(model.truck_pallet_load[truck_idx, truck_dest, prod, delivery_date])
+                    if (truck_idx, truck_dest, prod, t) in model.truck_pallet_load:
+                        pallet_vars.append(model.truck_pallet_load[truck_idx, truck_dest, prod, t])
+            else:
+                # Check if truck operates on this day of week
+                day_of_week_map = {
+                    0: 'monday', 1: 'tuesday', 2: 'wednesday', 3: 'thursday',
+                    4: 'friday', 5: 'saturday', 6: 'sunday'
+                }
+                actual_day_of_week = day_of_week_map[t.weekday()]
+
+                # Skip if truck doesn't operate on this day
+                if truck.day_of_week.lower() != actual_day_of_week:
+                    return Constraint.Skip
+                departures = 1
+
+                for route in routes_to_dest:
+                    # Calculate delivery date for shipment departing on this date
+                    delivery_date = self._arrival_date(t, self._offset_days(route))
+                    if delivery_date is None:
+                        continue
+
+                    # Collect pallet variables for this delivery
+                    for prod in model.products:
+                        if (truck_idx, truck_dest, prod, delivery_date) in model.truck_pallet_load:
+                            pallet_vars.append(model.truck_pallet_load[truck_idx, truck_dest, prod, delivery_date])
 
             # If no variables to sum, skip constraint
             if len(pallet_vars) == 0:
@@ -2989,13 +3990,41 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             # Use quicksum for proper Pyomo expression
             from pyomo.environ import quicksum
-            return quicksum(pallet_vars) <= self.PALLETS_PER_TRUCK
+            if self.mutable_parameters:
+                capacity = model.truck_capacity_pallets[truck_idx]
+            else:
+                capacity = self.PALLETS_PER_TRUCK
+            if departures > 1:
+                capacity = departures * capacity
+            return quicksum(pallet_vars) <= capacity
 
-        # Truck capacity constraints (one per truck per departure date)
+        def truck_capacity_row(truck_idx, t):
+            truck = self.truck_schedules[truck_idx]
+            truck_dest = truck.destination_node_id
+            routes_to_dest = self.routes_to_node.get(truck_dest, [])
+            if not routes_to_dest:
+                return None
+            if self.periods.is_aggregated:
+                departures = self._truck_departures(truck_idx, t)
+                delivery_dates = [t] if departures else []
+            else:
+                departures = 1
+                if truck.day_of_week.lower() != WEEKDAY_NAMES[t.weekday()]:
+                    return None
+                delivery_dates = [self._arrival_date(t, self._offset_days(route)) for route in routes_to_dest]
+            terms = [(model.truck_pallet_load[truck_idx, truck_dest, prod, delivery_date], 1.0)
+                     for delivery_date in delivery_dates if delivery_date is not None
+                     for prod in model.products
+                     if (truck_idx, truck_dest, prod, delivery_date) in model.truck_pallet_load]
+            if not terms:
+                return None
+            return terms, -math.inf, float(departures * self.PALLETS_PER_TRUCK)
+
+        # Truck capacity constraints (one per truck per departure date, or per
+        # delivery period with aggregated periods)
         truck_index = [(i, t) for i, truck in enumerate(self.truck_schedules) for t in model.dates]
-        model.truck_capacity_con = Constraint(
-            truck_index,
-            rule=truck_capacity_rule,
+        self._add_rows(
+            model, 'truck_capacity_con', truck_index, truck_capacity_rule, truck_capacity_row,
             doc="Truck capacity: total pallets on departure <= 44"
         )
 
@@ -3010,18 +4039,25 @@ class SlidingWindowModel(BaseOptimizationModel):
         """
         print(f"\nBuilding objective...")
 
+        # With mutable parameters, cost rates come from model.cost_rate and every
+        # cost term is kept even at rate 0 so a later update can switch it on
+        mutable = self.mutable_parameters
+
         # PRODUCTION COST (direct manufacturing cost)
         production_cost = 0
         if hasattr(model, 'production'):
             prod_cost_per_unit = self.cost_structure.production_cost_per_unit or 1.30
+            if mutable:
+                prod_cost_per_unit = model.cost_rate['production_cost_per_unit']
             from pyomo.environ import quicksum
             production_cost = prod_cost_per_unit * quicksum(
                 model.production[node_id, prod, t]
                 for (node_id, prod, t) in model.production
             )
-            print(f"  Production cost: ${prod_cost_per_unit:.2f}/unit")
+            print(f"  Production cost: ${value(prod_cost_per_unit):.2f}/unit")
 
         # HOLDING COST (via integer pallets - drives turnover/freshness)
+        # Daily costs are charged for every day of a (possibly multi-day) period
         holding_cost = 0
 
         if self.use_pallet_tracking and hasattr(model, 'pallet_count'):
@@ -3033,11 +4069,24 @@ class SlidingWindowModel(BaseOptimizationModel):
             ambient_daily_cost = self.cost_structure.storage_cost_per_pallet_day_ambient or 0
             ambient_fixed_cost = self.cost_structure.storage_cost_fixed_per_pallet_ambient or 0
 
+            if mutable:
+                holding_cost += sum(
+                    model.cost_rate['storage_cost_per_pallet_day_frozen'] * self.period_days[t] * model.pallet_count[node_id, prod, 'frozen', t]
+                    for (node_id, prod, state, t) in model.pallet_count
+                    if state == 'frozen'
+                )
+                holding_cost += sum(
+                    model.cost_rate['storage_cost_per_pallet_day_ambient'] * self.period_days[t] * model.pallet_count[node_id, prod, 'ambient', t]
+                    for (node_id, prod, state, t) in model.pallet_count
+                    if state == 'ambient'
+                )
+                print(f"  Pallet daily costs: mutable (model.cost_rate)")
+
             if frozen_daily_cost > 0 or frozen_fixed_cost > 0:
                 # Daily cost: Applied every day to every pallet
-                if frozen_daily_cost > 0:
+                if frozen_daily_cost > 0 and not mutable:
                     holding_cost += sum(
-                        frozen_daily_cost * model.pallet_count[node_id, prod, 'frozen', t]
+                        frozen_daily_cost * self.period_days[t] * model.pallet_count[node_id, prod, 'frozen', t]
                         for (node_id, prod, state, t) in model.pallet_count
                         if state == 'frozen'
                     )
@@ -3055,9 +4104,9 @@ class SlidingWindowModel(BaseOptimizationModel):
 
             if ambient_daily_cost > 0 or ambient_fixed_cost > 0:
                 # Daily cost: Applied every day to every pallet
-                if ambient_daily_cost > 0:
+                if ambient_daily_cost > 0 and not mutable:
                     holding_cost += sum(
-                        ambient_daily_cost * model.pallet_count[node_id, prod, 'ambient', t]
+                        ambient_daily_cost * self.period_days[t] * model.pallet_count[node_id, prod, 'ambient', t]
                         for (node_id, prod, state, t) in model.pallet_count
                         if state == 'ambient'
                     )
@@ -3077,11 +4126,13 @@ class SlidingWindowModel(BaseOptimizationModel):
         shortage_cost = 0
         if self.allow_shortages and hasattr(model, 'shortage'):
             penalty = self.cost_structure.shortage_penalty_per_unit
+            if mutable:
+                penalty = model.cost_rate['shortage_penalty_per_unit']
             shortage_cost = quicksum(
                 penalty * model.shortage[node_id, prod, t]
                 for (node_id, prod, t) in model.shortage
             )
-            print(f"  Shortage penalty: ${penalty:.2f}/unit")
+            print(f"  Shortage penalty: ${value(penalty):.2f}/unit")
 
         # DISPOSAL COST (for expired initial inventory)
         # MIP Technique: Penalty ensures disposal only when inventory truly expires
@@ -3091,6 +4142,8 @@ class SlidingWindowModel(BaseOptimizationModel):
         if hasattr(model, 'disposal'):
             # Set disposal penalty HIGHER than shortage penalty to prevent pathological solution
             shortage_penalty = self.cost_structure.shortage_penalty_per_unit if self.allow_shortages else 1000.0
+            if mutable and self.allow_shortages:
+                shortage_penalty = model.cost_rate['shortage_penalty_per_unit']
             disposal_penalty = shortage_penalty * 1.5  # 50% higher than shortage
 
             # Rationale: Disposing good inventory is worse than having a shortage
@@ -3099,13 +4152,13 @@ class SlidingWindowModel(BaseOptimizationModel):
                 disposal_penalty * model.disposal[node_id, prod, state, t]
                 for (node_id, prod, state, t) in model.disposal
             )
-            print(f"  Disposal penalty: ${disposal_penalty:.2f}/unit (> shortage ${shortage_penalty:.2f}/unit)")
+            print(f"  Disposal penalty: ${value(disposal_penalty):.2f}/unit (> shortage ${value(shortage_penalty):.2f}/unit)")
 
         # LABOR COST (piecewise: fixed hours FREE, overtime/weekend charged)
         labor_cost = 0
         if hasattr(model, 'labor_hours_used') and hasattr(model, 'overtime_hours'):
             for (node_id, t) in model.labor_hours_used:
-                labor_day = self.labor_calendar.get_labor_day(t)
+                labor_day = self._period_labor(t)
                 if labor_day:
                     fixed_hours = labor_day.fixed_hours if hasattr(labor_day, 'fixed_hours') else 0
 
@@ -3115,6 +4168,9 @@ class SlidingWindowModel(BaseOptimizationModel):
                         # Use overtime_hours variable (properly bounded >= 0)
                         overtime_rate = labor_day.overtime_rate if hasattr(labor_day, 'overtime_rate') else 660.0
                         labor_cost += overtime_rate * model.overtime_hours[node_id, t]
+                        if self._is_mixed_period(labor_day) and (node_id, t) in model.labor_hours_paid:
+                            # Aggregated period with weekend days: their hours at non_fixed_rate
+                            labor_cost += labor_day.non_fixed_rate * model.labor_hours_paid[node_id, t]
                     else:
                         # Weekend/holiday: ALL hours charged at non_fixed_rate
                         # Use labor_hours_paid (includes 4-hour minimum if producing)
@@ -3132,8 +4188,10 @@ class SlidingWindowModel(BaseOptimizationModel):
         if hasattr(model, 'in_transit'):
             for (origin, dest, prod, departure_date, state) in model.in_transit:
                 # Find route cost
-                route = next((r for r in self.routes if r.origin_node_id == origin and r.destination_node_id == dest), None)
-                if route and hasattr(route, 'cost_per_unit') and route.cost_per_unit:
+                route = self.route_by_pair.get((origin, dest))
+                if mutable and route:
+                    transport_cost += model.route_cost_per_unit[origin, dest] * model.in_transit[origin, dest, prod, departure_date, state]
+                elif route and hasattr(route, 'cost_per_unit') and route.cost_per_unit:
                     transport_cost += route.cost_per_unit * model.in_transit[origin, dest, prod, departure_date, state]
             # Note: Can't check if transport_cost > 0 (it's a Pyomo expression)
             print(f"  Transport cost: route costs included")
@@ -3145,22 +4203,26 @@ class SlidingWindowModel(BaseOptimizationModel):
         if hasattr(model, 'product_start'):
             # Direct changeover cost ($)
             changeover_cost_per_start = getattr(self.cost_structure, 'changeover_cost_per_start', 0) or 0
-            if changeover_cost_per_start > 0:
+            if mutable:
+                changeover_cost_per_start = model.cost_rate['changeover_cost_per_start']
+            if mutable or changeover_cost_per_start > 0:
                 changeover_cost = changeover_cost_per_start * sum(
                     model.product_start[node_id, prod, t]
                     for (node_id, prod, t) in model.product_start
                 )
-                print(f"  Changeover cost: ${changeover_cost_per_start:.2f} per start")
+                print(f"  Changeover cost: ${value(changeover_cost_per_start):.2f} per start")
 
             # Changeover waste (yield loss in units)
             changeover_waste_units = getattr(self.cost_structure, 'changeover_waste_units', 0) or 0
             if changeover_waste_units > 0:
                 production_cost_per_unit = self.cost_structure.production_cost_per_unit or 0
+                if mutable:
+                    production_cost_per_unit = model.cost_rate['production_cost_per_unit']
                 changeover_waste_cost = production_cost_per_unit * changeover_waste_units * sum(
                     model.product_start[node_id, prod, t]
                     for (node_id, prod, t) in model.product_start
                 )
-                print(f"  Changeover waste: {changeover_waste_units:.0f} units per start × ${production_cost_per_unit:.2f}/unit = ${production_cost_per_unit * changeover_waste_units:.2f} per start")
+                print(f"  Changeover waste: {changeover_waste_units:.0f} units per start × ${value(production_cost_per_unit):.2f}/unit = ${value(production_cost_per_unit) * changeover_waste_units:.2f} per start")
 
         # WASTE COST (end-of-horizon inventory + in-transit)
         # Pipeline inventory tracking: Both inventory at locations AND goods in transit count as waste
@@ -3168,54 +4230,50 @@ class SlidingWindowModel(BaseOptimizationModel):
         waste_multiplier = self.cost_structure.waste_cost_multiplier or 0
 
         # CRITICAL DIAGNOSTIC (2025-11-05): Debug why end inventory is high despite waste cost
-        print(f"  DEBUG WASTE COST:")
-        print(f"    cost_structure.waste_cost_multiplier = {self.cost_structure.waste_cost_multiplier}")
-        print(f"    After 'or 0' = {waste_multiplier}")
-        print(f"    Type: {type(waste_multiplier)}")
-        print(f"    Condition (waste_multiplier > 0): {waste_multiplier > 0}")
-        print(f"    hasattr(model, 'inventory'): {hasattr(model, 'inventory')}")
+        debug = self.build_diagnostics
+        if debug:
+            print(f"  DEBUG WASTE COST:")
+            print(f"    cost_structure.waste_cost_multiplier = {self.cost_structure.waste_cost_multiplier}")
+            print(f"    After 'or 0' = {waste_multiplier}")
+            print(f"    Type: {type(waste_multiplier)}")
+            print(f"    Condition (waste_multiplier > 0): {waste_multiplier > 0}")
+            print(f"    hasattr(model, 'inventory'): {hasattr(model, 'inventory')}")
 
         if waste_multiplier > 0 and hasattr(model, 'inventory'):
-            print(f"    ✅ ENTERED waste cost block")
-
             # Calculate end-of-horizon inventory (at locations)
             last_date = max(model.dates)
-            print(f"    Last date: {last_date}")
-
-            # Count how many inventory vars at last date
-            num_end_vars = sum(1 for (n,p,s,t) in model.inventory if t == last_date)
-            print(f"    Inventory variables at last date: {num_end_vars}")
 
             end_inventory = sum(
                 model.inventory[node_id, prod, state, last_date]
                 for (node_id, prod, state, t) in model.inventory
                 if t == last_date
             )
-            print(f"    end_inventory expression created (Pyomo sum)")
 
             # Calculate end-of-horizon in-transit (goods departing on last day)
             # These goods are in the pipeline and will deliver after planning horizon ends
             end_in_transit = 0
             if hasattr(model, 'in_transit'):
-                num_in_transit_end = sum(1 for (o,d,p,t,s) in model.in_transit if t == last_date)
-                print(f"    In-transit variables departing on last date: {num_in_transit_end}")
-
                 end_in_transit = sum(
                     model.in_transit[origin, dest, prod, last_date, state]
                     for (origin, dest, prod, departure_date, state) in model.in_transit
                     if departure_date == last_date
                 )
-                print(f"    end_in_transit expression created (Pyomo sum)")
+
+            if debug:
+                print(f"    ✅ ENTERED waste cost block")
+                print(f"    Last date: {last_date}")
+                print(f"    Inventory variables at last date: {sum(1 for (n,p,s,t) in model.inventory if t == last_date)}")
+                if hasattr(model, 'in_transit'):
+                    print(f"    In-transit variables departing on last date: {sum(1 for (o,d,p,t,s) in model.in_transit if t == last_date)}")
 
             prod_cost = self.cost_structure.production_cost_per_unit or 1.3
+            if mutable:
+                prod_cost = model.cost_rate['production_cost_per_unit']
             waste_cost = waste_multiplier * prod_cost * (end_inventory + end_in_transit)
+            prod_cost = value(prod_cost)
 
             print(f"  Waste cost: ${waste_multiplier * prod_cost:.2f}/unit × (end_inventory + end_in_transit)")
-            print(f"    Coefficient: ${waste_multiplier * prod_cost:.2f}/unit")
-            print(f"    Expression type: {type(waste_cost)}")
-            print(f"    If end_inventory=32,751, waste would be ${waste_multiplier * prod_cost * 32751:.2f}")
-            print(f"    ✅ WASTE COST EXPRESSION CREATED - WILL BE IN OBJECTIVE")
-        else:
+        elif debug:
             print(f"    ❌ SKIPPED waste cost block!")
             print(f"       waste_multiplier > 0: {waste_multiplier > 0}")
             print(f"       hasattr inventory: {hasattr(model, 'inventory')}")
@@ -3270,36 +4328,30 @@ class SlidingWindowModel(BaseOptimizationModel):
         """
         from pyomo.core.base import value
 
+        # All primal values in one read (HiGHS column array when the solver is
+        # at hand, else loaded Pyomo values); tables are keyed like the Vars
+        primals = PrimalValues(model, solver=self.primal_solver)
+
+        def table(name):
+            return primals.table(getattr(model, name)) if hasattr(model, name) else None
+
         solution = {}
 
         # Extract production
         production_by_date_product = {}
-        if hasattr(model, 'production'):
-            for (node_id, prod, t) in model.production:
-                var = model.production[node_id, prod, t]
-                try:
-                    # Try getting value directly
-                    if hasattr(var, 'value') and var.value is not None:
-                        qty = var.value
-                    else:
-                        qty = value(var)  # Use Pyomo value() function
-
-                    if qty and abs(qty) > 0.01:
-                        production_by_date_product[(node_id, prod, t)] = qty
-                except (ValueError, AttributeError, TypeError):
-                    # Variable has no value or is uninitialized - try returning 0
-                    try:
-                        qty = value(var)
-                        if qty is None:
-                            qty = 0
-                        if abs(qty) > 0.01:
-                            production_by_date_product[(node_id, prod, t)] = qty
-                    except:
-                        pass  # Give up on this variable
+        production = table('production')
+        if production is not None:
+            production_by_date_product = production.nonzero(0.01, absolute=True)
 
         solution['production_by_date_product'] = production_by_date_product
         solution['total_production'] = sum(production_by_date_product.values())
 
+        # Aggregated periods: daily production for reporting (period totals spread by daily demand)
+        if self.periods.is_aggregated:
+            solution['production_by_date_product_daily'] = self.periods.disaggregate_production(
+                production_by_date_product, self.forecast
+            )
+
         # DIAGNOSTIC: Log production extraction
         logger.info(f"Extracted {len(production_by_date_product)} production entries, total: {solution['total_production']:.0f} units")
         if len(production_by_date_product) == 0:
@@ -3308,22 +4360,11 @@ class SlidingWindowModel(BaseOptimizationModel):
                 logger.info(f"model.production index size: {len(model.production)}")
 
                 # Check if ANY production variables have non-zero values
-                non_zero_count = 0
-                sample_values = []
-                for key in list(model.production.keys())[:20]:  # Check first 20
-                    try:
-                        val = value(model.production[key])
-                        if val and abs(val) > 0.01:
-                            non_zero_count += 1
-                            if len(sample_values) < 5:
-                                sample_values.append((key, val))
-                    except:
-                        pass
-
-                logger.info(f"Non-zero production variables found: {non_zero_count}")
-                if sample_values:
+                non_zero = production.nonzero(0.01)
+                logger.info(f"Non-zero production variables found: {len(non_zero)}")
+                if non_zero:
                     logger.info(f"Sample production values:")
-                    for key, val in sample_values:
+                    for key, val in list(non_zero.items())[:5]:
                         logger.info(f"  production{key} = {val:.2f}")
                 else:
                     logger.error("All production variables are ZERO! This confirms zero production solution.")
@@ -3343,53 +4384,20 @@ class SlidingWindowModel(BaseOptimizationModel):
         logger.info(f"Created {len(production_batches)} production batch entries for Pydantic solution")
 
         # Extract inventory by state
-        inventory_by_state = {}
-        if hasattr(model, 'inventory'):
-            for (node_id, prod, state, t) in model.inventory:
-                try:
-                    qty = value(model.inventory[node_id, prod, state, t])
-                    if qty and qty > 0.01:
-                        inventory_by_state[(node_id, prod, state, t)] = qty
-                except:
-                    pass
+        inventory = table('inventory')
+        inventory_by_state = inventory.nonzero(0.01) if inventory is not None else {}
 
         solution['inventory'] = inventory_by_state
 
         # Extract state transitions
-        thaw_flows = {}
-        freeze_flows = {}
-        if hasattr(model, 'thaw'):
-            for (node_id, prod, t) in model.thaw:
-                try:
-                    qty = value(model.thaw[node_id, prod, t])
-                    if qty and qty > 0.01:
-                        thaw_flows[(node_id, prod, t)] = qty
-                except:
-                    pass
-
-        if hasattr(model, 'freeze'):
-            for (node_id, prod, t) in model.freeze:
-                try:
-                    qty = value(model.freeze[node_id, prod, t])
-                    if qty and qty > 0.01:
-                        freeze_flows[(node_id, prod, t)] = qty
-                except:
-                    pass
-
-        solution['thaw_flows'] = thaw_flows
-        solution['freeze_flows'] = freeze_flows
+        thaw, freeze = table('thaw'), table('freeze')
+        solution['thaw_flows'] = thaw.nonzero(0.01) if thaw is not None else {}
+        solution['freeze_flows'] = freeze.nonzero(0.01) if freeze is not None else {}
 
         # Extract disposal flows (expired inventory removed from system)
         # Key: (node_id, product_id, state, date) - includes state for FEFO processing
-        disposal_flows = {}
-        if hasattr(model, 'disposal'):
-            for (node_id, prod, state, t) in model.disposal:
-                try:
-                    qty = value(model.disposal[node_id, prod, state, t])
-                    if qty and qty > 0.01:
-                        disposal_flows[(node_id, prod, state, t)] = qty
-                except:
-                    pass
+        disposal = table('disposal')
+        disposal_flows = disposal.nonzero(0.01) if disposal is not None else {}
 
         solution['disposal_flows'] = disposal_flows
 
@@ -3399,44 +4407,28 @@ class SlidingWindowModel(BaseOptimizationModel):
         skipped_post_horizon = 0  # Counter for post-horizon shipments filtered out
         last_date = max(model.dates)  # Planning horizon end
 
-        if hasattr(model, 'in_transit'):
-            for (origin, dest, prod, departure_date, state) in model.in_transit:
-                try:
-                    var = model.in_transit[origin, dest, prod, departure_date, state]
-
-                    # Check if variable has a value assigned (skip uninitialized)
-                    # Pyomo variables have .stale attribute: True if not assigned by solver
-                    if hasattr(var, 'stale') and var.stale:
-                        continue  # Skip - solver didn't assign this variable
+        in_transit = table('in_transit')
+        if in_transit is not None:
+            for (origin, dest, prod, departure_date, state), qty in in_transit.nonzero(0.01).items():
+                # Calculate delivery date for UI compatibility
+                route = self.route_by_pair.get((origin, dest))
+                if route:
+                    # (arrival period when periods are aggregated; None beyond horizon)
+                    delivery_date = self._arrival_date(departure_date, self._offset_days(route))
+
+                    # CRITICAL FIX (2025-11-05): Filter post-horizon shipments
+                    # Model has NO demand beyond last_date
+                    # Shipments delivering after horizon serve no purpose → don't extract
+                    # (Goods stay as end-inventory, penalized by waste cost)
+                    if delivery_date is None or delivery_date > last_date:
+                        # Don't extract as shipment - serves no known demand
+                        skipped_post_horizon += 1
+                        logger.debug(f"Skipping post-horizon: {origin}→{dest} {prod[:30]} delivers {delivery_date} > {last_date}")
+                        continue
 
-                    # Safe value extraction
-                    if hasattr(var, 'value') and var.value is not None:
-                        qty = var.value
-                    else:
-                        continue  # No value, skip
-
-                    if qty and qty > 0.01:
-                        # Calculate delivery date for UI compatibility
-                        route = next((r for r in self.routes if r.origin_node_id == origin and r.destination_node_id == dest), None)
-                        if route:
-                            delivery_date = departure_date + timedelta(days=route.transit_days)
-
-                            # CRITICAL FIX (2025-11-05): Filter post-horizon shipments
-                            # Model has NO demand beyond last_date
-                            # Shipments delivering after horizon serve no purpose → don't extract
-                            # (Goods stay as end-inventory, penalized by waste cost)
-                            if delivery_date > last_date:
-                                # Don't extract as shipment - serves no known demand
-                                skipped_post_horizon += 1
-                                logger.debug(f"Skipping post-horizon: {origin}→{dest} {prod[:30]} delivers {delivery_date} > {last_date}")
-                                continue
-
-                            # Aggregate by route (ignoring state for UI simplicity)
-                            route_key = (origin, dest, prod, delivery_date)
-                            shipments_by_route[route_key] = shipments_by_route.get(route_key, 0) + qty
-                except (ValueError, AttributeError, TypeError):
-                    # Uninitialized variable - not used in solution, skip
-                    pass
+                    # Aggregate by route (ignoring state for UI simplicity)
+                    route_key = (origin, dest, prod, delivery_date)
+                    shipments_by_route[route_key] = shipments_by_route.get(route_key, 0) + qty
 
         solution['shipments_by_route_product_date'] = shipments_by_route
         logger.info(f"Extracted {len(shipments_by_route)} in-transit flows (converted to delivery dates)")
@@ -3445,92 +4437,94 @@ class SlidingWindowModel(BaseOptimizationModel):
 
         # Extract truck assignments (if truck pallet tracking enabled)
         truck_assignments = {}  # {(origin, dest, product, delivery_date): truck_id}
-        if hasattr(model, 'truck_pallet_load'):
-            for (truck_idx, dest, prod, delivery_date) in model.truck_pallet_load:
-                try:
-                    var = model.truck_pallet_load[truck_idx, dest, prod, delivery_date]
-                    if hasattr(var, 'stale') and var.stale:
-                        continue
+        truck_pallet_load = table('truck_pallet_load')
+        if truck_pallet_load is not None:
+            # Origin of each delivered (dest, product, date): first in model.nodes order
+            node_rank = {node_id: i for i, node_id in enumerate(model.nodes)}
+            origin_of = {}
+            for (origin, dest, prod, delivery_date), qty in shipments_by_route.items():
+                delivery = (dest, prod, delivery_date)
+                if qty <= 0 or origin not in node_rank:
+                    continue
+                if delivery not in origin_of or node_rank[origin] < node_rank[origin_of[delivery]]:
+                    origin_of[delivery] = origin
 
-                    pallets = value(var) if hasattr(var, 'value') and var.value is not None else 0
-                    if pallets and pallets > 0.01:
-                        # This shipment is assigned to this truck
-                        # Convert truck_idx to actual truck ID
-                        truck_id = self.truck_schedules[truck_idx].id if truck_idx < len(self.truck_schedules) else str(truck_idx)
-
-                        # Need to find origin for this dest
-                        for origin in model.nodes:
-                            route_key = (origin, dest, prod, delivery_date)
-                            if route_key in shipments_by_route and shipments_by_route[route_key] > 0:
-                                truck_assignments[route_key] = truck_id
-                                break
-                except:
-                    pass
+            for (truck_idx, dest, prod, delivery_date) in truck_pallet_load.nonzero(0.01):
+                origin = origin_of.get((dest, prod, delivery_date))
+                if origin is None:
+                    continue
+                # Convert truck_idx to actual truck ID
+                truck_id = self.truck_schedules[truck_idx].id if truck_idx < len(self.truck_schedules) else str(truck_idx)
+                truck_assignments[(origin, dest, prod, delivery_date)] = truck_id
 
         solution['truck_assignments'] = truck_assignments
 
         # Extract labor hours by date (for UI)
         labor_hours_by_date = {}
         labor_cost_by_date = {}
-        if hasattr(model, 'labor_hours_used'):
-            for (node_id, t) in model.labor_hours_used:
-                try:
-                    hours_used = value(model.labor_hours_used[node_id, t])
-                    if hours_used and hours_used > 0.01:
-                        # Extract paid hours (may differ from used due to 4h minimum)
-                        hours_paid = hours_used
-                        if hasattr(model, 'labor_hours_paid') and (node_id, t) in model.labor_hours_paid:
-                            hours_paid = value(model.labor_hours_paid[node_id, t])
-
-                        # Store as LaborHoursBreakdown with both used and paid
-                        from .result_schema import LaborHoursBreakdown
-                        labor_hours_by_date[t] = LaborHoursBreakdown(
-                            used=hours_used,
-                            paid=hours_paid,
-                            fixed=0.0,
-                            overtime=0.0,
-                            non_fixed=hours_paid
-                        )
+        labor_hours_used = table('labor_hours_used')
+        if labor_hours_used is not None:
+            from .result_schema import LaborHoursBreakdown
+            labor_hours_paid = table('labor_hours_paid')
+            overtime_hours = table('overtime_hours')
+            for (node_id, t), hours_used in labor_hours_used.nonzero(0.01).items():
+                # Extract paid hours (may differ from used due to 4h minimum)
+                hours_paid = hours_used
+                if labor_hours_paid is not None:
+                    hours_paid = labor_hours_paid.get((node_id, t), hours_used)
+
+                labor_day = self._period_labor(t)
+                if self._is_mixed_period(labor_day):
+                    # Weekdays + weekend: labor_hours_paid only covers the non-fixed
+                    # hours beyond the period's fixed hours and overtime
+                    period_overtime = overtime_hours.get((node_id, t)) if overtime_hours is not None else None
+                    period_overtime = period_overtime or 0.0
+                    labor_hours_by_date[t] = LaborHoursBreakdown(
+                        used=hours_used,
+                        paid=labor_day.fixed_hours + period_overtime + hours_paid,
+                        fixed=labor_day.fixed_hours,
+                        overtime=period_overtime,
+                        non_fixed=hours_paid
+                    )
+                else:
+                    # Store as LaborHoursBreakdown with both used and paid
+                    labor_hours_by_date[t] = LaborHoursBreakdown(
+                        used=hours_used,
+                        paid=hours_paid,
+                        fixed=0.0,
+                        overtime=0.0,
+                        non_fixed=hours_paid
+                    )
 
-                        # Calculate labor cost (match objective calculation)
-                        labor_day = self.labor_calendar.get_labor_day(t)
-                        if labor_day:
-                            fixed_hours = labor_day.fixed_hours if hasattr(labor_day, 'fixed_hours') else 0
-
-                            if fixed_hours > 0:
-                                # Weekday: only overtime costs
-                                if (node_id, t) in model.overtime_hours:
-                                    overtime = value(model.overtime_hours[node_id, t])
-                                    overtime_rate = labor_day.overtime_rate if hasattr(labor_day, 'overtime_rate') else 660.0
-                                    labor_cost_by_date[t] = overtime * overtime_rate
-                                else:
-                                    labor_cost_by_date[t] = 0.0
-                            else:
-                                # Weekend: use paid hours (includes 4-hour minimum)
-                                non_fixed_rate = labor_day.non_fixed_rate if hasattr(labor_day, 'non_fixed_rate') else 1320.0
-                                labor_cost_by_date[t] = hours_paid * non_fixed_rate
+                # Calculate labor cost (match objective calculation)
+                if labor_day:
+                    fixed_hours = labor_day.fixed_hours if hasattr(labor_day, 'fixed_hours') else 0
+
+                    if fixed_hours > 0:
+                        # Weekday: only overtime costs
+                        overtime = overtime_hours.get((node_id, t)) if overtime_hours is not None else None
+                        if overtime is not None:
+                            overtime_rate = labor_day.overtime_rate if hasattr(labor_day, 'overtime_rate') else 660.0
+                            labor_cost_by_date[t] = overtime * overtime_rate
                         else:
                             labor_cost_by_date[t] = 0.0
-                except:
-                    pass
+                        if self._is_mixed_period(labor_day):
+                            labor_cost_by_date[t] += hours_paid * (labor_day.non_fixed_rate or 0)
+                    else:
+                        # Weekend: use paid hours (includes 4-hour minimum)
+                        non_fixed_rate = labor_day.non_fixed_rate if hasattr(labor_day, 'non_fixed_rate') else 1320.0
+                        labor_cost_by_date[t] = hours_paid * (non_fixed_rate or 0)
+                else:
+                    labor_cost_by_date[t] = 0.0
 
         solution['labor_hours_by_date'] = labor_hours_by_date
         solution['labor_cost_by_date'] = labor_cost_by_date
         logger.info(f"Extracted labor hours for {len(labor_hours_by_date)} dates")
 
         # Extract shortages
-        total_shortage = 0
-        shortages_by_location = {}
-        if hasattr(model, 'shortage'):
-            for (node_id, prod, t) in model.shortage:
-                try:
-                    var = model.shortage[node_id, prod, t]
-                    qty = value(var)  # Don't check .stale
-                    if qty and qty > 0.01:
-                        shortages_by_location[(node_id, prod, t)] = qty
-                        total_shortage += qty
-                except (ValueError, AttributeError):
-                    pass
+        shortage = table('shortage')
+        shortages_by_location = shortage.nonzero(0.01) if shortage is not None else {}
+        total_shortage = sum(shortages_by_location.values())
 
         solution['shortages'] = shortages_by_location
         solution['total_shortage_units'] = total_shortage
@@ -3539,29 +4533,15 @@ class SlidingWindowModel(BaseOptimizationModel):
         # CRITICAL FIX (2025-11-05): Aggregate consumption from BOTH states
         demand_consumed_by_location = {}
         if hasattr(model, 'demand_consumed_from_ambient') and hasattr(model, 'demand_consumed_from_thawed'):
-            for (node_id, prod, t) in model.demand_consumed_from_ambient:
-                try:
-                    # Get consumption from both states
-                    consumed_ambient = value(model.demand_consumed_from_ambient[node_id, prod, t])
-                    consumed_thawed = value(model.demand_consumed_from_thawed[node_id, prod, t])
+            consumed_ambient = table('demand_consumed_from_ambient')
+            consumed_thawed = table('demand_consumed_from_thawed')
 
-                    # Total consumption for UI display
-                    total_consumed = consumed_ambient + consumed_thawed
-
-                    if total_consumed > 0.01:
-                        demand_consumed_by_location[(node_id, prod, t)] = total_consumed
-                except (ValueError, AttributeError):
-                    pass
+            # Total consumption for UI display (NaN where either state has no value)
+            total_consumed = consumed_ambient.values + consumed_thawed.align(consumed_ambient.keys)
+            demand_consumed_by_location = PrimalTable(consumed_ambient.keys, total_consumed).nonzero(0.01)
         elif hasattr(model, 'demand_consumed'):
             # Fallback for backward compatibility (old models without state-specific vars)
-            for (node_id, prod, t) in model.demand_consumed:
-                try:
-                    var = model.demand_consumed[node_id, prod, t]
-                    qty = value(var)
-                    if qty and qty > 0.01:
-                        demand_consumed_by_location[(node_id, prod, t)] = qty
-                except (ValueError, AttributeError):
-                    pass
+            demand_consumed_by_location = table('demand_consumed').nonzero(0.01)
 
         solution['demand_consumed'] = demand_consumed_by_location
         logger.info(f"Extracted demand consumed for {len(demand_consumed_by_location)} demand entries")
@@ -3591,8 +4571,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Transport cost (from routes if available)
         total_transport = 0
         for (origin, dest, prod, delivery_date), qty in shipments_by_route.items():
-            route = next((r for r in self.routes
-                         if r.origin_node_id == origin and r.destination_node_id == dest), None)
+            route = self.route_by_pair.get((origin, dest))
             if route and hasattr(route, 'cost_per_unit'):
                 total_transport += route.cost_per_unit * qty
         solution['total_transport_cost'] = total_transport
@@ -3625,16 +4604,14 @@ class SlidingWindowModel(BaseOptimizationModel):
                 pallet_days_frozen = 0
                 pallet_days_ambient = 0
 
-                for (node_id, prod, state, t) in model.pallet_count:
-                    # Use exception=False to avoid error messages for uninitialized vars
-                    pallets = value(model.pallet_count[node_id, prod, state, t], exception=False)
-                    if pallets is not None and pallets > 0.01:
-                        if state == 'frozen':
-                            solution['frozen_holding_cost'] += pallets * frozen_cost_per_pallet_day
-                            pallet_days_frozen += pallets
-                        elif state in ['ambient', 'thawed']:
-                            solution['ambient_holding_cost'] += pallets * ambient_cost_per_pallet_day
-                            pallet_days_ambient += pallets
+                for (node_id, prod, state, t), pallets in table('pallet_count').nonzero(0.01).items():
+                    pallets *= self.period_days[t]  # Pallet-days over the period
+                    if state == 'frozen':
+                        solution['frozen_holding_cost'] += pallets * frozen_cost_per_pallet_day
+                        pallet_days_frozen += pallets
+                    elif state in ['ambient', 'thawed']:
+                        solution['ambient_holding_cost'] += pallets * ambient_cost_per_pallet_day
+                        pallet_days_ambient += pallets
 
                 solution['total_holding_cost'] = solution['frozen_holding_cost'] + solution['ambient_holding_cost']
 
@@ -3655,13 +4632,11 @@ class SlidingWindowModel(BaseOptimizationModel):
                 ambient_fixed_cost = getattr(self.cost_structure, 'storage_cost_fixed_per_pallet_ambient', 0) or 0
 
                 pallet_entry_cost = 0
-                for (node_id, prod, state, t) in model.pallet_entry:
-                    entries = value(model.pallet_entry[node_id, prod, state, t], exception=False)
-                    if entries is not None and entries > 0.01:
-                        if state == 'frozen':
-                            pallet_entry_cost += entries * frozen_fixed_cost
-                        elif state in ['ambient', 'thawed']:
-                            pallet_entry_cost += entries * ambient_fixed_cost
+                for (node_id, prod, state, t), entries in table('pallet_entry').nonzero(0.01).items():
+                    if state == 'frozen':
+                        pallet_entry_cost += entries * frozen_fixed_cost
+                    elif state in ['ambient', 'thawed']:
+                        pallet_entry_cost += entries * ambient_fixed_cost
 
                 # Add pallet entry costs to holding costs
                 solution['total_holding_cost'] += pallet_entry_cost
@@ -3679,11 +4654,7 @@ class SlidingWindowModel(BaseOptimizationModel):
                 changeover_waste_units = getattr(self.cost_structure, 'changeover_waste_units', 0) or 0
                 production_cost_per_unit = self.cost_structure.production_cost_per_unit or 0
 
-                total_starts = 0
-                for (node_id, prod, t) in model.product_start:
-                    val = value(model.product_start[node_id, prod, t], exception=False)
-                    if val is not None and val > 0.01:
-                        total_starts += val
+                total_starts = table('product_start').total(threshold=0.01)
 
                 solution['total_changeover_cost'] = changeover_cost_per_start * total_starts
                 solution['total_changeover_waste_cost'] = production_cost_per_unit * changeover_waste_units * total_starts
@@ -3698,12 +4669,9 @@ class SlidingWindowModel(BaseOptimizationModel):
         if waste_multiplier > 0 and hasattr(model, 'inventory'):
             try:
                 last_date = max(model.dates)
-                end_inventory = 0
-                for (node_id, prod, state, t) in model.inventory:
-                    if t == last_date:
-                        val = value(model.inventory[node_id, prod, state, last_date], exception=False)
-                        if val is not None and val > 0.01:
-                            end_inventory += val
+                end_inventory = sum(
+                    qty for (node_id, prod, state, t), qty in inventory_by_state.items() if t == last_date
+                )
                 prod_cost = self.cost_structure.production_cost_per_unit or 1.3
                 solution['total_waste_cost'] = waste_multiplier * prod_cost * end_inventory
             except:
@@ -3931,6 +4899,8 @@ class SlidingWindowModel(BaseOptimizationModel):
         # 7. Preserve legacy dict format fields as extra attributes (needed by FEFO allocator)
         # Pydantic allows extra fields with Extra.allow configuration
         opt_solution.shipments_by_route_product_date = solution_dict.get('shipments_by_route_product_date', {})
+        if 'production_by_date_product_daily' in solution_dict:
+            opt_solution.production_by_date_product_daily = solution_dict['production_by_date_product_daily']
 
         # MANDATORY BUSINESS RULE VALIDATION
         # This catches bugs that made it through the optimization model
@@ -4132,8 +5102,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         # GREEDY with optional weighted age sorting
         # Process shipments chronologically, allocate using weighted or calendar age
         for (origin, dest, prod, delivery_date), qty in sorted(shipments_by_route.items(), key=lambda x: x[0][3]):
-            route = next((r for r in self.routes
-                         if r.origin_node_id == origin and r.destination_node_id == dest), None)
+            route = self.route_by_pair.get((origin, dest))
 
             # Derive state from route transport mode (fixes hardcoded 'ambient' bug)
             if route and hasattr(route, 'transport_mode'):
@@ -4204,7 +5173,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         batch_inventory_serialized = {}
         for (node_id, product_id, state), batches in allocator.batch_inventory.items():
             key = f"{node_id}|{product_id}|{state}"  # Serialize tuple to string
-            batch_inventory_serialized[key] = batches
+            batch_inventory_serialized[key] = list(batches)
 
         # Build return dict
         fefo_result = {
@@ -4255,9 +5224,7 @@ class SlidingWindowModel(BaseOptimizationModel):
         # Convert ShipmentResult (Pydantic) → Shipment (legacy model) for UI compatibility
         for idx, shipment_result in enumerate(shipment_results, start=1):
             # Find route for complete path information
-            route = next((r for r in self.routes
-                         if r.origin_node_id == shipment_result.origin and
-                            r.destination_node_id == shipment_result.destination), None)
+            route = self.route_by_pair.get((shipment_result.origin, shipment_result.destination))
 
             if not route:
                 logger.warning(f"No route found for shipment {shipment_result.origin} → {shipment_result.destination}")
@@ -0,0 +1,281 @@
+"""Persistent solve session for fast what-if re-solves.
+
+A regular BaseOptimizationModel.solve() rebuilds the Pyomo model and creates a
+fresh solver on every call. For what-if analysis (bump a demand, change a cost
+rate, cap a truck) almost all of that work is repeated for nothing: the model
+structure is unchanged, only a handful of numbers move.
+
+PersistentSolveSession builds the model ONCE with mutable parameters
+(SlidingWindowModel(mutable_parameters=True)) and keeps one APPSI HiGHS solver
+alive. Changes are written into the Pyomo Params in place; on the next solve
+APPSI pushes only the changed coefficients/bounds to HiGHS, so re-solves skip
+model construction and the Pyomo -> HiGHS translation entirely.
+
+Example:
+    session = PersistentSolveSession(model, time_limit_seconds=120, mip_gap=0.01)
+    base = session.solve()
+
+    session.set_demand('6104', 'HELGAS GFREE MIXED GRAIN 500G', date(2025, 11, 3), 1200)
+    session.set_cost('shortage_penalty_per_unit', 20.0)
+    what_if = session.solve()   # no rebuild
+
+Only values can change. Anything that alters model structure (new demand keys,
+new routes, different horizon) still needs a new model.
+"""
+
+import time
+from datetime import date as Date
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from pyomo.environ import value
+
+from .base_model import OptimizationResult
+
+if TYPE_CHECKING:
+    from .base_model import BaseOptimizationModel
+
+
+class PersistentSolveSession:
+    """Build once, then re-solve in place after parameter changes.
+
+    Attributes:
+        optimization_model: The wrapped model (e.g. SlidingWindowModel)
+        solver: Persistent APPSI HiGHS solver holding the Pyomo model
+        build_count: Number of times the Pyomo model was built (1 for a session)
+        solve_history: Per-solve stats (solve number, changes applied, times, objective)
+    """
+
+    def __init__(
+        self,
+        optimization_model: 'BaseOptimizationModel',
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+        use_warmstart: bool = False,
+        use_aggressive_heuristics: bool = False,
+        tee: bool = False,
+    ):
+        """Build the model with mutable parameters and create the persistent solver.
+
+        Args:
+            optimization_model: Model supporting mutable_parameters (SlidingWindowModel)
+            time_limit_seconds: Default time limit for each solve
+            mip_gap: Default MIP gap for each solve
+            use_warmstart: Pass variable values (previous solution) to HiGHS as a MIP start
+            use_aggressive_heuristics: Enable aggressive MIP heuristics
+            tee: Show solver output
+
+        Raises:
+            ValueError: If the model does not support mutable parameters
+        """
+        if not hasattr(optimization_model, 'mutable_parameters'):
+            raise ValueError(
+                f"{type(optimization_model).__name__} does not support mutable parameters; "
+                f"a persistent solve session needs e.g. SlidingWindowModel"
+            )
+
+        self.optimization_model = optimization_model
+        self.tee = tee
+
+        # Build once with every what-if value held in a mutable Param
+        optimization_model.mutable_parameters = True
+        build_start = time.time()
+        optimization_model.model = optimization_model.build_model()
+        optimization_model._build_time = time.time() - build_start
+        self.build_count = 1
+
+        self.solver = optimization_model._create_appsi_highs_solver(
+            time_limit_seconds=time_limit_seconds,
+            mip_gap=mip_gap,
+            use_warmstart=use_warmstart,
+            use_aggressive_heuristics=use_aggressive_heuristics,
+            tee=tee,
+        )
+
+        # Structure never changes inside a session: skip APPSI's scans for new or
+        # removed components and modified constraint/variable/objective expressions.
+        # Param values are re-read on every solve; variable bounds are only
+        # rescanned on a solve that follows a bound change (see set_truck_capacity).
+        update_config = self.solver.update_config
+        update_config.check_for_new_or_removed_constraints = False
+        update_config.check_for_new_or_removed_vars = False
+        update_config.check_for_new_or_removed_params = False
+        update_config.check_for_new_objective = False
+        update_config.update_constraints = False
+        update_config.update_vars = False
+        update_config.update_named_expressions = False
+        update_config.update_objective = False
+        update_config.update_params = True
+
+        self.solve_history: List[Dict[str, Any]] = []
+        self._pending_changes: List[Tuple] = []
+        self._bounds_changed = False
+        self._truck_pallet_vars: Optional[Dict[int, list]] = None
+
+    @property
+    def model(self):
+        """The persistent Pyomo model."""
+        return self.optimization_model.model
+
+    @property
+    def pending_changes(self) -> List[Tuple]:
+        """Changes made since the last solve, as (kind, key, old_value, new_value)."""
+        return list(self._pending_changes)
+
+    def set_demand(self, node_id: str, product_id: str, demand_date: Date, quantity: float):
+        """Change one demand quantity.
+
+        Args:
+            node_id: Demand node
+            product_id: Product
+            demand_date: Demand date
+            quantity: New demand (units)
+
+        Raises:
+            KeyError: If (node, product, date) had no demand when the model was built
+        """
+        key = (node_id, product_id, demand_date)
+        if key not in self.model.demand_qty:
+            raise KeyError(
+                f"No demand parameter for {key}; only demand that existed when the model "
+                f"was built can change in place (new demand keys need a new model)"
+            )
+        old = value(self.model.demand_qty[key])
+        self.model.demand_qty[key] = quantity
+        # Keep the model's demand dict in sync for solution extraction (fill rate, etc.)
+        self.optimization_model.demand[key] = quantity
+        self._pending_changes.append(('demand', key, old, quantity))
+
+    def update_demand(self, updates: Dict[Tuple[str, str, Date], float]):
+        """Change several demand quantities.
+
+        Args:
+            updates: {(node_id, product_id, date): quantity}
+        """
+        for (node_id, product_id, demand_date), quantity in updates.items():
+            self.set_demand(node_id, product_id, demand_date, quantity)
+
+    def set_cost(self, name: str, rate: float):
+        """Change an objective cost rate.
+
+        Args:
+            name: CostStructure field name (one of SlidingWindowModel.MUTABLE_COST_RATES)
+            rate: New value
+
+        Raises:
+            KeyError: If the cost rate is not mutable
+        """
+        if name not in self.model.cost_rate:
+            raise KeyError(
+                f"Cost rate '{name}' is not mutable. "
+                f"Mutable cost rates: {', '.join(self.model.cost_rate.keys())}"
+            )
+        old = value(self.model.cost_rate[name])
+        self.model.cost_rate[name] = rate
+        # Copy rather than mutate: the caller may share the CostStructure
+        self.optimization_model.cost_structure = self.optimization_model.cost_structure.model_copy(
+            update={name: rate}
+        )
+        self._pending_changes.append(('cost', name, old, rate))
+
+    def set_route_cost(self, origin: str, destination: str, cost_per_unit: float):
+        """Change the transport cost per unit of a route.
+
+        Args:
+            origin: Route origin node
+            destination: Route destination node
+            cost_per_unit: New cost per unit shipped
+
+        Raises:
+            KeyError: If no route connects origin -> destination
+        """
+        key = (origin, destination)
+        if key not in self.model.route_cost_per_unit:
+            raise KeyError(f"No route {origin} -> {destination} in the model")
+        old = value(self.model.route_cost_per_unit[key])
+        self.model.route_cost_per_unit[key] = cost_per_unit
+        route_by_pair = self.optimization_model.route_by_pair
+        route_by_pair[key] = route_by_pair[key].model_copy(update={'cost_per_unit': cost_per_unit})
+        self._pending_changes.append(('route_cost', key, old, cost_per_unit))
+
+    def set_truck_capacity(self, truck_idx: int, pallets: int):
+        """Change the pallet capacity of one truck schedule.
+
+        Updates both the truck capacity constraint RHS and the upper bound of
+        that truck's per-product pallet load variables (scaled by the number
+        of departures delivering into the period with aggregated periods).
+
+        Args:
+            truck_idx: Index into the model's truck_schedules
+            pallets: New capacity in pallets
+
+        Raises:
+            KeyError: If the truck index is not in the model
+        """
+        if truck_idx not in self.model.truck_capacity_pallets:
+            raise KeyError(f"No truck schedule with index {truck_idx} in the model")
+        old = value(self.model.truck_capacity_pallets[truck_idx])
+        self.model.truck_capacity_pallets[truck_idx] = pallets
+
+        if hasattr(self.model, 'truck_pallet_load'):
+            if self._truck_pallet_vars is None:
+                load_scale = self.optimization_model._truck_load_scale
+                self._truck_pallet_vars = {}
+                for key, var in self.model.truck_pallet_load.items():
+                    self._truck_pallet_vars.setdefault(key[0], []).append((var, load_scale(key[0], key[3])))
+            for var, scale in self._truck_pallet_vars.get(truck_idx, []):
+                var.setub(pallets * scale)
+            self._bounds_changed = True
+
+        self._pending_changes.append(('truck_capacity', truck_idx, old, pallets))
+
+    def solve(
+        self,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = None,
+    ) -> OptimizationResult:
+        """Solve the persistent model with all changes made since the last solve.
+
+        Args:
+            time_limit_seconds: Override the session time limit for this solve
+            mip_gap: Override the session MIP gap for this solve
+
+        Returns:
+            OptimizationResult (metadata also carries session statistics)
+        """
+        if time_limit_seconds is not None:
+            self.solver.config.time_limit = time_limit_seconds
+        if mip_gap is not None:
+            self.solver.config.mip_gap = mip_gap
+
+        solve_number = len(self.solve_history) + 1
+        changes = self._pending_changes
+        print(f"\nSolve session: solve #{solve_number} ({len(changes)} parameter changes, no rebuild)")
+
+        # First solve hands the whole model to HiGHS; after that only Params
+        # (and variable bounds, if any changed) are pushed
+        self.solver.update_config.update_vars = self._bounds_changed
+
+        start = time.time()
+        result = self.optimization_model._run_appsi_solve(self.solver)
+        total_time = time.time() - start
+
+        self.solver.update_config.update_vars = False
+        self._pending_changes = []
+        self._bounds_changed = False
+
+        stats = {
+            'solve_number': solve_number,
+            'num_changes': len(changes),
+            'solve_time': result.solve_time_seconds,
+            'total_time': total_time,
+            'objective': result.objective_value,
+        }
+        self.solve_history.append(stats)
+
+        result.metadata['solve_session'] = {
+            'solve_number': solve_number,
+            'build_count': self.build_count,
+            'build_time': self.optimization_model._build_time,
+            'num_changes': len(changes),
+        }
+        return result
@@ -0,0 +1,292 @@
+"""HiGHS MIP progress telemetry for long solves.
+
+APPSI only reports termination, objective and bound once HiGHS returns. A
+SolveTelemetry hooks the HiGHS callbacks of the APPSI solver (highspy) and
+records a time series of MIP progress while the solve runs:
+
+- 'incumbent': every improving solution (kCallbackMipImprovingSolution)
+- 'progress': periodic samples while B&B runs (kCallbackMipInterrupt,
+  throttled to sample_interval seconds or a change of incumbent/bound)
+
+Each sample (SolveProgress) has elapsed time, incumbent (primal bound), dual
+bound, relative gap and node count. Samples go to an optional callback as
+they arrive and end up in OptimizationResult.metadata['solve_progress'].
+
+Early stop: the solve is interrupted (keeping the incumbent) when
+- the gap reaches stop_gap after at least stop_gap_after_seconds, or
+- the callback returns True, or
+- request_stop() is called (e.g. from another thread)
+
+Example (callback):
+    telemetry = SolveTelemetry(callback=lambda p: print(p.elapsed, p.gap), stop_gap=0.02)
+    result = model.solve(solver_name='appsi_highs', telemetry=telemetry)
+
+Example (iterator, solve runs in a background thread):
+    telemetry = SolveTelemetry()
+    for progress in telemetry.iter_solve(model, solver_name='appsi_highs', time_limit_seconds=600):
+        print(progress)
+    result = telemetry.result
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional
+import queue
+import threading
+import time
+
+
+# Progress samples while B&B runs: at most one per interval unless bounds move
+DEFAULT_SAMPLE_INTERVAL = 1.0
+
+# HiGHS reports "no bound yet" as +/- kHighsInf
+_HIGHS_INF = 1e30
+
+
+@dataclass(frozen=True)
+class SolveProgress:
+    """One MIP progress sample.
+
+    Attributes:
+        elapsed: Seconds since the solve started (HiGHS running time)
+        event: 'incumbent' (improving solution) or 'progress' (periodic sample)
+        primal_bound: Incumbent objective (None before the first incumbent)
+        dual_bound: Best bound (None before the root LP)
+        gap: Relative gap (None without incumbent)
+        nodes: B&B nodes explored
+    """
+    elapsed: float
+    event: str
+    primal_bound: Optional[float] = None
+    dual_bound: Optional[float] = None
+    gap: Optional[float] = None
+    nodes: Optional[int] = None
+
+
+def _finite(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    value = float(value)
+    return value if abs(value) < _HIGHS_INF else None
+
+
+class SolveTelemetry:
+    """Collects HiGHS MIP progress and interrupts the solve on request.
+
+    Attributes:
+        samples: Progress samples in arrival order
+        stopped_early: True if the solve was interrupted by this telemetry
+        stop_reason: Why it was interrupted
+        supported: False if the HiGHS interface has no callbacks (no samples)
+        result: OptimizationResult of iter_solve()
+    """
+
+    def __init__(
+        self,
+        callback: Optional[Callable[[SolveProgress], Optional[bool]]] = None,
+        stop_gap: Optional[float] = None,
+        stop_gap_after_seconds: float = 0.0,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ):
+        """Configure the telemetry.
+
+        Args:
+            callback: Called with every sample; return True to stop the solve
+            stop_gap: Stop once the relative gap is at or below this value
+            stop_gap_after_seconds: Only apply stop_gap after this many seconds
+            sample_interval: Minimum seconds between periodic 'progress' samples
+        """
+        self.callback = callback
+        self.stop_gap = stop_gap
+        self.stop_gap_after_seconds = stop_gap_after_seconds
+        self.sample_interval = sample_interval
+
+        self.samples: List[SolveProgress] = []
+        self.stopped_early = False
+        self.stop_reason: Optional[str] = None
+        self.supported = True
+        self.result = None
+
+        self._stop_requested: Optional[str] = None
+        self._active = False
+        self._last_sample_time = float('-inf')
+        self._last_bounds = (None, None)
+
+    def request_stop(self, reason: str = "stop requested") -> None:
+        """Interrupt the running solve at the next HiGHS callback (thread-safe)."""
+        self._stop_requested = reason
+
+    # ------------------------------------------------------------------
+    # HiGHS callback plumbing
+    # ------------------------------------------------------------------
+
+    def attach(self, solver: Any, pyomo_model: Any) -> bool:
+        """Register the callbacks on an APPSI Highs solver before solve().
+
+        Loads the model into the solver first if it holds none yet (with the
+        update checks for the next solve() switched off, as for a partial
+        MIP start).
+
+        Args:
+            solver: pyomo.contrib.appsi.solvers.Highs
+            pyomo_model: Model about to be solved
+
+        Returns:
+            True if the callbacks were registered
+        """
+        self._active = True
+        self._last_sample_time = float('-inf')
+        self._last_bounds = (None, None)
+
+        if getattr(solver, '_solver_model', None) is None:
+            solver.set_instance(pyomo_model)
+            update_config = solver.update_config
+            update_config.check_for_new_or_removed_constraints = False
+            update_config.check_for_new_or_removed_vars = False
+            update_config.check_for_new_or_removed_params = False
+            update_config.check_for_new_objective = False
+            update_config.update_constraints = False
+            update_config.update_vars = False
+            update_config.update_params = False
+            update_config.update_named_expressions = False
+            update_config.update_objective = False
+
+        highs = getattr(solver, '_solver_model', None)
+        try:
+            if hasattr(highs, 'cbMipImprovingSolution'):
+                # highspy >= 1.10: event subscriptions
+                highs.cbMipImprovingSolution.subscribe(
+                    lambda e: self._on_event(e, 'incumbent', e.data_out, e.data_in))
+                highs.cbMipInterrupt.subscribe(
+                    lambda e: self._on_event(e, 'progress', e.data_out, e.data_in))
+            else:
+                from highspy import cb
+                callback_type = cb.HighsCallbackType
+                self._improving = int(callback_type.kCallbackMipImprovingSolution)
+                highs.setCallback(self._on_callback, None)
+                highs.startCallback(callback_type.kCallbackMipImprovingSolution)
+                highs.startCallback(callback_type.kCallbackMipInterrupt)
+        except (AttributeError, ImportError, TypeError) as e:
+            print(f"  Solve telemetry unavailable ({e})")
+            self.supported = False
+            return False
+        return True
+
+    def detach(self) -> None:
+        """Stop recording (callbacks registered on a reused solver become no-ops)."""
+        self._active = False
+
+    def _on_callback(self, callback_type, message, data_out, data_in, user_data):
+        event = 'incumbent' if int(callback_type) == self._improving else 'progress'
+        self._on_event(None, event, data_out, data_in)
+
+    def _on_event(self, highs_event, event: str, data_out, data_in) -> None:
+        if not self._active:
+            return
+
+        primal = _finite(getattr(data_out, 'mip_primal_bound', None))
+        dual = _finite(getattr(data_out, 'mip_dual_bound', None))
+        now = time.monotonic()
+        if event == 'progress':
+            if (primal, dual) == self._last_bounds and now - self._last_sample_time < self.sample_interval:
+                return self._check_stop(highs_event, data_in, None)
+
+        gap = _finite(getattr(data_out, 'mip_gap', None)) if primal is not None else None
+        progress = SolveProgress(
+            elapsed=float(getattr(data_out, 'running_time', 0.0)),
+            event=event,
+            primal_bound=primal,
+            dual_bound=dual,
+            gap=gap,
+            nodes=int(getattr(data_out, 'mip_node_count', 0)),
+        )
+        self.samples.append(progress)
+        self._last_sample_time = now
+        self._last_bounds = (primal, dual)
+
+        if self.callback is not None and self.callback(progress):
+            self.request_stop("callback requested stop")
+        self._check_stop(highs_event, data_in, progress)
+
+    def _check_stop(self, highs_event, data_in, progress: Optional[SolveProgress]) -> None:
+        reason = self._stop_requested
+        if reason is None and progress is not None and self.stop_gap is not None:
+            if (progress.gap is not None and progress.gap <= self.stop_gap
+                    and progress.elapsed >= self.stop_gap_after_seconds):
+                reason = f"gap {progress.gap:.2%} <= {self.stop_gap:.2%} after {progress.elapsed:.0f}s"
+        if reason is None:
+            return
+
+        self.stopped_early = True
+        self.stop_reason = reason
+        if highs_event is not None and hasattr(highs_event, 'interrupt'):
+            highs_event.interrupt()
+        else:
+            data_in.user_interrupt = True
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Samples as plain dicts (JSON-friendly, e.g. for pd.DataFrame)."""
+        return [asdict(sample) for sample in self.samples]
+
+    def summary(self) -> Dict[str, Any]:
+        """Stats for OptimizationResult.metadata['solve_progress']."""
+        incumbents = [s for s in self.samples if s.event == 'incumbent']
+        return {
+            'samples': self.records(),
+            'num_incumbents': len(incumbents),
+            'first_incumbent_seconds': incumbents[0].elapsed if incumbents else None,
+            'stopped_early': self.stopped_early,
+            'stop_reason': self.stop_reason,
+            'supported': self.supported,
+        }
+
+    def iter_solve(self, optimization_model: Any, **solve_kwargs) -> Iterator[SolveProgress]:
+        """Run optimization_model.solve() in a background thread and yield samples live.
+
+        The OptimizationResult is stored in self.result when the iterator is
+        exhausted; exceptions from solve() are re-raised there. Stopping the
+        iteration early does not stop the solve - call request_stop() first.
+
+        Args:
+            optimization_model: Model to solve (e.g. SlidingWindowModel)
+            **solve_kwargs: Arguments for solve() (telemetry is set to self)
+
+        Yields:
+            SolveProgress samples in arrival order
+        """
+        samples: 'queue.Queue' = queue.Queue()
+        user_callback = self.callback
+        outcome: Dict[str, Any] = {}
+        done = object()
+
+        def forward(progress: SolveProgress) -> Optional[bool]:
+            samples.put(progress)
+            return user_callback(progress) if user_callback is not None else None
+
+        def run():
+            try:
+                outcome['result'] = optimization_model.solve(telemetry=self, **solve_kwargs)
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                samples.put(done)
+
+        self.callback = forward
+        worker = threading.Thread(target=run, name="solve-telemetry", daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = samples.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            worker.join()
+            self.callback = user_callback
+
+        if 'error' in outcome:
+            raise outcome['error']
+        self.result = outcome.get('result')
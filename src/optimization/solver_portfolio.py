@@ -0,0 +1,568 @@
+"""Solver portfolio: race diverse solver configurations on the same model.
+
+One HiGHS run uses a few threads well; a large planning server has more
+cores than a single B&B search can keep busy. SolverPortfolio compiles the
+built model once (highs_direct.MatrixModel) and starts one process per
+member on the same arrays: HiGHS with different random seeds, heuristic
+effort, presolve and symmetry settings, plus CBC if it is on the PATH.
+Processes are needed because HiGHS's thread pool and options are per
+process. They are spawned, not forked: a forked child would inherit the
+parent's already-initialized HiGHS scheduler (APPSI and LP-first solves run
+HiGHS in the calling process) and the locks of its other threads (Streamlit).
+Each member also resets the HiGHS global scheduler before setting its own
+thread count.
+
+Members share what they can through shared memory:
+
+- the best incumbent objective (every improving HiGHS solution)
+- each member's dual bound
+
+Any bound is valid for the model, so the portfolio gap (best incumbent
+against best bound) can reach the target before any single member proves
+it. A HiGHS member that sees the portfolio gap at or below the target, or
+finishes optimal (within mip_gap), signals stop; the other members stop at
+their next callback and report their incumbents. Members still running
+after a grace period are terminated. Incumbent *solutions* are not injected
+into running searches (HiGHS only accepts a start before run()).
+
+SolverPortfolio mirrors the APPSI interface the solve pipeline uses (config,
+highs_options, solve, load_vars), so _run_appsi_solve extracts the winning
+solution like any HiGHS solve. Select it with solver_name='portfolio'.
+
+Example:
+    result = model.solve(solver_name='portfolio', time_limit_seconds=600, mip_gap=0.01)
+    result.metadata['portfolio']   # per-member status, objective, bound, time
+"""
+
+from dataclasses import dataclass, field
+from multiprocessing import connection
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+import math
+import multiprocessing
+import os
+import shutil
+import signal
+import subprocess
+import tempfile
+import time
+
+import numpy as np
+
+from .highs_direct import MatrixModel, _TERMINATION
+
+
+# HiGHS default mip_rel_gap (target gap when no mip_gap is configured)
+DEFAULT_TARGET_GAP = 1e-4
+
+# Terminations after which racing on is pointless
+_PROVEN = ('optimal', 'infeasible', 'unbounded', 'infeasibleOrUnbounded')
+
+
+@dataclass
+class PortfolioMember:
+    """One solver configuration in the portfolio.
+
+    Attributes:
+        name: Label in logs and result metadata
+        solver: 'highs' or 'cbc'
+        options: HiGHS options applied over the portfolio's base options
+            (ignored for CBC)
+    """
+    name: str
+    solver: str = 'highs'
+    options: Dict[str, Any] = field(default_factory=dict)
+
+
+# Diverse HiGHS configurations, most promising first (default project settings first)
+HIGHS_MEMBERS = [
+    PortfolioMember('default'),
+    PortfolioMember('seed_1', options={'random_seed': 1}),
+    PortfolioMember('no_symmetry', options={'random_seed': 2, 'mip_detect_symmetry': False}),
+    PortfolioMember('light_heuristics', options={'random_seed': 3, 'mip_heuristic_effort': 0.3}),
+    PortfolioMember('no_presolve', options={'random_seed': 4, 'presolve': 'off'}),
+    PortfolioMember('aggressive_heuristics', options={
+        'random_seed': 5, 'mip_heuristic_run_zi_round': True, 'mip_heuristic_run_shifting': True,
+    }),
+    PortfolioMember('min_heuristics', options={'random_seed': 6, 'mip_heuristic_effort': 0.05}),
+    PortfolioMember('seed_7', options={'random_seed': 7, 'mip_lp_age_limit': 20}),
+]
+
+
+def default_members(
+    cpus: Optional[int] = None,
+    threads_per_member: int = 2,
+    include_cbc: bool = True,
+) -> List[PortfolioMember]:
+    """Portfolio sized to the machine: one HiGHS member per threads_per_member cores.
+
+    Args:
+        cpus: Cores to use (default: os.cpu_count())
+        threads_per_member: HiGHS threads per member
+        include_cbc: Add a CBC member if the cbc executable is on the PATH
+            (it takes one of the HiGHS slots)
+
+    Returns:
+        Members with their HiGHS 'threads' option set
+    """
+    cpus = cpus or os.cpu_count() or 4
+    slots = max(1, cpus // threads_per_member)
+    cbc = include_cbc and slots > 1 and shutil.which('cbc') is not None
+    count = min(len(HIGHS_MEMBERS), slots - 1 if cbc else slots)
+
+    members = [
+        PortfolioMember(m.name, options=dict(m.options, threads=threads_per_member))
+        for m in HIGHS_MEMBERS[:count]
+    ]
+    if cbc:
+        members.append(PortfolioMember('cbc', solver='cbc'))
+    return members
+
+
+def portfolio_gap(best: float, bound: float) -> Optional[float]:
+    """Relative gap of a minimization incumbent to a lower bound (None if either is infinite)."""
+    if not (math.isfinite(best) and math.isfinite(bound)):
+        return None
+    return max(0.0, best - bound) / max(abs(best), 1e-10)
+
+
+@dataclass
+class MemberResult:
+    """Outcome of one member's run.
+
+    Attributes:
+        name: Member name
+        solver: 'highs' or 'cbc'
+        status: APPSI termination name ('optimal', 'maxTimeLimit',
+            'interrupted', ...), 'killed' if terminated, 'error' if it failed
+        objective: Incumbent objective (None without a feasible solution)
+        bound: Dual bound (None if unknown)
+        seconds: Wall time of the member's solve
+        col_value: Column values of the incumbent (not kept in metadata)
+        message: Error or solver message
+    """
+    name: str
+    solver: str
+    status: str
+    objective: Optional[float] = None
+    bound: Optional[float] = None
+    seconds: float = 0.0
+    col_value: Optional[np.ndarray] = None
+    message: str = ''
+
+    @property
+    def proved(self) -> bool:
+        return self.status in _PROVEN
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'name': self.name, 'solver': self.solver, 'status': self.status,
+            'objective': self.objective, 'bound': self.bound, 'seconds': self.seconds,
+            'message': self.message,
+        }
+
+
+# ----------------------------------------------------------------------
+# Worker processes
+# ----------------------------------------------------------------------
+
+def _publish_incumbent(best: Any, value: float) -> None:
+    with best.get_lock():
+        if value < best.value:
+            best.value = value
+
+
+def _subscribe(highs: Any, handler: Any) -> None:
+    """Route improving-solution and interrupt callbacks to handler(event, data_out, interrupt)."""
+    if hasattr(highs, 'cbMipImprovingSolution'):
+        # highspy >= 1.10: event subscriptions
+        def interrupter(e):
+            if hasattr(e, 'interrupt'):
+                return e.interrupt
+            return lambda: setattr(e.data_in, 'user_interrupt', True)
+
+        highs.cbMipImprovingSolution.subscribe(
+            lambda e: handler('incumbent', e.data_out, interrupter(e)))
+        highs.cbMipInterrupt.subscribe(
+            lambda e: handler('progress', e.data_out, interrupter(e)))
+        return
+
+    from highspy import cb
+    callback_type = cb.HighsCallbackType
+    improving = int(callback_type.kCallbackMipImprovingSolution)
+
+    def on_callback(kind, message, data_out, data_in, user_data):
+        def interrupt():
+            data_in.user_interrupt = True
+        handler('incumbent' if int(kind) == improving else 'progress', data_out, interrupt)
+
+    highs.setCallback(on_callback, None)
+    highs.startCallback(callback_type.kCallbackMipImprovingSolution)
+    highs.startCallback(callback_type.kCallbackMipInterrupt)
+
+
+def _reset_highs_scheduler(highspy: Any) -> None:
+    """Drop any HiGHS scheduler inherited from the parent (older highspy has no reset)."""
+    reset = getattr(highspy.Highs, 'resetGlobalScheduler', None)
+    if reset is not None:
+        reset(True)
+
+
+def _run_highs_member(slot, member, arrays, settings, best, bounds, stop, conn) -> None:
+    start = time.perf_counter()
+    try:
+        import highspy
+
+        _reset_highs_scheduler(highspy)
+        matrix = MatrixModel.from_arrays(arrays)
+        sign = -1.0 if matrix.maximize else 1.0
+        target = settings['target_gap']
+
+        highs = highspy.Highs()
+        highs.setOptionValue('output_flag', False)
+        highs.passModel(matrix.to_highs_lp())
+        for name, option in dict(settings['highs_options'], **member.options).items():
+            highs.setOptionValue(name, option)
+        if settings['time_limit']:
+            highs.setOptionValue('time_limit', float(settings['time_limit']))
+        if settings['mip_gap']:
+            highs.setOptionValue('mip_rel_gap', float(settings['mip_gap']))
+        if settings['start'] is not None:
+            solution = highspy.HighsSolution()
+            solution.col_value = list(settings['start'])
+            highs.setSolution(solution)
+
+        def on_event(event, data_out, interrupt):
+            primal = getattr(data_out, 'mip_primal_bound', math.inf)
+            dual = getattr(data_out, 'mip_dual_bound', -math.inf)
+            if event == 'incumbent' and abs(primal) < 1e30:
+                _publish_incumbent(best, sign * primal)
+            if abs(dual) < 1e30 and sign * dual > bounds[slot]:
+                bounds[slot] = sign * dual
+            gap = portfolio_gap(best.value, max(bounds[:]))
+            if gap is not None and gap <= target:
+                stop.set()
+            if stop.is_set():
+                interrupt()
+
+        if matrix.integrality.any():
+            _subscribe(highs, on_event)
+        highs.run()
+
+        status = highs.getModelStatus()
+        info = highs.getInfo()
+        result = MemberResult(
+            name=member.name, solver='highs',
+            status=_TERMINATION.get(getattr(status, 'name', str(status).split('.')[-1]), 'unknown'),
+        )
+        if info.primal_solution_status == 2:  # kSolutionStatusFeasible
+            result.objective = info.objective_function_value
+            result.col_value = np.asarray(highs.getSolution().col_value, dtype=np.float64)
+            _publish_incumbent(best, sign * result.objective)
+        if matrix.integrality.any():
+            bound = info.mip_dual_bound
+            result.bound = bound if abs(bound) < 1e30 else None
+        elif result.status == 'optimal':
+            result.bound = result.objective
+    except Exception as e:
+        result = MemberResult(name=member.name, solver='highs', status='error', message=str(e))
+
+    if result.proved:
+        stop.set()
+    result.seconds = time.perf_counter() - start
+    conn.send(result)
+    conn.close()
+
+
+def _read_cbc_solution(path: str, num_col: int):
+    """Status and column values from a CBC solution file (columns named c0, c1, ...)."""
+    with open(path) as f:
+        header = f.readline().strip()
+        col_value = np.zeros(num_col)
+        for line in f:
+            tokens = line.split()
+            if tokens and tokens[0] == '**':  # flagged (infeasible) entry
+                tokens = tokens[1:]
+            if len(tokens) >= 3 and tokens[1].startswith('c'):
+                col_value[int(tokens[1][1:])] = float(tokens[2])
+
+    if header.startswith('Optimal'):
+        status = 'optimal'
+    elif header.startswith('Infeasible') or header.startswith('Integer infeasible'):
+        status = 'infeasible'
+    elif header.startswith('Unbounded'):
+        status = 'unbounded'
+    elif header.startswith('Stopped on time'):
+        status = 'maxTimeLimit'
+    else:
+        status = 'interrupted'
+    feasible = 'objective value' in header and status not in ('infeasible', 'unbounded')
+    return status, col_value if feasible else None, header
+
+
+def _run_cbc_member(slot, member, arrays, settings, best, bounds, stop, conn) -> None:
+    start = time.perf_counter()
+    process = None
+
+    def on_terminate(signum, frame):
+        if process is not None:
+            process.kill()
+        os._exit(1)
+
+    signal.signal(signal.SIGTERM, on_terminate)
+    try:
+        import highspy
+
+        _reset_highs_scheduler(highspy)
+        matrix = MatrixModel.from_arrays(arrays)
+        sign = -1.0 if matrix.maximize else 1.0
+        # Written as a minimization (OBJSENSE support varies between CBC builds)
+        written = MatrixModel.from_arrays(dict(arrays, col_cost=sign * arrays['col_cost'], maximize=False))
+
+        with tempfile.TemporaryDirectory(prefix='portfolio_cbc_') as tmp:
+            mps_path = os.path.join(tmp, 'model.mps')
+            sol_path = os.path.join(tmp, 'model.sol')
+            writer = highspy.Highs()
+            writer.setOptionValue('output_flag', False)
+            writer.passModel(written.to_highs_lp(names=True))
+            writer.writeModel(mps_path)
+            del writer
+
+            command = ['cbc', mps_path]
+            if settings['time_limit']:
+                command += ['-sec', str(settings['time_limit'])]
+            command += ['-ratioGap', str(settings['target_gap']), '-solve', '-solu', sol_path]
+            process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            while process.poll() is None:
+                if stop.is_set():
+                    process.kill()
+                    process.wait()
+                    break
+                time.sleep(0.2)
+
+            if os.path.exists(sol_path):
+                status, col_value, header = _read_cbc_solution(sol_path, matrix.num_col)
+            else:
+                status, col_value, header = ('interrupted' if stop.is_set() else 'error'), None, ''
+        result = MemberResult(name=member.name, solver='cbc', status=status, message=header)
+        if col_value is not None:
+            result.col_value = col_value
+            result.objective = float(matrix.col_cost @ col_value + matrix.offset)
+            _publish_incumbent(best, sign * result.objective)
+        if status == 'optimal':
+            # Proven within the ratio gap; the incumbent is the tightest bound CBC reports
+            result.bound = result.objective
+    except Exception as e:
+        if process is not None and process.poll() is None:
+            process.kill()
+        result = MemberResult(name=member.name, solver='cbc', status='error', message=str(e))
+
+    if result.proved:
+        stop.set()
+    result.seconds = time.perf_counter() - start
+    conn.send(result)
+    conn.close()
+
+
+_WORKERS = {'highs': _run_highs_member, 'cbc': _run_cbc_member}
+
+
+# ----------------------------------------------------------------------
+# Portfolio solver
+# ----------------------------------------------------------------------
+
+class SolverPortfolio:
+    """APPSI-compatible solver that races PortfolioMembers in separate processes.
+
+    Attributes:
+        backend: Solver name reported in OptimizationResult ('portfolio')
+        config: time_limit, mip_gap, warmstart, stream_solver, load_solution
+        highs_options: Base HiGHS options for every HiGHS member (member
+            options override them)
+        members: Configurations to race
+        grace_seconds: Time members get to report after stop is signalled
+            (or after time_limit) before they are terminated
+        results: MemberResult per member of the last solve
+        stats: Summary of the last solve (result.metadata['portfolio'])
+    """
+
+    backend = 'portfolio'
+
+    def __init__(
+        self,
+        members: Optional[List[PortfolioMember]] = None,
+        grace_seconds: float = 10.0,
+        start_method: Optional[str] = None,
+    ):
+        """Configure the portfolio.
+
+        Args:
+            members: Configurations to race (default: default_members())
+            grace_seconds: Reporting time after stop before terminating members
+            start_method: multiprocessing start method (default 'spawn';
+                'forkserver' also works, 'fork' is unsafe once the calling
+                process has run HiGHS or other threads)
+        """
+        self.config = SimpleNamespace(
+            time_limit=None, mip_gap=None, warmstart=False, stream_solver=False, load_solution=False,
+        )
+        self.update_config = SimpleNamespace()
+        self.highs_options: Dict[str, Any] = {}
+        self.members = members if members is not None else default_members()
+        self.grace_seconds = grace_seconds
+        self.start_method = start_method or 'spawn'
+        self.results: List[MemberResult] = []
+        self.stats: Dict[str, Any] = {}
+        # HiGHS-like view of the winning solution (read by PrimalValues)
+        self._solver_model = None
+        self._pyomo_var_to_solver_var_map: Dict[int, int] = {}
+        self._matrix: Optional[MatrixModel] = None
+        self._winner: Optional[MemberResult] = None
+
+    def available(self) -> bool:
+        try:
+            import highspy  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def solve(self, model: Any) -> Any:
+        """Race the members on model and return APPSI-style Results of the best incumbent."""
+        from pyomo.contrib.appsi.base import Results, TerminationCondition
+
+        compile_start = time.perf_counter()
+        matrix = MatrixModel.from_pyomo(model)
+        compile_time = time.perf_counter() - compile_start
+        self._matrix = matrix
+        self._pyomo_var_to_solver_var_map = matrix.column_of
+        self._solver_model = None
+        self._winner = None
+
+        sign = -1.0 if matrix.maximize else 1.0
+        target = self.config.mip_gap or DEFAULT_TARGET_GAP
+        settings = {
+            'time_limit': self.config.time_limit,
+            'mip_gap': self.config.mip_gap,
+            'target_gap': target,
+            'highs_options': dict(self.highs_options),
+            'start': (np.array([0.0 if v.value is None else v.value for v in matrix.columns])
+                      if self.config.warmstart else None),
+        }
+        arrays = matrix.arrays()
+
+        print(f"\nSolver portfolio: {len(self.members)} members on {matrix.num_col:,} columns, "
+              f"{matrix.num_row:,} rows (compiled in {compile_time:.2f}s), target gap {target:.2%}")
+        for member in self.members:
+            print(f"  {member.name:<24} {member.solver:<6} {member.options}")
+
+        ctx = multiprocessing.get_context(self.start_method)
+        best = ctx.Value('d', math.inf)
+        bounds = ctx.Array('d', [-math.inf] * len(self.members))
+        stop = ctx.Event()
+
+        race_start = time.perf_counter()
+        pending: Dict[Any, tuple] = {}
+        for slot, member in enumerate(self.members):
+            receiver, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(
+                target=_WORKERS[member.solver],
+                args=(slot, member, arrays, settings, best, bounds, stop, sender),
+                name=f"portfolio-{member.name}",
+                daemon=True,
+            )
+            process.start()
+            sender.close()
+            pending[receiver] = (slot, process)
+
+        results: List[Optional[MemberResult]] = [None] * len(self.members)
+        deadline = (race_start + self.config.time_limit + self.grace_seconds
+                    if self.config.time_limit else None)
+        stop_time = None
+        proved_by = None
+        while pending:
+            for receiver in connection.wait(list(pending), timeout=0.5):
+                slot, process = pending.pop(receiver)
+                try:
+                    result = receiver.recv()
+                except EOFError:
+                    member = self.members[slot]
+                    result = MemberResult(member.name, member.solver, 'error',
+                                          message=f"exited without a result (code {process.exitcode})")
+                results[slot] = result
+                if result.proved and proved_by is None:
+                    proved_by = result.name
+                    stop.set()
+                print(f"  {result.name} finished: {result.status}, objective {result.objective}, "
+                      f"{time.perf_counter() - race_start:.1f}s")
+
+            now = time.perf_counter()
+            if stop.is_set() and stop_time is None:
+                stop_time = now
+            if ((stop_time is not None and now - stop_time > self.grace_seconds)
+                    or (deadline is not None and now > deadline)):
+                break
+
+        timed_out = bool(pending) and stop_time is None
+        for receiver, (slot, process) in pending.items():
+            process.terminate()
+            member = self.members[slot]
+            results[slot] = MemberResult(member.name, member.solver, 'killed', seconds=time.perf_counter() - race_start)
+        for receiver, (slot, process) in pending.items():
+            process.join(timeout=5)
+            receiver.close()
+        race_time = time.perf_counter() - race_start
+        self.results = results
+
+        feasible = [r for r in results if r.objective is not None and r.col_value is not None]
+        winner = min(feasible, key=lambda r: sign * r.objective) if feasible else None
+        bound_values = [sign * r.bound for r in results if r.bound is not None] + list(bounds[:])
+        best_bound = max(bound_values, default=-math.inf)
+        gap = portfolio_gap(sign * winner.objective, best_bound) if winner else None
+
+        results_out = Results()
+        if winner is not None:
+            self._winner = winner
+            solution = SimpleNamespace(value_valid=True, col_value=winner.col_value)
+            self._solver_model = SimpleNamespace(getSolution=lambda: solution)
+            results_out.best_feasible_objective = winner.objective
+            if math.isfinite(best_bound):
+                results_out.best_objective_bound = sign * best_bound
+            if proved_by is not None or (gap is not None and gap <= target):
+                results_out.termination_condition = TerminationCondition.optimal
+            elif timed_out or any(r.status == 'maxTimeLimit' for r in results):
+                results_out.termination_condition = TerminationCondition.maxTimeLimit
+            else:
+                results_out.termination_condition = TerminationCondition.interrupted
+        else:
+            proven = next((r.status for r in results if r.proved), None)
+            results_out.termination_condition = getattr(
+                TerminationCondition, proven or ('maxTimeLimit' if timed_out else 'unknown'),
+            )
+
+        self.stats = {
+            'members': [r.summary() for r in results],
+            'winner': winner.name if winner else None,
+            'proved_by': proved_by,
+            'gap': gap,
+            'target_gap': target,
+            'compile_seconds': compile_time,
+            'race_seconds': race_time,
+        }
+        gap_text = f"{gap:.2%}" if gap is not None else 'n/a'
+        print(f"  Portfolio winner: {self.stats['winner']} (gap {gap_text}, "
+              f"proved by {proved_by or 'none'}, {race_time:.1f}s)")
+        return results_out
+
+    def load_vars(self, vars_to_load: Optional[List[Any]] = None) -> None:
+        """Load the winning member's column values into the Pyomo variables."""
+        if self._winner is None:
+            raise RuntimeError("Solver portfolio has no feasible solution to load")
+        col_value = self._winner.col_value
+        if vars_to_load is None:
+            for var, val in zip(self._matrix.columns, col_value):
+                var.set_value(val, skip_validation=True)
+            return
+        for var in vars_to_load:
+            col = self._pyomo_var_to_solver_var_map.get(id(var))
+            if col is not None:
+                var.set_value(col_value[col], skip_validation=True)
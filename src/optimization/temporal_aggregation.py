@@ -0,0 +1,270 @@
+"""Variable-granularity planning periods for SlidingWindowModel.
+
+Long-range capacity plans (12-26 weeks) do not need daily resolution in the
+tail of the horizon. With a VariableGranularityConfig, SlidingWindowModel
+indexes every time dimension by planning period (the start date of a
+TimeBucket) instead of by day - e.g. daily periods for the first weeks, then
+weekly periods - which cuts the number of time-indexed variables several-fold.
+
+Day-based data is aggregated per period:
+
+- demand: summed into the period containing the forecast date
+- shelf life: a period's window holds the periods starting within L days of
+  its end date (daily periods: the usual t-L+1..t window)
+- transit: goods departing in period D arrive in the period containing
+  midpoint(D) + transit_days, so 1-2 day legs stay inside a weekly period
+- labor: fixed hours, overtime capacity and non-fixed-day capacity summed
+  over the days of the period (PeriodLabor)
+- trucks: one truck capacity per scheduled departure day in the period
+- per-day variable bounds and pallet-day holding costs scaled by period length
+
+Daily planning (no config) builds one period per day and every table matches
+the day-based arithmetic exactly.
+
+Reporting maps period production back to days with
+forecast_aggregator.disaggregate_to_daily (see disaggregate_production).
+
+Example:
+    config = VariableGranularityConfig(
+        near_term_days=28,
+        near_term_granularity=BucketGranularity.DAILY,
+        far_term_granularity=BucketGranularity.WEEKLY,
+    )
+    model = SlidingWindowModel(..., start_date=start, end_date=start + timedelta(weeks=26) - timedelta(days=1),
+                               granularity=config)
+    # 28 daily + 22 weekly periods instead of 182 days
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date as Date, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from ..models.time_period import (
+    TimeBucket,
+    VariableGranularityConfig,
+    create_daily_buckets,
+    create_variable_granularity_buckets,
+)
+
+
+# Labor hours available on a non-fixed day (weekend/holiday), as in the model
+NON_FIXED_DAY_MAX_HOURS = 14.0
+
+WEEKDAY_NAMES = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+
+@dataclass(frozen=True)
+class PeriodLabor:
+    """Labor availability and rates summed over the days of a multi-day period.
+
+    Attribute names follow LaborDay so the model's labor rules read either.
+
+    Attributes:
+        fixed_hours: Fixed hours over the fixed days (free, sunk cost)
+        overtime_hours: Overtime capacity over the fixed days
+        non_fixed_hours: Capacity over the non-fixed days (weekends/holidays)
+        overtime_rate: Highest overtime rate of the fixed days
+        non_fixed_rate: Highest non-fixed rate of the non-fixed days
+        minimum_hours: Minimum paid hours if producing (non-fixed days only)
+        is_fixed_day: True if the period has at least one fixed day
+        num_days: Days with a labor calendar entry
+    """
+    fixed_hours: float
+    overtime_hours: float
+    non_fixed_hours: float
+    overtime_rate: float
+    non_fixed_rate: float
+    minimum_hours: float
+    is_fixed_day: bool
+    num_days: int
+
+    @property
+    def max_hours(self) -> float:
+        """Total labor hours available in the period."""
+        return self.fixed_hours + self.overtime_hours + self.non_fixed_hours
+
+
+class PlanningPeriods:
+    """Planning periods of a SlidingWindowModel and their day-based lookups.
+
+    Attributes:
+        buckets: TimeBuckets covering start_date..end_date
+        dates: Period keys (bucket start dates), in order
+        period_days: {period: number of days}
+        is_aggregated: True if any period spans more than one day
+    """
+
+    def __init__(
+        self,
+        start_date: Date,
+        end_date: Date,
+        granularity: Optional[VariableGranularityConfig] = None,
+    ):
+        if granularity is None:
+            self.buckets: List[TimeBucket] = create_daily_buckets(start_date, end_date)
+        else:
+            self.buckets = create_variable_granularity_buckets(start_date, end_date, granularity)
+
+        self.start_date = start_date
+        self.end_date = end_date
+        self.granularity = granularity
+        self.dates: List[Date] = [bucket.start_date for bucket in self.buckets]
+        self.period_days: Dict[Date, int] = {bucket.start_date: bucket.num_days for bucket in self.buckets}
+        self.is_aggregated = any(days > 1 for days in self.period_days.values())
+
+        self._period_of_day: Dict[Date, Date] = {}
+        for t in self.dates:
+            for day in self.days(t):
+                self._period_of_day[day] = t
+
+        self._departure_tables: Dict[int, Dict[Date, Tuple[Date, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def days(self, t: Date) -> List[Date]:
+        """Calendar days covered by period t."""
+        return [t + timedelta(days=i) for i in range(self.period_days[t])]
+
+    def period_of(self, day: Date) -> Optional[Date]:
+        """Period containing a calendar day, or None outside the horizon."""
+        return self._period_of_day.get(day)
+
+    def end_of(self, t: Date) -> Date:
+        """Last day of period t."""
+        return t + timedelta(days=self.period_days[t] - 1)
+
+    def arrival_period(self, departure: Date, transit_days: float) -> Optional[Date]:
+        """Period in which goods departing in period `departure` arrive (None beyond horizon)."""
+        transit_days = timedelta(days=transit_days).days
+        midpoint = departure + timedelta(days=(self.period_days[departure] - 1) // 2)
+        return self.period_of(midpoint + timedelta(days=transit_days))
+
+    def departure_periods(self, arrival: Date, transit_days: float) -> Tuple[Date, ...]:
+        """Departure periods whose goods arrive in period `arrival` (oldest first).
+
+        Every departure period arrives in exactly one period, so arrivals are
+        never counted twice; a weekly period can receive from several daily
+        departure periods at the daily/weekly boundary. Tables are keyed by
+        whole transit days, so 1.0 and 1 share one table.
+        """
+        transit_days = timedelta(days=transit_days).days
+        table = self._departure_tables.get(transit_days)
+        if table is None:
+            grouped = defaultdict(list)
+            for departure in self.dates:
+                arrival_t = self.arrival_period(departure, transit_days)
+                if arrival_t is not None:
+                    grouped[arrival_t].append(departure)
+            table = self._departure_tables[transit_days] = {t: tuple(deps) for t, deps in grouped.items()}
+        return table.get(arrival, ())
+
+    def shelf_life_windows(self, shelf_life: int) -> Dict[Date, Tuple[Date, ...]]:
+        """{t: periods starting within shelf_life days of t's end}, clipped at planning start.
+
+        A window always holds t itself, even if the period is longer than the shelf life.
+        """
+        windows = {}
+        first = 0
+        for i, t in enumerate(self.dates):
+            window_start = self.end_of(t) - timedelta(days=shelf_life - 1)
+            while first < i and self.dates[first] < window_start:
+                first += 1
+            windows[t] = tuple(self.dates[first:i + 1])
+        return windows
+
+    def periods_within(self, num_days: int) -> List[Date]:
+        """Periods starting within the first num_days days of the horizon."""
+        cutoff = self.start_date + timedelta(days=num_days)
+        return [t for t in self.dates if t < cutoff]
+
+    def weekday_names(self, t: Date) -> Set[str]:
+        """Weekday names ('monday', ...) of the days in period t."""
+        return {WEEKDAY_NAMES[day.weekday()] for day in self.days(t)}
+
+    def count_weekday(self, t: Date, day_name: Optional[str]) -> int:
+        """Days in period t falling on day_name (every day if day_name is None)."""
+        if day_name is None:
+            return self.period_days[t]
+        day_name = day_name.lower()
+        return sum(1 for day in self.days(t) if WEEKDAY_NAMES[day.weekday()] == day_name)
+
+    def aggregate_demand(self, demand: Dict[Tuple[str, str, Date], float]) -> Dict[Tuple[str, str, Date], float]:
+        """Sum {(node, product, day): qty} into {(node, product, period): qty}."""
+        if not self.is_aggregated:
+            return demand
+        aggregated = defaultdict(float)
+        for (node_id, prod, day), qty in demand.items():
+            t = self.period_of(day)
+            if t is not None:
+                aggregated[(node_id, prod, t)] += qty
+        return dict(aggregated)
+
+    def labor(self, labor_calendar: Any, t: Date) -> Any:
+        """Labor for period t: the LaborDay for one-day periods, else a PeriodLabor.
+
+        Returns None if no day of the period has a labor calendar entry.
+        """
+        if self.period_days[t] == 1:
+            return labor_calendar.get_labor_day(t)
+
+        labor_days = [day for day in (labor_calendar.get_labor_day(d) for d in self.days(t)) if day]
+        if not labor_days:
+            return None
+
+        fixed_days = [day for day in labor_days if day.is_fixed_day]
+        non_fixed_days = [day for day in labor_days if not day.is_fixed_day]
+        return PeriodLabor(
+            fixed_hours=sum(day.fixed_hours for day in fixed_days),
+            overtime_hours=sum(getattr(day, 'overtime_hours', 0) or 0 for day in fixed_days),
+            non_fixed_hours=NON_FIXED_DAY_MAX_HOURS * len(non_fixed_days),
+            overtime_rate=max((day.overtime_rate for day in fixed_days), default=660.0),
+            non_fixed_rate=max((day.non_fixed_rate or 0 for day in non_fixed_days), default=1320.0) or 1320.0,
+            minimum_hours=max((day.minimum_hours for day in non_fixed_days), default=0.0),
+            is_fixed_day=bool(fixed_days),
+            num_days=len(labor_days),
+        )
+
+    def disaggregate_production(
+        self,
+        production: Dict[Tuple[str, str, Date], float],
+        forecast: Any,
+    ) -> Dict[Tuple[str, str, Date], float]:
+        """Spread {(node, product, period): qty} over days, proportional to daily demand.
+
+        Uses forecast_aggregator.disaggregate_to_daily per manufacturing node
+        (days without demand in a period share it evenly).
+        """
+        from ..models.forecast import Forecast
+        from ..models.forecast_aggregator import disaggregate_to_daily
+
+        if not self.is_aggregated:
+            return dict(production)
+
+        by_node: Dict[str, Dict[Date, Dict[str, float]]] = defaultdict(lambda: defaultdict(dict))
+        for (node_id, prod, t), qty in production.items():
+            by_node[node_id][t][prod] = qty
+
+        horizon_forecast = Forecast.from_store(
+            forecast.name,
+            forecast.store.filter_dates(self.start_date, self.end_date),
+            creation_date=forecast.creation_date,
+        )
+
+        daily = {}
+        for node_id, plan in by_node.items():
+            node_daily = disaggregate_to_daily(plan, horizon_forecast, self.buckets)
+            for day, quantities in node_daily.items():
+                for prod, qty in quantities.items():
+                    if qty > 0:
+                        daily[(node_id, prod, day)] = qty
+        return daily
+
+    def summary(self) -> str:
+        """One-line description, e.g. '28 daily + 22 weekly periods (182 days)'."""
+        counts: Dict[str, int] = {}
+        for bucket in self.buckets:
+            counts[bucket.granularity.value] = counts.get(bucket.granularity.value, 0) + 1
+        parts = ' + '.join(f"{n} {name}" for name, n in counts.items())
+        return f"{parts} periods ({sum(self.period_days.values())} days)"
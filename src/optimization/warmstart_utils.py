@@ -1,35 +1,45 @@
 """Warmstart utilities for rolling horizon optimization.
 
 This module provides functions to extract solutions from solved models,
-shift them forward in time, and apply them as warmstart hints for subsequent
-solves. This enables fast daily re-optimization using previous solutions.
+carry them forward to the next planning window, and apply them as warmstart
+hints for subsequent solves. This enables fast daily re-optimization using
+previous solutions.
+
+Hints are keyed by (variable_name, *index), e.g.
+('production', '6122', 'PROD_A', date(2025, 1, 7)) -> 1200.0, so they survive
+a model rebuild and a change of planning horizon.
 
 Key Functions:
 - extract_solution_for_warmstart: Extract complete solution from solved model
-- shift_warmstart_hints: Shift solution dates forward by N days
+- serialize_warmstart_hints / deserialize_warmstart_hints: JSON round-trip
+  (stored in solution.metadata of a saved solve)
+- extract_warmstart_for_rolling_window: Keep hints that fall in the new window
+- apply_warmstart_hints: Set variable values on a freshly built model
 - validate_warmstart_quality: Check if warmstart will be beneficial
 
 Example:
     # Day 1: Full solve (expensive)
     model_day1 = SlidingWindowModel(...)
-    result_day1 = model_day1.solve(use_warmstart=False)
+    result_day1 = model_day1.solve()
 
     # Extract solution
     warmstart_day1 = extract_solution_for_warmstart(model_day1)
 
-    # Day 2: Shift forecast and warmstart forward
-    warmstart_day2 = shift_warmstart_hints(warmstart_day1, shift_days=1,
-                                           new_start_date=date(2025, 1, 7),
-                                           new_end_date=date(2025, 2, 3))
+    # Day 2: keep the overlapping dates; the new tail is left to the solver
+    warmstart_day2 = extract_warmstart_for_rolling_window(
+        warmstart_day1,
+        new_start_date=date(2025, 1, 7),
+        new_end_date=date(2025, 2, 3),
+    )
 
     # Solve with warmstart (fast!)
     model_day2 = SlidingWindowModel(forecast=forecast_day2, ...)
-    result_day2 = model_day2.solve(use_warmstart=True,
-                                   warmstart_hints=warmstart_day2)
+    result_day2 = model_day2.solve(warmstart_hints=warmstart_day2)
 """
 
 from datetime import date as Date, timedelta
-from typing import Dict, Tuple, Optional, Any, Set
+from typing import Dict, List, Tuple, Optional, Any, Set
+import re
 import warnings
 from pyomo.environ import value as pyo_value
 
@@ -59,36 +69,88 @@ def clean_numerical_error(value: float, tolerance: float = 1e-10) -> float:
     return value
 
 
+# Sliding window variables carried from one solve to the next. Demand-side
+# variables (consumption, shortage, disposal) are left out on purpose: they are
+# driven by the forecast, which changes between solves, and HiGHS completes
+# them when it repairs the start.
+WARMSTART_VARIABLES = (
+    # Production and changeovers
+    'production',
+    'mix_count',
+    'product_produced',
+    'product_start',
+    'total_starts',
+    'any_production',
+    # Inventory and state transitions
+    'inventory',
+    'thaw',
+    'freeze',
+    # Shipments
+    'in_transit',
+    'shipment_from_init',
+    'shipment_from_new',
+    # Pallet integers
+    'pallet_count',
+    'pallet_entry',
+    'truck_pallet_load',
+    # Labor
+    'labor_hours_used',
+    'overtime_hours',
+    'labor_hours_paid',
+)
+
+# Demand-side flows saved with a solve for reporting and later analysis
+# (solution.metadata['flow_values']); never used as warmstart hints.
+RECORDED_FLOW_VARIABLES = (
+    'shortage',
+    'demand_consumed_from_ambient',
+    'demand_consumed_from_thawed',
+)
+
+# Discrete decisions handed to HiGHS as a partial MIP start. HiGHS fixes them
+# and completes the rest (pallet integers, flows) with a small sub-MIP. A full
+# start is usually rejected after a roll: new inventory/demand makes yesterday's
+# pallet counts and truck loads inconsistent, and HiGHS then drops the start.
+WARMSTART_START_VARIABLES = (
+    'mix_count',
+    'product_produced',
+)
+
+# Matches ISO dates written by serialize_warmstart_hints()
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+
 def extract_solution_for_warmstart(
     model: Any,
-    verbose: bool = False
+    verbose: bool = False,
+    variables: Tuple[str, ...] = WARMSTART_VARIABLES,
 ) -> Dict[Tuple, float]:
-    """Extract complete solution from solved optimization model for warmstart.
-
-    Extracts all relevant variable values from a solved optimization model
-    and converts them to the warmstart hints format. This provides 100%
-    variable coverage for a complete warmstart.
-
-    Variables Extracted:
-    - production[node, product, date]: Production quantities
-    - product_produced[node, product, date]: Binary production flags
-    - product_start[node, product, date]: Binary changeover flags
-    - inventory_cohort[node, product, prod_date, state_entry_date, inv_date, state]: Inventory by age in state
-    - shipment_cohort[origin, dest, product, state, prod_date, ship_date]: Shipments
-    - production_day[node, date]: Binary production day flags
-    - uses_overtime[node, date]: Overtime usage
-    - labor_hours_*[node, date]: Labor allocation variables
+    """Extract the solved SlidingWindowModel variables as warmstart hints.
+
+    Hints are keyed by (variable_name, *index) so variables sharing an index
+    (e.g. production and product_produced) never collide. Only nonzero values
+    are kept; a missing hint means zero.
+
+    Variables Extracted (see WARMSTART_VARIABLES):
+    - production, mix_count: Production quantities and integer mixes
+    - product_produced, product_start, total_starts, any_production: Changeover binaries
+    - inventory[node, product, state, date]: State inventory
+    - thaw, freeze: State transitions
+    - in_transit, shipment_from_init, shipment_from_new: Shipments by departure date
+    - pallet_count, pallet_entry, truck_pallet_load: Pallet integers
+    - labor_hours_used, overtime_hours, labor_hours_paid: Labor
 
     Args:
-        model: Solved UnifiedNodeModel instance with .model attribute (Pyomo model)
+        model: Solved SlidingWindowModel instance with .model attribute (Pyomo model)
         verbose: Print diagnostic information
+        variables: Variable families to extract (e.g. RECORDED_FLOW_VARIABLES)
 
     Returns:
-        Dictionary mapping variable indices to values:
-        {(node, product, date): value, ...}
+        Dictionary mapping (variable_name, *index) to value:
+        {('production', node, product, date): value, ...}
 
     Raises:
-        ValueError: If model is not solved or has no solution
+        ValueError: If model has no Pyomo model or no variable has a value
 
     Example:
         >>> result = model.solve(solver_name='appsi_highs')
@@ -96,176 +158,182 @@ def extract_solution_for_warmstart(
         ...     hints = extract_solution_for_warmstart(model, verbose=True)
         ...     print(f"Extracted {len(hints)} variable values")
     """
-    if not hasattr(model, 'model'):
+    if not hasattr(model, 'model') or model.model is None:
         raise ValueError("Model must have .model attribute (Pyomo ConcreteModel)")
 
     pyomo_model = model.model
     hints = {}
-
-    stats = {
-        'production': 0,
-        'product_produced': 0,
-        'product_start': 0,
-        'inventory_cohort': 0,
-        'shipment_cohort': 0,
-        'production_day': 0,
-        'uses_overtime': 0,
-        'labor_hours': 0,
-        'pallet_count': 0,
-        'other': 0,
-        'errors': 0,
-    }
-
-    # Extract production variables (ALL values, including zeros!)
-    if hasattr(pyomo_model, 'production'):
-        for key in pyomo_model.production:
-            try:
-                val = pyo_value(pyomo_model.production[key])
-                if val is not None:
-                    hints[key] = val  # Include zeros for complete warmstart
-                    stats['production'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-                if verbose:
-                    warnings.warn(f"Could not extract production{key}: {e}")
-
-    # Extract binary product_produced variables
-    if hasattr(pyomo_model, 'product_produced'):
-        for key in pyomo_model.product_produced:
-            try:
-                val = pyo_value(pyomo_model.product_produced[key])
-                if val is not None:
-                    hints[key] = 1 if val > 0.5 else 0  # Round binary
-                    stats['product_produced'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-                if verbose:
-                    warnings.warn(f"Could not extract product_produced{key}: {e}")
-
-    # Extract binary product_start variables (changeovers)
-    if hasattr(pyomo_model, 'product_start'):
-        for key in pyomo_model.product_start:
-            try:
-                val = pyo_value(pyomo_model.product_start[key])
-                if val is not None:
-                    hints[key] = 1 if val > 0.5 else 0  # Round binary
-                    stats['product_start'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-                if verbose:
-                    warnings.warn(f"Could not extract product_start{key}: {e}")
-
-    # Extract inventory_cohort variables (ALL values including zeros!)
-    if hasattr(pyomo_model, 'inventory_cohort'):
-        for key in pyomo_model.inventory_cohort:
-            try:
-                val = pyo_value(pyomo_model.inventory_cohort[key])
-                if val is not None:
-                    hints[key] = clean_numerical_error(val)  # Clean numerical errors
-                    stats['inventory_cohort'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-                if verbose:
-                    warnings.warn(f"Could not extract inventory_cohort{key}: {e}")
-
-    # Extract shipment_cohort variables (ALL values including zeros!)
-    if hasattr(pyomo_model, 'shipment_cohort'):
-        for key in pyomo_model.shipment_cohort:
-            try:
-                val = pyo_value(pyomo_model.shipment_cohort[key])
-                if val is not None:
-                    hints[key] = clean_numerical_error(val)  # Clean numerical errors
-                    stats['shipment_cohort'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-                if verbose:
-                    warnings.warn(f"Could not extract shipment_cohort{key}: {e}")
-
-    # Extract production_day binary variables
-    if hasattr(pyomo_model, 'production_day'):
-        for key in pyomo_model.production_day:
-            try:
-                val = pyo_value(pyomo_model.production_day[key])
-                if val is not None:
-                    hints[key] = 1 if val > 0.5 else 0
-                    stats['production_day'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-
-    # Extract uses_overtime binary variables
-    if hasattr(pyomo_model, 'uses_overtime'):
-        for key in pyomo_model.uses_overtime:
-            try:
-                val = pyo_value(pyomo_model.uses_overtime[key])
-                if val is not None:
-                    hints[key] = 1 if val > 0.5 else 0
-                    stats['uses_overtime'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-
-    # Extract labor hour allocation variables (ALL values including zeros!)
-    for labor_var_name in ['labor_hours_fixed', 'labor_hours_overtime',
-                           'labor_hours_nonfixed', 'labor_hours_paid_nonfixed']:
-        if hasattr(pyomo_model, labor_var_name):
-            var = getattr(pyomo_model, labor_var_name)
-            for key in var:
-                try:
-                    val = pyo_value(var[key])
-                    if val is not None:
-                        # Store with variable name prefix to avoid key collision
-                        hints[(labor_var_name,) + key] = val
-                        stats['labor_hours'] += 1
-                except Exception as e:
-                    stats['errors'] += 1
-
-    # Extract pallet_count variables (ALL values including zeros!)
-    for pallet_var_name in ['pallet_count_frozen', 'pallet_count_ambient']:
-        if hasattr(pyomo_model, pallet_var_name):
-            var = getattr(pyomo_model, pallet_var_name)
-            for key in var:
-                try:
-                    val = pyo_value(var[key])
-                    if val is not None:
-                        hints[(pallet_var_name,) + key] = val
-                        stats['pallet_count'] += 1
-                except Exception as e:
-                    stats['errors'] += 1
-
-    # Extract mix_count variables (ALL values including zeros!)
-    if hasattr(pyomo_model, 'mix_count'):
-        for key in pyomo_model.mix_count:
-            try:
-                val = pyo_value(pyomo_model.mix_count[key])
-                if val is not None:
-                    hints[('mix_count',) + key] = val
-                    stats['other'] += 1
-            except Exception as e:
-                stats['errors'] += 1
-
-    total_extracted = sum(stats.values()) - stats['errors']
+    stats = {}
+    has_values = False
+
+    for var_name in variables:
+        if not hasattr(pyomo_model, var_name):
+            continue
+        var = getattr(pyomo_model, var_name)
+        count = 0
+        for index, var_data in var.items():
+            val = var_data.value
+            if val is None:
+                continue
+            has_values = True
+            if var_data.is_integer():
+                val = float(round(val))
+            else:
+                val = clean_numerical_error(val)
+                if val < 0:
+                    val = 0.0
+            if val != 0:
+                key_index = index if isinstance(index, tuple) else (index,)
+                hints[(var_name,) + key_index] = val
+                count += 1
+        stats[var_name] = count
 
     if verbose:
         print(f"\n✓ Warmstart extraction complete:")
-        print(f"  Total variables: {total_extracted:,}")
-        print(f"  Production: {stats['production']:,}")
-        print(f"  Product binaries: {stats['product_produced']:,}")
-        print(f"  Changeover starts: {stats['product_start']:,}")
-        print(f"  Inventory cohorts: {stats['inventory_cohort']:,}")
-        print(f"  Shipment cohorts: {stats['shipment_cohort']:,}")
-        print(f"  Production days: {stats['production_day']:,}")
-        print(f"  Overtime flags: {stats['uses_overtime']:,}")
-        print(f"  Labor hours: {stats['labor_hours']:,}")
-        print(f"  Pallet counts: {stats['pallet_count']:,}")
-        print(f"  Other: {stats['other']:,}")
-        if stats['errors'] > 0:
-            print(f"  Errors: {stats['errors']:,}")
-
-    if total_extracted == 0:
+        print(f"  Nonzero values: {len(hints):,}")
+        for var_name, count in stats.items():
+            print(f"  {var_name}: {count:,}")
+
+    if not has_values:
         raise ValueError("No variables extracted from model. Is the model solved?")
 
     return hints
 
 
+def serialize_warmstart_hints(warmstart_hints: Dict[Tuple, float]) -> Dict[str, List[list]]:
+    """Convert warmstart hints to a JSON-friendly structure for solve files.
+
+    Args:
+        warmstart_hints: Hints from extract_solution_for_warmstart()
+
+    Returns:
+        {variable_name: [[*index, value], ...]} with dates as ISO strings
+    """
+    serialized: Dict[str, List[list]] = {}
+    for key, val in warmstart_hints.items():
+        var_name, index = key[0], key[1:]
+        row = [c.isoformat() if isinstance(c, Date) else c for c in index]
+        row.append(val)
+        serialized.setdefault(var_name, []).append(row)
+    return serialized
+
+
+def deserialize_warmstart_hints(data: Dict[str, List[list]]) -> Dict[Tuple, float]:
+    """Inverse of serialize_warmstart_hints().
+
+    Args:
+        data: {variable_name: [[*index, value], ...]} as stored in a solve file
+
+    Returns:
+        Warmstart hints keyed by (variable_name, *index) with dates restored
+    """
+    hints = {}
+    for var_name, rows in data.items():
+        for row in rows:
+            index = tuple(
+                Date.fromisoformat(c) if isinstance(c, str) and _ISO_DATE.match(c) else c
+                for c in row[:-1]
+            )
+            hints[(var_name,) + index] = row[-1]
+    return hints
+
+
+def apply_warmstart_hints(
+    pyomo_model: Any,
+    warmstart_hints: Dict[Tuple, float],
+    verbose: bool = False
+) -> Dict[str, int]:
+    """Load warmstart hints into a built Pyomo model, repairing bounds and integrality.
+
+    Every warmstart variable of the model is initialized: hinted values are
+    clamped into the variable bounds and rounded for integer/binary variables;
+    unhinted variables start at their lower bound (zero for this model). Hints
+    for variables or indices that do not exist in the model are dropped.
+    Fixed variables are never touched.
+
+    Args:
+        pyomo_model: Built Pyomo ConcreteModel (e.g. SlidingWindowModel.build_model())
+        warmstart_hints: Hints keyed by (variable_name, *index)
+        verbose: Print diagnostic information
+
+    Returns:
+        Statistics: applied, defaulted, dropped, clamped, rounded
+    """
+    stats = {'applied': 0, 'defaulted': 0, 'dropped': 0, 'clamped': 0, 'rounded': 0}
+
+    hinted_vars: Dict[str, Dict[Tuple, float]] = {}
+    for key, val in warmstart_hints.items():
+        hinted_vars.setdefault(key[0], {})[key[1:]] = val
+
+    for var_name in WARMSTART_VARIABLES:
+        hints = hinted_vars.pop(var_name, {})
+        if not hasattr(pyomo_model, var_name):
+            stats['dropped'] += len(hints)
+            continue
+        var = getattr(pyomo_model, var_name)
+
+        for index in hints:
+            lookup = index if len(index) != 1 else index[0]
+            if lookup not in var:
+                stats['dropped'] += 1
+
+        for index, var_data in var.items():
+            if var_data.fixed:
+                continue
+            key_index = index if isinstance(index, tuple) else (index,)
+            val = hints.get(key_index)
+            if val is None:
+                val = var_data.lb if var_data.lb is not None else 0.0
+                stats['defaulted'] += 1
+            else:
+                stats['applied'] += 1
+
+            lb, ub = var_data.lb, var_data.ub
+            if lb is not None and val < lb:
+                val = lb
+                stats['clamped'] += 1
+            elif ub is not None and val > ub:
+                val = ub
+                stats['clamped'] += 1
+            if var_data.is_integer() and val != round(val):
+                val = round(val)
+                stats['rounded'] += 1
+
+            var_data.set_value(val, skip_validation=True)
+
+    # Hints for variables this module does not warmstart
+    stats['dropped'] += sum(len(h) for h in hinted_vars.values())
+
+    if verbose:
+        print(f"\n✓ Warmstart applied:")
+        print(f"  Hinted values: {stats['applied']:,}")
+        print(f"  Defaulted (no hint): {stats['defaulted']:,}")
+        print(f"  Dropped (not in model): {stats['dropped']:,}")
+        print(f"  Clamped to bounds: {stats['clamped']:,}")
+        print(f"  Rounded to integer: {stats['rounded']:,}")
+
+    return stats
+
+
+def get_partial_start_variables(pyomo_model: Any) -> List[Any]:
+    """Variables to pass to the solver as a partial MIP start.
+
+    Args:
+        pyomo_model: Pyomo model initialized by apply_warmstart_hints()
+
+    Returns:
+        Variable data objects of WARMSTART_START_VARIABLES that have a value
+    """
+    variables = []
+    for var_name in WARMSTART_START_VARIABLES:
+        if hasattr(pyomo_model, var_name):
+            variables.extend(
+                v for v in getattr(pyomo_model, var_name).values()
+                if v.value is not None
+            )
+    return variables
+
+
 def shift_warmstart_hints(
     warmstart_hints: Dict[Tuple, float],
     shift_days: int,
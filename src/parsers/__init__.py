@@ -6,6 +6,7 @@ from .sap_ibp_converter import SapIbpConverter
 from .sap_ibp_parser import SapIbpParser
 from .product_alias_resolver import ProductAliasResolver
 from .inventory_parser import InventoryParser
+from .workbook_session import ParsedDataCache, WorkbookSession
 
 __all__ = [
     "ExcelParser",
@@ -14,4 +15,6 @@ __all__ = [
     "SapIbpParser",
     "ProductAliasResolver",
     "InventoryParser",
+    "WorkbookSession",
+    "ParsedDataCache",
 ]
@@ -10,7 +10,7 @@ from openpyxl import load_workbook
 
 from ..models import (
     Forecast,
-    ForecastEntry,
+    ForecastStore,
     Location,
     LocationType,
     Route,
@@ -24,7 +24,8 @@ from ..models import (
     CostStructure,
     Product,
 )
-from .product_alias_resolver import ProductAliasResolver
+from .product_alias_resolver import ProductAliasResolver, resolve_product_column
+from .workbook_session import WorkbookSession
 
 
 class ExcelParser:
@@ -43,13 +44,20 @@ class ExcelParser:
     Also supports SAP IBP export format (wide format with dates as columns).
     """
 
-    def __init__(self, file_path: Path | str, product_alias_resolver: Optional[ProductAliasResolver] = None):
+    def __init__(
+        self,
+        file_path: Path | str,
+        product_alias_resolver: Optional[ProductAliasResolver] = None,
+        workbook: Optional[WorkbookSession] = None,
+    ):
         """
         Initialize parser with Excel file path.
 
         Args:
             file_path: Path to the Excel file (.xlsm or .xlsx)
             product_alias_resolver: Optional product alias resolver for mapping product codes to canonical IDs
+            workbook: Optional WorkbookSession for file_path, shared with other
+                parsers of the same file. If None, one is opened on first read.
 
         Raises:
             FileNotFoundError: If file does not exist
@@ -62,6 +70,14 @@ class ExcelParser:
             raise ValueError(f"File must be .xlsm or .xlsx: {file_path}")
 
         self.product_alias_resolver = product_alias_resolver
+        self._workbook = workbook
+
+    @property
+    def workbook(self) -> WorkbookSession:
+        """Workbook session for this file (every sheet is read from one open workbook)."""
+        if self._workbook is None:
+            self._workbook = WorkbookSession(self.file_path)
+        return self._workbook
 
     def parse_forecast(self, sheet_name: str = "Forecast") -> Forecast:
         """
@@ -81,39 +97,35 @@ class ExcelParser:
         """
         # Try standard format first
         try:
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=sheet_name,
-                engine="openpyxl"
-            )
+            df = self.workbook.read_sheet(sheet_name)
 
             # Validate required columns
             required_cols = {"location_id", "product_id", "date", "quantity"}
             if required_cols.issubset(df.columns):
-                # Standard format - use existing parsing logic
-                entries = []
+                # Standard format - column-wise coercion, no per-row objects
+                raw_product_ids = df["product_id"].astype(str)
                 unmapped_products = set()
 
-                for _, row in df.iterrows():
-                    raw_product_id = str(row["product_id"])
-
-                    # Resolve product alias if resolver provided
-                    product_id = raw_product_id
-                    if self.product_alias_resolver:
-                        resolved_id = self.product_alias_resolver.resolve_product_id(raw_product_id)
-                        if resolved_id != raw_product_id:
-                            product_id = resolved_id
-                        elif not self.product_alias_resolver.is_mapped(raw_product_id):
-                            unmapped_products.add(raw_product_id)
-
-                    entry = ForecastEntry(
-                        location_id=str(row["location_id"]),
-                        product_id=product_id,  # Use resolved ID
-                        forecast_date=pd.to_datetime(row["date"]).date(),
-                        quantity=float(row["quantity"]),
-                        confidence=float(row["confidence"]) if "confidence" in row and pd.notna(row["confidence"]) else None,
-                    )
-                    entries.append(entry)
+                # Resolve product aliases in one mapped-series join
+                product_ids = raw_product_ids
+                if self.product_alias_resolver:
+                    product_ids, unmapped_products = resolve_product_column(self.product_alias_resolver, raw_product_ids)
+
+                dates = pd.to_datetime(df["date"])
+                if dates.isna().any():
+                    raise ValueError(f"{int(dates.isna().sum())} forecast rows have no date")
+
+                # Validated in bulk by ForecastStore (quantity >= 0, confidence in [0, 1])
+                store = ForecastStore.from_columns(
+                    location_ids=df["location_id"].astype(str).to_numpy(),
+                    product_ids=product_ids.to_numpy(),
+                    dates=dates.to_numpy(),
+                    quantities=pd.to_numeric(df["quantity"]).to_numpy(dtype=float),
+                    confidences=(
+                        pd.to_numeric(df["confidence"]).to_numpy(dtype=float)
+                        if "confidence" in df.columns else None
+                    ),
+                )
 
                 # Warn about unmapped products
                 if unmapped_products:
@@ -125,19 +137,21 @@ class ExcelParser:
                     )
 
                 forecast_name = f"Forecast from {self.file_path.name}"
-                return Forecast(name=forecast_name, entries=entries)
+                # Entries are created lazily from the store (see Forecast.from_store)
+                return Forecast.from_store(forecast_name, store)
         except Exception:
             # Sheet doesn't exist or isn't standard format
             pass
 
         # Try SAP IBP format detection
         from .sap_ibp_parser import SapIbpParser
-        sap_sheet = SapIbpParser.detect_sap_ibp_format(self.file_path)
+        sap_sheet = SapIbpParser.detect_sap_ibp_format(self.file_path, workbook=self.workbook)
         if sap_sheet:
             return SapIbpParser.parse_sap_ibp_forecast(
                 self.file_path,
                 sap_sheet,
-                product_alias_resolver=self.product_alias_resolver  # Pass through resolver
+                product_alias_resolver=self.product_alias_resolver,  # Pass through resolver
+                workbook=self.workbook,
             )
 
         # Neither format found
@@ -159,11 +173,7 @@ class ExcelParser:
         Raises:
             ValueError: If sheet is missing or malformed
         """
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        df = self.workbook.read_sheet(sheet_name)
 
         # Validate required columns
         required_cols = {"id", "name", "type", "storage_mode"}
@@ -252,11 +262,7 @@ class ExcelParser:
         Raises:
             ValueError: If sheet is missing or malformed
         """
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        df = self.workbook.read_sheet(sheet_name)
 
         # Validate required columns
         required_cols = {"id", "origin_id", "destination_id", "transport_mode", "transit_time_days"}
@@ -293,11 +299,7 @@ class ExcelParser:
         Raises:
             ValueError: If sheet is missing or malformed
         """
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        df = self.workbook.read_sheet(sheet_name)
 
         # Validate required columns
         required_cols = {"date", "regular_rate", "overtime_rate"}
@@ -305,20 +307,41 @@ class ExcelParser:
             missing = required_cols - set(df.columns)
             raise ValueError(f"Missing required columns: {missing}")
 
+        # Coerce columns once (missing values fall back to LaborDay defaults)
+        def numeric(col: str, default: float) -> list:
+            if col not in df.columns:
+                return [default] * len(df)
+            return pd.to_numeric(df[col]).astype(float).fillna(default).tolist()
+
+        dates = pd.to_datetime(df["date"]).dt.date.tolist()
+        fixed_hours = numeric("fixed_hours", 0.0)
+        overtime_hours = numeric("overtime_hours", 2.0)
+        regular_rates = pd.to_numeric(df["regular_rate"]).astype(float).tolist()
+        overtime_rates = pd.to_numeric(df["overtime_rate"]).astype(float).tolist()
+        non_fixed_rates = [None if pd.isna(v) else v for v in numeric("non_fixed_rate", float("nan"))]
+        minimum_hours = numeric("minimum_hours", 0.0)
+        if "is_fixed_day" in df.columns:
+            is_fixed_days = df["is_fixed_day"].where(df["is_fixed_day"].notna(), True).astype(bool).tolist()
+        else:
+            is_fixed_days = [True] * len(df)
+
         # Parse labor days
-        days = []
-        for _, row in df.iterrows():
-            day = LaborDay(
-                date=pd.to_datetime(row["date"]).date(),
-                fixed_hours=float(row["fixed_hours"]) if "fixed_hours" in row and pd.notna(row["fixed_hours"]) else 0.0,
-                overtime_hours=float(row["overtime_hours"]) if "overtime_hours" in row and pd.notna(row["overtime_hours"]) else 2.0,
-                regular_rate=float(row["regular_rate"]),
-                overtime_rate=float(row["overtime_rate"]),
-                non_fixed_rate=float(row["non_fixed_rate"]) if "non_fixed_rate" in row and pd.notna(row["non_fixed_rate"]) else None,
-                minimum_hours=float(row["minimum_hours"]) if "minimum_hours" in row and pd.notna(row["minimum_hours"]) else 0.0,
-                is_fixed_day=bool(row["is_fixed_day"]) if "is_fixed_day" in row and pd.notna(row["is_fixed_day"]) else True,
+        days = [
+            LaborDay(
+                date=day_date,
+                fixed_hours=fixed,
+                overtime_hours=overtime,
+                regular_rate=regular_rate,
+                overtime_rate=overtime_rate,
+                non_fixed_rate=non_fixed_rate,
+                minimum_hours=minimum,
+                is_fixed_day=is_fixed_day,
+            )
+            for day_date, fixed, overtime, regular_rate, overtime_rate, non_fixed_rate, minimum, is_fixed_day in zip(
+                dates, fixed_hours, overtime_hours, regular_rates, overtime_rates,
+                non_fixed_rates, minimum_hours, is_fixed_days,
             )
-            days.append(day)
+        ]
 
         calendar_name = f"Labor Calendar from {self.file_path.name}"
         return LaborCalendar(name=calendar_name, days=days)
@@ -336,11 +359,7 @@ class ExcelParser:
         Raises:
             ValueError: If sheet is missing or malformed
         """
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        df = self.workbook.read_sheet(sheet_name)
 
         # Validate required columns
         required_cols = {"id", "truck_name", "departure_type", "departure_time", "capacity"}
@@ -402,11 +421,7 @@ class ExcelParser:
         Raises:
             ValueError: If sheet is missing or malformed
         """
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        df = self.workbook.read_sheet(sheet_name)
 
         # Validate required columns
         required_cols = {"cost_type", "value"}
@@ -465,11 +480,7 @@ class ExcelParser:
             ValueError: If units_per_mix column is missing (required as of 2025-10-23)
         """
         try:
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=sheet_name,
-                engine="openpyxl"
-            )
+            df = self.workbook.read_sheet(sheet_name)
         except ValueError as e:
             if "Worksheet" in str(e) and ("not found" in str(e) or "does not exist" in str(e)):
                 raise ValueError(
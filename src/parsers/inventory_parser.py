@@ -2,13 +2,14 @@
 
 from datetime import date as Date, datetime
 from pathlib import Path
-from typing import Optional, List, Tuple
+from typing import Optional
 import warnings
 
 import pandas as pd
 
 from ..models.inventory import InventorySnapshot, InventoryEntry
-from .product_alias_resolver import ProductAliasResolver
+from .product_alias_resolver import ProductAliasResolver, resolve_product_column
+from .workbook_session import WorkbookSession
 
 
 class InventoryParser:
@@ -43,6 +44,7 @@ class InventoryParser:
         file_path: Path | str,
         product_alias_resolver: Optional[ProductAliasResolver] = None,
         snapshot_date: Optional[Date] = None,
+        workbook: Optional[WorkbookSession] = None,
     ):
         """Initialize inventory parser.
 
@@ -50,6 +52,7 @@ class InventoryParser:
             file_path: Path to inventory Excel file
             product_alias_resolver: Optional alias resolver for product codes
             snapshot_date: Date of inventory snapshot (default: today)
+            workbook: Optional WorkbookSession for file_path (avoids re-reading the file)
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -61,6 +64,7 @@ class InventoryParser:
 
         self.product_alias_resolver = product_alias_resolver
         self.snapshot_date = snapshot_date or Date.today()
+        self._workbook = workbook
 
     def parse(self, sheet_name: str | int = 0) -> InventorySnapshot:
         """Parse inventory file and return InventorySnapshot.
@@ -75,11 +79,14 @@ class InventoryParser:
             ValueError: If required columns are missing or data is malformed
         """
         # Read Excel file
-        df = pd.read_excel(
-            self.file_path,
-            sheet_name=sheet_name,
-            engine="openpyxl"
-        )
+        if self._workbook is not None:
+            df = self._workbook.read_sheet(sheet_name)
+        else:
+            df = pd.read_excel(
+                self.file_path,
+                sheet_name=sheet_name,
+                engine="openpyxl"
+            )
 
         # Validate required columns
         required_cols = {"Material", "Plant", "Unrestricted", "Base Unit of Measure"}
@@ -87,80 +94,66 @@ class InventoryParser:
             missing = required_cols - set(df.columns)
             raise ValueError(f"Missing required columns: {missing}")
 
-        # Check for Storage Location column (optional)
-        has_storage_location = "Storage Location" in df.columns
-
-        # Parse inventory entries
-        raw_entries = []
-        negative_count = 0
+        # Column-wise coercion
+        material = df["Material"].astype(str).str.strip()
+        plant = pd.to_numeric(df["Plant"])
+        quantity_raw = pd.to_numeric(df["Unrestricted"]).astype(float).fillna(0.0)
+        base_unit = df["Base Unit of Measure"]
+        base_unit = base_unit.astype(str).str.strip().str.upper().where(base_unit.notna(), None)
+        if "Storage Location" in df.columns:
+            storage_raw = pd.to_numeric(df["Storage Location"])
+            storage_location = storage_raw.astype("Int64").astype(str).where(storage_raw.notna(), None)
+        else:
+            storage_location = pd.Series([None] * len(df), index=df.index, dtype=object)
+
+        # Skip rows without a plant, then Storage Location 5000
+        keep = plant.notna()
+        is_5000 = keep & (storage_location == "5000")
+        skipped_5000 = int(is_5000.sum())
+        keep &= ~is_5000
+
+        # Convert to units based on Base Unit of Measure (unknown units: 1:1)
+        factor = base_unit.map(self.UNIT_CONVERSION)
+        unknown_units = set(base_unit[keep & factor.isna()].unique())
+        quantity_units = quantity_raw * factor.fillna(1.0)
+
+        # Handle negative quantities, then skip zero quantities
+        negative = keep & (quantity_units < 0)
+        negative_count = int(negative.sum())
+        quantity_units = quantity_units.where(~negative, 0.0)
+        keep &= quantity_units != 0
+
+        # Resolve product aliases in one mapped-series join
+        product_id = material[keep]
         unmapped_products = set()
-        skipped_5000 = 0
-        unknown_units = set()
-
-        for _, row in df.iterrows():
-            # Extract data
-            material = str(row["Material"]).strip()
-            plant = str(int(row["Plant"])) if pd.notna(row["Plant"]) else None
-            quantity_raw = float(row["Unrestricted"]) if pd.notna(row["Unrestricted"]) else 0.0
-            base_unit = str(row["Base Unit of Measure"]).strip().upper() if pd.notna(row["Base Unit of Measure"]) else None
-            storage_location = None
-            if has_storage_location and pd.notna(row.get("Storage Location")):
-                storage_location = str(int(row["Storage Location"]))
-
-            # Skip if no plant
-            if plant is None:
-                continue
-
-            # Skip Storage Location 5000
-            if storage_location == "5000":
-                skipped_5000 += 1
-                continue
-
-            # Convert to units based on Base Unit of Measure
-            if base_unit not in self.UNIT_CONVERSION:
-                unknown_units.add(base_unit)
-                quantity_units = quantity_raw  # Default to 1:1 if unknown
-            else:
-                quantity_units = quantity_raw * self.UNIT_CONVERSION[base_unit]
-
-            # Handle negative quantities
-            if quantity_units < 0:
-                negative_count += 1
-                quantity_units = 0.0
-
-            # Skip zero quantities
-            if quantity_units == 0:
-                continue
-
-            # Resolve product alias if resolver provided
-            product_id = material
-            if self.product_alias_resolver:
-                resolved_id = self.product_alias_resolver.resolve_product_id(material)
-                if resolved_id != material:
-                    product_id = resolved_id
-                elif not self.product_alias_resolver.is_mapped(material):
-                    unmapped_products.add(material)
-
-            raw_entries.append({
-                "location_id": plant,
-                "product_id": product_id,
-                "quantity": quantity_units,
-                "storage_location": storage_location,
-            })
+        if self.product_alias_resolver:
+            product_id, unmapped_products = resolve_product_column(self.product_alias_resolver, product_id)
+
+        raw = pd.DataFrame({
+            "location_id": plant[keep].astype("int64").astype(str),
+            "product_id": product_id,
+            "quantity": quantity_units[keep],
+            "storage_location": storage_location[keep],
+        })
 
         # Aggregate by (location_id, product_id, storage_location)
-        aggregated = self._aggregate_entries(raw_entries)
+        aggregated = self._aggregate_entries(raw)
 
         # Create InventoryEntry objects
-        entries = []
-        for agg in aggregated:
-            entry = InventoryEntry(
-                location_id=agg["location_id"],
-                product_id=agg["product_id"],
-                quantity=agg["quantity"],
-                storage_location=agg["storage_location"],
+        entries = [
+            InventoryEntry(
+                location_id=location_id,
+                product_id=prod_id,
+                quantity=quantity,
+                storage_location=storage,
+            )
+            for location_id, prod_id, storage, quantity in zip(
+                aggregated["location_id"],
+                aggregated["product_id"],
+                aggregated["storage_location"],
+                aggregated["quantity"],
             )
-            entries.append(entry)
+        ]
 
         # Warnings
         if negative_count > 0:
@@ -196,28 +189,25 @@ class InventoryParser:
 
         return snapshot
 
-    def _aggregate_entries(self, raw_entries: List[dict]) -> List[dict]:
+    def _aggregate_entries(self, raw_entries: pd.DataFrame) -> pd.DataFrame:
         """Aggregate raw entries by (location_id, product_id, storage_location).
 
         Args:
-            raw_entries: List of raw entry dictionaries
+            raw_entries: DataFrame with location_id, product_id, quantity and
+                storage_location columns (storage_location may be None)
 
         Returns:
-            List of aggregated entry dictionaries
+            DataFrame with one row per key, in first-occurrence order
         """
-        # Group by key
-        aggregated_dict = {}
-
-        for entry in raw_entries:
-            key = (
-                entry["location_id"],
-                entry["product_id"],
-                entry["storage_location"],
-            )
-
-            if key in aggregated_dict:
-                aggregated_dict[key]["quantity"] += entry["quantity"]
-            else:
-                aggregated_dict[key] = entry.copy()
-
-        return list(aggregated_dict.values())
+        keys = ["location_id", "product_id", "storage_location"]
+        aggregated = (
+            raw_entries
+            .groupby(keys, sort=False, dropna=False)["quantity"]
+            .sum()
+            .reset_index()
+        )
+        # groupby turns None keys into NaN
+        aggregated["storage_location"] = aggregated["storage_location"].astype(object).where(
+            aggregated["storage_location"].notna(), None
+        )
+        return aggregated
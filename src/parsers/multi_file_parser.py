@@ -1,12 +1,14 @@
 """Multi-file parser for separate forecast and network configuration files."""
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 from datetime import date as Date
+import warnings
 
 from .excel_parser import ExcelParser
 from .product_alias_resolver import ProductAliasResolver
 from .inventory_parser import InventoryParser
+from .workbook_session import ParsedDataCache, WorkbookSession
 from ..models import (
     Forecast,
     Location,
@@ -40,6 +42,11 @@ class MultiFileParser:
         # Or parse individually
         forecast = parser.parse_forecast()
         locations = parser.parse_locations()
+
+    Each file is read once (WorkbookSession); all its sheets are parsed from
+    the same open workbook. With cache_dir set, parsed results are cached on
+    disk by file content hash (ParsedDataCache), so parsing an unchanged file
+    again is a cache hit.
     """
 
     def __init__(
@@ -47,6 +54,7 @@ class MultiFileParser:
         forecast_file: Optional[Path | str] = None,
         network_file: Optional[Path | str] = None,
         inventory_file: Optional[Path | str] = None,
+        cache_dir: Optional[Path | str] = None,
     ):
         """
         Initialize multi-file parser.
@@ -56,6 +64,7 @@ class MultiFileParser:
             network_file: Path to file containing Locations, Routes, LaborCalendar,
                          TruckSchedules, CostParameters, and Alias sheets (optional)
             inventory_file: Path to file containing inventory snapshot data (optional)
+            cache_dir: Directory for the parsed-data cache (optional, no caching if None)
 
         Raises:
             ValueError: If both forecast_file and network_file are None
@@ -82,13 +91,25 @@ class MultiFileParser:
         if self.inventory_file and not self.inventory_file.exists():
             raise FileNotFoundError(f"Inventory file not found: {inventory_file}")
 
+        # One session per file: each file is read and opened once
+        self._forecast_workbook = WorkbookSession(self.forecast_file) if self.forecast_file else None
+        self._network_workbook = WorkbookSession(self.network_file) if self.network_file else None
+        self._inventory_workbook: Optional[WorkbookSession] = None
+        self._cache = ParsedDataCache(cache_dir) if cache_dir is not None else None
+
         # Load product alias resolver if network file is provided
         self._product_alias_resolver: Optional[ProductAliasResolver] = None
         if self.network_file:
             try:
-                self._product_alias_resolver = ProductAliasResolver(
-                    self.network_file,
-                    sheet_name="Alias"
+                self._product_alias_resolver = self._cached(
+                    "aliases",
+                    "Alias",
+                    [self._network_workbook],
+                    lambda: ProductAliasResolver(
+                        self.network_file,
+                        sheet_name="Alias",
+                        workbook=self._network_workbook,
+                    ),
                 )
             except Exception:
                 # If Alias sheet doesn't exist or parsing fails, continue without it
@@ -98,12 +119,64 @@ class MultiFileParser:
         # Create parsers with alias resolver
         self._forecast_parser = ExcelParser(
             self.forecast_file,
-            product_alias_resolver=self._product_alias_resolver
+            product_alias_resolver=self._product_alias_resolver,
+            workbook=self._forecast_workbook,
         ) if self.forecast_file else None
 
-        self._network_parser = ExcelParser(self.network_file) if self.network_file else None
+        self._network_parser = ExcelParser(
+            self.network_file,
+            workbook=self._network_workbook,
+        ) if self.network_file else None
         self._inventory_parser: Optional[InventoryParser] = None
 
+    def _cached(
+        self,
+        name: str,
+        sheet_name: Any,
+        workbooks: list[Optional[WorkbookSession]],
+        parse: Callable[[], Any],
+        *extra_key: Any,
+    ) -> Any:
+        """
+        Return parse() from the parsed-data cache, parsing on a miss.
+
+        Warnings raised while parsing (e.g. unmapped products) are stored with
+        the result and re-issued on a hit. Errors are not cached.
+
+        Args:
+            name: Result name (part of the cache key)
+            sheet_name: Sheet parsed (part of the cache key)
+            workbooks: Sessions of every file the result depends on (their
+                content hashes are part of the key; None = file not given)
+            parse: Function producing the result
+            *extra_key: Other inputs the result depends on
+        """
+        if self._cache is None:
+            return parse()
+
+        key = self._cache.make_key(
+            name,
+            sheet_name,
+            *[wb.content_hash if wb is not None else None for wb in workbooks],
+            *extra_key,
+        )
+        hit = self._cache.get(key)
+        if hit is not None:
+            result, issued = hit
+            for message, category in issued:
+                warnings.warn(message, category)
+            return result
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            result = parse()
+        issued = [(str(w.message), w.category) for w in caught]
+        for message, category in issued:
+            warnings.warn(message, category)
+
+        self._cache.put(key, (result, issued))
+        return result
+
     def parse_forecast(self, sheet_name: str = "Forecast") -> Forecast:
         """
         Parse forecast data with automatic product alias resolution.
@@ -123,7 +196,13 @@ class MultiFileParser:
         """
         if self._forecast_parser is None:
             raise ValueError("Cannot parse forecast: no forecast_file provided")
-        return self._forecast_parser.parse_forecast(sheet_name)
+        # Aliases come from the network file, so its contents are part of the key
+        return self._cached(
+            "forecast",
+            sheet_name,
+            [self._forecast_workbook, self._network_workbook],
+            lambda: self._forecast_parser.parse_forecast(sheet_name),
+        )
 
     def parse_locations(self, sheet_name: str = "Locations") -> list[Location]:
         """
@@ -141,7 +220,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse locations: no network_file provided")
-        return self._network_parser.parse_locations(sheet_name)
+        return self._cached(
+            "locations",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_locations(sheet_name),
+        )
 
     def parse_routes(self, sheet_name: str = "Routes") -> list[Route]:
         """
@@ -159,7 +243,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse routes: no network_file provided")
-        return self._network_parser.parse_routes(sheet_name)
+        return self._cached(
+            "routes",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_routes(sheet_name),
+        )
 
     def parse_labor_calendar(self, sheet_name: str = "LaborCalendar") -> LaborCalendar:
         """
@@ -177,7 +266,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse labor calendar: no network_file provided")
-        return self._network_parser.parse_labor_calendar(sheet_name)
+        return self._cached(
+            "labor_calendar",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_labor_calendar(sheet_name),
+        )
 
     def parse_truck_schedules(self, sheet_name: str = "TruckSchedules") -> list[TruckSchedule]:
         """
@@ -195,7 +289,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse truck schedules: no network_file provided")
-        return self._network_parser.parse_truck_schedules(sheet_name)
+        return self._cached(
+            "truck_schedules",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_truck_schedules(sheet_name),
+        )
 
     def parse_cost_structure(self, sheet_name: str = "CostParameters") -> CostStructure:
         """
@@ -213,7 +312,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse cost structure: no network_file provided")
-        return self._network_parser.parse_cost_structure(sheet_name)
+        return self._cached(
+            "cost_structure",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_cost_structure(sheet_name),
+        )
 
     def parse_products(self, sheet_name: str = "Products") -> dict[str, Product]:
         """
@@ -232,7 +336,12 @@ class MultiFileParser:
         """
         if self._network_parser is None:
             raise ValueError("Cannot parse products: no network_file provided")
-        return self._network_parser.parse_products(sheet_name)
+        return self._cached(
+            "products",
+            sheet_name,
+            [self._network_workbook],
+            lambda: self._network_parser.parse_products(sheet_name),
+        )
 
     def parse_all(
         self,
@@ -350,9 +459,15 @@ class MultiFileParser:
             raise ValueError("Cannot parse product aliases: no network_file provided")
 
         if self._product_alias_resolver is None:
-            self._product_alias_resolver = ProductAliasResolver(
-                self.network_file,
-                sheet_name=sheet_name
+            self._product_alias_resolver = self._cached(
+                "aliases",
+                sheet_name,
+                [self._network_workbook],
+                lambda: ProductAliasResolver(
+                    self.network_file,
+                    sheet_name=sheet_name,
+                    workbook=self._network_workbook,
+                ),
             )
 
         return self._product_alias_resolver
@@ -393,10 +508,18 @@ class MultiFileParser:
 
         # Create inventory parser
         if self._inventory_parser is None:
+            self._inventory_workbook = WorkbookSession(self.inventory_file)
             self._inventory_parser = InventoryParser(
                 self.inventory_file,
                 product_alias_resolver=alias_resolver,
                 snapshot_date=snapshot_date,
+                workbook=self._inventory_workbook,
             )
 
-        return self._inventory_parser.parse(sheet_name=sheet_name)
+        return self._cached(
+            "inventory",
+            sheet_name,
+            [self._inventory_workbook, self._network_workbook],
+            lambda: self._inventory_parser.parse(sheet_name=sheet_name),
+            self._inventory_parser.snapshot_date,
+        )
@@ -1,9 +1,11 @@
 """Product alias resolver for mapping equivalent product codes."""
 
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 import pandas as pd
 
+from .workbook_session import WorkbookSession
+
 
 class ProductAliasResolver:
     """Resolves product code aliases to canonical product IDs.
@@ -30,12 +32,19 @@ class ProductAliasResolver:
         Legacy files without headers are still supported for backwards compatibility.
     """
 
-    def __init__(self, network_config_file: Path | str, sheet_name: str = "Alias"):
+    def __init__(
+        self,
+        network_config_file: Path | str,
+        sheet_name: str = "Alias",
+        workbook: Optional[WorkbookSession] = None,
+    ):
         """Initialize product alias resolver.
 
         Args:
             network_config_file: Path to Network_Config.xlsx file
             sheet_name: Name of the alias sheet (default: "Alias")
+            workbook: Optional WorkbookSession for network_config_file, shared
+                with the other parsers of the same file
 
         Raises:
             FileNotFoundError: If file doesn't exist
@@ -48,17 +57,20 @@ class ProductAliasResolver:
         self.sheet_name = sheet_name
         self._alias_map: Dict[str, str] = {}
         self._canonical_products: Set[str] = set()
-        self._parse_aliases()
+        self._parse_aliases(workbook)
 
-    def _parse_aliases(self):
+    def _parse_aliases(self, workbook: Optional[WorkbookSession] = None):
         """Parse the Alias sheet and build the mapping."""
         try:
             # Read the Alias sheet
-            df = pd.read_excel(
-                self.file_path,
-                sheet_name=self.sheet_name,
-                engine="openpyxl"
-            )
+            if workbook is not None:
+                df = workbook.read_sheet(self.sheet_name)
+            else:
+                df = pd.read_excel(
+                    self.file_path,
+                    sheet_name=self.sheet_name,
+                    engine="openpyxl"
+                )
 
             if df.empty:
                 # No aliases defined - that's okay
@@ -180,3 +192,27 @@ class ProductAliasResolver:
     def __str__(self) -> str:
         """String representation."""
         return f"ProductAliasResolver({len(self._canonical_products)} products, {len(self._alias_map)} codes)"
+
+
+def resolve_product_column(resolver, product_codes: pd.Series) -> Tuple[pd.Series, Set[str]]:
+    """Resolve a column of product codes with one mapped-series join.
+
+    Each distinct code is resolved once (resolve_product_id / is_mapped), and
+    the result is mapped back onto the column, so parsers do not resolve row
+    by row.
+
+    Args:
+        resolver: ProductAliasResolver (or any object with resolve_product_id
+            and is_mapped)
+        product_codes: Series of product codes
+
+    Returns:
+        Tuple of (resolved Series with the same index, set of unmapped codes)
+    """
+    codes = product_codes.astype(str)
+    mapping = {code: resolver.resolve_product_id(code) for code in codes.unique()}
+    unmapped = {
+        code for code, resolved in mapping.items()
+        if resolved == code and not resolver.is_mapped(code)
+    }
+    return codes.map(mapping), unmapped
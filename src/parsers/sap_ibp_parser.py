@@ -8,8 +8,9 @@ import warnings
 import pandas as pd
 from openpyxl import load_workbook
 
-from ..models import Forecast, ForecastEntry
-from .product_alias_resolver import ProductAliasResolver
+from ..models import Forecast, ForecastStore
+from .product_alias_resolver import ProductAliasResolver, resolve_product_column
+from .workbook_session import WorkbookSession
 
 
 class SapIbpParser:
@@ -46,38 +47,40 @@ class SapIbpParser:
     ]
 
     @staticmethod
-    def detect_sap_ibp_format(file_path: Path) -> Optional[str]:
+    def detect_sap_ibp_format(file_path: Path, workbook: Optional[WorkbookSession] = None) -> Optional[str]:
         """
         Auto-detect SAP IBP sheets by searching for common patterns.
 
         Args:
             file_path: Path to the Excel file
+            workbook: Optional WorkbookSession for file_path. The detected sheet
+                is read once and reused by parse_sap_ibp_forecast().
 
         Returns:
             Sheet name if SAP IBP format detected, None otherwise
         """
         try:
-            # Use context manager to ensure file handle is closed (Windows compatibility)
-            with pd.ExcelFile(file_path, engine="openpyxl") as xl:
-                # Check each sheet for SAP IBP patterns
-                for sheet_name in xl.sheet_names:
-                    # Skip internal Excel sheets
-                    if sheet_name.startswith("_"):
-                        continue
-
-                    # Check if sheet name contains any SAP IBP pattern
-                    for pattern in SapIbpParser.SAP_IBP_PATTERNS:
-                        if pattern in sheet_name:
-                            # Verify structure by reading first few rows
-                            df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, nrows=6, engine="openpyxl")
-
-                            # Check if row 4 looks like headers (should have "Product ID", "Location ID", dates)
-                            if len(df) > 4:
-                                row_4 = df.iloc[4].astype(str)
-                                if "Product ID" in row_4.values and "Location ID" in row_4.values:
-                                    return sheet_name
-
-                return None
+            workbook = workbook or WorkbookSession(file_path)
+
+            # Check each sheet for SAP IBP patterns
+            for sheet_name in workbook.sheet_names:
+                # Skip internal Excel sheets
+                if sheet_name.startswith("_"):
+                    continue
+
+                # Check if sheet name contains any SAP IBP pattern
+                for pattern in SapIbpParser.SAP_IBP_PATTERNS:
+                    if pattern in sheet_name:
+                        # Verify structure from the first few rows
+                        df = workbook.read_sheet(sheet_name, header=None).head(6)
+
+                        # Check if row 4 looks like headers (should have "Product ID", "Location ID", dates)
+                        if len(df) > 4:
+                            row_4 = df.iloc[4].astype(str)
+                            if "Product ID" in row_4.values and "Location ID" in row_4.values:
+                                return sheet_name
+
+            return None
         except Exception:
             return None
 
@@ -85,7 +88,8 @@ class SapIbpParser:
     def parse_sap_ibp_forecast(
         file_path: Path,
         sheet_name: str,
-        product_alias_resolver: Optional[ProductAliasResolver] = None
+        product_alias_resolver: Optional[ProductAliasResolver] = None,
+        workbook: Optional[WorkbookSession] = None,
     ) -> Forecast:
         """
         Parse forecast data from SAP IBP export sheet.
@@ -96,6 +100,7 @@ class SapIbpParser:
             file_path: Path to the Excel file
             sheet_name: Name of the sheet containing SAP IBP data
             product_alias_resolver: Optional product alias resolver for mapping product codes to canonical IDs
+            workbook: Optional WorkbookSession for file_path (avoids re-reading the file)
 
         Returns:
             Forecast object with entries
@@ -104,7 +109,7 @@ class SapIbpParser:
             ValueError: If sheet is missing or malformed
         """
         # Read sheet with no header to access raw structure
-        df = pd.read_excel(file_path, sheet_name=sheet_name, header=None, engine="openpyxl")
+        df = (workbook or WorkbookSession(file_path)).read_sheet(sheet_name, header=None)
 
         # Validate structure
         if len(df) < 5:
@@ -196,30 +201,20 @@ class SapIbpParser:
         # Convert quantity to float
         df_long["quantity"] = df_long["quantity"].astype(float)
 
-        # Create ForecastEntry objects
-        entries = []
+        # Resolve product aliases in one mapped-series join
+        raw_product_ids = df_long["Product ID"]
+        product_ids = raw_product_ids
         unmapped_products = set()
-
-        for _, row in df_long.iterrows():
-            raw_product_id = row["Product ID"]
-
-            # Resolve product alias if resolver provided
-            product_id = raw_product_id
-            if product_alias_resolver:
-                resolved_id = product_alias_resolver.resolve_product_id(raw_product_id)
-                if resolved_id != raw_product_id:
-                    product_id = resolved_id
-                elif not product_alias_resolver.is_mapped(raw_product_id):
-                    unmapped_products.add(raw_product_id)
-
-            entry = ForecastEntry(
-                location_id=row["Location ID"],
-                product_id=product_id,  # Use resolved ID
-                forecast_date=row["date"],
-                quantity=row["quantity"],
-                confidence=None,
-            )
-            entries.append(entry)
+        if product_alias_resolver:
+            product_ids, unmapped_products = resolve_product_column(product_alias_resolver, raw_product_ids)
+
+        # Columnar forecast, validated in bulk; entries are created lazily
+        store = ForecastStore.from_columns(
+            location_ids=df_long["Location ID"].to_numpy(),
+            product_ids=product_ids.to_numpy(),
+            dates=pd.to_datetime(df_long["date"]).to_numpy(),
+            quantities=df_long["quantity"].to_numpy(dtype=float),
+        )
 
         # Warn about unmapped products
         if unmapped_products:
@@ -231,4 +226,4 @@ class SapIbpParser:
             )
 
         forecast_name = f"SAP IBP Forecast from {Path(file_path).name} (Sheet: {sheet_name})"
-        return Forecast(name=forecast_name, entries=entries)
+        return Forecast.from_store(forecast_name, store)
@@ -0,0 +1,164 @@
+"""Single-pass workbook access and on-disk cache for parsed input files.
+
+Every parser used to call pd.read_excel per sheet, so a network config with
+eight sheets was opened and parsed through openpyxl eight times (plus once
+more for SAP IBP detection). WorkbookSession reads the file once, opens the
+workbook once in read-only mode, and serves each sheet from it; a sheet read
+twice (e.g. SAP IBP detection followed by parsing) is parsed once.
+
+ParsedDataCache stores parsed results on disk keyed by the file content hash
+and PARSER_CACHE_VERSION, so re-uploading an unchanged file skips parsing.
+
+Example:
+    with WorkbookSession("Network_Config.xlsx") as workbook:
+        parser = ExcelParser(workbook.file_path, workbook=workbook)
+        locations = parser.parse_locations()
+        routes = parser.parse_routes()
+"""
+
+import hashlib
+import pickle
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pandas as pd
+
+
+# Bump when any parser's output for the same input changes (invalidates ParsedDataCache)
+PARSER_CACHE_VERSION = 1
+
+
+class WorkbookSession:
+    """An Excel file read once, with every sheet served from one open workbook.
+
+    The file is read into memory, so no OS file handle is held (Windows can
+    still replace the file while the session is alive).
+
+    Attributes:
+        file_path: Path of the workbook
+        content_hash: SHA-256 of the file contents
+    """
+
+    def __init__(self, file_path: Path | str):
+        """
+        Read the workbook file.
+
+        Args:
+            file_path: Path to the Excel file (.xlsm or .xlsx)
+
+        Raises:
+            FileNotFoundError: If file does not exist
+        """
+        self.file_path = Path(file_path)
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        self._data = self.file_path.read_bytes()
+        self.content_hash = hashlib.sha256(self._data).hexdigest()
+        self._excel: Optional[pd.ExcelFile] = None
+        self._frames: Dict[tuple, pd.DataFrame] = {}
+
+    def _workbook(self) -> pd.ExcelFile:
+        """Open the workbook (openpyxl, read-only) on first use."""
+        if self._excel is None:
+            self._excel = pd.ExcelFile(BytesIO(self._data), engine="openpyxl")
+        return self._excel
+
+    @property
+    def sheet_names(self) -> list[str]:
+        """Sheet names in workbook order."""
+        return list(self._workbook().sheet_names)
+
+    def read_sheet(self, sheet_name: str | int, header: Optional[int] = 0) -> pd.DataFrame:
+        """
+        Read a sheet as pd.read_excel would (parsed once per session).
+
+        Args:
+            sheet_name: Sheet name or index
+            header: Header row (None for no header)
+
+        Returns:
+            DataFrame (a copy - callers may modify it)
+
+        Raises:
+            ValueError: If the sheet does not exist ("Worksheet named ... not found")
+        """
+        key = (sheet_name, header)
+        if key not in self._frames:
+            self._frames[key] = self._workbook().parse(sheet_name, header=header)
+        return self._frames[key].copy()
+
+    def close(self) -> None:
+        """Release the open workbook and parsed sheets."""
+        if self._excel is not None:
+            self._excel.close()
+            self._excel = None
+        self._frames.clear()
+
+    def __enter__(self) -> "WorkbookSession":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __str__(self) -> str:
+        return f"WorkbookSession({self.file_path.name}, {self.content_hash[:12]})"
+
+
+class ParsedDataCache:
+    """On-disk cache of parsed results (pickled), keyed by content hash.
+
+    Storage structure:
+        {cache_dir}/
+            {key}.pkl - Pickled parse result
+
+    Keys combine PARSER_CACHE_VERSION with the caller's parts (parser method,
+    sheet name, content hashes of every file the result depends on), so a
+    changed file or parser version never hits a stale entry.
+    """
+
+    def __init__(self, cache_dir: Path | str = ".parse_cache"):
+        """
+        Initialize cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: .parse_cache)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Cache key for the given parts (and PARSER_CACHE_VERSION)."""
+        text = "|".join(str(p) for p in (PARSER_CACHE_VERSION,) + parts)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for key, or None on a miss (unreadable entries are removed)."""
+        path = self.cache_dir / f"{key}.pkl"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # Truncated write or incompatible pickle - treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key (written atomically)."""
+        path = self.cache_dir / f"{key}.pkl"
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f)
+        tmp_path.replace(path)
+
+    def clear(self) -> int:
+        """Delete all cache entries. Returns the number removed."""
+        removed = 0
+        for path in self.cache_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
+            removed += 1
+        return removed
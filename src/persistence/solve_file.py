@@ -2,19 +2,46 @@
 
 This module handles converting WorkflowResult objects to/from JSON format for
 persistent storage on the file system.
+
+Two formats are supported, selected by file extension:
+
+- .json: the whole result as one JSON document (original format)
+- .npz: compact binary container (NumPy zip archive). A JSON header member
+  holds everything except the stored variable values; the values
+  (solution.metadata['warmstart_hints'] and ['flow_values']) are stored as
+  one section per variable family (production, in_transit, inventory,
+  labor, ... and shortage, demand_consumed_from_ambient/_thawed), with typed
+  column arrays. The header can be read on its own and each section is only
+  read and decompressed when requested.
 """
 
 import json
+import re
 from datetime import datetime, date
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 import logging
 
+import numpy as np
+
 from ..workflows.base_workflow import WorkflowResult, WorkflowType
 from ..optimization.base_model import OptimizationResult
 
 logger = logging.getLogger(__name__)
 
+# Binary (.npz) container format
+BINARY_SUFFIX = ".npz"
+BINARY_FORMAT_NAME = "planning-solve"
+BINARY_FORMAT_VERSION = 1  # Bump on incompatible layout changes
+HEADER_KEY = "header"
+SECTION_PREFIX = "section__"
+
+# solution.metadata keys holding serialized variable values ({name: rows});
+# each variable family becomes one section
+SECTION_SOURCES = ("warmstart_hints", "flow_values")
+
+_ISO_DATE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 
 class SolveFile:
     """Handles serialization/deserialization of solve results to/from JSON files.
@@ -45,6 +72,12 @@ class SolveFile:
 
         # Load a result
         loaded_result = solve_file.load()
+
+        # Binary format: header and single sections without loading the rest
+        solve_file = SolveFile("solves/2025/wk43/daily_20251027_0615.npz")
+        header = solve_file.read_header()
+        production = solve_file.load_section("production")
+        result = solve_file.load(sections=["production", "in_transit"])
         ```
     """
 
@@ -70,6 +103,10 @@ class SolveFile:
         # Create parent directory if it doesn't exist
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
+        if self.is_binary:
+            self._save_binary(result)
+            return
+
         # Convert to dictionary
         data = self._result_to_dict(result)
 
@@ -79,8 +116,14 @@ class SolveFile:
 
         logger.info(f"Successfully saved solve result ({len(data)} keys)")
 
-    def load(self) -> WorkflowResult:
-        """Load WorkflowResult from JSON file.
+    def load(self, sections: Optional[Iterable[str]] = None) -> WorkflowResult:
+        """Load WorkflowResult from file.
+
+        Args:
+            sections: Variable families to load into
+                solution.metadata['warmstart_hints'] / ['flow_values']
+                (None = all). For binary files only these sections are
+                read; [] loads the header only.
 
         Returns:
             Loaded WorkflowResult
@@ -94,9 +137,20 @@ class SolveFile:
         if not self.file_path.exists():
             raise FileNotFoundError(f"Solve file not found: {self.file_path}")
 
-        # Read from file
-        with open(self.file_path, 'r') as f:
-            data = json.load(f)
+        if self.is_binary:
+            data = self._load_binary(sections)
+        else:
+            # Read from file
+            with open(self.file_path, 'r') as f:
+                data = json.load(f)
+            if sections is not None and data.get("solution_data"):
+                wanted = set(sections)
+                metadata = data["solution_data"].get("metadata", {})
+                for source in SECTION_SOURCES:
+                    if metadata.get(source):
+                        metadata[source] = {
+                            name: rows for name, rows in metadata[source].items() if name in wanted
+                        }
 
         # Convert to WorkflowResult
         result = self._dict_to_result(data)
@@ -112,11 +166,192 @@ class SolveFile:
         """
         return self.file_path.exists()
 
-    def _result_to_dict(self, result: WorkflowResult) -> Dict[str, Any]:
+    @property
+    def is_binary(self) -> bool:
+        """True if this file uses the binary (.npz) container format."""
+        return self.file_path.suffix.lower() == BINARY_SUFFIX
+
+    def read_header(self) -> Dict[str, Any]:
+        """Read the result fields without any variable values.
+
+        For binary files only the header member is read. For JSON files the
+        whole file is parsed and the stored values are dropped.
+
+        Returns:
+            Dictionary in the JSON file layout (without warmstart_hints and
+            flow_values). Binary headers also contain
+            "sections": {name: {"rows", "columns", "source"}}.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the binary format or version is not supported
+        """
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Solve file not found: {self.file_path}")
+
+        if self.is_binary:
+            with np.load(self.file_path, allow_pickle=False) as npz:
+                return self._decode_header(npz)
+
+        with open(self.file_path, 'r') as f:
+            data = json.load(f)
+        if data.get("solution_data"):
+            for source in SECTION_SOURCES:
+                data["solution_data"].get("metadata", {}).pop(source, None)
+        return data
+
+    def section_names(self) -> List[str]:
+        """Variable families stored in the file (binary header or JSON values)."""
+        if self.is_binary:
+            return list(self.read_header()["sections"])
+        return list(self._json_hints())
+
+    def load_section(self, name: str) -> Dict[Tuple, float]:
+        """Load one variable family.
+
+        Args:
+            name: Variable name (e.g. 'production', 'in_transit', 'shortage')
+
+        Returns:
+            Values keyed by (name, *index) with dates as date objects (the
+            warmstart hints layout, see warmstart_utils). Empty if the file
+            has no such section.
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+        """
+        if not self.file_path.exists():
+            raise FileNotFoundError(f"Solve file not found: {self.file_path}")
+
+        if not self.is_binary:
+            from ..optimization.warmstart_utils import deserialize_warmstart_hints
+            rows = self._json_hints().get(name)
+            return deserialize_warmstart_hints({name: rows}) if rows else {}
+
+        with np.load(self.file_path, allow_pickle=False) as npz:
+            header = self._decode_header(npz)
+            spec = header["sections"].get(name)
+            if spec is None:
+                return {}
+            values = npz[f"{SECTION_PREFIX}{name}__values"].tolist()
+            columns = [
+                self._decode_column(npz[f"{SECTION_PREFIX}{name}__i{i}"], kind, as_dates=True)
+                for i, kind in enumerate(spec["columns"])
+            ]
+        return {(name,) + index: value for index, value in zip(zip(*columns), values)}
+
+    def _json_hints(self) -> Dict[str, List[list]]:
+        """Serialized variable values (all SECTION_SOURCES) of a JSON solve file."""
+        with open(self.file_path, 'r') as f:
+            data = json.load(f)
+        metadata = (data.get("solution_data") or {}).get("metadata", {})
+        values: Dict[str, List[list]] = {}
+        for source in SECTION_SOURCES:
+            values.update(metadata.get(source) or {})
+        return values
+
+    # ------------------------------------------------------------------
+    # Binary container
+    # ------------------------------------------------------------------
+
+    def _save_binary(self, result: WorkflowResult) -> None:
+        """Write the result as a binary (.npz) container."""
+        metadata = (result.solution.metadata if result.solution else None) or {}
+
+        data = self._result_to_dict(result, exclude_solution_metadata=SECTION_SOURCES)
+
+        arrays: Dict[str, np.ndarray] = {}
+        sections: Dict[str, Dict[str, Any]] = {}
+        for source in SECTION_SOURCES:
+            for name, rows in (metadata.get(source) or {}).items():
+                if not rows:
+                    continue
+                columns = list(zip(*rows))
+                kinds = []
+                for i, column in enumerate(columns[:-1]):
+                    array, kind = self._encode_column(column)
+                    arrays[f"{SECTION_PREFIX}{name}__i{i}"] = array
+                    kinds.append(kind)
+                arrays[f"{SECTION_PREFIX}{name}__values"] = np.asarray(columns[-1], dtype=np.float64)
+                sections[name] = {"rows": len(rows), "columns": kinds, "source": source}
+
+        data["format"] = BINARY_FORMAT_NAME
+        data["format_version"] = BINARY_FORMAT_VERSION
+        data["sections"] = sections
+        header = json.dumps(data, default=self._json_serializer).encode("utf-8")
+        arrays[HEADER_KEY] = np.frombuffer(header, dtype=np.uint8)
+
+        # Write to a temp file and rename, so readers never see a partial file
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(f, **arrays)
+        tmp_path.replace(self.file_path)
+
+        logger.info(f"Successfully saved solve result ({len(sections)} sections)")
+
+    def _load_binary(self, sections: Optional[Iterable[str]]) -> Dict[str, Any]:
+        """Read a binary container into the JSON file layout."""
+        with np.load(self.file_path, allow_pickle=False) as npz:
+            data = self._decode_header(npz)
+            stored = data.pop("sections")
+            wanted = list(stored) if sections is None else [n for n in sections if n in stored]
+
+            by_source: Dict[str, Dict[str, List[list]]] = {}
+            for name in wanted:
+                values = npz[f"{SECTION_PREFIX}{name}__values"].tolist()
+                columns = [
+                    self._decode_column(npz[f"{SECTION_PREFIX}{name}__i{i}"], kind, as_dates=False)
+                    for i, kind in enumerate(stored[name]["columns"])
+                ]
+                # Files written before flow sections existed have no "source"
+                source = stored[name].get("source", "warmstart_hints")
+                by_source.setdefault(source, {})[name] = [list(row) for row in zip(*columns, values)]
+
+        if data.get("solution_data") is not None and by_source:
+            data["solution_data"].setdefault("metadata", {}).update(by_source)
+        return data
+
+    def _decode_header(self, npz: Any) -> Dict[str, Any]:
+        """Parse and version-check the header member of an open .npz file."""
+        if HEADER_KEY not in npz.files:
+            raise ValueError(f"Not a solve file (no header): {self.file_path}")
+        data = json.loads(npz[HEADER_KEY].tobytes().decode("utf-8"))
+        if data.get("format") != BINARY_FORMAT_NAME:
+            raise ValueError(f"Not a solve file (format {data.get('format')!r}): {self.file_path}")
+        if data.get("format_version", 0) > BINARY_FORMAT_VERSION:
+            raise ValueError(
+                f"Solve file {self.file_path} has format version {data['format_version']}; "
+                f"this version reads up to {BINARY_FORMAT_VERSION}"
+            )
+        return data
+
+    @staticmethod
+    def _encode_column(column: Tuple) -> Tuple[np.ndarray, str]:
+        """Typed array for one index column: 'date', 'int' or 'str'."""
+        if all(isinstance(c, str) and _ISO_DATE.match(c) for c in column):
+            return np.asarray(column, dtype="datetime64[D]"), "date"
+        if all(isinstance(c, int) and not isinstance(c, bool) for c in column):
+            return np.asarray(column, dtype=np.int64), "int"
+        return np.asarray([str(c) for c in column]), "str"
+
+    @staticmethod
+    def _decode_column(array: np.ndarray, kind: str, as_dates: bool) -> List[Any]:
+        """Python values for a stored index column (dates as date objects or ISO strings)."""
+        if kind == "date":
+            return array.astype(object).tolist() if as_dates else np.datetime_as_string(array, unit="D").tolist()
+        return array.tolist()
+
+    def _result_to_dict(
+        self,
+        result: WorkflowResult,
+        exclude_solution_metadata: Tuple[str, ...] = (),
+    ) -> Dict[str, Any]:
         """Convert WorkflowResult to dictionary for JSON serialization.
 
         Args:
             result: WorkflowResult to convert
+            exclude_solution_metadata: solution.metadata keys to leave out
+                (stored separately by the binary format)
 
         Returns:
             Dictionary representation
@@ -136,7 +371,7 @@ class SolveFile:
 
         # Serialize solution if present
         if result.solution:
-            data["solution_data"] = self._solution_to_dict(result.solution)
+            data["solution_data"] = self._solution_to_dict(result.solution, exclude_solution_metadata)
         else:
             data["solution_data"] = None
 
@@ -176,17 +411,23 @@ class SolveFile:
             error_message=data.get("error_message"),
         )
 
-    def _solution_to_dict(self, solution: OptimizationResult) -> Dict[str, Any]:
+    def _solution_to_dict(
+        self,
+        solution: OptimizationResult,
+        exclude_metadata: Tuple[str, ...] = (),
+    ) -> Dict[str, Any]:
         """Convert OptimizationResult to dictionary.
 
         Args:
             solution: OptimizationResult to serialize
+            exclude_metadata: Metadata keys to leave out
 
         Returns:
             Dictionary representation
         """
         # Convert metadata to JSON-serializable format (handle tuple keys)
-        serializable_metadata = self._make_json_serializable(solution.metadata) if solution.metadata else {}
+        metadata = {k: v for k, v in (solution.metadata or {}).items() if k not in exclude_metadata}
+        serializable_metadata = self._make_json_serializable(metadata) if metadata else {}
 
         return {
             "success": solution.success,
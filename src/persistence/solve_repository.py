@@ -7,23 +7,30 @@ Folder Structure:
     solves/
     ├── 2025/
     │   ├── wk43/
-    │   │   ├── initial_20251021_0830.json
-    │   │   ├── daily_20251021_0615.json
-    │   │   ├── daily_20251022_0610.json
-    │   │   ├── daily_20251023_0608.json
+    │   │   ├── initial_20251021_0830.npz
+    │   │   ├── daily_20251021_0615.npz
+    │   │   ├── daily_20251022_0610.npz
+    │   │   ├── daily_20251023_0608.json   - Older JSON solves stay readable
     │   │   ├── ...
-    │   │   └── weekly_20251027_0730.json
+    │   │   └── weekly_20251027_0730.npz
     │   └── wk44/
-    │       ├── daily_20251028_0612.json
+    │       ├── daily_20251028_0612.npz
     │       └── ...
-    └── 2026/
-        └── ...
+    ├── 2026/
+    │   └── ...
+    └── index.sqlite3      - Metadata index (one row per solve file)
+
+The index lets listing, filtering and cleanup run as queries instead of
+opening every solve file. It is updated in the same call as save() (in a
+transaction), and rebuilt from the solve files if it is missing.
 """
 
+from contextlib import closing
 from datetime import datetime, date as Date
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 import logging
+import sqlite3
 from dataclasses import dataclass
 
 from .solve_file import SolveFile
@@ -58,7 +65,10 @@ class SolveRepository:
     """Manages solve file storage and retrieval.
 
     The repository organizes solve files in a hierarchical structure:
-    - solves/{year}/wk{week}/{workflow_type}_{YYYYMMDD}_{HHMM}.json
+    - solves/{year}/wk{week}/{workflow_type}_{YYYYMMDD}_{HHMM}.{npz|json}
+
+    New solves are saved in the binary format (see SolveFile) unless
+    file_format="json" is passed; both formats are listed and loaded.
 
     This enables:
     - Easy discovery of solves by date, week, or type
@@ -86,16 +96,134 @@ class SolveRepository:
         ```
     """
 
-    def __init__(self, base_path: Path | str = "solves"):
+    INDEX_FILENAME = "index.sqlite3"
+    FILE_FORMATS = ("npz", "json")
+
+    def __init__(self, base_path: Path | str = "solves", file_format: str = "npz"):
         """Initialize SolveRepository.
 
         Args:
             base_path: Base directory for solve storage (default: "solves")
+            file_format: Format for new solve files: "npz" (binary, default)
+                or "json"
+
+        Raises:
+            ValueError: If file_format is not supported
         """
+        if file_format not in self.FILE_FORMATS:
+            raise ValueError(f"Unsupported solve file format {file_format!r} (expected one of {self.FILE_FORMATS})")
+        self.file_format = file_format
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.base_path / self.INDEX_FILENAME
+
+        if not self.index_path.exists():
+            self.rebuild_index()
+
         logger.info(f"Initialized SolveRepository at {self.base_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the metadata index (creating the table if needed)."""
+        conn = sqlite3.connect(self.index_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS solves (
+                file_path TEXT PRIMARY KEY,
+                workflow_type TEXT NOT NULL,
+                solve_timestamp TEXT NOT NULL,
+                success INTEGER NOT NULL,
+                objective_value REAL,
+                year INTEGER NOT NULL,
+                week INTEGER NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_solves_timestamp ON solves (solve_timestamp)")
+        return conn
+
+    def rebuild_index(self) -> int:
+        """Rebuild the metadata index by reading every solve file.
+
+        Called automatically when the index is missing. Run it manually after
+        adding or removing solve files outside the repository.
+
+        Returns:
+            Number of solves indexed
+        """
+        rows = []
+        for file_path in sorted(p for fmt in self.FILE_FORMATS for p in self.base_path.rglob(f"*.{fmt}")):
+            try:
+                rows.append(self._metadata_to_row(self._extract_metadata(file_path)))
+            except Exception as e:
+                logger.warning(f"Failed to load metadata from {file_path}: {e}")
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM solves")
+            conn.executemany("INSERT OR REPLACE INTO solves VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+        logger.info(f"Rebuilt solve index at {self.index_path} ({len(rows)} solves)")
+        return len(rows)
+
+    def _metadata_to_row(self, metadata: SolveMetadata) -> tuple:
+        """Index row for a solve (file path stored relative to base_path)."""
+        return (
+            metadata.file_path.relative_to(self.base_path).as_posix(),
+            metadata.workflow_type.value,
+            metadata.solve_timestamp.isoformat(),
+            int(metadata.success),
+            metadata.objective_value,
+            metadata.year,
+            metadata.week_number,
+        )
+
+    def _row_to_metadata(self, row: tuple) -> SolveMetadata:
+        """SolveMetadata for an index row."""
+        file_path, workflow_type, solve_timestamp, success, objective_value, year, week = row
+        return SolveMetadata(
+            file_path=self.base_path / file_path,
+            workflow_type=WorkflowType(workflow_type),
+            solve_timestamp=datetime.fromisoformat(solve_timestamp),
+            success=bool(success),
+            objective_value=objective_value,
+            week_number=week,
+            year=year,
+        )
+
+    def _query(
+        self,
+        workflow_type: Optional[WorkflowType] = None,
+        successful_only: bool = False,
+        year: Optional[int] = None,
+        week: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[SolveMetadata]:
+        """Indexed solves matching the filters, most recent first."""
+        conditions, params = [], []
+        if workflow_type:
+            conditions.append("workflow_type = ?")
+            params.append(workflow_type.value)
+        if successful_only:
+            conditions.append("success = 1")
+        if year is not None:
+            conditions.append("year = ?")
+            params.append(year)
+        if week is not None:
+            conditions.append("week = ?")
+            params.append(week)
+
+        sql = "SELECT * FROM solves"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY solve_timestamp DESC"
+        if limit or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit if limit else -1, offset]
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [self._row_to_metadata(row) for row in rows]
+
     def save(self, result: WorkflowResult) -> Path:
         """Save a solve result to the repository.
 
@@ -124,14 +252,32 @@ class SolveRepository:
         solve_file = SolveFile(file_path)
         solve_file.save(result)
 
+        # Index it (transaction: the row is written completely or not at all)
+        year, week, _ = result.solve_timestamp.isocalendar()
+        metadata = SolveMetadata(
+            file_path=file_path,
+            workflow_type=result.workflow_type,
+            solve_timestamp=result.solve_timestamp,
+            success=result.success,
+            objective_value=result.objective_value,
+            week_number=week,
+            year=year,
+        )
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO solves VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._metadata_to_row(metadata),
+            )
+
         logger.info(f"Saved {result.workflow_type.value} solve to {file_path}")
         return file_path
 
-    def load(self, file_path: Path | str) -> WorkflowResult:
+    def load(self, file_path: Path | str, sections: Optional[Iterable[str]] = None) -> WorkflowResult:
         """Load a solve result from file.
 
         Args:
             file_path: Path to solve file
+            sections: Variable families to load (None = all, see SolveFile.load)
 
         Returns:
             Loaded WorkflowResult
@@ -140,36 +286,41 @@ class SolveRepository:
             FileNotFoundError: If file doesn't exist
         """
         solve_file = SolveFile(file_path)
-        return solve_file.load()
+        return solve_file.load(sections=sections)
 
     def get_latest_solve(
         self,
         workflow_type: Optional[WorkflowType] = None,
-        successful_only: bool = True
+        successful_only: bool = True,
+        sections: Optional[Iterable[str]] = None,
     ) -> Optional[WorkflowResult]:
         """Get the most recent solve result.
 
         Args:
             workflow_type: Filter by workflow type (None = any type)
             successful_only: Only return successful solves (default: True)
+            sections: Variable families to load (None = all, see SolveFile.load)
 
         Returns:
             Most recent WorkflowResult, or None if no solves found
         """
-        solves = self.list_all_solves(
-            workflow_type=workflow_type,
-            successful_only=successful_only
-        )
-
-        if not solves:
-            return None
-
-        # Sort by timestamp (most recent first)
-        solves.sort(key=lambda s: s.solve_timestamp, reverse=True)
-        latest_metadata = solves[0]
-
-        # Load and return full result
-        return self.load(latest_metadata.file_path)
+        for metadata in self._query(workflow_type=workflow_type, successful_only=successful_only):
+            try:
+                return self.load(metadata.file_path, sections=sections)
+            except FileNotFoundError:
+                # Deleted outside the repository - drop the stale row and try the next one
+                logger.warning(f"Indexed solve file missing, removing from index: {metadata.file_path}")
+                self._remove_from_index([metadata])
+
+        return None
+
+    def _remove_from_index(self, solves: List[SolveMetadata]) -> None:
+        """Delete index rows for the given solves."""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "DELETE FROM solves WHERE file_path = ?",
+                [(m.file_path.relative_to(self.base_path).as_posix(),) for m in solves],
+            )
 
     def get_solves_for_week(
         self,
@@ -187,30 +338,7 @@ class SolveRepository:
         Returns:
             List of SolveMetadata for the specified week
         """
-        week_dir = self.base_path / str(year) / f"wk{week:02d}"
-
-        if not week_dir.exists():
-            return []
-
-        # Find all JSON files in week directory
-        solves = []
-        for file_path in week_dir.glob("*.json"):
-            try:
-                metadata = self._extract_metadata(file_path)
-
-                # Filter by workflow type if specified
-                if workflow_type and metadata.workflow_type != workflow_type:
-                    continue
-
-                solves.append(metadata)
-
-            except Exception as e:
-                logger.warning(f"Failed to load metadata from {file_path}: {e}")
-                continue
-
-        # Sort by timestamp
-        solves.sort(key=lambda s: s.solve_timestamp, reverse=True)
-        return solves
+        return self._query(workflow_type=workflow_type, year=year, week=week)
 
     def list_all_solves(
         self,
@@ -228,34 +356,11 @@ class SolveRepository:
         Returns:
             List of SolveMetadata, sorted by timestamp (most recent first)
         """
-        solves = []
-
-        # Recursively find all JSON files
-        for file_path in self.base_path.rglob("*.json"):
-            try:
-                metadata = self._extract_metadata(file_path)
-
-                # Apply filters
-                if workflow_type and metadata.workflow_type != workflow_type:
-                    continue
-
-                if successful_only and not metadata.success:
-                    continue
-
-                solves.append(metadata)
-
-            except Exception as e:
-                logger.warning(f"Failed to load metadata from {file_path}: {e}")
-                continue
-
-        # Sort by timestamp (most recent first)
-        solves.sort(key=lambda s: s.solve_timestamp, reverse=True)
-
-        # Apply limit
-        if limit:
-            solves = solves[:limit]
-
-        return solves
+        return self._query(
+            workflow_type=workflow_type,
+            successful_only=successful_only,
+            limit=limit,
+        )
 
     def delete_old_solves(
         self,
@@ -276,22 +381,25 @@ class SolveRepository:
             f"of type {workflow_type.value if workflow_type else 'all'})"
         )
 
-        # Get all solves
-        all_solves = self.list_all_solves(workflow_type=workflow_type)
-
-        # Determine which to delete
-        to_delete = all_solves[keep_latest_n:]
+        # Everything after the N most recent (index query, no files read)
+        to_delete = self._query(workflow_type=workflow_type, offset=keep_latest_n)
 
         # Delete files
         deleted_count = 0
+        removed = []
         for metadata in to_delete:
             try:
                 metadata.file_path.unlink()
                 deleted_count += 1
+                removed.append(metadata)
                 logger.debug(f"Deleted old solve: {metadata.file_path}")
+            except FileNotFoundError:
+                removed.append(metadata)  # Already gone - just drop the index row
             except Exception as e:
                 logger.warning(f"Failed to delete {metadata.file_path}: {e}")
 
+        self._remove_from_index(removed)
+
         logger.info(f"Deleted {deleted_count} old solve files")
         return deleted_count
 
@@ -302,7 +410,7 @@ class SolveRepository:
     ) -> Path:
         """Generate file path for a solve result.
 
-        Format: solves/{year}/wk{week}/{workflow_type}_{YYYYMMDD}_{HHMM}.json
+        Format: solves/{year}/wk{week}/{workflow_type}_{YYYYMMDD}_{HHMM}.{file_format}
 
         Args:
             workflow_type: Type of workflow
@@ -321,12 +429,12 @@ class SolveRepository:
         # Generate filename
         date_str = timestamp.strftime("%Y%m%d")
         time_str = timestamp.strftime("%H%M")
-        filename = f"{workflow_type.value}_{date_str}_{time_str}.json"
+        filename = f"{workflow_type.value}_{date_str}_{time_str}.{self.file_format}"
 
         return week_dir / filename
 
     def _extract_metadata(self, file_path: Path) -> SolveMetadata:
-        """Extract metadata from a solve file without loading full solution.
+        """Extract metadata from a solve file (used to rebuild the index).
 
         Args:
             file_path: Path to solve file
@@ -334,11 +442,8 @@ class SolveRepository:
         Returns:
             SolveMetadata object
         """
-        import json
-
-        # Read just the metadata (not full solution)
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        # Read just the metadata (binary files: header member only)
+        data = SolveFile(file_path).read_header()
 
         workflow_type = WorkflowType(data["workflow_type"])
         solve_timestamp = datetime.fromisoformat(data["solve_timestamp"])
@@ -8,8 +8,18 @@ from .manager import (
     Scenario,
     ScenarioManager,
 )
+from .sweep import (
+    ScenarioSweep,
+    SweepCase,
+    SweepResult,
+    build_sweep_grid,
+)
 
 __all__ = [
     "Scenario",
     "ScenarioManager",
+    "ScenarioSweep",
+    "SweepCase",
+    "SweepResult",
+    "build_sweep_grid",
 ]
@@ -8,12 +8,34 @@ from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pathlib import Path
+import hashlib
 import pickle
 import json
 import uuid
 import pandas as pd
 from copy import deepcopy
 
+from ..models.forecast import Forecast
+
+
+# Scenario fields stored as content-addressed payload blobs; everything else is
+# metadata kept in the scenario record and the index
+PAYLOAD_FIELDS = (
+    'forecast_data',
+    'labor_calendar',
+    'truck_schedules',
+    'cost_parameters',
+    'locations',
+    'routes',
+    'manufacturing_site',
+    'optimization_config',
+    'planning_results',
+    'optimization_results',
+)
+
+# Version of the {scenario_id}.pkl record (version 1 = pickled Scenario)
+RECORD_FORMAT_VERSION = 2
+
 
 @dataclass
 class Scenario:
@@ -113,10 +135,18 @@ class ScenarioManager:
     Handles saving, loading, comparing, and exporting planning scenarios.
     Uses file-based storage with pickle for full object serialization.
 
+    A scenario is stored as a small record (metadata plus payload hashes) and
+    one blob per input/result field (PAYLOAD_FIELDS). Blobs are named by the
+    SHA-256 of their content (see _content_digest), so a forecast or network
+    shared by several scenarios is stored once. Listing and comparing read
+    only the index.
+
     Storage structure:
         {storage_dir}/
-            {scenario_id}.pkl  - Pickled scenario objects
-            index.json         - Metadata index for fast listing
+            {scenario_id}.pkl  - Scenario record (metadata + payload hashes;
+                                 older versions: the pickled Scenario)
+            blobs/{sha256}.pkl - Pickled payloads, shared between scenarios
+            index.json         - Metadata index for fast listing and comparison
 
     Example:
         >>> manager = ScenarioManager()
@@ -149,6 +179,8 @@ class ScenarioManager:
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(exist_ok=True)
         self.index_file = self.storage_dir / "index.json"
+        self.blob_dir = self.storage_dir / "blobs"
+        self.blob_dir.mkdir(exist_ok=True)
 
         # Load or create index
         self._load_index()
@@ -169,20 +201,23 @@ class ScenarioManager:
             json.dump(self._index, f, indent=2, default=str)
 
     def _update_index(self, scenario: Scenario) -> None:
-        """Update index with scenario metadata."""
-        self._index[scenario.id] = {
-            'id': scenario.id,
-            'name': scenario.name,
-            'description': scenario.description,
-            'created_at': scenario.created_at.isoformat(),
-            'modified_at': scenario.modified_at.isoformat(),
-            'tags': scenario.tags,
-            'planning_mode': scenario.planning_mode,
-            'total_cost': scenario.total_cost,
-            'demand_satisfaction_pct': scenario.demand_satisfaction_pct,
-        }
+        """Update index with scenario metadata (everything but the payloads)."""
+        entry = self._metadata(scenario)
+        entry['created_at'] = scenario.created_at.isoformat()
+        entry['modified_at'] = scenario.modified_at.isoformat()
+        entry['format_version'] = RECORD_FORMAT_VERSION
+        self._index[scenario.id] = entry
         self._save_index()
 
+    @staticmethod
+    def _metadata(scenario: Scenario) -> Dict[str, Any]:
+        """Scenario fields that are not payloads."""
+        return {
+            name: getattr(scenario, name)
+            for name in Scenario.__dataclass_fields__
+            if name not in PAYLOAD_FIELDS
+        }
+
     def _remove_from_index(self, scenario_id: str) -> None:
         """Remove scenario from index."""
         if scenario_id in self._index:
@@ -190,20 +225,138 @@ class ScenarioManager:
             self._save_index()
 
     def _save_to_file(self, scenario: Scenario) -> None:
-        """Save scenario to pickle file."""
-        file_path = self.storage_dir / f"{scenario.id}.pkl"
-        with open(file_path, 'wb') as f:
-            pickle.dump(scenario, f)
+        """Save scenario payloads as blobs and its record to {id}.pkl."""
+        payloads = {}
+        for name in PAYLOAD_FIELDS:
+            value = getattr(scenario, name)
+            if value is not None:
+                payloads[name] = self._write_blob(value)
+
+        self._write_record(scenario.id, {
+            'format_version': RECORD_FORMAT_VERSION,
+            'metadata': self._metadata(scenario),
+            'payloads': payloads,
+        })
 
     def _load_from_file(self, scenario_id: str) -> Scenario:
-        """Load scenario from pickle file."""
-        file_path = self.storage_dir / f"{scenario_id}.pkl"
+        """Load scenario (metadata and payloads) from its record."""
+        record = self._load_record(scenario_id)
+        if isinstance(record, Scenario):
+            return record  # Version 1: whole scenario pickled
+
+        payloads = {name: self._read_blob(digest) for name, digest in record['payloads'].items()}
+        return Scenario(**record['metadata'], **payloads)
+
+    def _load_metadata(self, scenario_id: str) -> Scenario:
+        """Load scenario metadata only (payload fields None).
+
+        Read from the index; records indexed by older versions (or missing
+        from the index) are read from their record file.
+        """
+        entry = self._index.get(scenario_id)
+        if entry is not None and entry.get('format_version') == RECORD_FORMAT_VERSION:
+            metadata = {name: entry.get(name) for name in Scenario.__dataclass_fields__ if name not in PAYLOAD_FIELDS}
+            metadata['created_at'] = datetime.fromisoformat(entry['created_at'])
+            metadata['modified_at'] = datetime.fromisoformat(entry['modified_at'])
+            metadata['tags'] = list(entry.get('tags') or [])
+            return Scenario(**metadata)
+
+        record = self._load_record(scenario_id)
+        if isinstance(record, Scenario):
+            return record
+        return Scenario(**record['metadata'])
+
+    def _record_path(self, scenario_id: str) -> Path:
+        return self.storage_dir / f"{scenario_id}.pkl"
+
+    def _load_record(self, scenario_id: str) -> Any:
+        """Unpickle a scenario record (dict, or Scenario for version 1)."""
+        file_path = self._record_path(scenario_id)
         if not file_path.exists():
             raise FileNotFoundError(f"Scenario {scenario_id} not found")
 
         with open(file_path, 'rb') as f:
             return pickle.load(f)
 
+    def _write_record(self, scenario_id: str, record: Dict[str, Any]) -> None:
+        self._write_atomic(self._record_path(scenario_id), pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.blob_dir / f"{digest}.pkl"
+
+    @staticmethod
+    def _content_digest(value: Any, data: bytes) -> str:
+        """SHA-256 naming a payload blob.
+
+        Forecasts are hashed from their name, creation date and store columns,
+        so equal forecasts share a blob however their objects were built or
+        cached. Other payloads are hashed from their pickle (data).
+        """
+        if not isinstance(value, Forecast):
+            return hashlib.sha256(data).hexdigest()
+
+        store = value.store
+        h = hashlib.sha256()
+        h.update(json.dumps([
+            'Forecast', value.name, value.creation_date.isoformat(),
+            list(store.location_table), list(store.product_table),
+        ]).encode())
+        for column in (store.location_codes, store.product_codes, store.days,
+                       store.quantities, store.confidences):
+            h.update(column.tobytes())
+        return h.hexdigest()
+
+    def _write_blob(self, value: Any) -> str:
+        """Store a payload under the SHA-256 of its content; returns the hash."""
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        digest = self._content_digest(value, data)
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            self._write_atomic(blob_path, data)
+        return digest
+
+    def _read_blob(self, digest: str) -> Any:
+        blob_path = self._blob_path(digest)
+        if not blob_path.exists():
+            raise FileNotFoundError(f"Scenario payload {digest} not found")
+        with open(blob_path, 'rb') as f:
+            return pickle.load(f)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        """Write via a temporary file so readers never see a partial file."""
+        tmp_path = path.with_name(f"{path.name}.{uuid.uuid4().hex}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        tmp_path.replace(path)
+
+    def _referenced_blobs(self) -> set:
+        """Hashes of the blobs referenced by scenario records on disk.
+
+        Records are scanned rather than this manager's index, which may be
+        stale when several managers share the storage directory.
+        """
+        referenced = set()
+        for file_path in self.storage_dir.glob("*.pkl"):
+            try:
+                with open(file_path, 'rb') as f:
+                    record = pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                continue
+            if isinstance(record, dict) and record.get('format_version') == RECORD_FORMAT_VERSION:
+                referenced.update(record['payloads'].values())
+        return referenced
+
+    def _remove_unreferenced_blobs(self) -> int:
+        """Delete blobs no scenario record refers to; returns how many."""
+        referenced = self._referenced_blobs()
+        removed = 0
+        for blob_path in self.blob_dir.glob("*.pkl"):
+            if blob_path.stem not in referenced:
+                blob_path.unlink()
+                removed += 1
+        return removed
+
     def save_scenario(
         self,
         name: str,
@@ -368,7 +521,8 @@ class ScenarioManager:
             reverse: Sort in descending order (newest/highest first)
 
         Returns:
-            List of Scenario objects (metadata only, not full objects)
+            List of Scenario objects (metadata only, payload fields None;
+            use load_scenario() for inputs and results)
 
         Example:
             >>> # List all scenarios
@@ -382,17 +536,18 @@ class ScenarioManager:
         """
         scenarios = []
 
-        for scenario_id, metadata in self._index.items():
+        for scenario_id, metadata in list(self._index.items()):
             # Filter by tags
             if tags is not None:
                 scenario_tags = set(metadata.get('tags', []))
                 if not any(tag in scenario_tags for tag in tags):
                     continue
 
-            # Load full scenario to return
+            # Metadata only (payloads stay on disk)
             try:
-                scenario = self._load_from_file(scenario_id)
-                scenarios.append(scenario)
+                if not self._record_path(scenario_id).exists():
+                    raise FileNotFoundError(f"Scenario {scenario_id} not found")
+                scenarios.append(self._load_metadata(scenario_id))
             except FileNotFoundError:
                 # Scenario file missing - remove from index
                 self._remove_from_index(scenario_id)
@@ -425,11 +580,12 @@ class ScenarioManager:
         Example:
             >>> manager.delete_scenario("abc-123-def")
         """
-        file_path = self.storage_dir / f"{scenario_id}.pkl"
+        file_path = self._record_path(scenario_id)
 
         if file_path.exists():
             file_path.unlink()
             self._remove_from_index(scenario_id)
+            self._remove_unreferenced_blobs()  # Payloads shared with other scenarios stay
             return True
 
         return False
@@ -462,23 +618,29 @@ class ScenarioManager:
             ...     tags=["baseline", "approved"]
             ... )
         """
-        scenario = self._load_from_file(scenario_id)
+        record = self._load_record(scenario_id)
+        if isinstance(record, Scenario):
+            # Version 1 record: rewrite in the current format
+            self._save_to_file(record)
+            record = self._load_record(scenario_id)
+
+        metadata = record['metadata']
 
         # Update fields
         if name is not None:
-            scenario.name = name
+            metadata['name'] = name
         if description is not None:
-            scenario.description = description
+            metadata['description'] = description
         if tags is not None:
-            scenario.tags = tags
+            metadata['tags'] = tags
 
-        scenario.modified_at = datetime.now()
+        metadata['modified_at'] = datetime.now()
 
-        # Save updated scenario
-        self._save_to_file(scenario)
-        self._update_index(scenario)
+        # Save updated record (payload blobs are unchanged)
+        self._write_record(scenario_id, record)
+        self._update_index(Scenario(**metadata))
 
-        return scenario
+        return self._load_from_file(scenario_id)
 
     def compare_scenarios(
         self,
@@ -489,6 +651,8 @@ class ScenarioManager:
         Args:
             scenario_ids: List of scenario IDs to compare
 
+        Only scenario metadata is read (no payloads are unpickled).
+
         Returns:
             DataFrame with metrics side-by-side
 
@@ -496,7 +660,7 @@ class ScenarioManager:
             >>> comparison = manager.compare_scenarios([id1, id2, id3])
             >>> print(comparison)
         """
-        scenarios = [self._load_from_file(sid) for sid in scenario_ids]
+        scenarios = [self._load_metadata(sid) for sid in scenario_ids]
 
         # Build comparison data
         data = []
@@ -754,8 +918,10 @@ class ScenarioManager:
     def get_storage_size(self) -> int:
         """Get total storage size in bytes.
 
+        Payload blobs shared by several scenarios are counted once.
+
         Returns:
-            Total size of all scenario files in bytes
+            Total size of all scenario records, payload blobs and the index in bytes
 
         Example:
             >>> size = manager.get_storage_size()
@@ -766,6 +932,9 @@ class ScenarioManager:
         for file_path in self.storage_dir.glob("*.pkl"):
             total_size += file_path.stat().st_size
 
+        for blob_path in self.blob_dir.glob("*.pkl"):
+            total_size += blob_path.stat().st_size
+
         # Add index file size
         if self.index_file.exists():
             total_size += self.index_file.stat().st_size
@@ -773,10 +942,10 @@ class ScenarioManager:
         return total_size
 
     def cleanup_orphaned_files(self) -> int:
-        """Remove scenario files not in index.
+        """Remove scenario files not in index and payload blobs no scenario uses.
 
         Returns:
-            Number of files removed
+            Number of files removed (records and blobs)
 
         Example:
             >>> removed = manager.cleanup_orphaned_files()
@@ -792,4 +961,6 @@ class ScenarioManager:
                 file_path.unlink()
                 removed += 1
 
+        removed += self._remove_unreferenced_blobs()
+
         return removed
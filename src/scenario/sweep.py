@@ -0,0 +1,459 @@
+"""Parallel scenario sweeps on top of ScenarioManager.
+
+A sweep takes a base scenario (its saved inputs) plus a grid of parameter
+overrides, solves every case with SlidingWindowModel in a process pool and
+saves each result into the scenario store as it finishes. The comparison
+table (ScenarioManager.compare_scenarios) is built at the end.
+
+Supported overrides (SWEEP_PARAMETERS, plus any CostStructure field):
+    demand_multiplier: Scale every forecast quantity
+    truck_capacity: Capacity (units) of every truck schedule
+    ambient_shelf_life / frozen_shelf_life / thawed_shelf_life: Shelf life (days)
+    horizon_weeks: Planning horizon length
+    <CostStructure field>: e.g. shortage_penalty_per_unit=5000
+
+Each worker solves one case at a time with HiGHS limited to threads_per_worker
+threads, so max_workers * threads_per_worker should not exceed the cores.
+
+Example:
+    >>> manager = ScenarioManager()
+    >>> sweep = ScenarioSweep(manager, manager.load_scenario(base_id), horizon_weeks=4,
+    ...                       max_workers=16, threads_per_worker=2, time_limit_seconds=600)
+    >>> cases = build_sweep_grid(truck_capacity=[14080, 16000], demand_multiplier=[0.9, 1.0, 1.1])
+    >>> result = sweep.run(cases, tags=["capacity-what-if"])
+    >>> print(result.comparison)
+"""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date as Date, timedelta
+from itertools import product as cartesian_product
+from typing import Any, Callable, Dict, List, Optional
+import contextlib
+import io
+import logging
+import time
+
+import pandas as pd
+
+from .manager import Scenario, ScenarioManager
+
+logger = logging.getLogger(__name__)
+
+
+SWEEP_PARAMETERS = (
+    'demand_multiplier',
+    'truck_capacity',
+    'ambient_shelf_life',
+    'frozen_shelf_life',
+    'thawed_shelf_life',
+    'horizon_weeks',
+)
+
+# Shelf-life parameters -> SlidingWindowModel(shelf_life=...) state keys
+SHELF_LIFE_STATES = {
+    'ambient_shelf_life': 'ambient',
+    'frozen_shelf_life': 'frozen',
+    'thawed_shelf_life': 'thawed',
+}
+
+
+@dataclass
+class SweepCase:
+    """One point of a sweep grid.
+
+    Attributes:
+        name: Label used in the saved scenario name
+        overrides: Parameter overrides {parameter: value}
+    """
+    name: str
+    overrides: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class SweepResult:
+    """Outcome of ScenarioSweep.run().
+
+    Attributes:
+        scenario_ids: Saved scenario IDs in case order (failed cases omitted)
+        failures: {case name: error message} for cases that raised
+        comparison: compare_scenarios() table over scenario_ids
+        wall_time_seconds: Elapsed time for the whole sweep
+    """
+    scenario_ids: List[str]
+    failures: Dict[str, str]
+    comparison: pd.DataFrame
+    wall_time_seconds: float
+
+
+def build_sweep_grid(**axes: List[Any]) -> List[SweepCase]:
+    """Cartesian product of parameter values as sweep cases.
+
+    Args:
+        **axes: Parameter name -> list of values
+
+    Returns:
+        One SweepCase per combination, named "param=value, ..."
+
+    Example:
+        >>> build_sweep_grid(truck_capacity=[14080, 16000], demand_multiplier=[1.0, 1.2])
+        [SweepCase(name='truck_capacity=14080, demand_multiplier=1.0', ...), ...]
+    """
+    names = list(axes)
+    cases = []
+    for values in cartesian_product(*(axes[name] for name in names)):
+        overrides = dict(zip(names, values))
+        label = ', '.join(f"{name}={value}" for name, value in overrides.items())
+        cases.append(SweepCase(name=label or 'base', overrides=overrides))
+    return cases
+
+
+def validate_overrides(overrides: Dict[str, Any], cost_structure: Any = None) -> None:
+    """Check override names before any case is solved.
+
+    Raises:
+        ValueError: If a parameter is neither a sweep parameter nor a
+            CostStructure field
+    """
+    cost_fields = set(type(cost_structure).model_fields) if hasattr(type(cost_structure), 'model_fields') else set()
+    unknown = [name for name in overrides if name not in SWEEP_PARAMETERS and name not in cost_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown sweep parameter(s): {', '.join(sorted(unknown))}. "
+            f"Expected one of {', '.join(SWEEP_PARAMETERS)} or a CostStructure field"
+        )
+
+
+def apply_overrides(inputs: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    """Sweep inputs with overrides applied (the base inputs are not modified).
+
+    Args:
+        inputs: Base inputs (see ScenarioSweep.base_inputs)
+        overrides: Parameter overrides
+
+    Returns:
+        New inputs dict; shelf-life overrides are collected under 'shelf_life'
+    """
+    validate_overrides(overrides, inputs.get('cost_structure'))
+    case = dict(inputs)
+    case['shelf_life'] = dict(inputs.get('shelf_life') or {})
+
+    cost_updates = {}
+    for name, value in overrides.items():
+        if name == 'demand_multiplier':
+            case['forecast'] = _scale_forecast(inputs['forecast'], float(value))
+        elif name == 'truck_capacity':
+            case['truck_schedules'] = [
+                schedule.model_copy(update={'capacity': float(value)})
+                for schedule in inputs['truck_schedules']
+            ]
+        elif name in SHELF_LIFE_STATES:
+            case['shelf_life'][SHELF_LIFE_STATES[name]] = int(value)
+        elif name == 'horizon_weeks':
+            case['horizon_weeks'] = int(value)
+        else:
+            cost_updates[name] = value
+
+    if cost_updates:
+        case['cost_structure'] = inputs['cost_structure'].model_copy(update=cost_updates)
+
+    return case
+
+
+def _scale_forecast(forecast: Any, multiplier: float) -> Any:
+    """Forecast with every quantity multiplied (shares the store's key columns)."""
+    from ..models.forecast import Forecast
+    from ..models.forecast_store import ForecastStore
+
+    store = forecast.store
+    scaled = ForecastStore(
+        location_table=store.location_table,
+        product_table=store.product_table,
+        location_codes=store.location_codes,
+        product_codes=store.product_codes,
+        days=store.days,
+        quantities=store.quantities * multiplier,
+        confidences=store.confidences,
+    )
+    return Forecast.from_store(forecast.name, scaled, creation_date=forecast.creation_date)
+
+
+# ----------------------------------------------------------------------------
+# Worker side (module-level so the process pool can pickle it)
+# ----------------------------------------------------------------------------
+
+_WORKER_INPUTS: Optional[Dict[str, Any]] = None
+
+
+def _init_worker(inputs: Dict[str, Any]) -> None:
+    """Process pool initializer: receive the base inputs once per worker."""
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+
+
+def _solve_case(case: SweepCase, settings: Dict[str, Any], inputs: Optional[Dict[str, Any]] = None):
+    """Build and solve one sweep case.
+
+    Args:
+        case: Sweep case
+        settings: Solver settings (time_limit_seconds, mip_gap, threads, quiet)
+        inputs: Base inputs (None = the worker's, set by _init_worker)
+
+    Returns:
+        OptimizationResult with cost KPIs added to metadata
+    """
+    from ..optimization.legacy_to_unified_converter import LegacyToUnifiedConverter
+    from ..optimization.sliding_window_model import SlidingWindowModel
+
+    inputs = apply_overrides(inputs if inputs is not None else _WORKER_INPUTS, case.overrides)
+
+    output = io.StringIO() if settings.get('quiet', True) else None
+    with contextlib.redirect_stdout(output) if output is not None else contextlib.nullcontext():
+        nodes, routes, trucks = LegacyToUnifiedConverter().convert_all(
+            manufacturing_site=inputs['manufacturing_site'],
+            locations=inputs['locations'],
+            routes=inputs['routes'],
+            truck_schedules=inputs['truck_schedules'],
+            forecast=inputs['forecast'],
+        )
+
+        start_date = inputs['start_date']
+        model = SlidingWindowModel(
+            nodes=nodes,
+            routes=routes,
+            forecast=inputs['forecast'],
+            labor_calendar=inputs['labor_calendar'],
+            cost_structure=inputs['cost_structure'],
+            products=inputs['products'],
+            start_date=start_date,
+            end_date=start_date + timedelta(days=inputs['horizon_weeks'] * 7 - 1),
+            truck_schedules=trucks,
+            initial_inventory=inputs['initial_inventory'],
+            inventory_snapshot_date=inputs['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+            shelf_life=inputs['shelf_life'] or None,
+        )
+
+        result = model.solve(
+            solver_name='appsi_highs',
+            solver_options={'threads': settings['threads']} if settings.get('threads') else None,
+            time_limit_seconds=settings.get('time_limit_seconds'),
+            mip_gap=settings.get('mip_gap'),
+        )
+
+    solution = model.get_solution() if result.is_feasible() else None
+    if solution is not None:
+        result.metadata.update({
+            'labor_cost': solution.costs.labor.total,
+            'production_cost': solution.costs.production.total,
+            'transport_cost': solution.costs.transport.total,
+            'waste_cost': solution.costs.waste.total,
+            'demand_satisfaction_pct': solution.fill_rate * 100,
+            'total_production_units': int(round(solution.total_production)),
+        })
+    result.metadata['sweep_overrides'] = dict(case.overrides)
+    return result
+
+
+class ScenarioSweep:
+    """Solve a grid of parameter overrides of a base scenario in parallel.
+
+    Results are saved through the ScenarioManager in the parent process (the
+    only writer of the scenario index) as each case finishes.
+    """
+
+    def __init__(
+        self,
+        manager: ScenarioManager,
+        base_scenario: Scenario,
+        products: Optional[Dict[str, Any]] = None,
+        start_date: Optional[Date] = None,
+        horizon_weeks: int = 4,
+        initial_inventory: Optional[Dict[tuple, float]] = None,
+        inventory_snapshot_date: Optional[Date] = None,
+        max_workers: Optional[int] = None,
+        threads_per_worker: int = 2,
+        time_limit_seconds: Optional[float] = None,
+        mip_gap: Optional[float] = 0.01,
+    ):
+        """Initialize a sweep.
+
+        Args:
+            manager: Scenario store results are saved into
+            base_scenario: Scenario whose inputs are swept (forecast, labor
+                calendar, truck schedules, cost parameters, locations, routes,
+                manufacturing site)
+            products: Products by ID (default: one per forecast product, 415 units per mix)
+            start_date: Planning start (default: first forecast date)
+            horizon_weeks: Planning horizon unless overridden per case
+            initial_inventory: {(location, product, state): quantity}
+            inventory_snapshot_date: Date of initial_inventory
+            max_workers: Worker processes (None = cores // threads_per_worker;
+                1 = solve in this process)
+            threads_per_worker: HiGHS threads per solve
+            time_limit_seconds: Time limit per solve
+            mip_gap: MIP gap per solve
+
+        Raises:
+            ValueError: If the base scenario lacks inputs needed to solve
+        """
+        missing = [
+            name for name in ('forecast_data', 'labor_calendar', 'truck_schedules',
+                              'cost_parameters', 'locations', 'routes', 'manufacturing_site')
+            if getattr(base_scenario, name) is None
+        ]
+        if missing:
+            raise ValueError(f"Base scenario '{base_scenario.name}' is missing inputs: {', '.join(missing)}")
+
+        self.manager = manager
+        self.base_scenario = base_scenario
+        self.max_workers = max_workers
+        self.threads_per_worker = threads_per_worker
+        self.settings = {
+            'time_limit_seconds': time_limit_seconds,
+            'mip_gap': mip_gap,
+            'threads': threads_per_worker,
+            'quiet': True,
+        }
+
+        forecast = base_scenario.forecast_data
+        cost_structure = base_scenario.cost_parameters
+        if isinstance(cost_structure, dict):
+            from ..models.cost_structure import CostStructure
+            cost_structure = CostStructure(**cost_structure)
+
+        truck_schedules = base_scenario.truck_schedules
+        if hasattr(truck_schedules, 'schedules'):
+            truck_schedules = truck_schedules.schedules
+
+        if products is None:
+            from ..models.product import Product
+            products = {
+                pid: Product(id=pid, sku=pid, name=pid, units_per_mix=415)
+                for pid in forecast.store.product_ids
+            }
+
+        start_date = start_date or forecast.store.start_date
+        self.base_inputs: Dict[str, Any] = {
+            'forecast': forecast,
+            'labor_calendar': base_scenario.labor_calendar,
+            'truck_schedules': list(truck_schedules),
+            'cost_structure': cost_structure,
+            'locations': base_scenario.locations,
+            'routes': base_scenario.routes,
+            'manufacturing_site': base_scenario.manufacturing_site,
+            'products': products,
+            'start_date': start_date,
+            'horizon_weeks': horizon_weeks,
+            'initial_inventory': initial_inventory or {},
+            'inventory_snapshot_date': inventory_snapshot_date or start_date,
+            'shelf_life': {},
+        }
+
+    def run(
+        self,
+        cases: List[SweepCase],
+        tags: Optional[List[str]] = None,
+        on_result: Optional[Callable[[SweepCase, Scenario], None]] = None,
+    ) -> SweepResult:
+        """Solve all cases and save each as a scenario as soon as it finishes.
+
+        Args:
+            cases: Sweep cases (see build_sweep_grid)
+            tags: Extra tags for the saved scenarios ('sweep' is always added)
+            on_result: Called with (case, saved scenario) as each case is saved
+
+        Returns:
+            SweepResult with the comparison table in case order
+
+        Raises:
+            ValueError: If a case uses an unknown parameter (checked up front)
+        """
+        for case in cases:
+            validate_overrides(case.overrides, self.base_inputs['cost_structure'])
+
+        start = time.time()
+        saved: Dict[int, str] = {}
+        failures: Dict[str, str] = {}
+
+        def record(position: int, case: SweepCase, result=None, error: Optional[BaseException] = None):
+            if error is not None:
+                logger.error(f"Sweep case '{case.name}' failed: {error}")
+                failures[case.name] = str(error)
+                return
+            scenario = self._save_case(case, result, tags)
+            saved[position] = scenario.id
+            logger.info(f"Sweep case '{case.name}' saved as {scenario.id} ({len(saved)}/{len(cases)})")
+            if on_result is not None:
+                on_result(case, scenario)
+
+        if self.max_workers == 1:
+            for position, case in enumerate(cases):
+                try:
+                    result = _solve_case(case, self.settings, self.base_inputs)
+                except Exception as e:
+                    record(position, case, error=e)
+                else:
+                    record(position, case, result)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self._worker_count(len(cases)),
+                initializer=_init_worker,
+                initargs=(self.base_inputs,),
+            ) as executor:
+                futures = {
+                    executor.submit(_solve_case, case, self.settings): (position, case)
+                    for position, case in enumerate(cases)
+                }
+                for future in as_completed(futures):
+                    position, case = futures[future]
+                    error = future.exception()
+                    record(position, case, None if error else future.result(), error)
+
+        scenario_ids = [saved[position] for position in sorted(saved)]
+        comparison = self.manager.compare_scenarios(scenario_ids) if scenario_ids else pd.DataFrame()
+
+        return SweepResult(
+            scenario_ids=scenario_ids,
+            failures=failures,
+            comparison=comparison,
+            wall_time_seconds=time.time() - start,
+        )
+
+    def _worker_count(self, num_cases: int) -> int:
+        if self.max_workers is not None:
+            return max(1, min(self.max_workers, num_cases))
+        import os
+        cores = os.cpu_count() or 1
+        return max(1, min(cores // max(1, self.threads_per_worker), num_cases))
+
+    def _save_case(self, case: SweepCase, result, tags: Optional[List[str]]) -> Scenario:
+        """Save one solved case with the inputs it was solved with."""
+        inputs = apply_overrides(self.base_inputs, case.overrides)
+        start_date = inputs['start_date']
+
+        return self.manager.save_scenario(
+            name=f"{self.base_scenario.name} [{case.name}]",
+            description=f"Sweep of '{self.base_scenario.name}': {case.name}",
+            forecast_data=inputs['forecast'],
+            labor_calendar=inputs['labor_calendar'],
+            truck_schedules=inputs['truck_schedules'],
+            cost_parameters=inputs['cost_structure'],
+            locations=inputs['locations'],
+            routes=inputs['routes'],
+            manufacturing_site=inputs['manufacturing_site'],
+            planning_mode='optimization',
+            optimization_config={
+                'base_scenario_id': self.base_scenario.id,
+                'overrides': dict(case.overrides),
+                'start_date': start_date.isoformat(),
+                'end_date': (start_date + timedelta(days=inputs['horizon_weeks'] * 7 - 1)).isoformat(),
+                'time_limit_seconds': self.settings['time_limit_seconds'],
+                'mip_gap': self.settings['mip_gap'],
+                'threads': self.settings['threads'],
+            },
+            optimization_results=result,
+            tags=['sweep'] + list(tags or []),
+        )
@@ -197,19 +197,20 @@ class RetroVisualization:
 
     def _spawn_trucks_for_date(self, date: Date):
         """Spawn trucks departing on the given date."""
-        for movement in self.all_movements:
-            if movement.departure_date == date:
-                # Get positions
-                origin_pos = LOCATION_POSITIONS.get(movement.origin, (MAP_WIDTH // 2, MAP_HEIGHT // 2))
-                dest_pos = LOCATION_POSITIONS.get(movement.destination, (MAP_WIDTH // 2, MAP_HEIGHT // 2))
-
-                animated_truck = AnimatedTruck(
-                    movement=movement,
-                    origin_pos=origin_pos,
-                    dest_pos=dest_pos,
-                    progress=0.0,
-                )
-                self.active_trucks.append(animated_truck)
+        for leg in self.extractor.transit_index.departing(date):
+            movement = leg.item
+
+            # Get positions
+            origin_pos = LOCATION_POSITIONS.get(movement.origin, (MAP_WIDTH // 2, MAP_HEIGHT // 2))
+            dest_pos = LOCATION_POSITIONS.get(movement.destination, (MAP_WIDTH // 2, MAP_HEIGHT // 2))
+
+            animated_truck = AnimatedTruck(
+                movement=movement,
+                origin_pos=origin_pos,
+                dest_pos=dest_pos,
+                progress=0.0,
+            )
+            self.active_trucks.append(animated_truck)
 
     def _update_trucks(self):
         """Update positions of active trucks."""
@@ -9,6 +9,8 @@ from dataclasses import dataclass
 from datetime import date as Date, timedelta
 from collections import defaultdict
 
+from ..analysis.transit_index import TransitIndex, TransitLeg
+
 
 @dataclass
 class TruckMovement:
@@ -78,6 +80,10 @@ class SolutionDataExtractor:
         # Get demand satisfaction from shortages
         self.shortages = solution.get("shortages_by_dest_product_date", {})
 
+        # Truck movements and their interval index (built on first use)
+        self._movements: Optional[List[TruckMovement]] = None
+        self._transit_index: Optional[TransitIndex] = None
+
     def get_all_dates(self) -> List[Date]:
         """Get all unique dates in the solution, sorted."""
         dates = set()
@@ -122,6 +128,68 @@ class SolutionDataExtractor:
         Returns:
             List of TruckMovement objects representing truck trips
         """
+        if self._movements is None:
+            self._movements = self._extract_truck_movements()
+        return list(self._movements)
+
+    @property
+    def transit_index(self) -> TransitIndex:
+        """Interval index over truck movements (item = TruckMovement)."""
+        if self._transit_index is None:
+            self._transit_index = TransitIndex(
+                TransitLeg(
+                    origin_id=m.origin,
+                    destination_id=m.destination,
+                    departure_date=m.departure_date,
+                    arrival_date=m.arrival_date,
+                    item=m,
+                )
+                for m in self.get_truck_movements()
+            )
+        return self._transit_index
+
+    def get_movements_in_transit(
+        self,
+        date: Date,
+        origin: Optional[str] = None,
+        destination: Optional[str] = None,
+    ) -> List[TruckMovement]:
+        """
+        Truck movements on the road on a date (departed, not yet arrived).
+
+        Args:
+            date: Date to query
+            origin: Only movements from this location (optional)
+            destination: Only movements to this location (optional)
+
+        Returns:
+            List of TruckMovement objects
+        """
+        return [leg.item for leg in self.transit_index.on_date(date, origin, destination)]
+
+    def get_movements_between(
+        self,
+        start_date: Date,
+        end_date: Date,
+        origin: Optional[str] = None,
+        destination: Optional[str] = None,
+    ) -> List[TruckMovement]:
+        """
+        Truck movements on the road at any time in a date range (inclusive).
+
+        Args:
+            start_date: First date of the range
+            end_date: Last date of the range
+            origin: Only movements from this location (optional)
+            destination: Only movements to this location (optional)
+
+        Returns:
+            List of TruckMovement objects
+        """
+        return [leg.item for leg in self.transit_index.between(start_date, end_date, origin, destination)]
+
+    def _extract_truck_movements(self) -> List[TruckMovement]:
+        """Build truck movements from truck loads or leg-based shipments."""
         movements = []
 
         # If we have truck load data, use that
@@ -222,10 +290,9 @@ class SolutionDataExtractor:
             if loc == location_id and inv_date == date:
                 inventory_ambient[product] = quantity
 
-        # Get inbound and outbound shipments
-        all_movements = self.get_truck_movements()
-        inbound = [m for m in all_movements if m.destination == location_id and m.departure_date == date]
-        outbound = [m for m in all_movements if m.origin == location_id and m.departure_date == date]
+        # Get inbound and outbound shipments (departing on this date)
+        inbound = [leg.item for leg in self.transit_index.departing(date, destination_id=location_id)]
+        outbound = [leg.item for leg in self.transit_index.departing(date, origin_id=location_id)]
 
         # Get demand satisfied (for breadroom locations)
         demand_satisfied = {}
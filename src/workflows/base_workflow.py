@@ -44,7 +44,7 @@ class WorkflowConfig:
         fixed_period_weeks: Number of weeks that are frozen (Daily only)
         solve_time_limit: Maximum solve time in seconds (None = no limit)
         mip_gap_tolerance: MIP gap tolerance (e.g., 0.01 for 1%)
-        solver_name: Solver to use (e.g., 'appsi_highs', 'cbc')
+        solver_name: Solver to use (e.g., 'appsi_highs', 'highs_direct', 'portfolio', 'cbc')
         use_warmstart: Whether to use warmstart from previous solve
         allow_shortages: Whether to allow demand shortages
         track_batches: Whether to track production batches
@@ -168,7 +168,11 @@ class BaseWorkflow(ABC):
 
         # Will be populated during execution
         self.model = None
+        self.input_data: Optional[Dict[str, Any]] = None
         self.warmstart_data = None
+        self.warmstart_hints: Optional[Dict[tuple, float]] = None
+        self.fixed_period = None  # FixedPeriod set by apply_fixed_periods() (Daily)
+        self.telemetry = None  # SolveTelemetry set by the caller for live solve progress
         self.result: Optional[WorkflowResult] = None
 
         logger.info(
@@ -236,6 +240,7 @@ class BaseWorkflow(ABC):
             # Step 1: Prepare input data
             logger.info("Step 1: Preparing input data")
             input_data = self.prepare_input_data()
+            self.input_data = input_data
 
             # Step 2: Prepare warmstart
             if self.config.use_warmstart:
@@ -460,14 +465,121 @@ class BaseWorkflow(ABC):
     def _apply_warmstart(self) -> None:
         """Apply warmstart data to model variables.
 
-        This is called after model is built and before solving.
+        This is called after model is built and before solving. The Pyomo model
+        is (re)built inside solve(), so the hints are handed to solve() and
+        loaded into the fresh model there (with bound/integrality repair).
         """
         if not self.warmstart_data or not self.model:
             return
 
-        # Implementation will be added when warmstart module is ready
-        logger.info("Warmstart application not yet implemented")
-        pass
+        self.warmstart_hints = self.warmstart_data.get("hints") or None
+        if self.warmstart_hints:
+            logger.info(
+                f"Warmstart: {len(self.warmstart_hints):,} variable values "
+                f"from {self.warmstart_data.get('source', 'previous solve')}"
+            )
+
+    def _load_previous_solve(
+        self,
+        previous_solve_path: Optional[str],
+        workflow_types: Optional[List[WorkflowType]] = None,
+        sections: Optional[List[str]] = None,
+    ) -> Optional[tuple]:
+        """Load the solve this workflow builds on.
+
+        Args:
+            previous_solve_path: Solve file to load. If None, the most recent
+                successful solve in the default SolveRepository is used.
+            workflow_types: Acceptable workflow types for auto-discovery
+                (None = any type)
+            sections: Variable families to load (None = all). Binary solve
+                files only read these sections.
+
+        Returns:
+            Tuple of (WorkflowResult, source description), or None if no
+            previous solve exists
+
+        Raises:
+            FileNotFoundError: If previous_solve_path does not exist
+        """
+        from ..persistence.solve_file import SolveFile
+        from ..persistence.solve_repository import SolveRepository
+
+        if previous_solve_path is not None:
+            return SolveFile(previous_solve_path).load(sections=sections), str(previous_solve_path)
+
+        repository = SolveRepository()
+        previous = None
+        for workflow_type in (workflow_types or [None]):
+            candidate = repository.get_latest_solve(workflow_type=workflow_type, sections=sections)
+            if candidate and (previous is None or candidate.solve_timestamp > previous.solve_timestamp):
+                previous = candidate
+        if previous is None:
+            return None
+        return previous, f"latest {previous.workflow_type.value} solve ({previous.solve_timestamp:%Y-%m-%d %H:%M})"
+
+    def _load_previous_warmstart(
+        self,
+        previous_solve_path: Optional[str],
+        workflow_types: Optional[List[WorkflowType]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Load a saved solve and roll its variable values onto this horizon.
+
+        Args:
+            previous_solve_path: Solve file to warmstart from. If None, the most
+                recent successful solve in the default SolveRepository is used.
+            workflow_types: Acceptable workflow types for auto-discovery
+                (None = any type)
+
+        Returns:
+            Warmstart data dictionary (hints, source, statistics), or None if no
+            usable previous solve exists
+
+        Raises:
+            FileNotFoundError: If previous_solve_path does not exist
+        """
+        from ..optimization.warmstart_utils import (
+            extract_warmstart_for_rolling_window,
+            validate_warmstart_quality,
+        )
+
+        loaded = self._load_previous_solve(previous_solve_path, workflow_types)
+        if loaded is None:
+            logger.warning("No previous solve found for warmstart. Using cold start.")
+            return None
+        previous, source = loaded
+
+        hints = self._previous_solution_values(previous)
+        if not hints:
+            logger.warning(f"Previous solve {source} has no warmstart values. Using cold start.")
+            return None
+
+        rolled = extract_warmstart_for_rolling_window(
+            hints,
+            new_start_date=self.input_data["planning_start_date"],
+            new_end_date=self.input_data["planning_end_date"],
+        )
+        is_valid, message = validate_warmstart_quality(hints, rolled, min_overlap_ratio=0.5)
+        logger.info(f"Warmstart from {source}: {message}")
+        if not rolled:
+            return None
+
+        return {
+            "hints": rolled,
+            "source": source,
+            "previous_workflow_type": previous.workflow_type.value,
+            "num_previous_values": len(hints),
+            "num_values": len(rolled),
+            "quality_ok": is_valid,
+        }
+
+    @staticmethod
+    def _previous_solution_values(previous: WorkflowResult) -> Optional[Dict[tuple, float]]:
+        """Variable values stored with a saved solve (see _solve_model), or None."""
+        from ..optimization.warmstart_utils import deserialize_warmstart_hints
+
+        serialized = previous.solution.metadata.get("warmstart_hints") if previous.solution else None
+        return deserialize_warmstart_hints(serialized) if serialized else None
 
     def _solve_model(self) -> Optional[OptimizationResult]:
         """Solve the optimization model.
@@ -483,8 +595,31 @@ class BaseWorkflow(ABC):
             time_limit_seconds=self.config.solve_time_limit,
             mip_gap=self.config.mip_gap_tolerance,
             tee=True,  # DIAGNOSTIC: Show HiGHS output to see why it's infeasible
+            warmstart_hints=self.warmstart_hints,
+            fixed_period=self.fixed_period,
+            telemetry=self.telemetry,
         )
 
+        # Keep the incumbent in the result so the next Daily/Weekly solve can warmstart from it
+        if solution is not None and solution.is_feasible() and getattr(self.model, 'model', None) is not None:
+            from ..optimization.warmstart_utils import (
+                RECORDED_FLOW_VARIABLES,
+                extract_solution_for_warmstart,
+                serialize_warmstart_hints,
+            )
+            try:
+                hints = extract_solution_for_warmstart(self.model)
+                solution.metadata["warmstart_hints"] = serialize_warmstart_hints(hints)
+            except ValueError as e:
+                logger.warning(f"Could not extract warmstart values from solution: {e}")
+
+            # Shortages and demand consumed, stored with the solve (not hints)
+            try:
+                flows = extract_solution_for_warmstart(self.model, variables=RECORDED_FLOW_VARIABLES)
+                solution.metadata["flow_values"] = serialize_warmstart_hints(flows)
+            except ValueError as e:
+                logger.warning(f"Could not extract shortage/consumption values from solution: {e}")
+
         return solution
 
     def _validate_solution(self, solution: Optional[OptimizationResult]) -> Dict[str, Any]:
@@ -537,6 +672,10 @@ class BaseWorkflow(ABC):
             "planning_end_date": input_data.get("planning_end_date").isoformat() if input_data.get("planning_end_date") else None,
             "solver_name": self.config.solver_name,
             "used_warmstart": self.warmstart_data is not None,
+            "warmstart_source": self.warmstart_data.get("source") if self.warmstart_data else None,
+            "warmstart_values": len(self.warmstart_hints) if self.warmstart_hints else 0,
+            "fixed_period_start_date": self.fixed_period.start_date.isoformat() if self.fixed_period else None,
+            "fixed_period_end_date": self.fixed_period.end_date.isoformat() if self.fixed_period else None,
             "num_locations": len(self.locations),
             "num_routes": len(self.routes),
             "num_products": len(self.products),
@@ -180,7 +180,9 @@ class DailyWorkflow(BaseWorkflow):
         3. Extract variable values for initialization
 
         Note: Unlike Weekly workflow, Daily does NOT shift time forward.
-        The warmstart is used as-is since we're replanning the same horizon.
+        Dates shared with the previous solve keep their values exactly
+        (yesterday's incumbent for days 2-N); the new last day is left to
+        the solver.
 
         Returns:
             Warmstart data dictionary if using warmstart, None otherwise
@@ -195,50 +197,86 @@ class DailyWorkflow(BaseWorkflow):
 
         logger.info("Preparing warmstart for Daily workflow")
 
-        # TODO: Implement warmstart extraction
-        # This will be completed when warmstart module is ready
-        logger.warning(
-            "Warmstart extraction not yet implemented. "
-            "Using cold start for now."
+        return self._load_previous_warmstart(
+            self.previous_solve_path,
+            workflow_types=[WorkflowType.DAILY, WorkflowType.WEEKLY, WorkflowType.INITIAL],
         )
 
-        return None
-
     def apply_fixed_periods(self) -> None:
         """Fix variables for weeks 5-12 (locked time periods).
 
         For Daily workflow:
         - Weeks 1-4 (free period): Variables remain free
-        - Weeks 5-12 (fixed period): Variables fixed to previous solve values
+        - Weeks 5-12 (fixed period): Production, shipments and truck pallets
+          fixed to the previous solve's values (see optimization.fixed_periods)
         - Today (day 0): Already locked via today_plan_approved
 
-        This ensures long-term plan stability while allowing near-term replanning.
+        Inventory stays free, so yesterday's actuals (reflected in the starting
+        inventory) flow through the free period into the fixed plan. The fixed
+        period ends where the previous solve's horizon ended; the newest day(s)
+        are left free.
+
+        The decisions are fixed when solve() builds the Pyomo model. Before the
+        MIP runs, an LP pre-check verifies the fixed plan is still feasible.
 
         Raises:
             ValueError: If fixed periods create infeasibility with actuals
+                (raised from solve())
         """
         if not self.model:
             raise RuntimeError("Model must be built before applying fixed periods")
 
+        self.fixed_period = None
+        if self.input_data.get("all_periods_free") or not self.config.fixed_period_weeks:
+            logger.info("All periods free - no fixed periods applied")
+            return
+
         logger.info(
             f"Applying fixed periods for weeks {self.config.free_period_weeks + 1}-"
-            f"{self.config.planning_horizon_weeks} (weeks 5-12)"
+            f"{self.config.planning_horizon_weeks}"
         )
 
-        # TODO: Implement fixed period application
-        # This will be completed when fixed_periods module is ready
-        logger.warning(
-            "Fixed period application not yet implemented. "
-            "All periods will remain free for now."
+        from ..optimization.fixed_periods import FIXED_PERIOD_VARIABLES, FixedPeriod
+
+        # Only the fixed decision families are needed (binary solve files skip the rest)
+        loaded = self._load_previous_solve(
+            self.previous_solve_path,
+            workflow_types=[WorkflowType.DAILY, WorkflowType.WEEKLY, WorkflowType.INITIAL],
+            sections=list(FIXED_PERIOD_VARIABLES),
         )
+        if loaded is None:
+            logger.warning("No previous solve found. All periods will remain free.")
+            return
+        previous, source = loaded
+
+        values = self._previous_solution_values(previous)
+        if not values:
+            logger.warning(f"Previous solve {source} has no variable values. All periods will remain free.")
+            return
+
+        # Only dates the previous solve actually planned can be fixed
+        previous_end = previous.metadata.get("planning_end_date")
+        if previous_end:
+            previous_end = Date.fromisoformat(previous_end)
+        else:
+            previous_end = max(c for key in values for c in key if isinstance(c, Date))
+
+        fixed_start = self.input_data["fixed_period_start_date"]
+        fixed_end = min(self.input_data["planning_end_date"], previous_end)
+        if fixed_end < fixed_start:
+            logger.warning(
+                f"Previous solve {source} ends {previous_end}, before the fixed period "
+                f"starts ({fixed_start}). All periods will remain free."
+            )
+            return
 
-        # Future implementation will:
-        # 1. Load previous solve values for weeks 5-12
-        # 2. Fix production variables to those values
-        # 3. Fix shipment variables to those values
-        # 4. Allow inventory to adjust based on actuals
-        # 5. Validate that fixed values are feasible
-        # 6. Raise error if infeasibility detected
+        self.fixed_period = FixedPeriod(
+            start_date=fixed_start,
+            end_date=fixed_end,
+            values=values,
+            source=source,
+        )
+        logger.info(f"Fixed period {fixed_start} to {fixed_end} from {source}")
 
     def get_variance_report(self) -> Dict[str, Any]:
         """Generate variance report comparing plan vs actuals.
@@ -126,9 +126,10 @@ class WeeklyWorkflow(BaseWorkflow):
 
         For Weekly workflow:
         1. Load previous solve (Initial or Weekly)
-        2. Shift time forward by 1 week (weeks 2-12 → weeks 1-11)
-        3. Validate compatibility with new problem
-        4. Generate preview data for planner approval
+        2. Roll forward onto the new horizon: calendar dates shared with the
+           previous solve (its weeks 2-12 = new weeks 1-11) keep their values,
+           the new week 12 is left to the solver
+        3. Validate compatibility with new problem (overlap ratio)
 
         Returns:
             Warmstart data dictionary if using warmstart, None otherwise
@@ -143,15 +144,11 @@ class WeeklyWorkflow(BaseWorkflow):
 
         logger.info("Preparing warmstart for Weekly workflow")
 
-        # TODO: Implement warmstart extraction and shifting
-        # This will be completed when warmstart module is ready
-        logger.warning(
-            "Warmstart extraction not yet implemented. "
-            "Using cold start for now."
+        return self._load_previous_warmstart(
+            self.previous_solve_path,
+            workflow_types=[WorkflowType.WEEKLY, WorkflowType.INITIAL],
         )
 
-        return None
-
     def apply_fixed_periods(self) -> None:
         """Apply fixed period constraints.
 
@@ -1,7 +1,10 @@
 """Pytest configuration and shared fixtures."""
 
+import contextlib
+import io
 import pytest
-from datetime import date
+from datetime import date, timedelta
+from pathlib import Path
 
 from src.models import (
     Location,
@@ -144,3 +147,139 @@ def create_test_products(product_ids: list[str]) -> dict[str, Product]:
             units_per_mix=415  # Default test value
         )
     return products
+
+
+# ----------------------------------------------------------------------
+# Real-network SlidingWindowModel fixture and shared solver helpers
+# ----------------------------------------------------------------------
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "examples"
+
+
+@pytest.fixture(scope="module")
+def network_data():
+    """Real network + forecast + inventory, converted to unified format."""
+    from src.parsers.multi_file_parser import MultiFileParser
+    from src.models.manufacturing import ManufacturingSite
+    from src.optimization.legacy_to_unified_converter import LegacyToUnifiedConverter
+
+    parser = MultiFileParser(
+        forecast_file=DATA_DIR / "Gluten Free Forecast - Latest.xlsm",
+        network_file=DATA_DIR / "Network_Config.xlsx",
+        inventory_file=DATA_DIR / "inventory_latest.XLSX",
+    )
+    forecast, locations, routes, labor_calendar, truck_schedules_list, cost_structure = parser.parse_all()
+
+    manuf_loc = [loc for loc in locations if loc.type == LocationType.MANUFACTURING][0]
+    manufacturing_site = ManufacturingSite(
+        id=manuf_loc.id,
+        name=manuf_loc.name,
+        storage_mode=manuf_loc.storage_mode,
+        production_rate=1400.0,
+        daily_startup_hours=0.5,
+        daily_shutdown_hours=0.25,
+        default_changeover_hours=0.5,
+        production_cost_per_unit=cost_structure.production_cost_per_unit,
+    )
+    inventory_snapshot = parser.parse_inventory(snapshot_date=None)
+
+    converter = LegacyToUnifiedConverter()
+    return {
+        'nodes': converter.convert_nodes(manufacturing_site, locations, forecast),
+        'routes': converter.convert_routes(routes),
+        'truck_schedules': converter.convert_truck_schedules(truck_schedules_list, manufacturing_site.id),
+        'forecast': forecast,
+        'products': create_test_products(sorted(set(e.product_id for e in forecast.entries))),
+        'labor_calendar': labor_calendar,
+        'cost_structure': cost_structure,
+        'initial_inventory': inventory_snapshot.to_optimization_dict(),
+        'inventory_snapshot_date': inventory_snapshot.snapshot_date,
+    }
+
+
+def create_network_model(data: dict, weeks: int, end_date=None, **kwargs):
+    """
+    SlidingWindowModel over `weeks` weeks of the network_data fixture.
+
+    Shortages, pallet tracking and truck pallet tracking are on; kwargs are
+    passed to the model (e.g. granularity=..., prune_unreachable=False).
+    end_date, if given, replaces the end computed from `weeks`.
+    Construction output is suppressed.
+    """
+    from src.optimization.sliding_window_model import SlidingWindowModel
+
+    start = data['inventory_snapshot_date']
+    if end_date is None:
+        end_date = start + timedelta(weeks=weeks)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SlidingWindowModel(
+            nodes=data['nodes'],
+            routes=data['routes'],
+            forecast=data['forecast'],
+            products=data['products'],
+            labor_calendar=data['labor_calendar'],
+            cost_structure=data['cost_structure'],
+            start_date=start,
+            end_date=end_date,
+            truck_schedules=data['truck_schedules'],
+            initial_inventory=data['initial_inventory'],
+            inventory_snapshot_date=data['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+            **kwargs,
+        )
+
+
+def build_network_model(data: dict, weeks: int, formulation: str = 'window', **kwargs):
+    """
+    Create and build a network model (see create_network_model).
+
+    Returns:
+        (SlidingWindowModel, built Pyomo ConcreteModel)
+    """
+    model = create_network_model(data, weeks, shelf_life_formulation=formulation, **kwargs)
+    with contextlib.redirect_stdout(io.StringIO()):
+        return model, model.build_model()
+
+
+def small_mip_model():
+    """
+    Small Pyomo MIP exercising every solver-interface path.
+
+    Continuous, integer and binary columns, a fixed variable (folded into
+    the row bounds), a ranged row, a row with only the fixed variable, and
+    a maximized objective with a constant.
+    """
+    from pyomo.environ import (
+        Binary, ConcreteModel, Constraint, NonNegativeIntegers, NonNegativeReals, Objective, Var,
+        maximize,
+    )
+
+    m = ConcreteModel()
+    m.x = Var(within=NonNegativeReals, bounds=(0, 10))
+    m.y = Var(within=NonNegativeIntegers)
+    m.z = Var(within=Binary)
+    m.fixed = Var(within=NonNegativeReals)
+    m.fixed.fix(3)
+    m.cap = Constraint(expr=m.x + 2 * m.y + m.fixed <= 14)
+    m.link = Constraint(expr=(1, m.x - 5 * m.z + 1, 6))
+    m.only_fixed = Constraint(expr=m.fixed >= 1)
+    m.obj = Objective(expr=3 * m.x + 2 * m.y + m.z + 7, sense=maximize)
+    return m
+
+
+def appsi_highs_solver():
+    """
+    APPSI HiGHS solver with automatic solution loading off.
+
+    Skips the calling test if highspy/HiGHS is not installed.
+    """
+    pytest.importorskip("highspy")
+    from pyomo.contrib.appsi.solvers import Highs
+
+    solver = Highs()
+    if not solver.available():
+        pytest.skip("HiGHS not available")
+    solver.config.load_solution = False
+    return solver
@@ -0,0 +1,94 @@
+"""Tests for the model build profiler (src/optimization/build_profiler.py).
+
+A toy build adds variables and two constraint families in separate steps;
+the profiler attributes each component to its step and sizes it.
+"""
+
+import json
+
+import pytest
+from pyomo.environ import Binary, ConcreteModel, Constraint, NonNegativeReals, Objective, Var
+
+from src.optimization.build_profiler import BuildProfiler
+
+
+def _profiled_build(**kwargs):
+    profiler = BuildProfiler(**kwargs)
+    m = ConcreteModel()
+    days = range(3)
+    with profiler.step('variables', m):
+        m.production = Var(days, within=NonNegativeReals)
+        m.inventory = Var(days, within=NonNegativeReals)
+        m.produced = Var(days, within=Binary)
+    with profiler.step('balance', m):
+        m.balance = Constraint(
+            days, rule=lambda m, t: m.inventory[t] == (m.inventory[t - 1] if t else 0) + m.production[t] - 10
+        )
+    with profiler.step('big_m', m):
+        m.big_m = Constraint(days, rule=lambda m, t: m.production[t] <= 19600 * m.produced[t])
+    with profiler.step('objective', m):
+        m.obj = Objective(expr=sum(1.3 * m.production[t] + 0.5 * m.inventory[t] for t in days))
+    profiler.finish(m)
+    return profiler
+
+
+def _family(profiler, name):
+    return next(f for f in profiler.families if f.name == name)
+
+
+def test_steps_own_the_components_they_add():
+    profiler = _profiled_build()
+
+    assert [s.name for s in profiler.steps] == ['variables', 'balance', 'big_m', 'objective']
+    assert profiler.steps[0].variables == ['production', 'inventory', 'produced']
+    assert profiler.steps[1].constraints == ['balance']
+    assert profiler.steps[2].constraints == ['big_m']
+    assert all(s.seconds >= 0 and s.peak_memory_mb is not None for s in profiler.steps)
+    assert _family(profiler, 'big_m').step == 'big_m'
+
+
+def test_families_sized_with_nonzeros_and_coefficient_range():
+    profiler = _profiled_build()
+
+    balance = _family(profiler, 'balance')
+    assert (balance.size, balance.nonzeros) == (3, 8)
+    assert balance.min_abs_coef == 1.0 and balance.max_abs_coef == 1.0
+
+    big_m = _family(profiler, 'big_m')
+    assert big_m.nonzeros == 6 and big_m.max_abs_coef == 19600.0
+
+    obj = _family(profiler, 'obj')
+    assert obj.kind == 'objective' and obj.nonzeros == 6 and obj.min_abs_coef == 0.5
+
+    produced = _family(profiler, 'produced')
+    assert produced.kind == 'variable' and produced.size == 3 and produced.integer == 3
+
+    totals = profiler.report()['totals']
+    assert totals['rows'] == 6 and totals['columns'] == 9 and totals['integer_columns'] == 3
+    assert totals['nonzeros'] == 14
+    assert (totals['min_abs_coef'], totals['max_abs_coef']) == (0.5, 19600.0)
+
+
+def test_report_exports_as_json(tmp_path):
+    profiler = _profiled_build(track_memory=False, coefficients=False)
+    path = tmp_path / "profile.json"
+
+    profiler.to_json(str(path), weeks=12)
+    data = json.loads(path.read_text())
+
+    assert data['weeks'] == 12
+    assert [s['name'] for s in data['steps']] == ['variables', 'balance', 'big_m', 'objective']
+    assert data['steps'][0]['peak_memory_mb'] is None
+    assert data['totals']['nonzeros'] is None
+    assert 'balance' in profiler.summary()
+
+
+def test_dataframe_per_kind():
+    pytest.importorskip("pandas")
+    profiler = _profiled_build(track_memory=False)
+
+    df = profiler.to_dataframe()
+
+    assert set(df['name']) == {'balance', 'big_m'}
+    assert list(profiler.to_dataframe('variable')['integer']).count(3) == 1
+    assert set(profiler.to_dataframe('step')['name']) == {'variables', 'balance', 'big_m', 'objective'}
@@ -0,0 +1,94 @@
+"""Tests for the cumulative (prefix-sum) shelf life formulation.
+
+SlidingWindowModel(shelf_life_formulation='cumulative') writes every shelf life
+window O(t-L+1..t) <= Q(t-L+1..t) as a difference of cumulative inflow/outflow
+variables. It must describe the same feasible region as the default 'window'
+formulation, with far fewer constraint nonzeros.
+"""
+
+import pytest
+from pyomo.environ import Constraint, TransformationFactory
+from pyomo.repn import generate_standard_repn
+
+from tests.conftest import build_network_model as _build
+
+
+def _nonzeros(pyomo_model, component_names=None):
+    total = 0
+    for con in pyomo_model.component_data_objects(Constraint, active=True):
+        if component_names and con.parent_component().name not in component_names:
+            continue
+        repn = generate_standard_repn(con.body, compute_values=False, quadratic=False)
+        total += len(repn.linear_vars)
+    return total
+
+
+def test_unknown_formulation_rejected(network_data):
+    with pytest.raises(ValueError, match="shelf_life_formulation"):
+        _build(network_data, weeks=1, formulation='cohort')
+
+
+def test_cumulative_windows_are_compact(network_data):
+    """Each window constraint references at most 4 cumulative variables."""
+    window_model, window_pyomo = _build(network_data, weeks=4, formulation='window')
+    cum_model, cum_pyomo = _build(network_data, weeks=4, formulation='cumulative')
+
+    for state in ('ambient', 'frozen', 'thawed'):
+        assert hasattr(cum_pyomo, f'{state}_cum_inflow')
+        assert hasattr(cum_pyomo, f'{state}_cum_outflow')
+        for con in getattr(cum_pyomo, f'{state}_shelf_life_con').values():
+            repn = generate_standard_repn(con.body, compute_values=False, quadratic=False)
+            assert len(repn.linear_vars) <= 4
+
+    # Same window keys (a window with no flows is skipped in both formulations)
+    for state in ('ambient', 'frozen', 'thawed'):
+        window_keys = set(getattr(window_pyomo, f'{state}_shelf_life_con').keys())
+        cum_keys = set(getattr(cum_pyomo, f'{state}_shelf_life_con').keys())
+        assert window_keys == cum_keys, state
+
+    assert _nonzeros(cum_pyomo) < _nonzeros(window_pyomo)
+
+
+@pytest.mark.solver_required
+def test_lp_relaxation_matches_window_formulation(network_data):
+    """Both formulations give the same LP relaxation optimum."""
+    pytest.importorskip("highspy")
+    from pyomo.contrib.appsi.solvers import Highs
+
+    objectives = {}
+    for formulation in ('window', 'cumulative'):
+        _, pyomo_model = _build(network_data, weeks=2, formulation=formulation)
+        TransformationFactory('core.relax_integer_vars').apply_to(pyomo_model)
+        solver = Highs()
+        solver.config.load_solution = False
+        results = solver.solve(pyomo_model)
+        objectives[formulation] = results.best_feasible_objective
+
+    assert objectives['cumulative'] == pytest.approx(objectives['window'], rel=1e-6)
+
+
+def test_window_inflows_match_balance_arrivals(network_data):
+    """Frozen windows count every arrival the frozen balance counts.
+
+    Ambient shipments into a frozen-only node freeze on arrival but stay keyed
+    by the route's ship state in in_transit. Thawed windows only exist where a
+    thawed inventory variable does.
+    """
+    _, pyomo_model = _build(network_data, weeks=2, formulation='window')
+
+    def arrivals(con, node_id):
+        repn = generate_standard_repn(con.body, compute_values=False, quadratic=False)
+        return {var.name for var in repn.linear_vars
+                if var.parent_component().name == 'in_transit' and var.index()[1] == node_id}
+
+    checked = 0
+    for (node_id, prod, t), balance in pyomo_model.frozen_balance_con.items():
+        if (node_id, prod, t) not in pyomo_model.frozen_shelf_life_con:
+            continue
+        expected = arrivals(balance, node_id)
+        assert expected <= arrivals(pyomo_model.frozen_shelf_life_con[node_id, prod, t], node_id)
+        checked += len(expected)
+    assert checked > 0
+
+    for node_id, prod, t in pyomo_model.thawed_shelf_life_con.keys():
+        assert (node_id, prod, 'thawed', t) in pyomo_model.inventory
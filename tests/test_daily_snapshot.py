@@ -2364,3 +2364,66 @@ def test_full_network_all_locations() -> None:
     for location_id in zero_inventory_locations:
         assert snapshot.location_inventory[location_id].total_quantity == 0.0, \
             f"Location {location_id} should have zero inventory"
+
+
+# ===========================
+# Tests - Single-Pass Generation
+# ===========================
+
+
+def _snapshot_summary(snapshot: DailySnapshot) -> tuple:
+    """Comparable view of a snapshot (inventory, transit, flows, demand)."""
+    return (
+        snapshot.date,
+        {loc: dict(inv.by_product) for loc, inv in snapshot.location_inventory.items()},
+        [(t.shipment_id, t.origin_id, t.destination_id, t.days_in_transit) for t in snapshot.in_transit],
+        len(snapshot.inflows),
+        len(snapshot.outflows),
+        sorted((d.destination_id, d.product_id, d.supplied_quantity, d.shortage_quantity)
+               for d in snapshot.demand_satisfied),
+    )
+
+
+def test_single_pass_matches_per_day_snapshots(
+    basic_production_schedule: ProductionSchedule,
+    basic_shipments: List[Shipment],
+    locations_dict: Dict[str, Location],
+    basic_forecast: Forecast
+) -> None:
+    """iter_snapshots carries state day to day; each day must equal a standalone snapshot."""
+    generator = DailySnapshotGenerator(
+        basic_production_schedule, basic_shipments, locations_dict, basic_forecast
+    )
+    start_date = date(2025, 10, 12)  # Day before production
+    end_date = date(2025, 10, 18)
+
+    swept = generator.generate_snapshots(start_date, end_date)
+
+    assert len(swept) == 7
+    for snapshot in swept:
+        standalone = generator._generate_single_snapshot(snapshot.date)
+        assert _snapshot_summary(snapshot) == _snapshot_summary(standalone)
+
+    # Thursday: both shipments delivered and consumed, BATCH-003 still at manufacturing
+    thursday = swept[4]
+    assert thursday.location_inventory["6103"].total_quantity == 0.0
+    assert thursday.location_inventory["6122"].by_product["176283"] == 960.0
+    assert all(d.shortage_quantity == 0.0 for d in thursday.demand_satisfied)
+
+
+def test_get_snapshot_is_cached(
+    basic_production_schedule: ProductionSchedule,
+    basic_shipments: List[Shipment],
+    locations_dict: Dict[str, Location],
+    basic_forecast: Forecast
+) -> None:
+    """Snapshots requested one day at a time (UI slider) are built once."""
+    generator = DailySnapshotGenerator(
+        basic_production_schedule, basic_shipments, locations_dict, basic_forecast
+    )
+    wednesday = date(2025, 10, 15)
+
+    snapshot = generator.get_snapshot(wednesday)
+
+    assert generator.get_snapshot(wednesday) is snapshot
+    assert [t.shipment_id for t in snapshot.in_transit] == ["SHIP-001", "SHIP-002"]
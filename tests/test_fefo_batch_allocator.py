@@ -527,3 +527,75 @@ class TestIntegrationWithSlidingWindow:
         # Final location is first destination processed (6104)
         # Since batch is fully consumed (qty=0), location is informational only
         assert batch.location_id == '6104'
+
+
+class TestBatchPool:
+    """Test the heap-backed batch inventory against the sort-based FEFO order."""
+
+    @staticmethod
+    def _batches(n):
+        base = date(2025, 10, 1)
+        batches = []
+        for i in range(n):
+            production = base + timedelta(days=(i * 7) % 11)
+            state = ['ambient', 'frozen', 'thawed'][i % 3]
+            batches.append(Batch(
+                id=f"B{i}", product_id='Product_A', manufacturing_site_id='6122',
+                production_date=production,
+                state_entry_date=production + timedelta(days=(i * 5) % 4),
+                current_state=state, quantity=10.0, initial_quantity=10.0,
+                location_id='6104', initial_state='ambient',
+            ))
+        return batches
+
+    @pytest.mark.parametrize("use_weighted_age", [False, True])
+    def test_allocation_order_matches_stable_sort(self, use_weighted_age):
+        from src.analysis.lp_fefo_allocator import calculate_weighted_age_from_batch
+
+        batches = self._batches(40)
+        delivery = date(2025, 10, 20)
+        if use_weighted_age:
+            expected = sorted(batches, key=lambda b: calculate_weighted_age_from_batch(b, delivery), reverse=True)
+        else:
+            expected = sorted(batches, key=lambda b: b.state_entry_date)
+
+        allocator = FEFOBatchAllocator(nodes={}, products={}, start_date=date(2025, 10, 1), end_date=delivery)
+        allocator.batch_inventory[('6104', 'Product_A', 'ambient')] = batches
+
+        allocated = []
+        for _ in range(8):
+            allocations = allocator.allocate_shipment(
+                '6104', '6103', 'Product_A', 'ambient', 50.0, delivery, use_weighted_age=use_weighted_age
+            )
+            allocated.extend(a['batch_id'] for a in allocations)
+
+        assert allocated == [b.id for b in expected]
+        assert allocator.allocate_shipment('6104', '6103', 'Product_A', 'ambient', 10.0, delivery) == []
+
+    def test_pool_behaves_like_list(self):
+        batches = self._batches(3)
+        allocator = FEFOBatchAllocator(nodes={}, products={}, start_date=date(2025, 10, 1), end_date=date(2025, 10, 20))
+        pool = allocator.batch_inventory[('6104', 'Product_A', 'ambient')]
+
+        for batch in batches:
+            pool.append(batch)
+        pool.append(batches[0])   # already pooled
+        pool.remove(batches[1])
+
+        assert pool == [batches[0], batches[2]]
+        assert batches[1] not in pool and pool[-1] is batches[2]
+        with pytest.raises(ValueError):
+            pool.remove(batches[1])
+        assert ('6122', 'Product_A', 'frozen') not in allocator.batch_inventory   # .get() does not create
+
+    def test_history_lookup_uses_most_recent_snapshot(self):
+        batch = self._batches(1)[0]
+        for offset, location in [(5, '6125'), (1, '6122'), (9, '6103')]:
+            batch.location_id = location
+            batch.quantity = float(offset)
+            batch.record_snapshot(date(2025, 10, 1) + timedelta(days=offset))
+
+        assert batch.get_location_on_date(date(2025, 10, 4)) == '6122'
+        assert batch.get_location_on_date(date(2025, 10, 8)) == '6125'
+        assert batch.get_quantity_on_date(date(2025, 10, 30)) == 9.0
+        assert batch.get_location_on_date(date(2025, 9, 1)) == '6103'   # before history: current
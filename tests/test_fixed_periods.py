@@ -0,0 +1,129 @@
+"""Tests for Daily fixed-period variable locking (src/optimization/fixed_periods.py).
+
+The Daily workflow loads the previous solve and fixes production, shipments
+and truck pallets for the fixed period (weeks 5-12); inventory stays free.
+"""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from pyomo.environ import Binary, ConcreteModel, NonNegativeIntegers, NonNegativeReals, Var
+
+from src.models.cost_structure import CostStructure
+from src.models.forecast import Forecast
+from src.models.labor_calendar import LaborCalendar
+from src.optimization.base_model import OptimizationResult
+from src.optimization.fixed_periods import FixedPeriod, apply_fixed_period
+from src.optimization.warmstart_utils import serialize_warmstart_hints
+from src.persistence.solve_file import SolveFile
+from src.workflows import DailyWorkflow, WorkflowConfig, WorkflowResult, WorkflowType
+
+
+D1 = date(2025, 11, 3)
+D2 = date(2025, 11, 4)
+D3 = date(2025, 11, 5)
+
+ROUTE = ('6122', '6104', 'P1')
+
+
+def _toy_model():
+    """Small Pyomo model with the fixed-period variable names SlidingWindowModel uses."""
+    m = ConcreteModel()
+    days = [D1, D2, D3]
+    m.production = Var([('6122', 'P1', d) for d in days], within=NonNegativeReals, bounds=(0, 1000))
+    m.mix_count = Var([('6122', 'P1', d) for d in days], within=NonNegativeIntegers, bounds=(0, 5))
+    m.product_produced = Var([('6122', 'P1', d) for d in days], within=Binary)
+    m.in_transit = Var([ROUTE + (d, 'ambient') for d in days], within=NonNegativeReals)
+    m.inventory = Var([('6104', 'P1', 'ambient', d) for d in days], within=NonNegativeReals)
+    return m
+
+
+def _fixed(values, **kwargs):
+    return FixedPeriod(start_date=D2, end_date=D3, values=values, check_feasibility=False, **kwargs)
+
+
+def test_fixes_decisions_in_period_and_leaves_the_rest_free():
+    m = _toy_model()
+    values = {
+        ('production', '6122', 'P1', D1): 100.0,            # before fixed period - free
+        ('production', '6122', 'P1', D2): 200.0,
+        ('mix_count', '6122', 'P1', D2): 1.9999999,          # rounded
+        ('product_produced', '6122', 'P1', D2): 1.0,
+        ('in_transit',) + ROUTE + (D3, 'ambient'): 50.0,
+        ('inventory', '6104', 'P1', 'ambient', D2): 80.0,    # inventory never fixed
+    }
+
+    stats = apply_fixed_period(m, _fixed(values))
+
+    assert not m.production['6122', 'P1', D1].fixed
+    assert m.production['6122', 'P1', D2].fixed and m.production['6122', 'P1', D2].value == 200
+    assert m.production['6122', 'P1', D3].fixed and m.production['6122', 'P1', D3].value == 0
+    assert m.mix_count['6122', 'P1', D2].value == 2
+    assert m.product_produced['6122', 'P1', D3].value == 0
+    assert m.in_transit[ROUTE + (D3, 'ambient')].value == 50
+    assert m.in_transit[ROUTE + (D2, 'ambient')].fixed
+    assert not any(v.fixed for v in m.inventory.values())
+    assert stats == {'fixed': 8, 'fixed_nonzero': 4, 'fixed_zero': 4}
+
+
+def test_conflicting_values_raise():
+    m = _toy_model()
+    values = {
+        ('production', '6122', 'P1', D2): 1500.0,                 # above capacity
+        ('in_transit', '6122', '6130', 'P1', D2, 'ambient'): 10.0,  # route not in model
+    }
+
+    with pytest.raises(ValueError, match="2 fixed-period values conflict"):
+        apply_fixed_period(m, _fixed(values, source="yesterday"))
+
+
+def test_daily_workflow_fixes_weeks_after_free_period(tmp_path):
+    """Fixed period runs from the end of the free period to the end of the previous plan."""
+    previous_end = D1 + timedelta(weeks=12, days=-1)
+    hints = {
+        ('production', '6122', 'P1', D1): 100.0,
+        ('production', '6122', 'P1', D1 + timedelta(weeks=6)): 200.0,
+    }
+    previous = WorkflowResult(
+        workflow_type=WorkflowType.DAILY,
+        solve_timestamp=datetime(2025, 11, 3, 6, 0),
+        solution=OptimizationResult(
+            success=True,
+            objective_value=1.0,
+            metadata={'warmstart_hints': serialize_warmstart_hints(hints)},
+        ),
+        success=True,
+        metadata={'planning_end_date': previous_end.isoformat()},
+    )
+    solve_path = tmp_path / "daily.json"
+    SolveFile(solve_path).save(previous)
+
+    workflow = DailyWorkflow(
+        config=WorkflowConfig(
+            workflow_type=WorkflowType.DAILY,
+            planning_horizon_weeks=12,
+            free_period_weeks=4,
+            fixed_period_weeks=8,
+        ),
+        locations=[],
+        routes=[],
+        products=[],
+        forecast=Forecast(name="empty", entries=[]),
+        labor_calendar=LaborCalendar(name="empty", days=[]),
+        truck_schedules=[],
+        cost_structure=CostStructure(),
+        previous_solve_path=str(solve_path),
+    )
+    workflow.model = object()
+    workflow.input_data = {
+        'planning_start_date': D2,
+        'planning_end_date': D2 + timedelta(weeks=12, days=-1),
+        'fixed_period_start_date': D2 + timedelta(weeks=4),
+        'all_periods_free': False,
+    }
+
+    workflow.apply_fixed_periods()
+
+    assert workflow.fixed_period.start_date == D2 + timedelta(weeks=4)
+    assert workflow.fixed_period.end_date == previous_end
+    assert workflow.fixed_period.values == hints
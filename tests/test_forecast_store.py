@@ -0,0 +1,134 @@
+"""Tests for the columnar forecast store (src/models/forecast_store.py).
+
+Forecast builds a ForecastStore from its entries on first use; forecasts
+created with Forecast.from_store() expose their rows through a read-only
+ForecastEntryView so the entries API keeps working.
+"""
+
+from datetime import date
+import pickle
+
+import pandas as pd
+import pytest
+
+from src.models.forecast import Forecast, ForecastEntry
+from src.models.forecast_store import ForecastStore
+
+
+D1 = date(2025, 6, 1)
+D2 = date(2025, 6, 2)
+D3 = date(2025, 6, 3)
+
+
+def _store():
+    return ForecastStore.from_columns(
+        location_ids=["6104", "6103", "6103", "6103"],
+        product_ids=["P2", "P1", "P1", "P1"],
+        dates=[D1, D1, D2, D2],               # (6103, P1, D2) appears twice
+        quantities=[50.0, 100.0, 150.0, 25.0],
+        confidences=[None, 0.9, None, None],
+    )
+
+
+def test_point_lookup_sums_duplicates():
+    store = _store()
+
+    assert store.get_demand("6103", "P1", D2) == 175.0
+    assert store.get_demand("6104", "P2", D1) == 50.0
+    assert store.get_demand("6103", "P1", D3) == 0.0
+    assert store.get_demand("9999", "P1", D1) == 0.0
+
+
+def test_horizon_filter_and_group_by():
+    store = _store()
+
+    assert store.demand_dict(D2, D3) == {("6103", "P1", D2): 175.0}
+    assert store.aggregate(by=("location_id",)) == {"6103": 275.0, "6104": 50.0}
+    assert store.aggregate(by=("forecast_date", "product_id"), end_date=D1) == {
+        (D1, "P1"): 100.0,
+        (D1, "P2"): 50.0,
+    }
+    assert len(store.filter_dates(start_date=D2)) == 2
+    assert store.dates == [D1, D2]
+    assert store.filter_dates(D3, D3).demand_dict() == {}
+
+    with pytest.raises(ValueError):
+        store.aggregate(by=("quantity",))
+
+
+def test_vectorized_validation():
+    with pytest.raises(ValueError, match="negative or missing quantity"):
+        ForecastStore.from_columns(["6103"], ["P1"], [D1], [-1.0])
+    with pytest.raises(ValueError, match="confidence outside"):
+        ForecastStore.from_columns(["6103"], ["P1"], [D1], [1.0], confidences=[1.5])
+    with pytest.raises(ValueError, match="different lengths"):
+        ForecastStore.from_columns(["6103", "6104"], ["P1"], [D1], [1.0])
+
+
+def test_dataframe_round_trip():
+    df = pd.DataFrame({
+        "location_id": ["6103", "6104"],
+        "product_id": ["P1", "P2"],
+        "forecast_date": pd.to_datetime([D1, D2]),
+        "quantity": [10.0, 20.0],
+    })
+
+    store = ForecastStore.from_dataframe(df)
+
+    out = store.to_dataframe()
+    assert out["location_id"].tolist() == ["6103", "6104"]
+    assert out["forecast_date"].tolist() == [D1, D2]
+    assert out["quantity"].tolist() == [10.0, 20.0]
+
+
+def test_forecast_from_store_keeps_entries_api():
+    forecast = Forecast.from_store("IBP", _store())
+
+    assert len(forecast.entries) == 4
+    first = forecast.entries[1]
+    assert isinstance(first, ForecastEntry)
+    assert (first.location_id, first.product_id, first.forecast_date) == ("6103", "P1", D1)
+    assert first.confidence == 0.9
+    assert forecast.entries[0].confidence is None
+    assert sum(e.quantity for e in forecast.entries) == 325.0
+    assert len(forecast.entries[:2]) == 2
+    assert forecast.get_demand("6103", "P1", D2) == 175.0
+
+
+def test_forecast_store_follows_entries():
+    forecast = Forecast(name="test", entries=[
+        ForecastEntry(location_id="6103", product_id="P1", forecast_date=D1, quantity=100),
+    ])
+    assert forecast.get_demand("6103", "P1", D1) == 100.0
+
+    forecast.entries.append(
+        ForecastEntry(location_id="6103", product_id="P1", forecast_date=D2, quantity=40)
+    )
+    assert forecast.get_demand("6103", "P1", D2) == 40.0
+
+    forecast.entries[0].quantity = 70
+    forecast.refresh_store()
+    assert forecast.get_demand("6103", "P1", D1) == 70.0
+
+
+def test_pickle_leaves_out_cached_store():
+    forecast = Forecast(name="test", entries=[
+        ForecastEntry(location_id="6103", product_id="P1", forecast_date=D1, quantity=100),
+    ])
+    before = pickle.dumps(forecast)
+    assert forecast.get_demand("6103", "P1", D1) == 100.0   # builds the store
+
+    assert pickle.dumps(forecast) == before
+    loaded = pickle.loads(before)
+    assert loaded.get_demand("6103", "P1", D1) == 100.0
+
+
+def test_pickled_store_forecast_keeps_its_store():
+    forecast = Forecast.from_store("IBP", _store())
+    before = pickle.dumps(forecast)
+    assert forecast.get_demand("6103", "P1", D2) == 175.0   # builds the demand index
+
+    assert pickle.dumps(forecast) == before
+    loaded = pickle.loads(before)
+    assert loaded.store is loaded.entries.store
+    assert loaded.get_demand("6103", "P1", D2) == 175.0
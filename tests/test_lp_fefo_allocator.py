@@ -0,0 +1,95 @@
+"""Tests for the sparse LP FEFO allocator (src/analysis/lp_fefo_allocator.py).
+
+SparseLPFEFOAllocator builds the same weighted-age LP as LPFEFOAllocator as a
+scipy.sparse matrix per (origin, product, state) group and solves it with
+highspy, either per group or as one block-diagonal LP.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.analysis.fefo_batch_allocator import Batch
+from src.analysis.lp_fefo_allocator import (
+    LPFEFOAllocator,
+    SparseLPFEFOAllocator,
+    calculate_weighted_age_from_batch,
+)
+
+pytestmark = pytest.mark.solver_required
+
+D0 = date(2025, 10, 1)
+
+
+def _batch(batch_id, location, product, state, age_days, quantity, entry_offset=0):
+    produced = D0 - timedelta(days=age_days)
+    return Batch(
+        id=batch_id, product_id=product, manufacturing_site_id='6122',
+        production_date=produced, state_entry_date=produced + timedelta(days=entry_offset),
+        current_state=state, quantity=quantity, initial_quantity=quantity,
+        location_id=location, initial_state='ambient',
+    )
+
+
+@pytest.fixture
+def problem():
+    batches = [
+        _batch('old', '6122', 'P1', 'ambient', 6, 100.0),
+        _batch('new', '6122', 'P1', 'ambient', 1, 60.0),
+        _batch('frozen', 'Lineage', 'P1', 'frozen', 30, 80.0, entry_offset=3),
+        _batch('P2', '6122', 'P2', 'ambient', 2, 50.0),
+        _batch('empty', '6122', 'P1', 'ambient', 0, 0.0),
+    ]
+    shipments = [
+        ('6122', '6104', 'P1', 'ambient', 90.0, D0 + timedelta(days=1)),
+        ('6122', '6125', 'P1', 'ambient', 40.0, D0 + timedelta(days=2)),
+        ('Lineage', '6130', 'P1', 'frozen', 30.0, D0 + timedelta(days=7)),
+        ('6122', '6104', 'P2', 'ambient', 50.0, D0 + timedelta(days=1)),
+    ]
+    return batches, shipments
+
+
+@pytest.mark.parametrize("decompose", [True, False])
+def test_satisfies_shipments_at_minimum_weighted_age(problem, decompose):
+    pytest.importorskip("highspy")
+    pytest.importorskip("scipy")
+    batches, shipments = problem
+
+    result = SparseLPFEFOAllocator(batches, shipments, decompose=decompose).optimize_allocation()
+
+    shipped = {}
+    for alloc in result['allocations']:
+        shipped[alloc['shipment_idx']] = shipped.get(alloc['shipment_idx'], 0.0) + alloc['quantity']
+        assert batches[alloc['batch_idx']].id == alloc['batch_id']
+    assert shipped == pytest.approx({i: s[4] for i, s in enumerate(shipments)})
+
+    expected_objective = sum(
+        calculate_weighted_age_from_batch(batches[a['batch_idx']], shipments[a['shipment_idx']][5]) * a['quantity']
+        for a in result['allocations']
+    )
+    assert result['objective_value'] == pytest.approx(expected_objective)
+    assert result['num_subproblems'] == (3 if decompose else 1)
+    assert [(a['batch_idx'], a['shipment_idx']) for a in result['allocations']] == sorted(
+        (a['batch_idx'], a['shipment_idx']) for a in result['allocations']
+    )
+
+
+def test_matches_pyomo_objective(problem):
+    pytest.importorskip("highspy")
+    pytest.importorskip("scipy")
+    batches, shipments = problem
+
+    sparse_result = SparseLPFEFOAllocator(batches, shipments).optimize_allocation()
+    pyomo_result = LPFEFOAllocator(batches, shipments).optimize_allocation()
+
+    assert sparse_result['objective_value'] == pytest.approx(pyomo_result['objective_value'])
+    assert sparse_result['num_variables'] == pyomo_result['num_variables']
+
+
+def test_insufficient_supply_returns_none(problem):
+    pytest.importorskip("highspy")
+    pytest.importorskip("scipy")
+    batches, shipments = problem
+    shipments.append(('6122', '6103', 'P2', 'ambient', 10.0, D0 + timedelta(days=3)))   # only 50 of P2
+
+    assert SparseLPFEFOAllocator(batches, shipments).optimize_allocation() is None
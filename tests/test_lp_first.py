@@ -0,0 +1,185 @@
+"""Tests for the LP-relaxation-first integer repair (src/optimization/lp_first.py).
+
+repair_lp_relaxation solves the LP relaxation, then rounds and fixes one
+integer family at a time (up, nearest, down) keeping the first rounding whose
+LP stays feasible.
+"""
+
+import time
+
+import pytest
+from pyomo.environ import (
+    Binary, ConcreteModel, Constraint, NonNegativeIntegers, NonNegativeReals, Objective, Reals, Var,
+)
+
+from src.optimization.base_model import BaseOptimizationModel, OptimizationResult
+from src.optimization.lp_first import (
+    MIN_SOLVE_SECONDS,
+    RepairResult,
+    relax_integrality,
+    repair_lp_relaxation,
+    restore_integrality,
+    unfix_repaired,
+)
+
+pytestmark = pytest.mark.solver_required
+
+
+def _highs():
+    pytest.importorskip("highspy")
+    from pyomo.contrib.appsi.solvers import Highs
+    solver = Highs()
+    if not solver.available():
+        pytest.skip("HiGHS not available")
+    solver.config.load_solution = False
+    return solver
+
+
+def _pallet_model():
+    """500 units of stock held on integer pallets of 320 units."""
+    m = ConcreteModel()
+    m.inventory = Var(within=NonNegativeReals)
+    m.pallet_count = Var(within=NonNegativeIntegers, bounds=(0, 62))
+    m.product_produced = Var(within=Binary)
+    m.demand = Constraint(expr=m.inventory >= 500)
+    m.pallets = Constraint(expr=m.pallet_count * 320 >= m.inventory)
+    m.produced = Constraint(expr=m.inventory <= 1000 * m.product_produced)
+    m.obj = Objective(expr=m.inventory + 10 * m.pallet_count + 30 * m.product_produced)
+    return m
+
+
+def test_relax_and_restore_integrality():
+    m = _pallet_model()
+
+    relaxed = relax_integrality(m)
+    assert len(relaxed) == 2
+    assert m.product_produced.domain is Reals and m.product_produced.bounds == (0, 1)
+    assert m.pallet_count.bounds == (0, 62)
+
+    restore_integrality(relaxed)
+    assert m.product_produced.is_binary()
+    assert m.pallet_count.is_integer() and m.pallet_count.bounds == (0, 62)
+
+
+def test_repair_rounds_up_to_feasible_integer_solution():
+    m = _pallet_model()
+
+    repair = repair_lp_relaxation(m, _highs())
+
+    assert repair.success
+    assert repair.lp_bound == pytest.approx(500 + 10 * 500 / 320 + 30 * 0.5)
+    assert repair.objective == pytest.approx(500 + 20 + 30)
+    assert repair.gap == pytest.approx((550 - repair.lp_bound) / 550)
+    assert repair.rounding == {'product_produced': 'up', 'pallet_count': 'up'}
+    assert m.pallet_count.fixed and m.pallet_count.value == 2
+    assert m.pallet_count.is_integer()
+
+    unfix_repaired(repair)
+    assert not m.pallet_count.fixed and m.pallet_count.value == 2
+
+
+def test_repair_falls_back_to_rounding_down():
+    m = ConcreteModel()
+    m.mix_count = Var(within=NonNegativeIntegers, bounds=(0, 10))
+    m.production = Var(within=NonNegativeReals, bounds=(90, 180))
+    m.mix = Constraint(expr=m.production == 100 * m.mix_count)
+    m.obj = Objective(expr=-m.production)
+
+    repair = repair_lp_relaxation(m, _highs())
+
+    assert repair.success
+    assert repair.rounding == {'mix_count': 'down'}
+    assert m.mix_count.value == 1 and m.production.value == pytest.approx(100)
+
+
+def test_repair_fails_without_feasible_rounding():
+    m = ConcreteModel()
+    m.mix_count = Var(within=NonNegativeIntegers, bounds=(0, 10))
+    m.production = Var(within=NonNegativeReals, bounds=(150, 180))
+    m.mix = Constraint(expr=m.production == 100 * m.mix_count)
+    m.obj = Objective(expr=m.production)
+
+    repair = repair_lp_relaxation(m, _highs())
+
+    assert not repair.success
+    assert "mix_count" in repair.message
+    assert not m.mix_count.fixed and m.mix_count.is_integer()
+
+
+def test_gap_needs_objective_and_bound():
+    assert RepairResult(success=False).gap is None
+    assert RepairResult(success=True, lp_bound=90.0, objective=100.0).gap == pytest.approx(0.1)
+
+
+def test_repair_gives_each_lp_the_remaining_time():
+    m = _pallet_model()
+    solver = _highs()
+
+    repair = repair_lp_relaxation(m, solver, deadline=time.time() + 100)
+
+    assert repair.success
+    assert 90 < solver.config.time_limit <= 100
+
+
+def test_repair_stops_at_deadline():
+    m = _pallet_model()
+
+    repair = repair_lp_relaxation(m, _highs(), deadline=time.time())
+
+    assert not repair.success
+    assert repair.message == "time limit reached"
+    assert repair.lp_solves == 0
+    assert m.pallet_count.is_integer() and not m.pallet_count.fixed
+
+
+class _MixModel(BaseOptimizationModel):
+    """Mix model solved with lp_first; records the final solve instead of running it."""
+
+    def build_model(self):
+        m = ConcreteModel()
+        m.mix_count = Var([1], within=NonNegativeIntegers, bounds=(0, 10))
+        m.production = Var([1], within=NonNegativeReals, bounds=(90, 180))
+        m.mix = Constraint(expr=m.production[1] == 100 * m.mix_count[1])
+        m.obj = Objective(expr=-m.production[1])
+        return m
+
+    def extract_solution(self, model):
+        return None
+
+    def _set_appsi_partial_start(self, solver, variables):
+        self.partial_start = [v.value for v in variables]
+
+    def _run_appsi_solve(self, solver, telemetry=None):
+        self.final_time_limit = solver.config.time_limit
+        return OptimizationResult(success=True)
+
+
+def test_lp_first_resolves_the_default_solver(monkeypatch):
+    model = _MixModel()
+    monkeypatch.setattr(model.solver_config, 'get_best_available_solver', lambda *args, **kwargs: 'appsi_highs')
+    _highs()
+
+    result = model.solve(lp_first='fast')
+
+    assert result.metadata['lp_first']['success']
+
+    monkeypatch.setattr(model.solver_config, 'get_best_available_solver', lambda *args, **kwargs: 'cbc')
+    with pytest.raises(ValueError, match="got 'cbc'"):
+        model.solve(lp_first='fast')
+
+
+def test_lp_first_shares_the_time_limit_and_falls_back_to_hints():
+    model = _MixModel()
+    _highs()
+
+    result = model.solve(
+        solver_name='appsi_highs',
+        lp_first='warmstart',
+        time_limit_seconds=0.5,
+        warmstart_hints={('mix_count', 1): 1.0},
+    )
+
+    assert result.metadata['lp_first']['message'] == "time limit reached"
+    assert result.metadata['lp_first']['lp_solves'] == 0
+    assert model.final_time_limit == MIN_SOLVE_SECONDS
+    assert model.partial_start == [1.0]
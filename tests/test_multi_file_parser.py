@@ -231,3 +231,63 @@ class TestMultiFileParser:
         # Warnings should be present if there are unused locations
         if len(validation["unused_locations"]) > 0:
             assert len(validation["warnings"]) > 0
+
+
+class TestMultiFileParserWorkbookCache:
+    """Tests for single-pass workbook reading and the parsed-data cache."""
+
+    @pytest.fixture
+    def network_config_path(self):
+        """Path to Network_Config.xlsx test file."""
+        return Path("data/examples/Network_Config.xlsx")
+
+    def test_network_file_opened_once(self, network_config_path, monkeypatch):
+        """All network sheets (and the Alias sheet) are parsed from one open workbook."""
+        from src.parsers import workbook_session
+
+        opened = []
+        real_excel_file = workbook_session.pd.ExcelFile
+
+        def counting_excel_file(*args, **kwargs):
+            opened.append(args)
+            return real_excel_file(*args, **kwargs)
+
+        monkeypatch.setattr(workbook_session.pd, "ExcelFile", counting_excel_file)
+
+        parser = MultiFileParser(network_file=network_config_path)
+        parser.parse_locations()
+        parser.parse_routes()
+        parser.parse_labor_calendar()
+        parser.parse_truck_schedules()
+        parser.parse_cost_structure()
+
+        assert len(opened) == 1
+
+    def test_unchanged_file_served_from_cache(self, network_config_path, tmp_path, monkeypatch):
+        """A second parser over the same file contents does not parse again."""
+        from src.parsers.excel_parser import ExcelParser
+
+        first = MultiFileParser(network_file=network_config_path, cache_dir=tmp_path)
+        locations = first.parse_locations()
+        assert any(tmp_path.glob("*.pkl"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed again despite unchanged file")
+
+        monkeypatch.setattr(ExcelParser, "parse_locations", fail)
+
+        second = MultiFileParser(network_file=network_config_path, cache_dir=tmp_path)
+        cached = second.parse_locations()
+
+        assert [loc.id for loc in cached] == [loc.id for loc in locations]
+
+    def test_cache_key_depends_on_content_and_version(self, monkeypatch):
+        """Changed file contents or parser version produce a different key."""
+        from src.parsers import workbook_session
+        from src.parsers.workbook_session import ParsedDataCache
+
+        key = ParsedDataCache.make_key("locations", "Locations", "hash-a")
+        assert key != ParsedDataCache.make_key("locations", "Locations", "hash-b")
+
+        monkeypatch.setattr(workbook_session, "PARSER_CACHE_VERSION", workbook_session.PARSER_CACHE_VERSION + 1)
+        assert key != ParsedDataCache.make_key("locations", "Locations", "hash-a")
@@ -41,6 +41,72 @@ class TestExcelParser:
     #     pass
 
 
+class TestExcelParserVectorized:
+    """Tests for the column-wise forecast and labor calendar parsing."""
+
+    class _Resolver:
+        """Duck-typed alias resolver (resolve_product_id / is_mapped)."""
+        mappings = {"176283": "HELGAS MIXED GRAIN"}
+
+        def resolve_product_id(self, code: str) -> str:
+            return self.mappings.get(code, code)
+
+        def is_mapped(self, code: str) -> bool:
+            return code in self.mappings
+
+    def test_parse_forecast_columns(self, tmp_path):
+        """Aliases resolved per distinct code; entries created lazily from the store."""
+        test_file = tmp_path / "forecast.xlsx"
+        pd.DataFrame([
+            {"location_id": 6104, "product_id": 176283, "date": date(2025, 6, 1), "quantity": 100, "confidence": 0.8},
+            {"location_id": 6104, "product_id": 176283, "date": date(2025, 6, 2), "quantity": 150, "confidence": None},
+            {"location_id": 6125, "product_id": 999999, "date": date(2025, 6, 1), "quantity": 40, "confidence": None},
+        ]).to_excel(test_file, sheet_name="Forecast", index=False)
+
+        with pytest.warns(UserWarning, match="1 unmapped product codes"):
+            forecast = ExcelParser(test_file, product_alias_resolver=self._Resolver()).parse_forecast()
+
+        assert len(forecast.entries) == 3
+        first = forecast.entries[0]
+        assert (first.location_id, first.product_id, first.forecast_date) == ("6104", "HELGAS MIXED GRAIN", date(2025, 6, 1))
+        assert first.quantity == 100.0
+        assert first.confidence == 0.8
+        assert forecast.entries[1].confidence is None
+        assert forecast.get_demand("6125", "999999", date(2025, 6, 1)) == 40.0
+
+    def test_parse_forecast_rejects_negative_quantity(self, tmp_path):
+        """Bulk validation rejects the sheet (and no SAP IBP sheet exists)."""
+        test_file = tmp_path / "forecast.xlsx"
+        pd.DataFrame([
+            {"location_id": "6104", "product_id": "P1", "date": date(2025, 6, 1), "quantity": -5},
+        ]).to_excel(test_file, sheet_name="Forecast", index=False)
+
+        with pytest.raises(ValueError, match="Could not find valid forecast data"):
+            ExcelParser(test_file).parse_forecast()
+
+    def test_parse_labor_calendar_defaults(self, tmp_path):
+        """Missing optional values fall back to the LaborDay defaults."""
+        test_file = tmp_path / "labor.xlsx"
+        pd.DataFrame([
+            {"date": date(2025, 6, 2), "fixed_hours": 12, "regular_rate": 20.0, "overtime_rate": 30.0,
+             "non_fixed_rate": None, "is_fixed_day": True},
+            {"date": date(2025, 6, 7), "fixed_hours": None, "regular_rate": 20.0, "overtime_rate": 30.0,
+             "non_fixed_rate": 40.0, "is_fixed_day": False},
+        ]).to_excel(test_file, sheet_name="LaborCalendar", index=False)
+
+        calendar = ExcelParser(test_file).parse_labor_calendar()
+
+        weekday, weekend = calendar.days
+        assert weekday.date == date(2025, 6, 2)
+        assert weekday.fixed_hours == 12.0
+        assert weekday.overtime_hours == 2.0
+        assert weekday.non_fixed_rate is None
+        assert weekday.is_fixed_day is True
+        assert weekend.fixed_hours == 0.0
+        assert weekend.non_fixed_rate == 40.0
+        assert weekend.is_fixed_day is False
+
+
 class TestExcelParserCostStructureStateSpecific:
     """Tests for parsing state-specific fixed pallet costs from Excel."""
 
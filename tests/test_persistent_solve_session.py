@@ -0,0 +1,222 @@
+"""Tests for PersistentSolveSession (build once, re-solve after in-place updates).
+
+SlidingWindowModel(mutable_parameters=True) keeps demand, cost rates, route
+costs and truck capacities in mutable Params. A persistent session changes
+those Params and re-solves through the same APPSI HiGHS instance, without
+calling build_model() again.
+"""
+
+import contextlib
+import io
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from pyomo.environ import Objective, TransformationFactory, value
+from pyomo.repn import generate_standard_repn
+
+from src.parsers.multi_file_parser import MultiFileParser
+from src.models.manufacturing import ManufacturingSite
+from src.models.location import LocationType
+from src.optimization.legacy_to_unified_converter import LegacyToUnifiedConverter
+from src.optimization.sliding_window_model import SlidingWindowModel
+from src.optimization.solve_session import PersistentSolveSession
+from tests.conftest import create_test_products
+
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "examples"
+
+
+@pytest.fixture(scope="module")
+def network_data():
+    """Real network + forecast + inventory, converted to unified format."""
+    parser = MultiFileParser(
+        forecast_file=DATA_DIR / "Gluten Free Forecast - Latest.xlsm",
+        network_file=DATA_DIR / "Network_Config.xlsx",
+        inventory_file=DATA_DIR / "inventory_latest.XLSX",
+    )
+    forecast, locations, routes, labor_calendar, truck_schedules_list, cost_structure = parser.parse_all()
+
+    manuf_loc = [loc for loc in locations if loc.type == LocationType.MANUFACTURING][0]
+    manufacturing_site = ManufacturingSite(
+        id=manuf_loc.id,
+        name=manuf_loc.name,
+        storage_mode=manuf_loc.storage_mode,
+        production_rate=1400.0,
+        daily_startup_hours=0.5,
+        daily_shutdown_hours=0.25,
+        default_changeover_hours=0.5,
+        production_cost_per_unit=cost_structure.production_cost_per_unit,
+    )
+    inventory_snapshot = parser.parse_inventory(snapshot_date=None)
+
+    converter = LegacyToUnifiedConverter()
+    return {
+        'nodes': converter.convert_nodes(manufacturing_site, locations, forecast),
+        'routes': converter.convert_routes(routes),
+        'truck_schedules': converter.convert_truck_schedules(truck_schedules_list, manufacturing_site.id),
+        'forecast': forecast,
+        'products': create_test_products(sorted(set(e.product_id for e in forecast.entries))),
+        'labor_calendar': labor_calendar,
+        'cost_structure': cost_structure,
+        'initial_inventory': inventory_snapshot.to_optimization_dict(),
+        'inventory_snapshot_date': inventory_snapshot.snapshot_date,
+    }
+
+
+def _create_model(data, weeks, **kwargs):
+    start = data['inventory_snapshot_date']
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SlidingWindowModel(
+            nodes=data['nodes'],
+            routes=data['routes'],
+            forecast=data['forecast'],
+            products=data['products'],
+            labor_calendar=data['labor_calendar'],
+            cost_structure=data['cost_structure'],
+            start_date=start,
+            end_date=start + timedelta(weeks=weeks),
+            truck_schedules=data['truck_schedules'],
+            initial_inventory=data['initial_inventory'],
+            inventory_snapshot_date=data['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+            **kwargs,
+        )
+
+
+def _create_lp_session(data, weeks):
+    """Session whose model is LP-relaxed before the first solve (fast, exact objectives)."""
+    model = _create_model(data, weeks)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = PersistentSolveSession(model)
+    TransformationFactory('core.relax_integer_vars').apply_to(session.model)
+    return session
+
+
+def _objective_terms(pyomo_model):
+    obj = next(pyomo_model.component_data_objects(Objective, active=True))
+    repn = generate_standard_repn(obj.expr, compute_values=True, quadratic=False)
+    terms = {}
+    for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+        if coef:
+            terms[var.name] = terms.get(var.name, 0) + coef
+    return terms
+
+
+def test_mutable_parameters_match_constant_model(network_data):
+    """Params hold the same values the constant model uses."""
+    constant = _create_model(network_data, weeks=2)
+    mutable = _create_model(network_data, weeks=2, mutable_parameters=True)
+    with contextlib.redirect_stdout(io.StringIO()):
+        constant_pyomo = constant.build_model()
+        mutable_pyomo = mutable.build_model()
+
+    assert not hasattr(constant_pyomo, 'demand_qty')
+    assert set(mutable_pyomo.cost_rate.keys()) == set(SlidingWindowModel.MUTABLE_COST_RATES)
+    assert {k: value(v) for k, v in mutable_pyomo.demand_qty.items()} == mutable.demand
+
+    for key, con in constant_pyomo.demand_balance_con.items():
+        assert value(mutable_pyomo.demand_balance_con[key].upper) == pytest.approx(value(con.upper))
+    for key, con in constant_pyomo.truck_capacity_con.items():
+        assert value(mutable_pyomo.truck_capacity_con[key].upper) == pytest.approx(value(con.upper))
+
+    constant_terms = _objective_terms(constant_pyomo)
+    mutable_terms = _objective_terms(mutable_pyomo)
+    assert mutable_terms.keys() == constant_terms.keys()
+    for name, coef in constant_terms.items():
+        assert mutable_terms[name] == pytest.approx(coef), name
+
+
+def test_session_updates_params_and_model_data(network_data):
+    """Setters write the Params and keep demand/cost data used by extraction in sync."""
+    model = _create_model(network_data, weeks=1)
+    original_costs = model.cost_structure
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = model.create_solve_session()
+
+    key = next(iter(model.demand))
+    session.set_demand(*key, 1234.0)
+    session.set_cost('shortage_penalty_per_unit', 7.5)
+    origin, dest = next(iter(model.route_by_pair))
+    session.set_route_cost(origin, dest, 0.42)
+    session.set_truck_capacity(0, 20)
+
+    pyomo_model = session.model
+    assert value(pyomo_model.demand_qty[key]) == 1234.0
+    assert model.demand[key] == 1234.0
+    assert value(pyomo_model.cost_rate['shortage_penalty_per_unit']) == 7.5
+    assert model.cost_structure.shortage_penalty_per_unit == 7.5
+    assert model.cost_structure is not original_costs  # caller's CostStructure untouched
+    assert model.route_by_pair[(origin, dest)].cost_per_unit == 0.42
+    assert value(pyomo_model.truck_capacity_pallets[0]) == 20
+    assert all(var.ub == 20 for k, var in pyomo_model.truck_pallet_load.items() if k[0] == 0)
+    assert [change[0] for change in session.pending_changes] == ['demand', 'cost', 'route_cost', 'truck_capacity']
+
+    with pytest.raises(KeyError):
+        session.set_cost('waste_cost_multiplier', 1.0)
+    with pytest.raises(KeyError):
+        session.set_demand('NO_SUCH_NODE', key[1], key[2], 1.0)
+
+
+def test_truck_capacity_bound_scaled_by_departures_in_aggregated_periods(network_data):
+    """A weekly load stays bounded by its departures, not by a single truck."""
+    from src.models.time_period import BucketGranularity, VariableGranularityConfig
+
+    granularity = VariableGranularityConfig(
+        near_term_days=14,
+        near_term_granularity=BucketGranularity.DAILY,
+        far_term_granularity=BucketGranularity.WEEKLY,
+    )
+    model = _create_model(network_data, weeks=4, granularity=granularity)
+    with contextlib.redirect_stdout(io.StringIO()):
+        session = model.create_solve_session()
+
+    session.set_truck_capacity(0, 20)
+
+    loads = [(k, var) for k, var in session.model.truck_pallet_load.items() if k[0] == 0]
+    assert loads
+    for (truck_idx, _, _, t), var in loads:
+        assert var.ub == 20 * model._truck_load_scale(truck_idx, t)
+
+
+@pytest.mark.solver_required
+def test_resolve_after_updates_matches_fresh_solve(network_data):
+    """Re-solving in place gives the same optimum as a fresh solve with the same values."""
+    pytest.importorskip("highspy")
+
+    session = _create_lp_session(network_data, weeks=1)
+    model = session.optimization_model
+    build_calls = []
+    original_build = model.build_model
+    model.build_model = lambda: build_calls.append(1) or original_build()
+
+    demand_key = max(model.demand, key=model.demand.get)
+    changes = {
+        'demand': (demand_key, model.demand[demand_key] * 3),
+        'shortage': 4.0,
+        'truck_capacity': 10,
+    }
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        base = session.solve()
+        session.set_demand(*changes['demand'][0], changes['demand'][1])
+        session.set_cost('shortage_penalty_per_unit', changes['shortage'])
+        session.set_truck_capacity(0, changes['truck_capacity'])
+        resolved = session.solve()
+
+    assert build_calls == []
+    assert session.build_count == 1
+    assert resolved.metadata['solve_session']['solve_number'] == 2
+    assert resolved.metadata['solve_session']['num_changes'] == 3
+    assert resolved.objective_value != pytest.approx(base.objective_value, rel=1e-6)
+
+    fresh = _create_lp_session(network_data, weeks=1)
+    with contextlib.redirect_stdout(io.StringIO()):
+        fresh.set_demand(*changes['demand'][0], changes['demand'][1])
+        fresh.set_cost('shortage_penalty_per_unit', changes['shortage'])
+        fresh.set_truck_capacity(0, changes['truck_capacity'])
+        expected = fresh.solve()
+
+    assert resolved.objective_value == pytest.approx(expected.objective_value, rel=1e-6)
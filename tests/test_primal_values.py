@@ -0,0 +1,85 @@
+"""Tests for bulk primal value extraction (src/optimization/primal_values.py).
+
+The HiGHS path is exercised with a SimpleNamespace stand-in for the APPSI
+solver: a col_value array plus the Pyomo-var -> column map.
+"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyomo.environ import ConcreteModel, NonNegativeReals, Var
+
+from src.optimization.primal_values import PrimalTable, PrimalValues
+
+
+def _model():
+    m = ConcreteModel()
+    m.nodes = ['6122', '6104']
+    m.production = Var(m.nodes, ['P1', 'P2'], within=NonNegativeReals)
+    m.shortage = Var(['6104'], ['P1'], within=NonNegativeReals)
+    m.production['6122', 'P1'].value = 1000.0
+    m.production['6122', 'P2'].value = 0.001
+    m.production['6104', 'P1'].value = None
+    m.production['6104', 'P2'].value = 0.0
+    return m
+
+
+def _fake_solver(columns, col_value, valid=True):
+    highs = SimpleNamespace(getSolution=lambda: SimpleNamespace(value_valid=valid, col_value=col_value))
+    return SimpleNamespace(_solver_model=highs, _pyomo_var_to_solver_var_map=columns)
+
+
+def test_pyomo_values_without_solver():
+    m = _model()
+    primals = PrimalValues(m)
+    production = primals.table(m.production)
+
+    assert primals.source == 'pyomo'
+    assert len(production) == 4
+    assert production.nonzero(0.01) == {('6122', 'P1'): 1000.0}
+    assert production.get(('6104', 'P1')) is None
+    assert production.get(('6104', 'P2')) == 0.0
+    assert production.total() == pytest.approx(1000.001)
+    assert primals.table(m.production) is production
+
+
+def test_highs_column_values_mapped_through_var_map():
+    m = _model()
+    # Only three production columns in HiGHS; ('6104', 'P2') was never sent
+    columns = {
+        id(m.production['6122', 'P1']): 2,
+        id(m.production['6122', 'P2']): 0,
+        id(m.production['6104', 'P1']): 1,
+    }
+    solver = _fake_solver(columns, [5.0, 7.5, 1200.0])
+
+    primals = PrimalValues(m, solver=solver)
+    production = primals.table(m.production)
+
+    assert primals.source == 'highs'
+    assert production.nonzero(0.01) == {('6122', 'P1'): 1200.0, ('6122', 'P2'): 5.0, ('6104', 'P1'): 7.5}
+    # Unmapped variable falls back to its Pyomo value
+    assert production.get(('6104', 'P2')) == 0.0
+
+
+def test_invalid_highs_solution_falls_back_to_pyomo_values():
+    m = _model()
+    solver = _fake_solver({id(m.production['6122', 'P1']): 0}, [5.0], valid=False)
+
+    primals = PrimalValues(m, solver=solver)
+
+    assert primals.source == 'pyomo'
+    assert primals.table(m.production).get(('6122', 'P1')) == 1000.0
+
+
+def test_table_thresholds_and_alignment():
+    table = PrimalTable(['a', 'b', 'c'], np.array([-2.0, 0.5, np.nan]))
+
+    assert table.nonzero(1.0) == {}
+    assert table.nonzero(1.0, absolute=True) == {'a': -2.0}
+    assert table.total(threshold=0.0) == pytest.approx(0.5)
+    assert table.where(np.array([True, False, True]))['a'] == -2.0
+
+    aligned = table.align(['c', 'b', 'missing'])
+    assert np.isnan(aligned[0]) and aligned[1] == 0.5 and np.isnan(aligned[2])
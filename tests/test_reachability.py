@@ -0,0 +1,147 @@
+"""Tests for the reachability analysis behind variable pruning (src/optimization/reachability.py).
+
+Network: plant 6122 produces ambient, ships ambient to hub 6104 (1 day) and
+on to breadroom 6103 (1 day), and ambient to frozen-only Lineage (1 day,
+freezes on arrival), which ships frozen to ambient-only 6130 (3 days, thaws
+on arrival).
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.optimization.reachability import FlowLeg, VariableSupport
+from tests.conftest import appsi_highs_solver, build_network_model
+
+
+D0 = date(2025, 11, 3)
+
+LEGS = [
+    FlowLeg('6122', '6104', 'ambient', 'ambient', 1),
+    FlowLeg('6104', '6103', 'ambient', 'ambient', 1),
+    FlowLeg('6122', 'Lineage', 'ambient', 'frozen', 1),
+    FlowLeg('Lineage', '6130', 'frozen', 'thawed', 3),
+]
+
+
+def _support(days=14, sources=(), sinks=None, prune_dates=True):
+    dates = [D0 + timedelta(days=i) for i in range(days)]
+    if sinks is None:
+        sinks = {('6103', 'P1', 'ambient'), ('6130', 'P1', 'thawed'), ('6104', 'P2', 'ambient')}
+    return VariableSupport(
+        dates=dates,
+        products=['P1', 'P2'],
+        legs=LEGS,
+        transitions={},
+        sources={('6122', 'P1', 'ambient'), ('6122', 'P2', 'ambient'), *sources},
+        sinks=sinks,
+        end_date=dates[-1],
+        prune_dates=prune_dates,
+    )
+
+
+def test_earliest_dates_follow_shortest_transit():
+    support = _support()
+
+    assert support.earliest[('6122', 'P1', 'ambient')] == D0
+    assert support.earliest[('6104', 'P1', 'ambient')] == D0 + timedelta(days=1)
+    assert support.earliest[('6103', 'P1', 'ambient')] == D0 + timedelta(days=2)
+    assert support.earliest[('Lineage', 'P1', 'frozen')] == D0 + timedelta(days=1)
+    assert support.earliest[('6130', 'P1', 'thawed')] == D0 + timedelta(days=4)
+
+    assert not support.has_inventory('6103', 'P1', 'ambient', D0 + timedelta(days=1))
+    assert support.has_inventory('6103', 'P1', 'ambient', D0 + timedelta(days=2))
+
+
+def test_unreachable_and_useless_series_are_dropped():
+    support = _support()
+
+    # 6130 only receives frozen goods (thawed on arrival)
+    assert not support.has_series('6130', 'P1', 'ambient')
+    # P2 is only demanded at the hub: nothing downstream of it, no Lineage stock
+    assert support.has_series('6104', 'P2', 'ambient')
+    assert not support.has_series('6103', 'P2', 'ambient')
+    assert not support.has_series('Lineage', 'P2', 'frozen')
+    # Production state at the plant is always kept
+    assert support.has_series('6122', 'P2', 'ambient')
+
+
+def test_initial_inventory_is_kept_from_day_one():
+    support = _support(sources={('6103', 'P2', 'ambient'), ('6130', 'P1', 'thawed')})
+
+    assert support.earliest[('6103', 'P2', 'ambient')] == D0
+    assert support.earliest[('6130', 'P1', 'thawed')] == D0
+
+
+def test_transitions_are_same_day():
+    dates = [D0 + timedelta(days=i) for i in range(7)]
+    support = VariableSupport(
+        dates=dates,
+        products=['P1'],
+        legs=[FlowLeg('6122', 'Lineage', 'ambient', 'frozen', 1), FlowLeg('Lineage', '6104', 'frozen', 'frozen', 2)],
+        transitions={'6104': [('frozen', 'thawed'), ('frozen', 'ambient')]},
+        sources={('6122', 'P1', 'ambient')},
+        sinks={('6104', 'P1', 'ambient'), ('6104', 'P1', 'thawed')},
+        end_date=dates[-1],
+    )
+
+    assert support.earliest[('6104', 'P1', 'frozen')] == D0 + timedelta(days=3)
+    assert support.earliest[('6104', 'P1', 'ambient')] == D0 + timedelta(days=3)
+    assert support.earliest[('6104', 'P1', 'thawed')] == D0 + timedelta(days=3)
+
+
+def test_shelf_life_does_not_cut_long_paths():
+    """Arrivals restart the model's per-node shelf-life windows, so only the horizon limits reach."""
+    legs = [FlowLeg('6122', '6104', 'ambient', 'ambient', 10), FlowLeg('6104', '6103', 'ambient', 'ambient', 10)]
+    dates = [D0 + timedelta(days=i) for i in range(28)]
+    support = VariableSupport(
+        dates=dates, products=['P1'], legs=legs, transitions={},
+        sources={('6122', 'P1', 'ambient')}, sinks={('6103', 'P1', 'ambient')}, end_date=dates[-1],
+    )
+
+    # 20 days ambient in transit > 17-day ambient shelf life
+    assert support.earliest[('6103', 'P1', 'ambient')] == D0 + timedelta(days=20)
+
+
+def test_series_reached_after_horizon_end_are_dropped():
+    support = _support(days=4)
+
+    assert support.has_series('6103', 'P1', 'ambient')
+    assert not support.has_series('6130', 'P1', 'thawed')
+
+
+def test_date_pruning_can_be_disabled():
+    support = _support(prune_dates=False)
+
+    assert support.has_inventory('6103', 'P1', 'ambient', D0)
+    assert not support.has_inventory('6103', 'P2', 'ambient', D0)
+
+
+def test_summary_reports_removed_columns_and_rows():
+    support = _support()
+    support.record('inventory', 100, 60, rows_removed=80)
+    support.record('thaw/freeze', 10, 10)
+
+    assert support.stats()['inventory'] == {'total': 100, 'kept': 60, 'rows_removed': 80}
+    assert "inventory: 60 of 100 kept (40% removed)" in support.summary()
+    assert "Removed: 40 columns, 80 rows" in support.summary()
+
+
+@pytest.mark.solver_required
+def test_pruning_keeps_the_optimum(network_data):
+    """Pruned and unpruned builds of the real network have the same LP optimum.
+
+    Pruned columns can never carry flow that reaches demand, so removing them
+    must not move the objective.
+    """
+    from pyomo.environ import TransformationFactory
+
+    objectives = {}
+    for prune in (True, False):
+        model, pyomo_model = build_network_model(network_data, weeks=2, prune_unreachable=prune)
+        assert (model.support is not None) == prune
+        TransformationFactory('core.relax_integer_vars').apply_to(pyomo_model)
+        results = appsi_highs_solver().solve(pyomo_model)
+        objectives[prune] = results.best_feasible_objective
+
+    assert objectives[True] == pytest.approx(objectives[False], rel=1e-6)
@@ -0,0 +1,126 @@
+"""Tests for the rolling-horizon relax-and-fix solve (src/optimization/rolling_horizon.py).
+
+Windows commit window_days at a time with an LP-relaxed look-ahead; integer
+variables after the committed window are relaxed, earlier windows are fixed.
+"""
+
+import contextlib
+import io
+from datetime import date, timedelta
+
+import pytest
+from pyomo.environ import Binary, ConcreteModel, NonNegativeIntegers, NonNegativeReals, Reals, Var
+
+from src.optimization.rolling_horizon import (
+    RollingHorizonSolver,
+    build_windows,
+    fix_committed_integers,
+    relax_integer_variables,
+)
+from tests.conftest import create_network_model
+
+
+D0 = date(2025, 11, 3)
+
+
+def test_build_windows_cover_horizon():
+    end = D0 + timedelta(days=40)
+    windows = build_windows(D0, end, window_days=14, lookahead_days=7)
+
+    assert [(w.start_date, w.end_date) for w in windows] == [
+        (D0, D0 + timedelta(days=13)),
+        (D0 + timedelta(days=14), D0 + timedelta(days=27)),
+        (D0 + timedelta(days=28), end),
+    ]
+    assert [w.horizon_end for w in windows] == [D0 + timedelta(days=20), D0 + timedelta(days=34), end]
+    assert [w.index for w in windows] == [0, 1, 2]
+
+
+def test_build_windows_rejects_invalid_parameters():
+    with pytest.raises(ValueError, match="window_days"):
+        build_windows(D0, D0 + timedelta(days=7), window_days=0, lookahead_days=7)
+    with pytest.raises(ValueError, match="lookahead_days"):
+        build_windows(D0, D0 + timedelta(days=7), window_days=7, lookahead_days=-1)
+
+
+def test_relax_integer_variables_after_committed_window():
+    days = [D0 + timedelta(days=i) for i in range(4)]
+    m = ConcreteModel()
+    m.production = Var([('6122', 'P1', d) for d in days], within=NonNegativeReals)
+    m.product_produced = Var([('6122', 'P1', d) for d in days], within=Binary)
+    m.pallet_count = Var([('6104', 'P1', 'ambient', d) for d in days], within=NonNegativeIntegers, bounds=(0, 62))
+    m.product_produced['6122', 'P1', days[3]].fix(1)
+
+    relaxed, integer = relax_integer_variables(m, after=days[1])
+
+    assert (relaxed, integer) == (3, 4)
+    assert m.product_produced['6122', 'P1', days[1]].is_integer()
+    assert m.product_produced['6122', 'P1', days[2]].domain is Reals
+    assert m.product_produced['6122', 'P1', days[2]].bounds == (0, 1)
+    assert m.pallet_count['6104', 'P1', 'ambient', days[2]].bounds == (0, 62)
+    assert m.product_produced['6122', 'P1', days[3]].is_integer()   # fixed - untouched
+    assert m.production['6122', 'P1', days[3]].domain is NonNegativeReals
+
+
+def test_fix_committed_integers_up_to_end_date():
+    days = [D0 + timedelta(days=i) for i in range(3)]
+    m = ConcreteModel()
+    m.inventory = Var([('6104', 'P1', 'ambient', d) for d in days], within=NonNegativeReals)
+    m.pallet_count = Var([('6104', 'P1', 'ambient', d) for d in days], within=NonNegativeIntegers)
+    m.total_starts = Var(days, within=NonNegativeIntegers)
+    values = {
+        ('pallet_count', '6104', 'P1', 'ambient', days[0]): 3.0,
+        ('total_starts', days[1]): 2.0,
+    }
+
+    fixed = fix_committed_integers(m, days[1], values)
+
+    assert fixed == 4
+    assert m.pallet_count['6104', 'P1', 'ambient', days[0]].value == 3
+    assert m.pallet_count['6104', 'P1', 'ambient', days[1]].value == 0   # missing -> zero
+    assert m.total_starts[days[1]].value == 2
+    assert not m.pallet_count['6104', 'P1', 'ambient', days[2]].fixed
+    assert not m.inventory['6104', 'P1', 'ambient', days[0]].fixed
+
+
+@pytest.mark.solver_required
+def test_rolling_horizon_close_to_full_solve(network_data):
+    """Relax-and-fix over 3 weeks (1-week windows) is feasible and within 5% of the full solve.
+
+    Both solves use a 1% MIP gap, so the rolling objective may also come in
+    up to 1% below the full-horizon one.
+    """
+    pytest.importorskip("highspy")
+
+    weeks = 3
+    start = network_data['inventory_snapshot_date']
+    end = start + timedelta(weeks=weeks) - timedelta(days=1)
+
+    full_model = create_network_model(network_data, weeks, end_date=end)
+    with contextlib.redirect_stdout(io.StringIO()):
+        full = full_model.solve(solver_name='appsi_highs', time_limit_seconds=300, mip_gap=0.01)
+    assert full.is_feasible()
+
+    solver = RollingHorizonSolver(
+        lambda horizon_end: create_network_model(network_data, weeks, end_date=horizon_end),
+        start, end, window_days=7, lookahead_days=7, time_limit_seconds=120, mip_gap=0.01,
+    )
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = solver.solve(verbose=False)
+
+    assert result.is_feasible()
+    assert result.metadata['rolling_horizon']['completed']
+    assert len(result.metadata['rolling_horizon']['windows']) == 3
+    assert solver.model.end_date == end
+    assert solver.model.get_solution() is not None
+    # Integers dated in earlier windows are all fixed
+    last_start = solver.windows[-1].start_date
+    free_before_last = [
+        var_data.name
+        for var_data in solver.model.model.component_data_objects(Var)
+        if var_data.is_integer() and not var_data.fixed
+        and isinstance(var_data.index(), tuple)
+        and max((c for c in var_data.index() if isinstance(c, date)), default=last_start) < last_start
+    ]
+    assert free_before_last == []
+    assert full.objective_value * 0.99 <= result.objective_value <= full.objective_value * 1.05
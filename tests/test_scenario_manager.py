@@ -552,6 +552,80 @@ class TestScenarioManager:
         scenario_file = Path(temp_storage) / f"{scenario.id}.pkl"
         assert scenario_file.exists()
 
+    def test_shared_payloads_stored_once(self, scenario_manager, sample_scenario_data):
+        """Test identical forecasts are stored as one blob and survive deletes."""
+        data = {k: v for k, v in sample_scenario_data.items() if k != 'name'}
+        scenario1 = scenario_manager.save_scenario(name='Scenario 1', **data)
+        size_one = scenario_manager.get_storage_size()
+        scenario2 = scenario_manager.save_scenario(name='Scenario 2', **data)
+
+        blobs = list(scenario_manager.blob_dir.glob('*.pkl'))
+        assert len(blobs) == 1
+        assert scenario_manager.get_storage_size() - size_one < blobs[0].stat().st_size + 2048
+
+        # Shared blob stays while scenario2 references it
+        scenario_manager.delete_scenario(scenario1.id)
+        loaded = scenario_manager.load_scenario(scenario2.id)
+        pd.testing.assert_frame_equal(loaded.forecast_data, sample_scenario_data['forecast_data'])
+
+        scenario_manager.delete_scenario(scenario2.id)
+        assert list(scenario_manager.blob_dir.glob('*.pkl')) == []
+
+    def test_equal_forecasts_share_one_blob(self, scenario_manager):
+        """Test two equal but separate Forecast objects are stored as one blob."""
+        from datetime import date
+        from src.models.forecast import Forecast, ForecastEntry
+
+        def make_forecast(location_id):
+            return Forecast(name='IBP', creation_date=date(2025, 6, 1), entries=[
+                ForecastEntry(location_id=location_id(), product_id='P1',
+                              forecast_date=date(2025, 6, 1) + timedelta(days=i), quantity=100.0 + i)
+                for i in range(3)
+            ])
+
+        first = make_forecast(lambda: '6103')
+        second = make_forecast(lambda: ''.join(['61', '03']))   # equal, one string object per entry
+        first.get_demand('6103', 'P1', date(2025, 6, 1))  # builds the cached store
+
+        scenario_manager.save_scenario(name='Scenario 1', forecast_data=first)
+        scenario = scenario_manager.save_scenario(name='Scenario 2', forecast_data=second)
+
+        assert len(list(scenario_manager.blob_dir.glob('*.pkl'))) == 1
+        loaded = scenario_manager.load_scenario(scenario.id)
+        assert loaded.forecast_data.get_demand('6103', 'P1', date(2025, 6, 3)) == 102.0
+
+    def test_compare_and_list_read_metadata_only(self, scenario_manager, sample_scenario_data):
+        """Test comparing and listing do not read payload blobs."""
+        scenario = scenario_manager.save_scenario(**sample_scenario_data)
+        for blob_path in scenario_manager.blob_dir.glob('*.pkl'):
+            blob_path.unlink()
+
+        comparison_df = scenario_manager.compare_scenarios([scenario.id])
+        assert comparison_df['Scenario'].tolist() == ['Test Scenario']
+
+        listed = scenario_manager.list_scenarios()
+        assert listed[0].total_cost == 50000.0
+        assert listed[0].forecast_data is None
+
+        with pytest.raises(FileNotFoundError):
+            scenario_manager.load_scenario(scenario.id)
+
+    def test_load_legacy_pickled_scenario(self, scenario_manager, temp_storage):
+        """Test scenarios saved as a whole pickled Scenario still load and update."""
+        import pickle
+        legacy = Scenario(id='legacy-id', name='Legacy', total_cost=1.0,
+                          forecast_data=pd.DataFrame({'demand': [5]}))
+        with open(Path(temp_storage) / 'legacy-id.pkl', 'wb') as f:
+            pickle.dump(legacy, f)
+        scenario_manager._index['legacy-id'] = {'id': 'legacy-id', 'name': 'Legacy', 'tags': []}
+
+        assert scenario_manager.load_scenario('legacy-id').forecast_data['demand'].tolist() == [5]
+
+        updated = scenario_manager.update_scenario('legacy-id', name='Migrated')
+        assert updated.name == 'Migrated'
+        assert updated.forecast_data['demand'].tolist() == [5]
+        assert len(list(scenario_manager.blob_dir.glob('*.pkl'))) == 1
+
     def test_scenario_deepcopy_isolation(self, scenario_manager):
         """Test that saved scenarios are isolated from original objects."""
         # Create mutable data
@@ -0,0 +1,176 @@
+"""Tests for parallel scenario sweeps (src/scenario/sweep.py).
+
+Most tests replace solving with a stub and cover the grid, override
+handling and how results are streamed into the scenario store. One
+solver_required test runs a small real sweep through the process pool.
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.models.forecast import Forecast, ForecastEntry
+
+from src.scenario import ScenarioManager, ScenarioSweep, build_sweep_grid
+from src.scenario import sweep as sweep_module
+from src.scenario.manager import Scenario
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ScenarioManager(storage_dir=str(tmp_path / "scenarios"))
+
+
+@pytest.fixture
+def base_scenario():
+    return Scenario(
+        id='base-id',
+        name='Baseline',
+        forecast_data=SimpleNamespace(name='forecast'),
+        labor_calendar='calendar',
+        truck_schedules=[],
+        cost_parameters=SimpleNamespace(),
+        locations=[],
+        routes=[],
+        manufacturing_site='6122',
+    )
+
+
+def test_grid_is_cartesian_product():
+    cases = build_sweep_grid(horizon_weeks=[4, 8], ambient_shelf_life=[14, 17, 21])
+
+    assert len(cases) == 6
+    assert cases[0].name == 'horizon_weeks=4, ambient_shelf_life=14'
+    assert cases[-1].overrides == {'horizon_weeks': 8, 'ambient_shelf_life': 21}
+
+
+def test_overrides_do_not_touch_base_inputs():
+    inputs = {'horizon_weeks': 4, 'shelf_life': {}, 'cost_structure': None}
+
+    case = sweep_module.apply_overrides(inputs, {'horizon_weeks': 12, 'frozen_shelf_life': 90})
+
+    assert case['horizon_weeks'] == 12
+    assert case['shelf_life'] == {'frozen': 90}
+    assert inputs == {'horizon_weeks': 4, 'shelf_life': {}, 'cost_structure': None}
+    with pytest.raises(ValueError, match="truck_capcity"):
+        sweep_module.apply_overrides(inputs, {'truck_capcity': 1})
+
+
+def test_results_are_saved_as_they_finish(manager, base_scenario, monkeypatch):
+    def fake_solve(case, settings, inputs=None):
+        if case.overrides['horizon_weeks'] == 6:
+            raise RuntimeError("solver crashed")
+        return SimpleNamespace(
+            objective_value=1000.0 * case.overrides['horizon_weeks'],
+            solve_time_seconds=1.0,
+            metadata={'labor_cost': 10.0, 'demand_satisfaction_pct': 99.0},
+        )
+
+    monkeypatch.setattr(sweep_module, '_solve_case', fake_solve)
+    sweep = ScenarioSweep(
+        manager, base_scenario, products={}, start_date=date(2025, 11, 3), max_workers=1,
+    )
+    streamed = []
+
+    result = sweep.run(
+        build_sweep_grid(horizon_weeks=[4, 6, 8]),
+        tags=['capacity'],
+        on_result=lambda case, scenario: streamed.append(case.name),
+    )
+
+    assert streamed == ['horizon_weeks=4', 'horizon_weeks=8']
+    assert result.failures == {'horizon_weeks=6': 'solver crashed'}
+    assert list(result.comparison['Total Cost']) == ['$4,000.00', '$8,000.00']
+
+    saved = manager.load_scenario(result.scenario_ids[1])
+    assert saved.name == 'Baseline [horizon_weeks=8]'
+    assert saved.tags == ['sweep', 'capacity']
+    assert saved.optimization_config['end_date'] == '2025-12-28'
+    assert saved.labor_cost == 10.0
+
+
+def test_scale_forecast_multiplies_quantities():
+    forecast = Forecast(name='IBP', creation_date=date(2025, 11, 1), entries=[
+        ForecastEntry(location_id='6104', product_id='P1', forecast_date=date(2025, 11, 3), quantity=100.0),
+        ForecastEntry(location_id='6110', product_id='P2', forecast_date=date(2025, 11, 4), quantity=40.0),
+    ])
+
+    scaled = sweep_module._scale_forecast(forecast, 1.5)
+
+    assert scaled.get_demand('6104', 'P1', date(2025, 11, 3)) == 150.0
+    assert scaled.get_demand('6110', 'P2', date(2025, 11, 4)) == 60.0
+    assert (scaled.name, scaled.creation_date) == ('IBP', date(2025, 11, 1))
+    assert forecast.get_demand('6104', 'P1', date(2025, 11, 3)) == 100.0
+
+
+def test_shelf_life_override_reaches_the_model(network_data):
+    from src.optimization.sliding_window_model import SlidingWindowModel
+    from tests.conftest import create_network_model
+
+    model = create_network_model(network_data, weeks=1, shelf_life={'ambient': 10, 'thawed': 7})
+
+    assert (model.AMBIENT_SHELF_LIFE, model.FROZEN_SHELF_LIFE, model.THAWED_SHELF_LIFE) == (10, 120, 7)
+    assert set(model.shelf_life_windows) == {10, 120, 7}
+    assert SlidingWindowModel.AMBIENT_SHELF_LIFE == 17
+    with pytest.raises(ValueError, match="chilled"):
+        create_network_model(network_data, weeks=1, shelf_life={'chilled': 5})
+
+
+@pytest.fixture(scope="module")
+def example_scenario():
+    """Baseline scenario with the example network and forecast (legacy inputs)."""
+    from src.models.location import LocationType
+    from src.models.manufacturing import ManufacturingSite
+    from src.parsers.multi_file_parser import MultiFileParser
+
+    data_dir = Path(__file__).parent.parent / "data" / "examples"
+    parser = MultiFileParser(
+        forecast_file=data_dir / "Gluten Free Forecast - Latest.xlsm",
+        network_file=data_dir / "Network_Config.xlsx",
+    )
+    forecast, locations, routes, labor_calendar, truck_schedules, cost_structure = parser.parse_all()
+    manuf_loc = [loc for loc in locations if loc.type == LocationType.MANUFACTURING][0]
+    manufacturing_site = ManufacturingSite(
+        id=manuf_loc.id,
+        name=manuf_loc.name,
+        storage_mode=manuf_loc.storage_mode,
+        production_rate=1400.0,
+        production_cost_per_unit=cost_structure.production_cost_per_unit,
+    )
+    return Scenario(
+        id='example-id',
+        name='Example',
+        forecast_data=forecast,
+        labor_calendar=labor_calendar,
+        truck_schedules=truck_schedules,
+        cost_parameters=cost_structure,
+        locations=locations,
+        routes=routes,
+        manufacturing_site=manufacturing_site,
+    )
+
+
+@pytest.mark.solver_required
+def test_process_pool_sweep_solves_every_case(manager, example_scenario):
+    pytest.importorskip("highspy")
+
+    sweep = ScenarioSweep(
+        manager, example_scenario, horizon_weeks=1,
+        max_workers=2, threads_per_worker=1, time_limit_seconds=60, mip_gap=0.05,
+    )
+    cases = build_sweep_grid(demand_multiplier=[1.0, 1.2]) + build_sweep_grid(ambient_shelf_life=[10])
+
+    result = sweep.run(cases)
+
+    assert result.failures == {}
+    assert len(result.scenario_ids) == 3
+    scenarios = [manager.load_scenario(scenario_id) for scenario_id in result.scenario_ids]
+    assert [s.optimization_config['overrides'] for s in scenarios] == [
+        {'demand_multiplier': 1.0}, {'demand_multiplier': 1.2}, {'ambient_shelf_life': 10},
+    ]
+    assert all(s.optimization_results.is_feasible() for s in scenarios)
+    assert scenarios[1].optimization_results.metadata['sweep_overrides'] == {'demand_multiplier': 1.2}
+    start = date.fromisoformat(scenarios[0].optimization_config['start_date'])
+    assert scenarios[0].optimization_config['end_date'] == (start + timedelta(days=6)).isoformat()
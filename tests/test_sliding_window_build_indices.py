@@ -0,0 +1,161 @@
+"""Tests for SlidingWindowModel precomputed constraint indices.
+
+The constraint rules use lookup tables built once in __init__ (date positions,
+shelf life windows, per-node arrival/departure legs) instead of rescanning
+model.dates and self.routes on every rule call. These tests check the tables
+against the brute-force definitions and that model build time scales roughly
+linearly with the planning horizon.
+"""
+
+import contextlib
+import io
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from src.parsers.multi_file_parser import MultiFileParser
+from src.models.manufacturing import ManufacturingSite
+from src.models.location import LocationType
+from src.models.unified_route import TransportMode
+from src.optimization.legacy_to_unified_converter import LegacyToUnifiedConverter
+from src.optimization.sliding_window_model import SlidingWindowModel
+from tests.conftest import create_test_products
+
+
+DATA_DIR = Path(__file__).parent.parent / "data" / "examples"
+
+
+@pytest.fixture(scope="module")
+def network_data():
+    """Real network + forecast + inventory, converted to unified format."""
+    parser = MultiFileParser(
+        forecast_file=DATA_DIR / "Gluten Free Forecast - Latest.xlsm",
+        network_file=DATA_DIR / "Network_Config.xlsx",
+        inventory_file=DATA_DIR / "inventory_latest.XLSX",
+    )
+    forecast, locations, routes, labor_calendar, truck_schedules_list, cost_structure = parser.parse_all()
+
+    manuf_loc = [loc for loc in locations if loc.type == LocationType.MANUFACTURING][0]
+    manufacturing_site = ManufacturingSite(
+        id=manuf_loc.id,
+        name=manuf_loc.name,
+        storage_mode=manuf_loc.storage_mode,
+        production_rate=1400.0,
+        daily_startup_hours=0.5,
+        daily_shutdown_hours=0.25,
+        default_changeover_hours=0.5,
+        production_cost_per_unit=cost_structure.production_cost_per_unit,
+    )
+    inventory_snapshot = parser.parse_inventory(snapshot_date=None)
+
+    converter = LegacyToUnifiedConverter()
+    return {
+        'nodes': converter.convert_nodes(manufacturing_site, locations, forecast),
+        'routes': converter.convert_routes(routes),
+        'truck_schedules': converter.convert_truck_schedules(truck_schedules_list, manufacturing_site.id),
+        'forecast': forecast,
+        'products': create_test_products(sorted(set(e.product_id for e in forecast.entries))),
+        'labor_calendar': labor_calendar,
+        'cost_structure': cost_structure,
+        'initial_inventory': inventory_snapshot.to_optimization_dict(),
+        'inventory_snapshot_date': inventory_snapshot.snapshot_date,
+    }
+
+
+def _create_model(data, weeks):
+    start = data['inventory_snapshot_date']
+    with contextlib.redirect_stdout(io.StringIO()):
+        return SlidingWindowModel(
+            nodes=data['nodes'],
+            routes=data['routes'],
+            forecast=data['forecast'],
+            products=data['products'],
+            labor_calendar=data['labor_calendar'],
+            cost_structure=data['cost_structure'],
+            start_date=start,
+            end_date=start + timedelta(weeks=weeks),
+            truck_schedules=data['truck_schedules'],
+            initial_inventory=data['initial_inventory'],
+            inventory_snapshot_date=data['inventory_snapshot_date'],
+            allow_shortages=True,
+            use_pallet_tracking=True,
+            use_truck_pallet_tracking=True,
+        )
+
+
+def test_date_index_and_windows(network_data):
+    """Date positions and clipped shelf life windows match list slicing."""
+    model = _create_model(network_data, weeks=4)
+    dates = model.dates
+
+    assert model.date_index == {d: i for i, d in enumerate(dates)}
+    assert dates[0] not in model.date_to_prev
+    assert all(model.date_to_prev[dates[i]] == dates[i - 1] for i in range(1, len(dates)))
+
+    for shelf_life in (17, 120, 14):
+        windows = model.shelf_life_windows[shelf_life]
+        for i, t in enumerate(dates):
+            expected = dates[max(0, i - shelf_life + 1):i + 1]
+            assert list(windows[t]) == expected
+            assert len(windows[t]) <= shelf_life
+
+
+def test_arrival_and_departure_legs_match_route_scan(network_data):
+    """Per-node legs reproduce the date arithmetic of a full route scan."""
+    model = _create_model(network_data, weeks=4)
+    dates_set = set(model.dates)
+
+    for node_id, node in model.nodes.items():
+        for arrival_state in ('ambient', 'frozen', 'thawed'):
+            legs = model.arrival_legs.get((node_id, arrival_state), [])
+            routes = [
+                r for r in model.routes_to_node[node_id]
+                if model._determine_arrival_state(r, node) == arrival_state
+            ]
+            assert [origin for origin, _, _ in legs] == [r.origin_node_id for r in routes]
+
+            for (origin, ship_state, offset_days), route in zip(legs, routes):
+                expected_ship_state = 'frozen' if route.transport_mode == TransportMode.FROZEN else 'ambient'
+                assert ship_state == expected_ship_state
+                for t in model.dates:
+                    departure = t - timedelta(days=route.transit_days)
+                    expected = departure if departure in dates_set else None
+                    assert model._departure_date(t, offset_days) == expected
+
+        for ship_state in ('ambient', 'frozen'):
+            expected_dests = [
+                r.destination_node_id for r in model.routes_from_node[node_id]
+                if (r.transport_mode == TransportMode.FROZEN) == (ship_state == 'frozen')
+            ]
+            assert model.departure_legs.get((node_id, ship_state), []) == expected_dests
+
+    for route in model.routes:
+        first_match = next(
+            r for r in model.routes
+            if r.origin_node_id == route.origin_node_id and r.destination_node_id == route.destination_node_id
+        )
+        assert model.route_by_pair[(route.origin_node_id, route.destination_node_id)] is first_match
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+def test_build_time_scales_linearly(network_data):
+    """Per-day build time for a 26-week horizon stays close to the 4-week cost.
+
+    Before the precomputed indices each rule call rescanned model.dates, so the
+    per-day cost grew with horizon length.
+    """
+    per_day_ms = {}
+    for weeks in (4, 8, 12, 26):
+        model = _create_model(network_data, weeks)
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            model.build_model()
+            build_time = time.perf_counter() - start
+        per_day_ms[weeks] = build_time / len(model.dates) * 1000
+        print(f"  {weeks:>2} weeks: {build_time:.2f}s ({per_day_ms[weeks]:.1f} ms/day)")
+
+    # Roughly linear: per-day cost must not blow up with the horizon
+    assert per_day_ms[26] < 2.0 * per_day_ms[4], per_day_ms
@@ -0,0 +1,132 @@
+"""Tests for the binary (.npz) solve file format (src/persistence/solve_file.py).
+
+Variable values (warmstart hints and recorded shortage/consumption flows)
+are stored as one section per variable family; the header and single
+sections can be read without loading the rest of the file.
+"""
+
+import json
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from src.optimization.base_model import OptimizationResult
+from src.optimization.warmstart_utils import serialize_warmstart_hints
+from src.persistence.solve_file import SolveFile
+from src.persistence.solve_repository import SolveRepository
+from src.workflows import WorkflowResult, WorkflowType
+
+
+D1 = date(2025, 11, 3)
+D2 = date(2025, 11, 4)
+
+HINTS = {
+    ('production', '6122', 'P1', D1): 100.0,
+    ('production', '6122', 'P2', D2): 40.5,
+    ('in_transit', '6122', '6104', 'P1', D1, 'ambient'): 60.0,
+    ('inventory', '6104', 'P1', 'ambient', D2): 12.0,
+    ('mix_count', '6122', 'P1', D1): 2.0,
+}
+
+FLOWS = {
+    ('shortage', '6104', 'P1', D2): 25.0,
+    ('demand_consumed_from_ambient', '6104', 'P1', D1): 75.0,
+}
+
+
+def _result():
+    return WorkflowResult(
+        workflow_type=WorkflowType.DAILY,
+        solve_timestamp=datetime(2025, 11, 3, 6, 15),
+        solution=OptimizationResult(
+            success=True,
+            objective_value=1234.5,
+            metadata={
+                'warmstart_hints': serialize_warmstart_hints(HINTS),
+                'flow_values': serialize_warmstart_hints(FLOWS),
+                'total_cost': 1234.5,
+            },
+        ),
+        success=True,
+        objective_value=1234.5,
+        metadata={'planning_end_date': D2.isoformat()},
+    )
+
+
+@pytest.fixture
+def saved(tmp_path):
+    solve_file = SolveFile(tmp_path / "daily.npz")
+    solve_file.save(_result())
+    return solve_file
+
+
+def test_round_trip_matches_json(saved, tmp_path):
+    json_file = SolveFile(tmp_path / "daily.json")
+    json_file.save(_result())
+
+    binary = saved.load()
+    text = json_file.load()
+
+    assert binary.objective_value == text.objective_value == 1234.5
+    assert binary.metadata == text.metadata
+    assert binary.solution.metadata['warmstart_hints'] == text.solution.metadata['warmstart_hints']
+    assert binary.solution.metadata['flow_values'] == text.solution.metadata['flow_values']
+    assert binary.solution.metadata['total_cost'] == 1234.5
+
+
+def test_sections_load_independently(saved):
+    header = saved.read_header()
+    assert header['workflow_type'] == 'daily'
+    assert 'warmstart_hints' not in header['solution_data']['metadata']
+    assert 'flow_values' not in header['solution_data']['metadata']
+    assert header['sections']['production'] == {
+        'rows': 2, 'columns': ['str', 'str', 'date'], 'source': 'warmstart_hints',
+    }
+    assert sorted(saved.section_names()) == [
+        'demand_consumed_from_ambient', 'in_transit', 'inventory', 'mix_count', 'production', 'shortage',
+    ]
+
+    assert saved.load_section('in_transit') == {('in_transit', '6122', '6104', 'P1', D1, 'ambient'): 60.0}
+    assert saved.load_section('thaw') == {}
+
+    partial = saved.load(sections=['production', 'shortage'])
+    assert list(partial.solution.metadata['warmstart_hints']) == ['production']
+    assert list(partial.solution.metadata['flow_values']) == ['shortage']
+    assert 'warmstart_hints' not in saved.load(sections=[]).solution.metadata
+
+
+def test_shortage_section_is_stored(saved, tmp_path):
+    assert saved.read_header()['sections']['shortage']['source'] == 'flow_values'
+    assert saved.load_section('shortage') == {('shortage', '6104', 'P1', D2): 25.0}
+
+    json_file = SolveFile(tmp_path / "daily.json")
+    json_file.save(_result())
+    assert json_file.load_section('shortage') == saved.load_section('shortage')
+
+
+def test_newer_format_version_is_rejected(tmp_path):
+    path = tmp_path / "future.npz"
+    header = json.dumps({'format': 'planning-solve', 'format_version': 99}).encode()
+    np.savez_compressed(path, header=np.frombuffer(header, dtype=np.uint8))
+
+    with pytest.raises(ValueError, match="format version 99"):
+        SolveFile(path).load()
+
+
+def test_repository_saves_binary_and_reads_json(tmp_path):
+    repo = SolveRepository(base_path=tmp_path / "solves")
+    legacy = tmp_path / "solves" / "2025" / "wk45" / "daily_20251102_0600.json"
+    legacy.parent.mkdir(parents=True)
+    result = _result()
+    result.solve_timestamp = datetime(2025, 11, 2, 6, 0)
+    SolveFile(legacy).save(result)
+
+    path = repo.save(_result())
+    repo.rebuild_index()
+
+    assert path.suffix == '.npz'
+    assert len(repo.list_all_solves()) == 2
+    latest = repo.get_latest_solve(sections=['mix_count'])
+    assert latest.solution.metadata['warmstart_hints'] == {'mix_count': [['6122', 'P1', '2025-11-03', 2.0]]}
+    assert SolveRepository(tmp_path / "json", file_format="json").save(_result()).suffix == '.json'
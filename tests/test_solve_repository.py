@@ -0,0 +1,80 @@
+"""Tests for the indexed solve repository (src/persistence/solve_repository.py).
+
+Listing, filtering and cleanup are queries against solves/index.sqlite3;
+the index is written on save() and rebuilt from the solve files if missing.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.persistence.solve_repository import SolveRepository
+from src.workflows import WorkflowResult, WorkflowType
+
+
+def _result(workflow_type, timestamp, success=True, objective=100.0):
+    return WorkflowResult(
+        workflow_type=workflow_type,
+        solve_timestamp=timestamp,
+        success=success,
+        objective_value=objective,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = SolveRepository(base_path=tmp_path / "solves")
+    repo.save(_result(WorkflowType.INITIAL, datetime(2025, 10, 20, 8, 30), objective=300.0))
+    repo.save(_result(WorkflowType.DAILY, datetime(2025, 10, 21, 6, 15)))
+    repo.save(_result(WorkflowType.DAILY, datetime(2025, 10, 22, 6, 10), success=False, objective=None))
+    repo.save(_result(WorkflowType.WEEKLY, datetime(2025, 10, 27, 7, 30), objective=250.0))
+    return repo
+
+
+def test_listing_and_filters_come_from_index(repo, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("solve file read for metadata")
+
+    monkeypatch.setattr(repo, "_extract_metadata", fail)
+
+    solves = repo.list_all_solves()
+    assert [s.solve_timestamp.day for s in solves] == [27, 22, 21, 20]
+
+    daily = repo.list_all_solves(workflow_type=WorkflowType.DAILY, successful_only=True)
+    assert [s.solve_timestamp.day for s in daily] == [21]
+
+    week_43 = repo.get_solves_for_week(year=2025, week=43)
+    assert {s.workflow_type for s in week_43} == {WorkflowType.INITIAL, WorkflowType.DAILY}
+    assert repo.get_solves_for_week(year=2025, week=44)[0].objective_value == 250.0
+
+    assert len(repo.list_all_solves(limit=2)) == 2
+
+
+def test_latest_solve_skips_failed_and_missing_files(repo):
+    latest_daily = repo.get_latest_solve(workflow_type=WorkflowType.DAILY)
+    assert latest_daily.solve_timestamp == datetime(2025, 10, 21, 6, 15)
+
+    repo.list_all_solves(workflow_type=WorkflowType.WEEKLY)[0].file_path.unlink()
+
+    latest = repo.get_latest_solve()
+    assert latest.workflow_type == WorkflowType.DAILY
+    assert len(repo.list_all_solves()) == 3   # stale row dropped
+
+
+def test_delete_old_solves_updates_index(repo):
+    deleted = repo.delete_old_solves(keep_latest_n=2)
+
+    assert deleted == 2
+    remaining = repo.list_all_solves()
+    assert [s.solve_timestamp.day for s in remaining] == [27, 22]
+    assert sorted(p.name for p in repo.base_path.rglob("*.npz")) == sorted(s.file_path.name for s in remaining)
+
+
+def test_missing_index_is_rebuilt(repo):
+    repo.index_path.unlink()
+
+    reopened = SolveRepository(base_path=repo.base_path)
+
+    assert reopened.index_path.exists()
+    assert len(reopened.list_all_solves()) == 4
+    assert reopened.list_all_solves(successful_only=True)[-1].workflow_type == WorkflowType.INITIAL
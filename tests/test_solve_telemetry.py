@@ -0,0 +1,119 @@
+"""Tests for the HiGHS MIP progress telemetry (src/optimization/solve_telemetry.py).
+
+HiGHS callback data is faked with SimpleNamespace objects carrying the
+data_out fields highspy reports (running_time, mip_primal_bound, ...).
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.optimization.solve_telemetry import SolveProgress, SolveTelemetry
+
+
+def _data_out(elapsed, primal=1e40, dual=-1e40, gap=1e40, nodes=0):
+    return SimpleNamespace(running_time=elapsed, mip_primal_bound=primal, mip_dual_bound=dual,
+                           mip_gap=gap, mip_node_count=nodes)
+
+
+def _emit(telemetry, event, data_out):
+    data_in = SimpleNamespace(user_interrupt=False)
+    telemetry._on_event(None, event, data_out, data_in)
+    return data_in
+
+
+def _active(**kwargs):
+    telemetry = SolveTelemetry(**kwargs)
+    telemetry._active = True
+    return telemetry
+
+
+def test_samples_recorded_with_infinite_bounds_as_none():
+    received = []
+    telemetry = _active(callback=received.append)
+
+    _emit(telemetry, 'progress', _data_out(0.5, nodes=1))
+    _emit(telemetry, 'incumbent', _data_out(2.0, primal=1100.0, dual=1000.0, gap=0.0909, nodes=12))
+
+    assert telemetry.samples == received
+    assert telemetry.samples[0] == SolveProgress(elapsed=0.5, event='progress', nodes=1)
+    assert telemetry.samples[1] == SolveProgress(
+        elapsed=2.0, event='incumbent', primal_bound=1100.0, dual_bound=1000.0, gap=0.0909, nodes=12)
+
+    summary = telemetry.summary()
+    assert summary['num_incumbents'] == 1
+    assert summary['first_incumbent_seconds'] == 2.0
+    assert summary['samples'][1]['primal_bound'] == 1100.0
+    assert not summary['stopped_early']
+
+
+def test_progress_samples_throttled_until_bounds_move():
+    telemetry = _active(sample_interval=60.0)
+
+    _emit(telemetry, 'progress', _data_out(1.0, primal=1100.0, dual=1000.0, gap=0.09))
+    _emit(telemetry, 'progress', _data_out(1.5, primal=1100.0, dual=1000.0, gap=0.09))
+    _emit(telemetry, 'progress', _data_out(2.0, primal=1100.0, dual=1010.0, gap=0.08))
+    _emit(telemetry, 'incumbent', _data_out(2.5, primal=1100.0, dual=1010.0, gap=0.08))
+
+    assert [s.elapsed for s in telemetry.samples] == [1.0, 2.0, 2.5]
+
+
+def test_stop_gap_interrupts_after_minimum_time():
+    telemetry = _active(stop_gap=0.05, stop_gap_after_seconds=10.0)
+
+    assert not _emit(telemetry, 'incumbent', _data_out(5.0, primal=1040.0, dual=1000.0, gap=0.04)).user_interrupt
+    assert not telemetry.stopped_early
+
+    assert _emit(telemetry, 'progress', _data_out(12.0, primal=1040.0, dual=1001.0, gap=0.0375)).user_interrupt
+    assert telemetry.stopped_early
+    assert "gap" in telemetry.stop_reason
+
+
+def test_callback_and_request_stop_interrupt():
+    telemetry = _active(callback=lambda progress: progress.nodes >= 100)
+    assert not _emit(telemetry, 'progress', _data_out(1.0, nodes=10)).user_interrupt
+    assert _emit(telemetry, 'progress', _data_out(2.0, dual=5.0, nodes=100)).user_interrupt
+    assert telemetry.stop_reason == "callback requested stop"
+
+    telemetry = _active()
+    telemetry.request_stop("user cancelled")
+    assert _emit(telemetry, 'progress', _data_out(1.0)).user_interrupt
+    assert telemetry.stop_reason == "user cancelled"
+
+
+def test_detached_telemetry_ignores_callbacks():
+    telemetry = _active()
+    telemetry.detach()
+
+    _emit(telemetry, 'incumbent', _data_out(1.0, primal=10.0, dual=9.0, gap=0.1))
+
+    assert telemetry.samples == []
+
+
+@pytest.mark.solver_required
+def test_attach_records_progress_of_appsi_highs_solve():
+    pytest.importorskip("highspy")
+    from pyomo.contrib.appsi.solvers import Highs
+    from pyomo.environ import ConcreteModel, Constraint, NonNegativeIntegers, Objective, Var, maximize
+
+    solver = Highs()
+    if not solver.available():
+        pytest.skip("HiGHS not available")
+    solver.config.load_solution = False
+
+    m = ConcreteModel()
+    weights = [23, 31, 29, 44, 53, 38, 63, 85, 89, 82]
+    values = [92, 57, 49, 68, 60, 43, 67, 84, 87, 72]
+    m.take = Var(range(len(weights)), within=NonNegativeIntegers, bounds=(0, 3))
+    m.capacity = Constraint(expr=sum(w * m.take[i] for i, w in enumerate(weights)) <= 365)
+    m.obj = Objective(expr=sum(v * m.take[i] for i, v in enumerate(values)), sense=maximize)
+
+    telemetry = SolveTelemetry(sample_interval=0.0)
+    assert telemetry.attach(solver, m)
+    results = solver.solve(m)
+    telemetry.detach()
+
+    assert results.best_feasible_objective is not None
+    incumbents = [s for s in telemetry.samples if s.event == 'incumbent']
+    assert incumbents
+    assert incumbents[-1].primal_bound == pytest.approx(results.best_feasible_objective)
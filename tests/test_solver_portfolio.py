@@ -0,0 +1,125 @@
+"""Tests for the solver portfolio (src/optimization/solver_portfolio.py).
+
+Member selection, gap and CBC solution parsing are pure functions; the race
+itself runs real HiGHS worker processes on a small MIP and must agree with
+APPSI HiGHS.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.optimization.base_model import BaseOptimizationModel
+from src.optimization.highs_direct import MatrixModel
+from src.optimization.solver_portfolio import (
+    HIGHS_MEMBERS, PortfolioMember, SolverPortfolio, _read_cbc_solution, default_members, portfolio_gap,
+)
+from src.optimization.solve_telemetry import SolveTelemetry
+from tests.conftest import appsi_highs_solver, small_mip_model
+
+
+def test_default_members_fill_the_cores(monkeypatch):
+    monkeypatch.setattr('shutil.which', lambda name: None)
+    members = default_members(cpus=16, threads_per_member=2)
+    assert [m.name for m in members] == [m.name for m in HIGHS_MEMBERS[:8]]
+    assert all(m.solver == 'highs' and m.options['threads'] == 2 for m in members)
+    assert len({m.options.get('random_seed') for m in members}) == 8
+
+    monkeypatch.setattr('shutil.which', lambda name: '/usr/bin/cbc')
+    members = default_members(cpus=16, threads_per_member=4)
+    assert [m.solver for m in members] == ['highs', 'highs', 'highs', 'cbc']
+
+    # A single slot is always HiGHS with the project defaults
+    assert [m.name for m in default_members(cpus=2, threads_per_member=2)] == ['default']
+
+
+def test_portfolio_gap():
+    assert portfolio_gap(110.0, 100.0) == pytest.approx(10 / 110)
+    assert portfolio_gap(100.0, 100.5) == 0.0
+    assert portfolio_gap(math.inf, 100.0) is None
+    assert portfolio_gap(110.0, -math.inf) is None
+
+
+def test_cbc_solution_parsed_by_column_name(tmp_path):
+    path = tmp_path / "model.sol"
+    path.write_text(
+        "Stopped on time - objective value 42.5\n"
+        "      0 c0            3.5                       0\n"
+        "      2 c2              1                       1\n"
+        "**    4 c4             -2                       0\n"
+    )
+    status, col_value, header = _read_cbc_solution(str(path), 5)
+
+    assert status == 'maxTimeLimit' and header.startswith('Stopped on time')
+    assert col_value.tolist() == [3.5, 0.0, 1.0, 0.0, -2.0]
+
+    path.write_text("Infeasible - objective value 0\n")
+    assert _read_cbc_solution(str(path), 5)[:2] == ('infeasible', None)
+
+
+def test_matrix_arrays_round_trip():
+    matrix = MatrixModel.from_pyomo(small_mip_model())
+    copy = MatrixModel.from_arrays(matrix.arrays())
+
+    assert copy.columns == [] and copy.num_col == matrix.num_col == 3
+    assert copy.num_row == matrix.num_row and copy.maximize and copy.offset == 7.0
+    assert np.array_equal(copy.value, matrix.value)
+
+
+@pytest.mark.solver_required
+def test_portfolio_solve_matches_appsi():
+    appsi = appsi_highs_solver()
+    m = small_mip_model()
+    # HiGHS has already run in this process; members must not inherit its scheduler
+    expected = appsi.solve(m).best_feasible_objective
+
+    members = [
+        PortfolioMember('default', options={'threads': 1}),
+        PortfolioMember('no_presolve', options={'threads': 1, 'presolve': 'off', 'random_seed': 1}),
+    ]
+    portfolio = SolverPortfolio(members=members, grace_seconds=5.0)
+    portfolio.config.time_limit = 30
+    results = portfolio.solve(m)
+    portfolio.load_vars()
+
+    assert str(results.termination_condition).endswith('optimal')
+    assert results.best_feasible_objective == pytest.approx(expected)
+    assert portfolio.stats['proved_by'] in ('default', 'no_presolve')
+    assert {r['name'] for r in portfolio.stats['members']} == {'default', 'no_presolve'}
+    assert m.fixed.value == 3
+    assert 3 * m.x.value + 2 * m.y.value + m.z.value + 7 == pytest.approx(expected)
+
+
+def test_members_are_spawned_not_forked():
+    assert SolverPortfolio(members=[]).start_method == 'spawn'
+    assert SolverPortfolio(members=[], start_method='forkserver').start_method == 'forkserver'
+
+
+class _StubModel(BaseOptimizationModel):
+    """Records what _solve_with_appsi_highs hands to the solve step."""
+
+    def build_model(self):
+        return None
+
+    def extract_solution(self, model):
+        return None
+
+    def _create_appsi_highs_solver(self, **kwargs):
+        self.solver_kwargs = kwargs
+        return object()
+
+    def _run_appsi_solve(self, solver, telemetry=None, extract=True):
+        self.telemetry = telemetry
+        return 'result'
+
+
+def test_portfolio_warns_when_telemetry_is_dropped():
+    model = _StubModel()
+
+    with pytest.warns(RuntimeWarning, match="portfolio"):
+        result = model._solve_with_appsi_highs(portfolio=True, telemetry=SolveTelemetry())
+
+    assert result == 'result'
+    assert model.telemetry is None
+    assert model.solver_kwargs['portfolio']
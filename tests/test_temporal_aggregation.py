@@ -0,0 +1,245 @@
+"""Tests for variable-granularity planning periods (src/optimization/temporal_aggregation.py).
+
+PlanningPeriods maps SlidingWindowModel's day-based data onto TimeBucket
+periods. With daily periods every table must match the day arithmetic the
+model used before; with weekly tail periods every departure must arrive in
+exactly one period and demand/labor must be conserved.
+
+On the real network, an all-daily config must build exactly the default
+model, and a weekly tail must build a smaller, feasible model.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from src.models.labor_calendar import LaborCalendar, LaborDay
+from src.models.time_period import BucketGranularity, VariableGranularityConfig
+from src.optimization.temporal_aggregation import PeriodLabor, PlanningPeriods
+from tests.conftest import build_network_model, create_network_model
+
+
+START = date(2025, 10, 6)  # Monday
+END = START + timedelta(weeks=8) - timedelta(days=1)
+
+WEEKLY_TAIL = VariableGranularityConfig(
+    near_term_days=14,
+    near_term_granularity=BucketGranularity.DAILY,
+    far_term_granularity=BucketGranularity.WEEKLY,
+)
+
+ALL_DAILY = VariableGranularityConfig(
+    near_term_days=7,
+    near_term_granularity=BucketGranularity.DAILY,
+    far_term_granularity=BucketGranularity.DAILY,
+)
+
+
+@pytest.fixture
+def labor_calendar():
+    days = []
+    for i in range((END - START).days + 1):
+        d = START + timedelta(days=i)
+        weekday = d.weekday() < 5
+        days.append(LaborDay(
+            date=d,
+            fixed_hours=12.0 if weekday else 0.0,
+            regular_rate=25.0,
+            overtime_rate=37.5,
+            non_fixed_rate=None if weekday else 40.0,
+            minimum_hours=0.0 if weekday else 4.0,
+            is_fixed_day=weekday,
+        ))
+    return LaborCalendar(name="test", days=days)
+
+
+def test_daily_periods_match_day_arithmetic():
+    periods = PlanningPeriods(START, END)
+    dates = [START + timedelta(days=i) for i in range((END - START).days + 1)]
+
+    assert not periods.is_aggregated
+    assert periods.dates == dates
+    for shelf_life in (14, 17, 120):
+        windows = periods.shelf_life_windows(shelf_life)
+        for i, t in enumerate(dates):
+            assert windows[t] == tuple(dates[max(0, i - shelf_life + 1):i + 1])
+    for transit in (0, 1, 2, 7):
+        for i, t in enumerate(dates):
+            expected = (dates[i - transit],) if i - transit >= 0 else ()
+            assert periods.departure_periods(t, transit) == expected
+
+
+def test_weekly_tail_periods():
+    periods = PlanningPeriods(START, END, WEEKLY_TAIL)
+
+    assert periods.is_aggregated
+    assert len(periods) == 14 + 6
+    assert sum(periods.period_days.values()) == (END - START).days + 1
+    assert periods.period_of(END) == END - timedelta(days=6)
+    assert periods.periods_within(17) == periods.dates[:15]
+    assert periods.count_weekday(periods.dates[-1], 'Tuesday') == 1
+    assert periods.count_weekday(periods.dates[-1], None) == 7
+    assert periods.summary() == "14 daily + 6 weekly periods (56 days)"
+
+
+@pytest.mark.parametrize("transit", [0, 1, 2, 3, 7, 10])
+def test_each_departure_arrives_in_one_period(transit):
+    periods = PlanningPeriods(START, END, WEEKLY_TAIL)
+
+    arrivals = {}
+    for t in periods.dates:
+        for departure in periods.departure_periods(t, transit):
+            assert departure not in arrivals
+            assert departure <= t
+            arrivals[departure] = t
+
+    for departure in periods.dates:
+        assert arrivals.get(departure) == periods.arrival_period(departure, transit)
+
+
+@pytest.mark.parametrize("granularity", [None, WEEKLY_TAIL])
+def test_float_transit_days_use_whole_day_tables(granularity):
+    """UnifiedRoute.transit_days is a float; 1.0 and 1 must map to the same periods."""
+    periods = PlanningPeriods(START, END, granularity)
+
+    for t in periods.dates:
+        assert periods.departure_periods(t, 1.0) == periods.departure_periods(t, 1)
+        assert periods.departure_periods(t, 0.5) == periods.departure_periods(t, 0)
+        assert periods.arrival_period(t, 2.0) == periods.arrival_period(t, 2)
+    assert set(periods._departure_tables) == {0, 1}
+
+
+def test_shelf_life_window_contains_own_period():
+    periods = PlanningPeriods(START, END, WEEKLY_TAIL)
+
+    windows = periods.shelf_life_windows(3)
+    for t in periods.dates:
+        assert windows[t][-1] == t
+    assert windows[periods.dates[-1]] == (periods.dates[-1],)
+
+    windows = periods.shelf_life_windows(17)
+    tail = periods.dates[-1]
+    assert windows[tail] == tuple(t for t in periods.dates if periods.end_of(tail) - t < timedelta(days=17))
+
+
+def test_aggregate_demand_conserves_quantity():
+    periods = PlanningPeriods(START, END, WEEKLY_TAIL)
+    demand = {
+        ('6104', 'P1', START + timedelta(days=i)): float(i + 1)
+        for i in range((END - START).days + 1)
+    }
+    demand[('6104', 'P1', END + timedelta(days=1))] = 999.0  # Outside horizon
+
+    aggregated = periods.aggregate_demand(demand)
+
+    assert set(t for (_, _, t) in aggregated) <= set(periods.dates)
+    assert sum(aggregated.values()) == pytest.approx(sum(range(1, 57)))
+    assert aggregated[('6104', 'P1', periods.dates[-1])] == pytest.approx(sum(range(50, 57)))
+
+
+def test_period_labor(labor_calendar):
+    periods = PlanningPeriods(START, END, WEEKLY_TAIL)
+
+    assert isinstance(periods.labor(labor_calendar, START), LaborDay)
+
+    week = periods.labor(labor_calendar, periods.dates[-1])
+    assert isinstance(week, PeriodLabor)
+    assert week.fixed_hours == pytest.approx(60.0)
+    assert week.overtime_hours == pytest.approx(10.0)
+    assert week.non_fixed_hours == pytest.approx(28.0)
+    assert week.max_hours == pytest.approx(98.0)
+    assert week.non_fixed_rate == pytest.approx(40.0)
+    assert week.is_fixed_day
+    assert week.num_days == 7
+
+
+# ----------------------------------------------------------------------
+# SlidingWindowModel(granularity=...) on the real network
+# ----------------------------------------------------------------------
+
+def _objective_terms(pyomo_model):
+    from pyomo.repn import generate_standard_repn
+
+    repn = generate_standard_repn(pyomo_model.obj.expr, compute_values=True, quadratic=False)
+    terms = {}
+    for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+        terms[var.name] = terms.get(var.name, 0.0) + coef
+    return terms, repn.constant
+
+
+def _var_names(pyomo_model):
+    from pyomo.environ import Var
+
+    return {v.name for v in pyomo_model.component_data_objects(Var)}
+
+
+def test_default_model_builds_with_truck_pallet_tracking(network_data):
+    """Truck pallet rows look up departures with the routes' float transit days."""
+    from pyomo.repn import generate_standard_repn
+
+    model, pyomo_model = build_network_model(network_data, weeks=2)
+
+    assert model.use_truck_pallet_tracking
+    assert not model.periods.is_aggregated
+    assert len(pyomo_model.truck_pallet_ceiling_con) > 0
+    for (truck_idx, dest, prod, delivery_date), con in pyomo_model.truck_pallet_ceiling_con.items():
+        repn = generate_standard_repn(con.body, compute_values=True, quadratic=False)
+        for var in repn.linear_vars:
+            if var.parent_component() is pyomo_model.in_transit:
+                origin, _, _, departure_date, _ = var.index()
+                route = model.route_by_pair[(origin, dest)]
+                assert departure_date == delivery_date - timedelta(days=route.transit_days)
+
+
+def test_daily_granularity_builds_the_default_model(network_data):
+    default, default_pyomo = build_network_model(network_data, weeks=2)
+    daily, daily_pyomo = build_network_model(network_data, weeks=2, granularity=ALL_DAILY)
+
+    assert not daily.periods.is_aggregated
+    assert list(daily_pyomo.dates) == list(default_pyomo.dates)
+    assert _var_names(daily_pyomo) == _var_names(default_pyomo)
+    assert daily_pyomo.nconstraints() == default_pyomo.nconstraints()
+
+    daily_terms, daily_constant = _objective_terms(daily_pyomo)
+    default_terms, default_constant = _objective_terms(default_pyomo)
+    assert daily_terms.keys() == default_terms.keys()
+    for name, coef in default_terms.items():
+        assert daily_terms[name] == pytest.approx(coef), name
+    assert daily_constant == pytest.approx(default_constant)
+
+
+def test_weekly_tail_shrinks_the_model(network_data):
+    _, daily_pyomo = build_network_model(network_data, weeks=6)
+    weekly, weekly_pyomo = build_network_model(network_data, weeks=6, granularity=WEEKLY_TAIL)
+
+    assert weekly.periods.is_aggregated
+    assert len(weekly_pyomo.dates) < len(daily_pyomo.dates)
+    assert weekly_pyomo.nvariables() < daily_pyomo.nvariables()
+    assert weekly_pyomo.nconstraints() < daily_pyomo.nconstraints()
+
+
+def test_aggregated_truck_capacity_per_delivery_period(network_data):
+    """Each capacity row covers one delivery period at 44 pallets per departure into it."""
+    from pyomo.repn import generate_standard_repn
+
+    model, pyomo_model = build_network_model(network_data, weeks=4, granularity=WEEKLY_TAIL)
+    assert len(pyomo_model.truck_capacity_con) > 0
+
+    for (truck_idx, t), con in pyomo_model.truck_capacity_con.items():
+        repn = generate_standard_repn(con.body, compute_values=True, quadratic=False)
+        assert {var.index()[3] for var in repn.linear_vars} == {t}
+        departures = model._truck_departures(truck_idx, t)
+        assert con.upper == pytest.approx(model.PALLETS_PER_TRUCK * departures)
+        for var in repn.linear_vars:
+            assert var.ub == model.PALLETS_PER_TRUCK * departures
+
+
+@pytest.mark.solver_required
+def test_aggregated_model_is_feasible(network_data):
+    pytest.importorskip("highspy")
+    model = create_network_model(network_data, weeks=4, granularity=WEEKLY_TAIL)
+
+    result = model.solve(solver_name='appsi_highs', time_limit_seconds=120, mip_gap=0.05)
+
+    assert result.is_feasible()
+    assert result.objective_value is not None
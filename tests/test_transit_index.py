@@ -0,0 +1,91 @@
+"""Tests for the in-transit interval index (src/analysis/transit_index.py).
+
+A leg is on the road from its departure date up to (not including) its
+arrival date; queries return legs in insertion order.
+"""
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List
+
+from src.analysis.transit_index import TransitIndex, TransitLeg
+
+
+D0 = date(2025, 10, 13)
+
+
+@dataclass
+class _Leg:
+    from_location_id: str
+    to_location_id: str
+    transit_days: int
+
+
+@dataclass
+class _Route:
+    route_legs: List[_Leg]
+
+
+@dataclass
+class _Shipment:
+    id: str
+    delivery_date: date
+    route: _Route
+
+    @property
+    def total_transit_days(self) -> int:
+        return sum(leg.transit_days for leg in self.route.route_legs)
+
+
+def _leg(origin, dest, depart_offset, days, item):
+    departure = D0 + timedelta(days=depart_offset)
+    return TransitLeg(origin, dest, departure, departure + timedelta(days=days), item)
+
+
+def test_matches_linear_scan():
+    legs = [
+        _leg("6122", "6125", i % 9, 1 + i % 4, i) if i % 3 else _leg("6122", "6104", i % 7, 2, i)
+        for i in range(60)
+    ]
+    index = TransitIndex(legs)
+
+    for start in range(-2, 14):
+        for length in range(3):
+            d1 = D0 + timedelta(days=start)
+            d2 = d1 + timedelta(days=length)
+            expected = [l for l in legs if l.departure_date <= d2 and l.arrival_date > d1]
+            assert index.between(d1, d2) == expected
+        expected_lane = [
+            l for l in legs
+            if l.departure_date <= d1 < l.arrival_date and l.destination_id == "6104"
+        ]
+        assert index.on_date(d1, origin_id="6122", destination_id="6104") == expected_lane
+
+
+def test_departing_arriving_and_zero_day_legs():
+    index = TransitIndex([
+        _leg("6122", "6125", 0, 1, "a"),
+        _leg("6125", "6103", 1, 0, "same-day"),   # never on the road
+        _leg("6122", "6125", 1, 2, "b"),
+    ])
+
+    assert [l.item for l in index.on_date(D0 + timedelta(days=1))] == ["b"]
+    assert [l.item for l in index.departing(D0 + timedelta(days=1))] == ["same-day", "b"]
+    assert [l.item for l in index.arriving(D0 + timedelta(days=1), destination_id="6125")] == ["a"]
+    assert index.lanes == [("6122", "6125"), ("6125", "6103")]
+    assert TransitIndex([]).on_date(D0) == []
+
+
+def test_from_shipments_derives_leg_dates():
+    shipment = _Shipment(
+        id="SHIP-001",
+        delivery_date=D0 + timedelta(days=3),
+        route=_Route([_Leg("6122", "6125", 1), _Leg("6125", "6103", 1)]),
+    )
+
+    index = TransitIndex.from_shipments([shipment])
+
+    first, second = index.legs
+    assert (first.departure_date, first.arrival_date) == (D0 + timedelta(days=1), D0 + timedelta(days=2))
+    assert index.on_date(D0 + timedelta(days=2)) == [second]
+    assert second.item is shipment and second.transit_days == 1
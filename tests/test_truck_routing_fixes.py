@@ -169,7 +169,8 @@ def test_day_of_week_enforcement():
         end_date=end_date,
         allow_shortages=True,
         use_pallet_tracking=False,
-        use_truck_pallet_tracking=False
+        use_truck_pallet_tracking=False,
+        prune_unreachable=False,  # No demand this week; checks truck days, not reachability
     )
 
     pyomo_model = model_builder.build_model()
@@ -0,0 +1,161 @@
+"""Tests for rolling-horizon warmstart (src/optimization/warmstart_utils.py).
+
+Hints are keyed by (variable_name, *index). They are stored in the saved solve
+(solution.metadata['warmstart_hints']), filtered onto the next planning window
+by the Daily/Weekly workflows, and loaded into the freshly built model.
+"""
+
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+from pyomo.environ import Binary, ConcreteModel, NonNegativeIntegers, NonNegativeReals, Var
+
+from src.models.cost_structure import CostStructure
+from src.models.forecast import Forecast
+from src.models.labor_calendar import LaborCalendar
+from src.optimization.base_model import OptimizationResult
+from src.optimization.warmstart_utils import (
+    apply_warmstart_hints,
+    deserialize_warmstart_hints,
+    extract_solution_for_warmstart,
+    extract_warmstart_for_rolling_window,
+    get_partial_start_variables,
+    serialize_warmstart_hints,
+)
+from src.persistence.solve_file import SolveFile
+from src.workflows import DailyWorkflow, WorkflowConfig, WorkflowResult, WorkflowType
+
+
+D1 = date(2025, 11, 3)
+D2 = date(2025, 11, 4)
+D3 = date(2025, 11, 5)
+
+
+def _toy_model():
+    """Small Pyomo model with the warmstart variable names SlidingWindowModel uses."""
+    m = ConcreteModel()
+    m.production = Var([('6122', 'P1', D1), ('6122', 'P1', D2)], within=NonNegativeReals, bounds=(0, 1000))
+    m.mix_count = Var([('6122', 'P1', D1), ('6122', 'P1', D2)], within=NonNegativeIntegers, bounds=(0, 5))
+    m.product_produced = Var([('6122', 'P1', D1), ('6122', 'P1', D2)], within=Binary)
+    m.overtime_hours = Var([D1, D2], within=NonNegativeReals)
+    return m
+
+
+def test_apply_hints_repairs_bounds_and_integrality():
+    m = _toy_model()
+    m.production['6122', 'P1', D2].fix(10)
+    hints = {
+        ('production', '6122', 'P1', D1): 1500.0,   # above ub -> clamped
+        ('production', '6122', 'P1', D2): 300.0,    # fixed var -> untouched
+        ('mix_count', '6122', 'P1', D1): 2.6,       # rounded
+        ('product_produced', '6122', 'P1', D1): 1.0,
+        ('overtime_hours', D1): 1.5,                # single-index key
+        ('production', '6122', 'P1', D3): 50.0,     # index not in model -> dropped
+        ('no_such_var', 'x'): 1.0,                  # variable not warmstarted -> dropped
+    }
+
+    stats = apply_warmstart_hints(m, hints)
+
+    assert m.production['6122', 'P1', D1].value == 1000
+    assert m.production['6122', 'P1', D2].value == 10
+    assert m.mix_count['6122', 'P1', D1].value == 3
+    assert m.mix_count['6122', 'P1', D2].value == 0          # unhinted -> lower bound
+    assert m.product_produced['6122', 'P1', D1].value == 1
+    assert m.overtime_hours[D1].value == 1.5
+    assert m.overtime_hours[D2].value == 0
+    assert stats['clamped'] == 1
+    assert stats['rounded'] == 1
+    assert stats['dropped'] == 2
+
+    partial = get_partial_start_variables(m)
+    assert {v.name for v in partial} == {
+        v.name for v in list(m.mix_count.values()) + list(m.product_produced.values())
+    }
+
+
+def test_extract_and_serialize_round_trip():
+    m = _toy_model()
+    m.production['6122', 'P1', D1].set_value(1200.0)
+    m.production['6122', 'P1', D2].set_value(-1e-12)        # numerical noise -> zero, omitted
+    m.mix_count['6122', 'P1', D1].set_value(2.0000001)
+    m.product_produced['6122', 'P1', D1].set_value(1)
+    m.overtime_hours[D2].set_value(0.75)
+
+    hints = extract_solution_for_warmstart(SimpleNamespace(model=m))
+
+    assert hints == {
+        ('production', '6122', 'P1', D1): 1200.0,
+        ('mix_count', '6122', 'P1', D1): 2.0,
+        ('product_produced', '6122', 'P1', D1): 1.0,
+        ('overtime_hours', D2): 0.75,
+    }
+    assert deserialize_warmstart_hints(serialize_warmstart_hints(hints)) == hints
+
+    with pytest.raises(ValueError):
+        extract_solution_for_warmstart(SimpleNamespace(model=_toy_model()))
+
+
+def test_rolling_window_keeps_overlapping_dates_only():
+    hints = {
+        ('production', '6122', 'P1', D1): 100.0,
+        ('production', '6122', 'P1', D2): 200.0,
+        ('in_transit', '6122', '6104', 'P1', D2, 'ambient'): 50.0,
+        ('overtime_hours', D3): 1.0,
+    }
+    rolled = extract_warmstart_for_rolling_window(hints, new_start_date=D2, new_end_date=D2)
+    assert rolled == {
+        ('production', '6122', 'P1', D2): 200.0,
+        ('in_transit', '6122', '6104', 'P1', D2, 'ambient'): 50.0,
+    }
+
+
+def test_daily_workflow_warmstarts_from_saved_solve(tmp_path):
+    """A saved solve's hints are loaded and rolled onto the Daily horizon."""
+    hints = {
+        ('production', '6122', 'P1', D1): 100.0,   # yesterday - dropped
+        ('production', '6122', 'P1', D2): 200.0,
+        ('mix_count', '6122', 'P1', D2): 1.0,
+        ('overtime_hours', D3): 2.0,
+    }
+    previous = WorkflowResult(
+        workflow_type=WorkflowType.WEEKLY,
+        solve_timestamp=datetime(2025, 11, 3, 6, 0),
+        solution=OptimizationResult(
+            success=True,
+            objective_value=1.0,
+            metadata={'warmstart_hints': serialize_warmstart_hints(hints)},
+        ),
+        success=True,
+    )
+    solve_path = tmp_path / "weekly.json"
+    SolveFile(solve_path).save(previous)
+
+    workflow = DailyWorkflow(
+        config=WorkflowConfig(
+            workflow_type=WorkflowType.DAILY,
+            planning_horizon_weeks=12,
+            free_period_weeks=4,
+            fixed_period_weeks=8,
+            use_warmstart=True,
+        ),
+        locations=[],
+        routes=[],
+        products=[],
+        forecast=Forecast(name="empty", entries=[]),
+        labor_calendar=LaborCalendar(name="empty", days=[]),
+        truck_schedules=[],
+        cost_structure=CostStructure(),
+        previous_solve_path=str(solve_path),
+    )
+    workflow.input_data = {
+        'planning_start_date': D2,
+        'planning_end_date': D2 + timedelta(weeks=12),
+    }
+
+    warmstart = workflow.prepare_warmstart()
+
+    assert warmstart['hints'] == {k: v for k, v in hints.items() if k[-1] != D1}
+    assert warmstart['previous_workflow_type'] == 'weekly'
+    assert warmstart['num_previous_values'] == 4
+    assert warmstart['num_values'] == 3
@@ -851,6 +851,43 @@ def _get_date_range(
     return min(dates), max(dates)
 
 
+def _get_snapshot_generator(
+    production_schedule: ProductionSchedule,
+    shipments: List[Shipment],
+    locations: Dict[str, Location],
+    forecast: Any,
+    model_solution: Any
+) -> DailySnapshotGenerator:
+    """Get the snapshot generator for these inputs, reusing the one from the last rerun.
+
+    The generator is kept in session state keyed by the identity of its inputs,
+    which stay the same objects across Streamlit reruns for one set of results.
+    """
+    key = tuple(id(obj) for obj in (production_schedule, shipments, locations, forecast, model_solution))
+    try:
+        cached = st.session_state.get('_daily_snapshot_generator')
+    except Exception:
+        cached = None
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    generator = DailySnapshotGenerator(
+        production_schedule=production_schedule,
+        shipments=shipments,
+        locations_dict=locations,
+        forecast=forecast,
+        model_solution=model_solution  # Pass model solution to enable MODEL MODE
+    )
+    try:
+        # Keep the inputs referenced too, so their ids cannot be reused
+        st.session_state['_daily_snapshot_generator'] = (
+            key, generator, (production_schedule, shipments, locations, forecast, model_solution)
+        )
+    except Exception:
+        pass
+    return generator
+
+
 def _generate_snapshot(
     selected_date: Date,
     production_schedule: ProductionSchedule,
@@ -908,17 +945,14 @@ def _generate_snapshot(
     if 'model_solution' in results:
         model_solution = results['model_solution']
 
-    # Create backend snapshot generator
-    generator = DailySnapshotGenerator(
-        production_schedule=production_schedule,
-        shipments=shipments,
-        locations_dict=locations,
-        forecast=forecast,
-        model_solution=model_solution  # Pass model solution to enable MODEL MODE
+    # Create backend snapshot generator (indexes the solution once; reused while
+    # the same results are shown so moving the date slider only builds new days)
+    generator = _get_snapshot_generator(
+        production_schedule, shipments, locations, forecast, model_solution
     )
 
-    # Generate backend snapshot
-    backend_snapshot = generator._generate_single_snapshot(selected_date)
+    # Generate backend snapshot (cached per date)
+    backend_snapshot = generator.get_snapshot(selected_date)
 
     # Convert backend dataclasses to UI-friendly dict format
     snapshot = {
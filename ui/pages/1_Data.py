@@ -386,7 +386,8 @@ with tab_upload:
                         parser = MultiFileParser(
                             forecast_file=forecast_path,
                             network_file=network_path,
-                            inventory_file=inventory_path
+                            inventory_file=inventory_path,
+                            cache_dir=".parse_cache",  # Re-uploading unchanged files skips parsing
                         )
 
                         forecast_obj, locations, routes, labor_calendar, truck_schedules_list, cost_structure = parser.parse_all()
@@ -33,6 +33,7 @@ from ui.components.workflow_checklist import (
 )
 
 from src.workflows import InitialWorkflow, WorkflowConfig, WorkflowType
+from src.optimization.solve_telemetry import SolveTelemetry
 from src.persistence import SolveRepository
 from src.models.truck_schedule import TruckScheduleCollection
 
@@ -144,9 +145,11 @@ with tab2:
             st.subheader("Solver Settings")
             solver_name = st.selectbox(
                 "Solver",
-                options=["appsi_highs", "cbc", "glpk"],
+                options=["appsi_highs", "highs_direct", "portfolio", "cbc", "glpk"],
                 index=0,
-                help="Optimization solver. APPSI HiGHS recommended for binary variables."
+                help="Optimization solver. APPSI HiGHS recommended for binary variables. "
+                     "highs_direct: same HiGHS solve, model passed as sparse arrays (faster load). "
+                     "portfolio: races several HiGHS configurations (and CBC) on all cores."
             )
 
             time_limit = st.number_input(
@@ -168,6 +171,17 @@ with tab2:
                 help="Solution quality tolerance. 0.01 = 1% gap (good balance). Lower = better solution but longer solve time."
             )
 
+            stop_gap = st.number_input(
+                "Stop Early at Gap",
+                min_value=0.0,
+                max_value=0.5,
+                value=0.0,
+                step=0.005,
+                format="%.4f",
+                help="Stop the solve and keep the incumbent once the gap reaches this value "
+                     "(APPSI HiGHS only). 0 = off. E.g. 0.03 to accept a 3% plan instead of waiting for the MIP gap."
+            )
+
         with col2:
             st.subheader("Model Options")
 
@@ -204,6 +218,7 @@ with tab2:
             "planning_horizon_weeks": horizon_weeks,
             "solve_time_limit": time_limit if time_limit > 0 else None,
             "mip_gap_tolerance": mip_gap,
+            "stop_gap": stop_gap if stop_gap > 0 else None,
             "solver_name": solver_name,
             "allow_shortages": allow_shortages,
             "track_batches": track_batches,
@@ -237,6 +252,8 @@ with tab3:
             time_limit_str = f"{config['solve_time_limit']}s" if config['solve_time_limit'] else "No limit"
             st.metric("Time Limit", time_limit_str)
             st.metric("MIP Gap", f"{config['mip_gap_tolerance']*100:.2f}%")
+            if config.get('stop_gap'):
+                st.metric("Stop Early at Gap", f"{config['stop_gap']*100:.2f}%")
         with col3:
             st.metric("Allow Shortages", "Yes" if config['allow_shortages'] else "No")
             st.metric("Track Batches", "Yes" if config['track_batches'] else "No")
@@ -305,6 +322,31 @@ with tab3:
                         status_text.text("Solving optimization problem...")
                         progress_bar.progress(30)
 
+                        # Live MIP progress from the HiGHS callbacks (appsi_highs)
+                        metrics_text = st.empty()
+                        gap_chart = st.empty()
+                        gap_history = []
+
+                        def show_progress(progress):
+                            if progress.gap is not None:
+                                gap_history.append({'Elapsed (s)': progress.elapsed, 'Gap (%)': progress.gap * 100})
+                                gap_chart.line_chart(gap_history, x='Elapsed (s)', y='Gap (%)', height=200)
+                            incumbent = f"${progress.primal_bound:,.2f}" if progress.primal_bound is not None else "-"
+                            bound = f"${progress.dual_bound:,.2f}" if progress.dual_bound is not None else "-"
+                            gap = f"{progress.gap * 100:.2f}%" if progress.gap is not None else "-"
+                            metrics_text.markdown(
+                                f"**{progress.elapsed:.0f}s** | Incumbent {incumbent} | Bound {bound} | "
+                                f"Gap {gap} | Nodes {progress.nodes or 0:,}"
+                            )
+                            if config['solve_time_limit']:
+                                fraction = min(progress.elapsed / config['solve_time_limit'], 1.0)
+                                progress_bar.progress(30 + int(fraction * 60))
+
+                        workflow.telemetry = SolveTelemetry(
+                            callback=show_progress,
+                            stop_gap=config.get('stop_gap'),
+                        )
+
                         # Execute workflow
                         result = workflow.execute()
 
@@ -344,6 +386,16 @@ with tab3:
                         with col4:
                             st.metric("Solver Status", result.solver_status or "N/A")
 
+                        telemetry = workflow.telemetry
+                        if telemetry.stopped_early:
+                            st.info(f"⏹️ Stopped early: {telemetry.stop_reason}")
+                        if telemetry.samples:
+                            with st.expander("Solve Progress"):
+                                import pandas as pd
+                                progress_df = pd.DataFrame(telemetry.records())
+                                st.line_chart(progress_df, x='elapsed', y=['primal_bound', 'dual_bound'])
+                                st.dataframe(progress_df, use_container_width=True)
+
                         session_state.set_workflow_step("initial", 3)
 
                         st.info("👉 Proceed to **Results** tab to review the optimized plan.")